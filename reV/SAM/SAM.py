@@ -3,7 +3,6 @@
 
 Wraps the NREL-PySAM library with additional reV features.
 """
-import json
 import logging
 import numpy as np
 import os
@@ -11,6 +10,7 @@ import pandas as pd
 from warnings import warn
 import PySAM.GenericSystem as generic
 
+from reV.config.sam_config import SAMConfig
 from reV.utilities.exceptions import (SAMInputWarning, SAMInputError,
                                       SAMExecutionError, ResourceError)
 
@@ -249,12 +249,26 @@ class Sam:
     # callable attributes to be ignored in the get/set logic
     IGNORE_ATTRS = ['assign', 'execute', 'export']
 
-    def __init__(self):
-        self._pysam = self.PYSAM.new()
-        self._attr_dict = None
+    # PySAM attribute resolution tables shared by all instances, keyed by the
+    # PySAM object type
+    _ATTR_TABLES = {}
+
+    def __init__(self, pysam=None):
+        """
+        Parameters
+        ----------
+        pysam : object | None
+            Optional pre-existing PySAM object (instance of self.PYSAM) to
+            wrap. This allows a PySAM object to be re-used across sites
+            without re-initializing it. None will create a new PySAM object.
+        """
+        if pysam is None:
+            pysam = self.PYSAM.new()
+
+        self._pysam = pysam
+        self._attr_table = self._get_attr_table(pysam)
         self._default = None
-        self._inputs = []
-        if 'constant' in self.input_list:
+        if 'constant' in self._attr_table['input_groups']:
             self['constant'] = 0.0
 
     def __getitem__(self, key):
@@ -289,24 +303,38 @@ class Sam:
             Data to set to the key.
         """
 
-        if key not in self.input_list:
+        group = self._attr_table['input_groups'].get(key, None)
+        if group is None:
             msg = ('Could not set input key "{}". Attribute not '
                    'found in PySAM object: "{}"'
                    .format(key, self.pysam))
             logger.exception(msg)
             raise SAMInputError(msg)
         else:
-            group = self._get_group(key, outputs=False)
-            try:
-                setattr(getattr(self.pysam, group), key, value)
-            except Exception as e:
-                msg = ('Could not set input key "{}" to '
-                       'group "{}" in "{}".\n'
-                       'Data is: {} ({})\n'
-                       'Received the following error: "{}"'
-                       .format(key, group, self.pysam, value, type(value), e))
-                logger.exception(msg)
-                raise SAMInputError(msg)
+            self._set_input(group, key, value)
+
+    def _set_input(self, group, key, value):
+        """Set a PySAM input data attribute to a known input group.
+
+        Parameters
+        ----------
+        group : str
+            PySAM input group that key belongs to.
+        key : str
+            Lowest level attribute name.
+        value : object
+            Data to set to the key.
+        """
+        try:
+            setattr(getattr(self.pysam, group), key, value)
+        except Exception as e:
+            msg = ('Could not set input key "{}" to '
+                   'group "{}" in "{}".\n'
+                   'Data is: {} ({})\n'
+                   'Received the following error: "{}"'
+                   .format(key, group, self.pysam, value, type(value), e))
+            logger.exception(msg)
+            raise SAMInputError(msg)
 
     @property
     def pysam(self):
@@ -328,6 +356,55 @@ class Sam:
 
         return self._default
 
+    @classmethod
+    def _get_attr_table(cls, pysam):
+        """Get the attribute resolution table for a PySAM object type. The
+        table is built by introspecting the first PySAM object of each type
+        and is then shared by all Sam instances wrapping that type.
+
+        Parameters
+        ----------
+        pysam : object
+            PySAM object (e.g. instance of cls.PYSAM).
+
+        Returns
+        -------
+        table : dict
+            Dictionary with keys:
+                attr_dict: PySAM variable groups mapped to lists of the
+                    lowest level attribute/variable names.
+                input_list: List of lowest level input attribute names.
+                groups: Attribute names mapped to the first group they
+                    belong to (including outputs).
+                input_groups: Input attribute names mapped to the first
+                    (non-output) group they belong to.
+        """
+        table = cls._ATTR_TABLES.get(type(pysam), None)
+        if table is None:
+            keys = cls._get_pysam_attrs(pysam)
+            attr_dict = {k: cls._get_pysam_attrs(getattr(pysam, k))
+                         for k in keys}
+
+            input_list = []
+            groups = {}
+            input_groups = {}
+            for group, attrs in attr_dict.items():
+                for attr in attrs:
+                    groups.setdefault(attr, group)
+
+                if group.lower() != 'outputs':
+                    input_list += attrs
+                    for attr in attrs:
+                        input_groups.setdefault(attr, group)
+
+            table = {'attr_dict': attr_dict,
+                     'input_list': input_list,
+                     'groups': groups,
+                     'input_groups': input_groups}
+            cls._ATTR_TABLES[type(pysam)] = table
+
+        return table
+
     @property
     def attr_dict(self):
         """Get the heirarchical PySAM object attribute dictionary.
@@ -339,12 +416,7 @@ class Sam:
                keys: variable groups
                values: lowest level attribute/variable names
         """
-        if self._attr_dict is None:
-            keys = self._get_pysam_attrs(self.pysam)
-            self._attr_dict = {k: self._get_pysam_attrs(getattr(self.pysam, k))
-                               for k in keys}
-
-        return self._attr_dict
+        return self._attr_table['attr_dict']
 
     @property
     def input_list(self):
@@ -355,12 +427,7 @@ class Sam:
         _inputs : list
             List of lowest level input attributes.
         """
-        if not any(self._inputs):
-            for k, v in self.attr_dict.items():
-                if k.lower() != 'outputs':
-                    self._inputs += v
-
-        return self._inputs
+        return self._attr_table['input_list']
 
     def _get_group(self, key, outputs=True):
         """Get the group that the input key belongs to.
@@ -378,21 +445,13 @@ class Sam:
         group : str | None
             PySAM attribute group that key belongs to. None if not found.
         """
-        group = None
-
-        temp = self.attr_dict
-        if not outputs:
-            temp = {k: v for (k, v) in temp.items()
-                    if k.lower() != 'outputs'}
-
-        for k, v in temp.items():
-            if key in v:
-                group = k
-                break
-
-        return group
+        if outputs:
+            return self._attr_table['groups'].get(key, None)
+        else:
+            return self._attr_table['input_groups'].get(key, None)
 
-    def _get_pysam_attrs(self, obj):
+    @classmethod
+    def _get_pysam_attrs(cls, obj):
         """Get a list of attributes from obj with ignore logic.
 
         Parameters
@@ -407,7 +466,7 @@ class Sam:
             not included.
         """
         attrs = [a for a in dir(obj) if not a.startswith('__')
-                 and a not in self.IGNORE_ATTRS]
+                 and a not in cls.IGNORE_ATTRS]
         return attrs
 
     def execute(self):
@@ -438,16 +497,7 @@ class Sam:
             Filtered Input value associated with key.
         """
 
-        if '.' in key:
-            key = key.replace('.', '_')
-
-        if ':constant' in key and 'adjust:' in key:
-            key = key.replace('adjust:', '')
-
-        if isinstance(value, str) and '[' in value and ']' in value:
-            value = json.loads(value)
-
-        return key, value
+        return SAMConfig.filter_inputs(key, value)
 
     def assign_inputs(self, inputs, raise_warning=False):
         """Assign a flat dictionary of inputs to the PySAM object.
@@ -461,10 +511,15 @@ class Sam:
             are not found in the PySAM object.
         """
 
+        input_groups = self._attr_table['input_groups']
         for k, v in inputs.items():
-            k, v = self._filter_inputs(k, v)
-            if k in self.input_list and v is not None:
-                self[k] = v
+            group = input_groups.get(k, None)
+            if group is None or isinstance(v, str):
+                k, v = self._filter_inputs(k, v)
+                group = input_groups.get(k, None)
+
+            if group is not None and v is not None:
+                self._set_input(group, k, v)
             elif raise_warning:
                 wmsg = ('Not setting input "{}" to: {}.'
                         .format(k, v))
@@ -489,8 +544,12 @@ class RevPySam(Sam):
                       'windpower': WindResource,
                       }
 
+    # SAM system inputs that are set from the site meta data and can
+    # therefore change from site to site for a single SAM config.
+    SITE_INPUTS = ()
+
     def __init__(self, meta, sam_sys_inputs, output_request,
-                 site_sys_inputs=None):
+                 site_sys_inputs=None, pysam=None):
         """Initialize a SAM object.
 
         Parameters
@@ -506,9 +565,13 @@ class RevPySam(Sam):
         site_sys_inputs : dict
             Optional set of site-specific SAM system inputs to complement the
             site-agnostic inputs.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
 
-        super().__init__()
+        super().__init__(pysam=pysam)
+        self._assign_keys = None
         self._meta = meta
         self._site = None
         self.time_interval = 1
@@ -719,6 +782,62 @@ class RevPySam(Sam):
             logger.error(msg)
             raise SAMExecutionError(msg)
 
+    @classmethod
+    def get_site_input_keys(cls, site_sys_inputs=None):
+        """Get the SAM input keys that are specific to a single site.
+
+        Parameters
+        ----------
+        site_sys_inputs : dict | None
+            Optional set of site-specific SAM system inputs to complement the
+            site-agnostic inputs.
+
+        Returns
+        -------
+        keys : set
+            SAM input keys set from the site meta data or the site-specific
+            inputs (NaN site inputs are ignored).
+        """
+        keys = set(cls.SITE_INPUTS)
+        if site_sys_inputs is not None:
+            for k, v in site_sys_inputs.items():
+                if not (isinstance(v, float) and np.isnan(v)):
+                    keys.add(k)
+
+        return keys
+
+    @property
+    def assign_keys(self):
+        """Get the subset of sam_sys_inputs keys to assign to PySAM.
+
+        Returns
+        -------
+        _assign_keys : set | None
+            Subset of the sam_sys_inputs keys to assign to the PySAM object.
+            None (default) assigns all sam_sys_inputs.
+        """
+        return self._assign_keys
+
+    @assign_keys.setter
+    def assign_keys(self, keys):
+        """Only assign a subset of the sam_sys_inputs to the PySAM object.
+
+        This is used when a PySAM object is re-used across sites and all
+        site-agnostic inputs have already been assigned.
+
+        Parameters
+        ----------
+        keys : set | list | None
+            Subset of the sam_sys_inputs keys to assign to the PySAM object.
+            None assigns all sam_sys_inputs.
+        """
+        self._assign_keys = keys
+
     def assign_inputs(self):
         """Assign the self.sam_sys_inputs attribute to the PySAM object."""
-        super().assign_inputs(self.sam_sys_inputs)
+        if self._assign_keys is None:
+            super().assign_inputs(self.sam_sys_inputs)
+        else:
+            inputs = {k: self.sam_sys_inputs[k] for k in self._assign_keys
+                      if k in self.sam_sys_inputs}
+            super().assign_inputs(inputs)
@@ -4,7 +4,6 @@
 Wraps the NREL-PySAM lcoefcr and singleowner modules with
 additional reV features.
 """
-from copy import deepcopy
 import logging
 import numpy as np
 from warnings import warn
@@ -105,8 +104,8 @@ class Economic(RevPySam):
             Dataframe of site-specific input variables. Row index corresponds
             to site number/gid (via df.loc not df.iloc), column labels are the
             variable keys that will be passed forward as SAM parameters.
-        site_gids : list
-            List of all site gid values from the cf_file.
+        site_gids : dict
+            Lookup of site gid to index for all sites in the cf_file.
         cf_arr : np.ndarray
             Array of cf_mean values for all sites in the cf_file for the
             given year.
@@ -123,7 +122,7 @@ class Economic(RevPySam):
         """
 
         # get the index location of the site in question
-        isite = site_gids.index(site)
+        isite = site_gids[site]
 
         # calculate the capacity factor
         cf = cf_arr[isite]
@@ -170,9 +169,10 @@ class Economic(RevPySam):
         # Retrieve the generation profile for single owner input
         with Outputs(cf_file) as cfh:
 
-            # get the index location of the site in question
-            site_gids = list(cfh.get_meta_arr('gid'))
-            isites = [site_gids.index(s) for s in sites]
+            # get the index location of the sites in question
+            site_gids = {gid: i for i, gid
+                         in enumerate(cfh.get_meta_arr('gid').tolist())}
+            isites = [site_gids[s] for s in sites]
 
             # look for the cf_profile dataset
             if 'cf_profile' in cfh.datasets:
@@ -361,8 +361,8 @@ class LCOE(Economic):
 
         Returns
         -------
-        site_gids : list
-            List of all site gid values from the cf_file.
+        site_gids : dict
+            Lookup of site gid to index for all sites in the cf_file.
         calc_aey : bool
             Flag to require calculation of the annual energy yield before
             running LCOE.
@@ -373,7 +373,8 @@ class LCOE(Economic):
 
         # get the cf_file meta data gid's to use as indexing tools
         with Outputs(cf_file) as cfh:
-            site_gids = list(cfh.meta['gid'])
+            site_gids = {gid: i for i, gid
+                         in enumerate(cfh.meta['gid'].values.tolist())}
 
         calc_aey = False
         if 'annual_energy' not in site_df:
@@ -460,6 +461,287 @@ class LCOE(Economic):
 
         return out
 
+    @staticmethod
+    def _get_site_inputs(key, sites, configs, sam_configs, site_df):
+        """Get one SAM input for many sites as an array. Site-specific values
+        in site_df take priority over the SAM config values. NaN site values
+        fall back to the SAM config (same as RevPySam._parse_site_sys_inputs).
+
+        Parameters
+        ----------
+        key : str
+            SAM input key.
+        sites : list
+            List of site gids.
+        configs : np.ndarray
+            SAM config ID for every site in sites.
+        sam_configs : dict
+            SAM config dictionaries keyed by SAM config ID.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Row index corresponds
+            to site number/gid (via df.loc not df.iloc), column labels are the
+            variable keys that will be passed forward as SAM parameters.
+
+        Returns
+        -------
+        arr : np.ndarray | None
+            1D float array of input values for all sites, None if the input
+            is not available for one or more sites.
+        """
+        arr = np.full(len(sites), np.nan)
+        for config_id in np.unique(configs):
+            if key in sam_configs[config_id]:
+                arr[configs == config_id] = sam_configs[config_id][key]
+
+        if key in site_df:
+            site_arr = site_df.loc[sites, key].values.astype(np.float64)
+            arr = np.where(np.isnan(site_arr), arr, site_arr)
+
+        if np.isnan(arr).any():
+            arr = None
+
+        return arr
+
+    @staticmethod
+    def _get_sys_cap_arr(sites, configs, sam_configs, site_df):
+        """Find the system capacity for many sites in either the SAM configs
+        or site_df. Same priority as Economic._parse_sys_cap().
+
+        Parameters
+        ----------
+        sites : list
+            List of site gids.
+        configs : np.ndarray
+            SAM config ID for every site in sites.
+        sam_configs : dict
+            SAM config dictionaries keyed by SAM config ID.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Row index corresponds
+            to site number/gid (via df.loc not df.iloc), column labels are the
+            variable keys that will be passed forward as SAM parameters.
+
+        Returns
+        -------
+        sys_caps : dict
+            System capacity keyed by SAM config ID. Values are either the
+            scalar config value or an array of site-specific values for all
+            sites.
+        """
+        sys_caps = {}
+        for config_id in np.unique(configs):
+            inputs = sam_configs[config_id]
+            if 'system_capacity' in inputs:
+                sys_caps[config_id] = inputs['system_capacity']
+            elif 'turbine_capacity' in inputs:
+                sys_caps[config_id] = inputs['turbine_capacity']
+            elif 'system_capacity' in site_df:
+                sys_caps[config_id] = site_df.loc[sites,
+                                                  'system_capacity'].values
+            elif 'turbine_capacity' in site_df:
+                sys_caps[config_id] = site_df.loc[sites,
+                                                  'turbine_capacity'].values
+            else:
+                Economic._parse_sys_cap(None, inputs, site_df)
+
+        return sys_caps
+
+    @staticmethod
+    def _scalar_dtype(*operands):
+        """Get the dtype of numpy scalar arithmetic on the given operands.
+
+        The per-site Economic._get_annual_energy() math runs on numpy
+        scalars, which can promote to a different precision than arrays of
+        the same dtype (e.g. numpy<2 returns float64 for float32 scalar math
+        with python numbers). np.result_type() of scalar operands follows
+        the scalar promotion rules, so arrays are represented here by a
+        scalar of their dtype.
+
+        Parameters
+        ----------
+        operands : np.ndarray | int | float
+            Array or scalar operands of a single arithmetic operation.
+
+        Returns
+        -------
+        dtype : np.dtype
+            Result dtype of the equivalent per-site scalar operation.
+        """
+        operands = [op.dtype.type(0) if isinstance(op, np.ndarray) else op
+                    for op in operands]
+
+        return np.result_type(*operands)
+
+    @staticmethod
+    def _calc_aey_arr(sys_cap, cf, mask):
+        """Calculate the annual energy yield for a subset of sites in the
+        precision of the per-site calculation.
+
+        Parameters
+        ----------
+        sys_cap : int | float | np.ndarray
+            System capacity, either a scalar or an array for all sites.
+        cf : np.ndarray
+            Capacity factor for all sites.
+        mask : np.ndarray
+            Boolean mask of the sites to calculate.
+
+        Returns
+        -------
+        aey : np.ndarray
+            Annual energy yield for the masked sites.
+        """
+        if isinstance(sys_cap, np.ndarray):
+            sys_cap = sys_cap[mask]
+
+        cf = cf[mask]
+
+        # Calc annual energy, mult by 8760 to convert kW to kWh. Each
+        # operation is promoted like the per-site scalar operation.
+        aey = np.multiply(sys_cap, cf, dtype=LCOE._scalar_dtype(sys_cap, cf))
+
+        return np.multiply(aey, 8760, dtype=LCOE._scalar_dtype(aey, 8760))
+
+    @staticmethod
+    def _get_annual_energy_arr(sites, configs, sam_configs, site_df,
+                               site_gids, cf_arr, calc_aey):
+        """Get the cf and annual energy for many sites at once and add to
+        site_df. Vectorized version of Economic._get_annual_energy() with
+        identical results (see LCOE._scalar_dtype()).
+
+        Parameters
+        ----------
+        sites : list
+            List of site gids.
+        configs : np.ndarray
+            SAM config ID for every site in sites.
+        sam_configs : dict
+            SAM config dictionaries keyed by SAM config ID.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Row index corresponds
+            to site number/gid (via df.loc not df.iloc), column labels are the
+            variable keys that will be passed forward as SAM parameters.
+        site_gids : dict
+            Lookup of site gid to index for all sites in the cf_file.
+        cf_arr : np.ndarray
+            Array of cf_mean values for all sites in the cf_file for the
+            given year.
+        calc_aey : bool
+            Flag to add annual_energy to df.
+
+        Returns
+        -------
+        site_df : pd.DataFrame
+            Same as input but with added labels "capacity_factor" and
+            "annual_energy" (latter is dependent on calc_aey flag).
+        """
+        cf = cf_arr[[site_gids[site] for site in sites]]
+        pct = cf > 1
+        if pct.any():
+            warn('Capacity factor > 1. Dividing by 100.')
+
+        pct_cf = np.divide(cf, 100, dtype=LCOE._scalar_dtype(cf, 100))
+        cf_out = np.where(pct, pct_cf, cf).astype(np.float64)
+        site_df.loc[sites, 'capacity_factor'] = cf_out
+
+        if calc_aey:
+            sys_caps = LCOE._get_sys_cap_arr(sites, configs, sam_configs,
+                                             site_df)
+            aey = np.zeros(len(sites))
+            for config_id, sys_cap in sys_caps.items():
+                for site_cf, mask in ((cf, ~pct), (pct_cf, pct)):
+                    mask = mask & (configs == config_id)
+                    aey[mask] = LCOE._calc_aey_arr(sys_cap, site_cf, mask)
+
+            site_df.loc[sites, 'annual_energy'] = aey
+
+        return site_df
+
+    @classmethod
+    def reV_run_vectorized(cls, points_control, site_df, cf_file, year,
+                           output_request=('lcoe_fcr',)):
+        """Compute the fixed charge rate LCOE for all sites in one vectorized
+        pass without running PySAM. This evaluates the same closed-form
+        equation as the SAM lcoefcr module:
+
+        lcoe_fcr = (fixed_charge_rate * capital_cost + fixed_operating_cost)
+        / annual_energy + variable_operating_cost
+
+        Parameters
+        ----------
+        points_control : config.PointsControl
+            PointsControl instance containing project points site and SAM
+            config info.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Row index corresponds
+            to site number/gid (via df.loc not df.iloc), column labels are the
+            variable keys that will be passed forward as SAM parameters.
+        cf_file : str
+            reV generation capacity factor output file with path.
+        year : int | str | None
+            reV generation year to calculate econ for. Looks for cf_mean_{year}
+            or cf_profile_{year}. None will default to a non-year-specific cf
+            dataset (cf_mean, cf_profile).
+        output_request : list | tuple | str
+            Output(s) to retrieve. Outputs other than "lcoe_fcr" must be
+            SAM config or site-specific inputs.
+
+        Returns
+        -------
+        out : dict
+            Nested dictionaries where the top level key is the site index,
+            the second level key is the variable name, second level value is
+            the output variable value.
+        """
+        if isinstance(output_request, str):
+            output_request = (output_request,)
+
+        pp = points_control.project_points
+        sites = list(points_control.sites)
+        configs = pp.df.set_index('gid').loc[sites, 'config'].values
+        sam_configs = pp.sam_configs
+
+        site_gids, calc_aey, cf_arr = cls._parse_lcoe_inputs(site_df, cf_file,
+                                                             year)
+        site_df = cls._get_annual_energy_arr(sites, configs, sam_configs,
+                                             site_df, site_gids, cf_arr,
+                                             calc_aey)
+
+        keys = ('fixed_charge_rate', 'capital_cost', 'fixed_operating_cost',
+                'variable_operating_cost', 'annual_energy')
+        inputs = {k: cls._get_site_inputs(k, sites, configs, sam_configs,
+                                          site_df) for k in keys}
+        missing = [k for k, v in inputs.items() if v is None]
+        if any(missing):
+            msg = ('LCOE inputs {} are missing from the SAM config and '
+                   'site-specific inputs for one or more sites.'
+                   .format(missing))
+            logger.error(msg)
+            raise SAMExecutionError(msg)
+
+        # Native units are $/kWh, mult by 1000 for $/MWh.
+        lcoe = ((inputs['fixed_charge_rate'] * inputs['capital_cost']
+                 + inputs['fixed_operating_cost'])
+                / inputs['annual_energy']
+                + inputs['variable_operating_cost']) * 1000
+
+        results = {}
+        for req in output_request:
+            if req == 'lcoe_fcr':
+                results[req] = lcoe
+            else:
+                results[req] = cls._get_site_inputs(req, sites, configs,
+                                                    sam_configs, site_df)
+                if results[req] is None:
+                    msg = ('Could not retrieve output "{}" for vectorized '
+                           'LCOE.'.format(req))
+                    logger.error(msg)
+                    raise SAMExecutionError(msg)
+
+        out = {site: {req: arr[i] for req, arr in results.items()}
+               for i, site in enumerate(sites)}
+
+        return out
+
 
 class SingleOwner(Economic):
     """SAM single owner economic model.
@@ -574,11 +856,10 @@ class SingleOwner(Economic):
         profiles = cls._get_cf_profiles(points_control.sites, cf_file, year)
 
         for i, site in enumerate(points_control.sites):
-            # get SAM inputs from project_points based on the current site
-            _, inputs = points_control.project_points[site]
-
-            # ensure that site-specific data is not persisted to other sites
-            site_inputs = deepcopy(inputs)
+            # get SAM inputs from project_points based on the current site.
+            # This is a per-site copy so site-specific data is not persisted
+            # to other sites.
+            _, site_inputs = points_control.project_points[site]
 
             # set the generation profile as an input.
             site_inputs = cls._make_gen_profile(i, site, profiles, site_df,
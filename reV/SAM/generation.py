@@ -8,6 +8,7 @@ from abc import ABC
 import copy
 import os
 import logging
+import time
 import numpy as np
 import pandas as pd
 from warnings import warn
@@ -269,9 +270,96 @@ class Generation(RevPySam, ABC):
             so.outputs_to_utc_arr()
             self.outputs.update(so.outputs)
 
+    @classmethod
+    def _init_sim(cls, pysams, config, res_df, meta, inputs, output_request,
+                  site_sys_inputs):
+        """Initialize a SAM simulation, re-using PySAM objects if available.
+
+        Parameters
+        ----------
+        pysams : dict | None
+            Lookup of {config_id: (pysam, site_input_keys)} from previous
+            sites that were run on this worker. The PySAM object and the
+            site-specific input keys assigned to it are updated in-place.
+            None will initialize a new PySAM object for the site.
+        config : str
+            SAM config ID for the current site.
+        res_df : pd.DataFrame
+            2D table with resource data for the current site.
+        meta : pd.DataFrame
+            1D table with resource meta data for the current site.
+        inputs : dict
+            Site-agnostic SAM system model inputs arguments.
+        output_request : list
+            Requested SAM outputs.
+        site_sys_inputs : dict
+            Site-specific SAM system inputs to complement the site-agnostic
+            inputs.
+
+        Returns
+        -------
+        sim : Generation
+            Initialized SAM generation simulation object.
+        """
+        pysam = None
+        site_keys = cls.get_site_input_keys(site_sys_inputs)
+        assign_keys = None
+        if pysams is not None and config in pysams:
+            pysam, prev_keys = pysams[config]
+            assign_keys = site_keys | prev_keys
+            if any(k not in inputs and k not in site_keys
+                   for k in prev_keys):
+                # inputs set by the previous site cannot be unset
+                pysam = None
+                assign_keys = None
+
+        sim = cls(resource=res_df, meta=meta, sam_sys_inputs=inputs,
+                  output_request=output_request,
+                  site_sys_inputs=site_sys_inputs, pysam=pysam)
+
+        if pysams is not None:
+            sim.assign_keys = assign_keys
+            pysams[config] = (sim.pysam, site_keys)
+
+        return sim
+
+    @classmethod
+    def get_resources(cls, points_control, res_file,
+                      output_request=('cf_mean',)):
+        """Load the SAM resource for a points control split and run it
+        through the curtailment filter if applicable.
+
+        Parameters
+        ----------
+        points_control : config.PointsControl
+            PointsControl instance containing project points site and SAM
+            config info.
+        res_file : str
+            Resource file with full path.
+        output_request : list | tuple
+            Outputs to retrieve from SAM.
+
+        Returns
+        -------
+        resources : rex.sam_resource.SAMResource
+            Preloaded (and curtailed) resource iterator object to pass to SAM.
+        """
+        resources = RevPySam.get_sam_res(res_file,
+                                         points_control.project_points,
+                                         points_control.project_points.tech,
+                                         output_request=output_request)
+
+        curtailment = points_control.project_points.curtailment
+        if curtailment is not None:
+            resources = curtail(resources, curtailment,
+                                random_seed=curtailment.random_seed)
+
+        return resources
+
     @classmethod
     def reV_run(cls, points_control, res_file, site_df,
-                output_request=('cf_mean',), drop_leap=False):
+                output_request=('cf_mean',), drop_leap=False,
+                reuse_pysam=False, resources=None):
         """Execute SAM generation based on a reV points control instance.
 
         Parameters
@@ -290,6 +378,15 @@ class Generation(RevPySam, ABC):
         drop_leap : bool
             Drops February 29th from the resource data. If False, December
             31st is dropped from leap years.
+        reuse_pysam : bool
+            Flag to initialize a single PySAM object per SAM config and
+            re-use it for all sites. The site-agnostic inputs are assigned
+            once and only the resource data and site-specific inputs are
+            updated for each subsequent site.
+        resources : rex.sam_resource.SAMResource | None
+            Optional resource object for this split that was already loaded
+            by get_resources() (e.g. prefetched while the previous split was
+            running). None will load the resource here.
 
         Returns
         -------
@@ -300,21 +397,18 @@ class Generation(RevPySam, ABC):
         """
         # initialize output dictionary
         out = {}
+        pysams = {} if reuse_pysam else None
+        t_start = time.time()
 
-        # Get the RevPySam resource object
-        resources = RevPySam.get_sam_res(res_file,
-                                         points_control.project_points,
-                                         points_control.project_points.tech,
-                                         output_request=output_request)
-
-        # run resource through curtailment filter if applicable
-        curtailment = points_control.project_points.curtailment
-        if curtailment is not None:
-            resources = curtail(resources, curtailment,
-                                random_seed=curtailment.random_seed)
+        # Get the (curtailed) RevPySam resource object
+        if resources is None:
+            resources = cls.get_resources(points_control, res_file,
+                                          output_request=output_request)
 
         # Use resource object iterator
+        t_sites = 0
         for res_df, meta in resources:
+            t0 = time.time()
 
             # drop the leap day
             if drop_leap:
@@ -322,16 +416,15 @@ class Generation(RevPySam, ABC):
 
             # get SAM inputs from project_points based on the current site
             site = res_df.name
-            _, inputs = points_control.project_points[site]
+            config, inputs = points_control.project_points[site]
 
             res_outs, out_req_cleaned = cls._get_res(res_df, output_request)
             res_mean, out_req_cleaned = cls._get_res_mean(resources, site,
                                                           out_req_cleaned)
 
             # iterate through requested sites.
-            sim = cls(resource=res_df, meta=meta, sam_sys_inputs=inputs,
-                      output_request=out_req_cleaned,
-                      site_sys_inputs=dict(site_df.loc[site, :]))
+            sim = cls._init_sim(pysams, config, res_df, meta, inputs,
+                                out_req_cleaned, dict(site_df.loc[site, :]))
             sim._gen_exec()
 
             # collect outputs to dictout
@@ -343,6 +436,16 @@ class Generation(RevPySam, ABC):
             if res_mean is not None:
                 out[site].update(res_mean)
 
+            t_sites += time.time() - t0
+
+        if out:
+            logger.debug('{} ran {} sites in {:.2f} seconds ({:.2f} seconds '
+                         'running sites, {:.4f} seconds per site, '
+                         'reuse_pysam={})'
+                         .format(cls.__name__, len(out),
+                                 time.time() - t_start, t_sites,
+                                 t_sites / len(out), reuse_pysam))
+
         return out
 
 
@@ -350,8 +453,12 @@ class Solar(Generation, ABC):
     """Base Class for Solar generation from SAM
     """
 
+    # tilt and azimuth can be set from the site latitude
+    SITE_INPUTS = ('tilt', 'azimuth')
+
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None, drop_leap=False):
+                 site_sys_inputs=None, output_request=None, drop_leap=False,
+                 pysam=None):
         """Initialize a SAM solar object.
 
         Parameters
@@ -372,6 +479,9 @@ class Solar(Generation, ABC):
         drop_leap : bool
             Drops February 29th from the resource data. If False, December
             31st is dropped from leap years.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
 
         # drop the leap day
@@ -383,7 +493,7 @@ class Solar(Generation, ABC):
 
         # don't pass resource to base class, set in set_nsrdb instead.
         super().__init__(meta, sam_sys_inputs, output_request,
-                         site_sys_inputs=site_sys_inputs)
+                         site_sys_inputs=site_sys_inputs, pysam=pysam)
 
         # Set the site number using resource
         if isinstance(resource, pd.DataFrame):
@@ -520,7 +630,7 @@ class Pvwatts(Solar, ABC):
     PYSAM = PySamPV7
 
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None):
+                 site_sys_inputs=None, output_request=None, pysam=None):
         """Initialize a SAM solar PV object.
 
         Parameters
@@ -538,11 +648,14 @@ class Pvwatts(Solar, ABC):
             Requested SAM outputs (e.g., 'cf_mean', 'annual_energy',
             'cf_profile', 'gen_profile', 'energy_yield', 'ppa_price',
             'lcoe_fcr').
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
         super().__init__(resource=resource, meta=meta,
                          sam_sys_inputs=sam_sys_inputs,
                          site_sys_inputs=site_sys_inputs,
-                         output_request=output_request)
+                         output_request=output_request, pysam=pysam)
 
     def cf_mean(self):
         """Get mean capacity factor (fractional) from SAM.
@@ -681,13 +794,13 @@ class TcsMoltenSalt(Solar):
     PYSAM = PySamCSP
 
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None):
+                 site_sys_inputs=None, output_request=None, pysam=None):
         """Initialize a SAM concentrated solar power (CSP) object.
         """
         super().__init__(resource=resource, meta=meta,
                          sam_sys_inputs=sam_sys_inputs,
                          site_sys_inputs=site_sys_inputs,
-                         output_request=output_request)
+                         output_request=output_request, pysam=pysam)
 
     def cf_profile(self):
         """Get absolute value hourly capacity factor (frac) profile in
@@ -720,7 +833,8 @@ class TcsMoltenSalt(Solar):
 class SolarThermal(Solar, ABC):
     """ Base class for solar thermal """
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None, drop_leap=False):
+                 site_sys_inputs=None, output_request=None, drop_leap=False,
+                 pysam=None):
         """Initialize a SAM solar thermal object
 
         Parameters
@@ -744,12 +858,16 @@ class SolarThermal(Solar, ABC):
             Feb 29th. For leap years, December 31st is dropped and time steps
             are shifted to relabel Feb 29th as March 1st, March 1st as March
             2nd, etc.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
         self._drop_leap = drop_leap
         super().__init__(resource=resource, meta=meta,
                          sam_sys_inputs=sam_sys_inputs,
                          site_sys_inputs=site_sys_inputs,
-                         output_request=output_request, drop_leap=False)
+                         output_request=output_request, drop_leap=False,
+                         pysam=pysam)
 
     def set_nsrdb(self, resource):
         """
@@ -858,7 +976,8 @@ class SolarWaterHeat(SolarThermal):
     PYSAM = PySamSWH
 
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None, drop_leap=False):
+                 site_sys_inputs=None, output_request=None, drop_leap=False,
+                 pysam=None):
         """Initialize a SAM solar water heater object.
 
         Parameters
@@ -882,12 +1001,16 @@ class SolarWaterHeat(SolarThermal):
             Feb 29th. For leap years, December 31st is dropped and time steps
             are shifted to relabel Feb 29th as March 1st, March 1st as March
             2nd, etc.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
         self._pysam_weather_tag = 'solar_resource_file'
         super().__init__(resource=resource, meta=meta,
                          sam_sys_inputs=sam_sys_inputs,
                          site_sys_inputs=site_sys_inputs,
-                         output_request=output_request, drop_leap=drop_leap)
+                         output_request=output_request, drop_leap=drop_leap,
+                         pysam=pysam)
 
     @property
     def default(self):
@@ -911,7 +1034,8 @@ class LinearDirectSteam(SolarThermal):
     PYSAM = PySamLDS
 
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None, drop_leap=False):
+                 site_sys_inputs=None, output_request=None, drop_leap=False,
+                 pysam=None):
         """Initialize a SAM process heat linear Fresnel direct steam object.
 
         Parameters
@@ -935,12 +1059,16 @@ class LinearDirectSteam(SolarThermal):
             Feb 29th. For leap years, December 31st is dropped and time steps
             are shifted to relabel Feb 29th as March 1st, March 1st as March
             2nd, etc.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
         self._pysam_weather_tag = 'file_name'
         super().__init__(resource=resource, meta=meta,
                          sam_sys_inputs=sam_sys_inputs,
                          site_sys_inputs=site_sys_inputs,
-                         output_request=output_request, drop_leap=drop_leap)
+                         output_request=output_request, drop_leap=drop_leap,
+                         pysam=pysam)
 
     def cf_mean(self):
         """Calculate mean capacity factor (fractional) from SAM.
@@ -979,7 +1107,8 @@ class TroughPhysicalHeat(SolarThermal):
     PYSAM = PySamTPPH
 
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None, drop_leap=False):
+                 site_sys_inputs=None, output_request=None, drop_leap=False,
+                 pysam=None):
         """Initialize a SAM trough physical process heat object.
 
         Parameters
@@ -1003,12 +1132,16 @@ class TroughPhysicalHeat(SolarThermal):
             Feb 29th. For leap years, December 31st is dropped and time steps
             are shifted to relabel Feb 29th as March 1st, March 1st as March
             2nd, etc.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
         self._pysam_weather_tag = 'file_name'
         super().__init__(resource=resource, meta=meta,
                          sam_sys_inputs=sam_sys_inputs,
                          site_sys_inputs=site_sys_inputs,
-                         output_request=output_request, drop_leap=drop_leap)
+                         output_request=output_request, drop_leap=drop_leap,
+                         pysam=pysam)
 
     def cf_mean(self):
         """Calculate mean capacity factor (fractional) from SAM.
@@ -1046,7 +1179,8 @@ class WindPower(Generation):
     PYSAM = PySamWindPower
 
     def __init__(self, resource=None, meta=None, sam_sys_inputs=None,
-                 site_sys_inputs=None, output_request=None, drop_leap=False):
+                 site_sys_inputs=None, output_request=None, drop_leap=False,
+                 pysam=None):
         """Initialize a SAM wind object.
 
         Parameters
@@ -1067,6 +1201,9 @@ class WindPower(Generation):
         drop_leap : bool
             Drops February 29th from the resource data. If False, December
             31st is dropped from leap years.
+        pysam : object | None
+            Optional pre-existing PySAM object to re-use. None will create a
+            new PySAM object.
         """
 
         # drop the leap day
@@ -1077,7 +1214,7 @@ class WindPower(Generation):
 
         # don't pass resource to base class, set in set_wtk instead.
         super().__init__(meta, sam_sys_inputs, output_request,
-                         site_sys_inputs=site_sys_inputs)
+                         site_sys_inputs=site_sys_inputs, pysam=pysam)
 
         # Set the site number using resource
         if isinstance(resource, pd.DataFrame):
@@ -7,7 +7,6 @@ Created on Mon Feb  3 14:40:42 2020
 """
 import logging
 from warnings import warn
-from pkg_resources import get_distribution
 from packaging import version
 from reV.utilities.exceptions import PySAMVersionError, PySAMVersionWarning
 
@@ -109,6 +108,7 @@ class PySamVersionChecker:
     @property
     def pysam_version(self):
         """Get the PySAM distribution version"""
+        from pkg_resources import get_distribution
         return str(get_distribution('nrel-pysam')).split(' ')[1]
 
     @classmethod
@@ -3,38 +3,47 @@
 reV command line interface (CLI).
 """
 import click
+import importlib
 import logging
 
-from reV.batch.cli_batch import from_config as run_batch_from_config
-from reV.batch.cli_batch import valid_config_keys as batch_keys
-from reV.handlers.cli_collect import from_config as run_collect_from_config
-from reV.handlers.cli_collect import valid_config_keys as collect_keys
-from reV.handlers.cli_multi_year import from_config as run_my_from_config
-from reV.handlers.cli_multi_year import valid_config_keys as my_keys
-from reV.econ.cli_econ import from_config as run_econ_from_config
-from reV.econ.cli_econ import valid_config_keys as econ_keys
-from reV.generation.cli_gen import from_config as run_gen_from_config
-from reV.generation.cli_gen import valid_config_keys as gen_keys
-from reV.offshore.cli_offshore import from_config as run_offshore_from_config
-from reV.offshore.cli_offshore import valid_config_keys as offshore_keys
-from reV.pipeline.cli_pipeline import from_config as run_pipeline_from_config
-from reV.pipeline.cli_pipeline import valid_config_keys as pipeline_keys
-from reV.rep_profiles.cli_rep_profiles import from_config as run_rp_from_config
-from reV.rep_profiles.cli_rep_profiles import (valid_config_keys
-                                               as rep_profiles_keys)
-from reV.supply_curve.cli_sc_aggregation import (from_config
-                                                 as run_sc_agg_from_config)
-from reV.supply_curve.cli_sc_aggregation import (valid_config_keys
-                                                 as sc_agg_keys)
-from reV.supply_curve.cli_supply_curve import from_config as run_sc_from_config
-from reV.supply_curve.cli_supply_curve import valid_config_keys as sc_keys
-from reV.qa_qc.cli_qa_qc import from_config as run_qa_qc_from_config
-from reV.qa_qc.cli_qa_qc import valid_config_keys as qa_qc_keys
-
 from rex.utilities.cli_dtypes import STR
 
 logger = logging.getLogger(__name__)
 
+# Module CLIs for each reV command. These are only imported when a command is
+# invoked so that every reV call does not pay the import cost of all modules.
+MODULE_CLIS = {'generation': 'reV.generation.cli_gen',
+               'econ': 'reV.econ.cli_econ',
+               'offshore': 'reV.offshore.cli_offshore',
+               'collect': 'reV.handlers.cli_collect',
+               'pipeline': 'reV.pipeline.cli_pipeline',
+               'batch': 'reV.batch.cli_batch',
+               'multi-year': 'reV.handlers.cli_multi_year',
+               'supply-curve-aggregation': 'reV.supply_curve.'
+                                           'cli_sc_aggregation',
+               'supply-curve': 'reV.supply_curve.cli_supply_curve',
+               'rep-profiles': 'reV.rep_profiles.cli_rep_profiles',
+               'qa-qc': 'reV.qa_qc.cli_qa_qc',
+               }
+
+
+def _get_command(module, command='from_config'):
+    """Import a reV module CLI command when it is invoked.
+
+    Parameters
+    ----------
+    module : str
+        reV module name (key in MODULE_CLIS).
+    command : str
+        Name of the click command in the module CLI.
+
+    Returns
+    -------
+    click.Command
+        Click command from the reV module CLI.
+    """
+    return getattr(importlib.import_module(MODULE_CLIS[module]), command)
+
 
 @click.group()
 @click.option('--name', '-n', default='reV', type=STR,
@@ -62,7 +71,7 @@ def generation(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_gen_from_config, config_file=config_file,
+        ctx.invoke(_get_command('generation'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -72,7 +81,7 @@ def valid_generation_keys(ctx):
     """
     Valid Generation config keys
     """
-    ctx.invoke(gen_keys)
+    ctx.invoke(_get_command('generation', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -84,7 +93,7 @@ def econ(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_econ_from_config, config_file=config_file,
+        ctx.invoke(_get_command('econ'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -94,7 +103,7 @@ def valid_econ_keys(ctx):
     """
     Valid Econ config keys
     """
-    ctx.invoke(econ_keys)
+    ctx.invoke(_get_command('econ', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -106,7 +115,7 @@ def offshore(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_offshore_from_config, config_file=config_file,
+        ctx.invoke(_get_command('offshore'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -116,7 +125,7 @@ def valid_offshore_keys(ctx):
     """
     Valid offshore config keys
     """
-    ctx.invoke(offshore_keys)
+    ctx.invoke(_get_command('offshore', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -128,7 +137,7 @@ def collect(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_collect_from_config, config_file=config_file,
+        ctx.invoke(_get_command('collect'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -138,7 +147,7 @@ def valid_collect_keys(ctx):
     """
     Valid Collect config keys
     """
-    ctx.invoke(collect_keys)
+    ctx.invoke(_get_command('collect', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -160,7 +169,7 @@ def pipeline(ctx, cancel, monitor, background, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_pipeline_from_config, config_file=config_file,
+        ctx.invoke(_get_command('pipeline'), config_file=config_file,
                    cancel=cancel, monitor=monitor, background=background,
                    verbose=verbose)
 
@@ -171,7 +180,7 @@ def valid_pipeline_keys(ctx):
     """
     Valid Pipeline config keys
     """
-    ctx.invoke(pipeline_keys)
+    ctx.invoke(_get_command('pipeline', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -195,7 +204,7 @@ def batch(ctx, dry_run, cancel, delete, monitor_background, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_batch_from_config, config_file=config_file,
+        ctx.invoke(_get_command('batch'), config_file=config_file,
                    dry_run=dry_run, cancel=cancel, delete=delete,
                    monitor_background=monitor_background,
                    verbose=verbose)
@@ -207,7 +216,7 @@ def valid_batch_keys(ctx):
     """
     Valid Batch config keys
     """
-    ctx.invoke(batch_keys)
+    ctx.invoke(_get_command('batch', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -219,7 +228,7 @@ def multi_year(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_my_from_config, config_file=config_file,
+        ctx.invoke(_get_command('multi-year'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -229,7 +238,7 @@ def valid_multi_year_keys(ctx):
     """
     Valid Multi Year config keys
     """
-    ctx.invoke(my_keys)
+    ctx.invoke(_get_command('multi-year', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -241,8 +250,8 @@ def supply_curve_aggregation(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_sc_agg_from_config, config_file=config_file,
-                   verbose=verbose)
+        ctx.invoke(_get_command('supply-curve-aggregation'),
+                   config_file=config_file, verbose=verbose)
 
 
 @supply_curve_aggregation.command()
@@ -251,7 +260,7 @@ def valid_supply_curve_aggregation_keys(ctx):
     """
     Valid Supply Curve Aggregation config keys
     """
-    ctx.invoke(sc_agg_keys)
+    ctx.invoke(_get_command('supply-curve-aggregation', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -263,7 +272,7 @@ def supply_curve(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_sc_from_config, config_file=config_file,
+        ctx.invoke(_get_command('supply-curve'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -273,7 +282,7 @@ def valid_supply_curve_keys(ctx):
     """
     Valid Supply Curve config keys
     """
-    ctx.invoke(sc_keys)
+    ctx.invoke(_get_command('supply-curve', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -285,7 +294,7 @@ def rep_profiles(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_rp_from_config, config_file=config_file,
+        ctx.invoke(_get_command('rep-profiles'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -295,7 +304,7 @@ def valid_rep_profiles_keys(ctx):
     """
     Valid Representative Profiles config keys
     """
-    ctx.invoke(rep_profiles_keys)
+    ctx.invoke(_get_command('rep-profiles', 'valid_config_keys'))
 
 
 @main.group(invoke_without_command=True)
@@ -307,7 +316,7 @@ def qa_qc(ctx, verbose):
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
         verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_qa_qc_from_config, config_file=config_file,
+        ctx.invoke(_get_command('qa-qc'), config_file=config_file,
                    verbose=verbose)
 
 
@@ -317,7 +326,7 @@ def valid_qa_qc_keys(ctx):
     """
     Valid QA/QC config keys
     """
-    ctx.invoke(qa_qc_keys)
+    ctx.invoke(_get_command('qa-qc', 'valid_config_keys'))
 
 
 if __name__ == '__main__':
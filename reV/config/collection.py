@@ -32,6 +32,7 @@ class CollectionConfig(AnalysisConfig):
         super().__init__(config)
 
         self._purge = False
+        self._max_workers = 1
         self._dsets = None
         self._file_prefixes = None
         self._ec = None
@@ -79,6 +80,21 @@ class CollectionConfig(AnalysisConfig):
         self._purge = self.get('purge_chunks', self._purge)
         return self._purge
 
+    @property
+    def max_workers(self):
+        """Get the number of workers used to collect datasets from the
+        chunked files. Taken from the execution_control block.
+
+        Returns
+        -------
+        max_workers : int | None
+            Number of parallel workers. Default is 1 which runs in serial,
+            None uses all available workers.
+        """
+        self._max_workers = self.execution_control.get('max_workers',
+                                                       self._max_workers)
+        return self._max_workers
+
     @property
     def dsets(self):
         """Get dset names to collect.
@@ -28,6 +28,7 @@ class MultiYearConfig(AnalysisConfig):
         """
         super().__init__(config)
         self._groups = None
+        self._max_workers = 1
 
     @property
     def my_file(self):
@@ -40,6 +41,21 @@ class MultiYearConfig(AnalysisConfig):
         my_file = os.path.join(self.dirout, self.name + ".h5")
         return my_file
 
+    @property
+    def max_workers(self):
+        """Get the number of workers used to compute the multi-year
+        statistics. Taken from the execution_control block.
+
+        Returns
+        -------
+        max_workers : int | None
+            Number of parallel workers. Default is 1 which runs in serial,
+            None uses all available workers.
+        """
+        self._max_workers = self.execution_control.get('max_workers',
+                                                       self._max_workers)
+        return self._max_workers
+
     @property
     def group_names(self):
         """
@@ -59,14 +75,16 @@ class MultiYearConfig(AnalysisConfig):
         Returns
         -------
         group_params : dict
-            Dictionary of group parameters: name, source_files, dsets
+            Dictionary of group parameters: name, source_files, dsets,
+            compute_stats
         """
         group_params = {}
         for name in self.group_names:
             group = self._groups[name]
             group_params[name] = {'group': group.name,
                                   'dsets': group.dsets,
-                                  'source_files': group.source_files}
+                                  'source_files': group.source_files,
+                                  'compute_stats': group.compute_stats}
 
         return group_params
 
@@ -77,7 +95,7 @@ class MultiYearGroup:
     """
     def __init__(self, name, out_dir, source_files="PIPELINE",
                  source_dir=None, source_prefix=None,
-                 dsets=('cf_mean',)):
+                 dsets=('cf_mean',), compute_stats=False):
         """
         Parameters
         ----------
@@ -95,6 +113,9 @@ class MultiYearGroup:
             File prefix to search for in source directory
         dsets : list | tuple
             List of datasets to collect
+        compute_stats : bool
+            Flag to also compute the multi-year mean and standard deviation
+            profiles for profile datasets.
         """
         self._name = name
         self._dirout = out_dir
@@ -102,6 +123,7 @@ class MultiYearGroup:
         self._source_dir = source_dir
         self._source_prefix = source_prefix
         self._dsets = SAMOutputRequest(dsets)
+        self._compute_stats = compute_stats
 
     @property
     def name(self):
@@ -161,6 +183,16 @@ class MultiYearGroup:
         """
         return self._dsets
 
+    @property
+    def compute_stats(self):
+        """
+        Returns
+        -------
+        _compute_stats : bool
+            Flag to compute multi-year mean and standard deviation profiles
+        """
+        return self._compute_stats
+
     @classmethod
     def factory(cls, out_dir, groups_dict):
         """
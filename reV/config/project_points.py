@@ -2,7 +2,6 @@
 """
 reV Project Points Configuration
 """
-import copy
 import logging
 from math import ceil
 import numpy as np
@@ -244,6 +243,8 @@ class ProjectPoints:
 
         # set protected attributes
         self._df = self._parse_points(points, res_file=res_file)
+        self._gid_index = None
+        self._configs = None
         self._sam_config_obj = self._parse_sam_config(sam_config)
         self._check_points_config_mapping()
         self._tech = str(tech)
@@ -265,18 +266,21 @@ class ProjectPoints:
             config section.
         config : dict
             Actual SAM input values in a single level dictionary with variable
-            names (keys) and values.
+            names (keys) and values. This is a shallow (copy-on-write) copy
+            of the shared SAM config: keys can be set or replaced for a
+            single site without affecting other sites, but nested values must
+            not be modified in place.
         """
 
-        site_bool = (self.df['gid'] == site)
-        try:
-            config_id = self.df.loc[site_bool, 'config'].values[0]
-        except KeyError:
+        i = self.gid_index.get(site, None)
+        if i is None:
             raise KeyError('Site {} not found in this instance of '
                            'ProjectPoints. Available sites include: {}'
                            .format(site, self.sites))
 
-        return config_id, copy.deepcopy(self.sam_configs[config_id])
+        config_id = self._configs[i]
+
+        return config_id, dict(self.sam_configs[config_id])
 
     def __repr__(self):
         msg = ("{} for sites {} through {}"
@@ -416,16 +420,34 @@ class ProjectPoints:
         ind : int
             Row index of gid in the project points dataframe.
         """
-        if gid not in self._df['gid'].values:
+        ind = self.gid_index.get(gid, None)
+        if ind is None:
             e = ('Requested resource gid {} is not present in the project '
                  'points dataframe. Cannot return row index.'.format(gid))
             logger.error(e)
             raise ConfigError(e)
 
-        ind = np.where(self._df['gid'] == gid)[0][0]
-
         return ind
 
+    @property
+    def gid_index(self):
+        """Get a hashed lookup of resource gid to row index (iloc) in the
+        project points dataframe. If a gid is duplicated, the first row is
+        used.
+
+        Returns
+        -------
+        _gid_index : dict
+            Dictionary mapping resource gids to row index locations.
+        """
+        if self._gid_index is None:
+            gids = self._df['gid'].values.tolist()
+            n = len(gids)
+            self._gid_index = dict(zip(gids[::-1], range(n - 1, -1, -1)))
+            self._configs = self._df['config'].values
+
+        return self._gid_index
+
     @property
     def df(self):
         """Get the project points dataframe property.
@@ -745,6 +767,8 @@ class ProjectPoints:
         df2_cols = [c for c in df2.columns if c not in self._df or c == key]
         self._df = pd.merge(self._df, df2[df2_cols], how='left', left_on='gid',
                             right_on=key, copy=False, validate='1:1')
+        self._gid_index = None
+        self._configs = None
 
     def get_sites_from_config(self, config):
         """Get a site list that corresponds to a config key.
@@ -310,3 +310,26 @@ class QaQcModule:
                             .format(min_area))
 
         return min_area
+
+    @property
+    def excl_cache_dir(self):
+        """Get the directory to cache the combined exclusion layer mask in
+        (None for no cache)."""
+        excl_cache_dir = self._config.get('excl_cache_dir', 'PIPELINE')
+
+        if excl_cache_dir == 'PIPELINE':
+            try:
+                excl_cache_dir = Pipeline.parse_previous(
+                    self._out_root, 'qa-qc', target='excl_cache_dir',
+                    target_module='supply-curve-aggregation')[0]
+            except KeyError:
+                excl_cache_dir = None
+                logger.debug('Could not parse excl_cache_dir from previous '
+                             'pipeline jobs, exclusions mask will not be '
+                             'cached.')
+            else:
+                logger.info('QA/QC using the following '
+                            'pipeline input for excl_cache_dir: {}'
+                            .format(excl_cache_dir))
+
+        return excl_cache_dir
@@ -202,6 +202,19 @@ class GenConfig(SAMAnalysisConfig):
 
         return self._curtailment
 
+    @property
+    def prefetch(self):
+        """Get the flag to load the resource for the next points control
+        split in the background while SAM runs the current split. Only
+        applies to serial runs (max_workers=1).
+
+        Returns
+        -------
+        prefetch : bool
+            Flag to prefetch the resource. Default is False.
+        """
+        return bool(self.get('prefetch', False))
+
     @property
     def resource_file(self):
         """
@@ -297,6 +310,18 @@ class EconConfig(SAMAnalysisConfig):
         """
         return bool(self.get('append', False))
 
+    @property
+    def vectorized_lcoe(self):
+        """Get the flag to compute lcoe_fcr for all sites in a vectorized
+        pass instead of running one PySAM object per site.
+
+        Returns
+        -------
+        vectorized_lcoe : bool
+            Flag to run the vectorized LCOE calculation. Default is False.
+        """
+        return bool(self.get('vectorized_lcoe', False))
+
     def parse_cf_files(self):
         """Get the capacity factor files (reV generation output data).
 
@@ -2,6 +2,7 @@
 """
 reV configuration framework for SAM config inputs.
 """
+import json
 import logging
 import os
 from warnings import warn
@@ -147,9 +148,41 @@ class SAMConfig(BaseConfig):
 
         return self._downscale[0]
 
+    @staticmethod
+    def filter_inputs(key, value):
+        """Perform any necessary filtering of input keys and values for PySAM.
+
+        Parameters
+        ----------
+        key : str
+            SAM input key.
+        value : str | int | float | list | np.ndarray
+            Input value associated with key.
+
+        Returns
+        -------
+        key : str
+            Filtered SAM input key.
+        value : str | int | float | list | np.ndarray
+            Filtered Input value associated with key.
+        """
+
+        if '.' in key:
+            key = key.replace('.', '_')
+
+        if ':constant' in key and 'adjust:' in key:
+            key = key.replace('adjust:', '')
+
+        if isinstance(value, str) and '[' in value and ']' in value:
+            value = json.loads(value)
+
+        return key, value
+
     @property
     def inputs(self):
-        """Get the SAM input file(s) (JSON) and return as a dictionary.
+        """Get the SAM input file(s) (JSON) and return as a dictionary. Input
+        keys and values are filtered for PySAM once when the configs are
+        loaded (see SAMConfig.filter_inputs).
 
         Parameters
         ----------
@@ -165,6 +198,8 @@ class SAMConfig(BaseConfig):
                 if fname.endswith('.json') is True:
                     if os.path.exists(fname):
                         config = safe_json_load(fname)
+                        config = dict(self.filter_inputs(k, v)
+                                      for k, v in config.items())
                         SAMInputsChecker.check(config)
                         self._inputs[key] = config
                     else:
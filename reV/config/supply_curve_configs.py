@@ -43,7 +43,10 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
         self._default_resolution = 64
         self._default_area_filter_kernel = 'queen'
         self._default_min_area = None
+        self._default_area_filter_mode = 'window'
         self._default_excl_dict = None
+        self._default_engine = 'point'
+        self._default_tm_engine = 'chunk'
 
         self._sc_agg_preflight()
 
@@ -208,6 +211,11 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
         """Get the minimum area filter minimum area in km2."""
         return self.get('min_area', self._default_min_area)
 
+    @property
+    def area_filter_mode(self):
+        """Get the minimum area filter mode ('window' or 'global')."""
+        return self.get('area_filter_mode', self._default_area_filter_mode)
+
     @property
     def friction_fpath(self):
         """Get the filepath to a friction surface h5 file
@@ -224,6 +232,35 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
         """Get the check_excl_layers flag."""
         return self.get('check_excl_layers', False)
 
+    @property
+    def excl_cache_dir(self):
+        """Get the directory to cache the combined exclusion layer mask in
+        (None for no cache)."""
+        return self.get('excl_cache_dir', None)
+
+    @property
+    def shared_dir(self):
+        """Get the scratch directory to share aggregation input arrays with
+        parallel workers through (None for no sharing)."""
+        return self.get('shared_dir', None)
+
+    @property
+    def engine(self):
+        """Get the aggregation engine name ('point' or 'band')."""
+        return self.get('engine', self._default_engine)
+
+    @property
+    def tm_engine(self):
+        """Get the tech mapping engine name ('chunk' or 'band') used if the
+        techmap dataset has to be created."""
+        return self.get('tm_engine', self._default_tm_engine)
+
+    @property
+    def tm_sc_resolution(self):
+        """Get the SC resolution to save the valid SC point index for next to
+        a newly created techmap. None uses the aggregation resolution."""
+        return self.get('tm_sc_resolution', None)
+
 
 class SupplyCurveConfig(AnalysisConfig):
     """SC config."""
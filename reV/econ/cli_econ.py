@@ -102,6 +102,7 @@ def from_config(ctx, config_file, verbose):
     ctx.obj['DIROUT'] = config.dirout
     ctx.obj['LOGDIR'] = config.logdir
     ctx.obj['APPEND'] = config.append
+    ctx.obj['VECTORIZED_LCOE'] = config.vectorized_lcoe
     ctx.obj['OUTPUT_REQUEST'] = config.output_request
     ctx.obj['SITES_PER_WORKER'] = config.execution_control.sites_per_worker
     ctx.obj['MAX_WORKERS'] = config.execution_control.max_workers
@@ -217,12 +218,15 @@ def submit_from_config(ctx, name, cf_file, year, config, verbose):
 @click.option('-ap', '--append', is_flag=True,
               help='Flag to append econ datasets to source cf_file. This has '
               'priority over fout and dirout inputs.')
+@click.option('-vl', '--vectorized_lcoe', is_flag=True,
+              help='Flag to compute lcoe_fcr for all sites in a vectorized '
+              'pass instead of running one PySAM object per site.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, sam_files, cf_file, year, points, site_data,
            sites_per_worker, fout, dirout, logdir, output_request,
-           append, verbose):
+           append, vectorized_lcoe, verbose):
     """Run reV gen directly w/o a config file."""
     ctx.ensure_object(dict)
     ctx.obj['POINTS'] = points
@@ -236,6 +240,7 @@ def direct(ctx, sam_files, cf_file, year, points, site_data,
     ctx.obj['LOGDIR'] = logdir
     ctx.obj['OUTPUT_REQUEST'] = output_request
     ctx.obj['APPEND'] = append
+    ctx.obj['VECTORIZED_LCOE'] = vectorized_lcoe
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
 
@@ -266,6 +271,7 @@ def local(ctx, max_workers, timeout, points_range, verbose):
     logdir = ctx.obj['LOGDIR']
     output_request = ctx.obj['OUTPUT_REQUEST']
     append = ctx.obj['APPEND']
+    vectorized_lcoe = ctx.obj['VECTORIZED_LCOE']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     if append:
@@ -300,7 +306,8 @@ def local(ctx, max_workers, timeout, points_range, verbose):
                  points_range=points_range,
                  fout=fout,
                  dirout=dirout,
-                 append=append)
+                 append=append,
+                 vectorized_lcoe=vectorized_lcoe)
 
     tmp_str = ' with points range {}'.format(points_range)
     runtime = (time.time() - t0) / 60
@@ -353,7 +360,7 @@ def get_node_cmd(name, sam_files, cf_file, year=None, site_data=None,
                  sites_per_worker=None, max_workers=None, timeout=1800,
                  fout='reV.h5', dirout='./out/econ_out',
                  logdir='./out/log_econ', output_request='lcoe_fcr',
-                 append=False, verbose=False):
+                 append=False, verbose=False, vectorized_lcoe=False):
     """Made a reV econ direct-local command line interface call string.
 
     Parameters
@@ -397,6 +404,9 @@ def get_node_cmd(name, sam_files, cf_file, year=None, site_data=None,
         over the fout and dirout inputs.
     verbose : bool
         Flag to turn on debug logging. Default is False.
+    vectorized_lcoe : bool
+        Flag to compute lcoe_fcr for all sites in a vectorized pass instead
+        of running one PySAM object per site.
 
     Returns
     -------
@@ -426,6 +436,9 @@ def get_node_cmd(name, sam_files, cf_file, year=None, site_data=None,
     if append:
         arg_direct.append('-ap')
 
+    if vectorized_lcoe:
+        arg_direct.append('-vl')
+
     arg_loc = ['-mw {}'.format(SLURM.s(max_workers)),
                '-to {}'.format(SLURM.s(timeout)),
                '-pr {}'.format(SLURM.s(points_range))]
@@ -484,6 +497,7 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, module, conda_env,
     logdir = ctx.obj['LOGDIR']
     output_request = ctx.obj['OUTPUT_REQUEST']
     append = ctx.obj['APPEND']
+    vectorized_lcoe = ctx.obj['VECTORIZED_LCOE']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize a logger on the year level
@@ -515,7 +529,7 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, module, conda_env,
                            fout=fout_node,
                            dirout=dirout, logdir=logdir,
                            output_request=output_request, append=append,
-                           verbose=verbose)
+                           verbose=verbose, vectorized_lcoe=vectorized_lcoe)
 
         status = Status.retrieve_job_status(dirout, 'econ', node_name,
                                             hardware='eagle',
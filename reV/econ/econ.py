@@ -406,7 +406,8 @@ class Econ(BaseGen):
                 max_workers=1, sites_per_worker=100,
                 pool_size=(os.cpu_count() * 2),
                 timeout=1800, points_range=None, fout=None,
-                dirout='./econ_out', append=False):
+                dirout='./econ_out', append=False, persistent_pool=False,
+                vectorized_lcoe=False):
         """Execute a parallel reV econ run with smart data flushing.
 
         Parameters
@@ -455,6 +456,15 @@ class Econ(BaseGen):
         append : bool
             Flag to append econ datasets to source cf_file. This has priority
             over the fout and dirout inputs.
+        persistent_pool : bool
+            Flag to run all points control splits on a single long-lived
+            process pool (workers are only spawned once per node) instead of
+            starting a new process pool for every pool_size splits.
+        vectorized_lcoe : bool
+            Flag to compute "lcoe_fcr" for all sites in a vectorized pass
+            over the cf_mean and site data arrays instead of running one
+            PySAM Lcoefcr object per site. Only used if the output request
+            maps to the SAM LCOE module.
 
         Returns
         -------
@@ -494,6 +504,9 @@ class Econ(BaseGen):
 
         try:
             kwargs['econ_fun'] = econ._fun
+            if vectorized_lcoe and econ._sam_module == SAM_LCOE:
+                kwargs['econ_fun'] = SAM_LCOE.reV_run_vectorized
+
             if max_workers == 1:
                 logger.debug('Running serial econ for: {}'.format(pc))
                 for pc_sub in pc:
@@ -503,6 +516,7 @@ class Econ(BaseGen):
                 logger.debug('Running parallel econ for: {}'.format(pc))
                 econ._parallel_run(max_workers=max_workers,
                                    pool_size=pool_size, timeout=timeout,
+                                   persistent_pool=persistent_pool,
                                    **kwargs)
 
         except Exception as e:
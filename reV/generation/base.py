@@ -3,13 +3,14 @@
 reV base gen and econ module.
 """
 from abc import ABC, abstractmethod
-from concurrent.futures import TimeoutError
+from concurrent.futures import FIRST_COMPLETED, wait
 import logging
 import pandas as pd
 import numpy as np
 import os
 import psutil
 import sys
+import time
 from warnings import warn
 
 from reV.config.project_points import ProjectPoints, PointsControl
@@ -58,7 +59,10 @@ class BaseGen(ABC):
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many site
             results will be stored in-memory at any given time before flushing
-            to disk.
+            to disk. Finished site results are also flushed early (in whole
+            output chunks) if the in-memory output arrays plus the results
+            held for later output chunks exceed this fraction of the total
+            node memory.
         """
 
         self._points_control = points_control
@@ -91,6 +95,9 @@ class BaseGen(ABC):
         # pre-initialize output arrays to store results when available.
         self._out = {}
         self._finished_sites = []
+        self._pending = {}
+        self._pending_bytes = 0
+        self._mem_total = None
         self._out_n_sites = 0
         self._out_chunk = ()
         self._check_sam_version_inputs()
@@ -184,6 +191,26 @@ class BaseGen(ABC):
 
         return self._site_mem
 
+    @property
+    def site_chunk(self):
+        """Get the site-axis chunk size of the h5 output datasets.
+
+        Returns
+        -------
+        site_chunk : int
+            Largest site-axis chunk size of the requested output datasets.
+            Early flushes are aligned to this chunk size so that every
+            chunk in the output file is only written once.
+        """
+        site_chunk = 1
+        for request in self.output_request:
+            tmp = request if request in self.OUT_ATTRS else 'other'
+            chunks = self.OUT_ATTRS.get(tmp, {}).get('chunks', None)
+            if chunks is not None and chunks[-1] is not None:
+                site_chunk = max(site_chunk, int(chunks[-1]))
+
+        return site_chunk
+
     @property
     def points_control(self):
         """Get project points controller.
@@ -377,24 +404,26 @@ class BaseGen(ABC):
         if isinstance(result, dict):
 
             # iterate through dict where sites are keys and values are
-            # corresponding results
+            # corresponding results. Results can arrive in any order and are
+            # placed in the output arrays by site index.
             for site_gid, site_output in result.items():
 
-                # check that the sites are stored sequentially then add to
-                # the finished site list
-                if self._finished_sites:
-                    if int(site_gid) < np.max(self._finished_sites):
-                        raise Exception('Site results are non sequential!')
+                # add site gid to the finished list after outputs are unpacked
+                if self.unpack_output(site_gid, site_output):
+                    self._finished_sites.append(site_gid)
 
-                # unpack site output object
-                self.unpack_output(site_gid, site_output)
+            self._advance_out_chunk()
 
-                # add site gid to the finished list after outputs are unpacked
-                self._finished_sites.append(site_gid)
+            # stream finished results to disk if the outputs held in memory
+            # exceed the memory limit
+            if self._out_mem_exceeded():
+                self.flush_finished()
 
         elif isinstance(result, type(None)):
             self._out.clear()
             self._finished_sites.clear()
+            self._pending.clear()
+            self._pending_bytes = 0
         else:
             raise TypeError('Did not recognize the type of output. '
                             'Tried to set output type "{}", but requires '
@@ -971,8 +1000,26 @@ class BaseGen(ABC):
             Resource-native site gid (index).
         site_output : dict
             SAM site output object.
+
+        Returns
+        -------
+        unpacked : bool
+            True if the site output was unpacked to the in-memory output
+            arrays. False if the site belongs to a later output chunk, in
+            which case it is held until that chunk is initialized.
         """
 
+        # get the index in the output array for the current site
+        i = self.site_index(site_gid, out_index=True)
+
+        # check to see if the site is beyond the current output chunk.
+        # If so, hold the output until the current chunk is finished.
+        if i + 1 > self._out_n_sites:
+            self._pending[site_gid] = site_output
+            self._pending_bytes += sum(np.asarray(v).nbytes
+                                       for v in site_output.values())
+            return False
+
         # iterate through the site results
         for var, value in site_output.items():
             if var not in self._out:
@@ -980,17 +1027,6 @@ class BaseGen(ABC):
                                'was not yet initialized in the output '
                                'dictionary.')
 
-            # get the index in the output array for the current site
-            i = self.site_index(site_gid, out_index=True)
-
-            # check to see if we have exceeded the current output chunk.
-            # If so, flush data to disk and reset the output initialization
-            if i + 1 > self._out_n_sites:
-                self.flush()
-                global_site_index = self.site_index(site_gid)
-                self._init_out_arrays(index_0=global_site_index)
-                i = self.site_index(site_gid, out_index=True)
-
             if isinstance(value, (list, tuple, np.ndarray)):
                 if not isinstance(value, np.ndarray):
                     value = np.array(value)
@@ -999,6 +1035,45 @@ class BaseGen(ABC):
             elif value != 0:
                 self._out[var][i] = value
 
+        return True
+
+    def _unpack_pending(self):
+        """Unpack held site outputs that belong to the current output chunk.
+        """
+        pending = self._pending
+        self._pending = {}
+        self._pending_bytes = 0
+        for site_gid, site_output in pending.items():
+            if self.unpack_output(site_gid, site_output):
+                self._finished_sites.append(site_gid)
+
+    def _out_mem_exceeded(self):
+        """Check if the output arrays and the results held for later output
+        chunks exceed the memory utilization limit.
+
+        Returns
+        -------
+        exceeded : bool
+            True if the outputs held in memory exceed mem_util_lim of the
+            total node memory.
+        """
+        if self._mem_total is None:
+            self._mem_total = psutil.virtual_memory().total
+
+        out_bytes = sum(arr.nbytes for arr in self._out.values())
+        out_bytes += self._pending_bytes
+
+        return out_bytes > self.mem_util_lim * self._mem_total
+
+    def _advance_out_chunk(self):
+        """Flush the in-memory outputs to disk and initialize the next output
+        chunk once every site in the current output chunk is finished."""
+        while (len(self._finished_sites) >= self._out_n_sites
+               and self.out_chunk[1] + 1 < len(self.project_points)):
+            self.flush()
+            self._init_out_arrays(index_0=self.out_chunk[1] + 1)
+            self._unpack_pending()
+
     def site_index(self, site_gid, out_index=False):
         """Get the index corresponding to the site gid.
 
@@ -1019,7 +1094,7 @@ class BaseGen(ABC):
         """
 
         # get the index for site_gid in the (global) project points site list.
-        global_site_index = self.project_points.sites.index(site_gid)
+        global_site_index = self.project_points.index(site_gid)
 
         if not out_index:
             output_index = global_site_index
@@ -1035,6 +1110,32 @@ class BaseGen(ABC):
 
         return output_index
 
+    def _write_h5(self, islice, n_sites=None):
+        """Write the in-memory output arrays to the output .h5 file.
+
+        Parameters
+        ----------
+        islice : slice
+            Global site index slice to write the output data to.
+        n_sites : int | None
+            Number of sites (from the start of the in-memory output arrays)
+            to write. None writes the full arrays.
+        """
+        # open output file in append mode to add output results to
+        with Outputs(self._fpath, mode='a') as f:
+
+            # iterate through all output requests writing each as a dataset
+            for dset, arr in self._out.items():
+                if n_sites is not None:
+                    arr = arr[..., :n_sites]
+
+                if len(arr.shape) == 1:
+                    # write array of scalars
+                    f[dset, islice] = arr
+                else:
+                    # write 2D array of profiles
+                    f[dset, :, islice] = arr
+
     def flush(self):
         """Flush the output data in self.out attribute to disk in .h5 format.
 
@@ -1051,20 +1152,58 @@ class BaseGen(ABC):
 
             # get the slice of indices to write outputs to
             islice = slice(self.out_chunk[0], self.out_chunk[1] + 1)
+            self._write_h5(islice)
 
-            # open output file in append mode to add output results to
-            with Outputs(self._fpath, mode='a') as f:
+            logger.debug('Flushed output successfully to disk.')
 
-                # iterate through all output requests writing each as a dataset
-                for dset, arr in self._out.items():
-                    if len(arr.shape) == 1:
-                        # write array of scalars
-                        f[dset, islice] = arr
-                    else:
-                        # write 2D array of profiles
-                        f[dset, :, islice] = arr
+    def flush_finished(self):
+        """Flush the finished site results to disk and free their memory.
 
-            logger.debug('Flushed output successfully to disk.')
+        Only whole site chunks of the output datasets (see site_chunk) are
+        written so that each h5 chunk is only written once. The in-memory
+        output arrays are re-initialized starting at the first site that was
+        not written, and any finished results for that partial chunk are
+        carried over. Data is not flushed if _fpath is None or if no site
+        chunk has been completed.
+        """
+        if not isinstance(self._fpath, str) or not self._finished_sites:
+            return
+
+        # only the contiguous block of finished sites can be written
+        done = np.zeros(self._out_n_sites, dtype=bool)
+        done[[self.site_index(gid, out_index=True)
+              for gid in self._finished_sites]] = True
+        n_done = self._out_n_sites if done.all() else int(np.argmin(done))
+        i_end = self.out_chunk[0] + n_done
+        if i_end < len(self.project_points):
+            i_end = (i_end // self.site_chunk) * self.site_chunk
+
+        n_flush = i_end - self.out_chunk[0]
+        if n_flush <= 0:
+            return
+
+        logger.info('In-memory outputs exceeded {:.1f}% of the node memory, '
+                    'flushing {} finished sites to disk, target file: "{}"'
+                    .format(100 * self.mem_util_lim, n_flush, self._fpath))
+        self._write_h5(slice(self.out_chunk[0], i_end), n_sites=n_flush)
+
+        carry = {k: v[..., n_flush:].copy() for k, v in self._out.items()}
+        finished = [gid for gid in self._finished_sites
+                    if self.site_index(gid) >= i_end]
+
+        if i_end < len(self.project_points):
+            self._init_out_arrays(index_0=i_end)
+            for k, v in carry.items():
+                self._out[k][..., :v.shape[-1]] = v
+
+            self._finished_sites = finished
+            self._unpack_pending()
+            self._advance_out_chunk()
+        else:
+            self._out.clear()
+            self._finished_sites.clear()
+
+        logger.debug('Flushed finished output successfully to disk.')
 
     def _pre_split_pc(self, pool_size=(os.cpu_count() * 2)):
         """Pre-split project control iterator into sub chunks to further
@@ -1102,8 +1241,176 @@ class BaseGen(ABC):
                      .format(len(pc_chunks), [len(x) for x in pc_chunks]))
         return N, pc_chunks
 
+    def _log_mem(self, i, N):
+        """Log the memory utilization during a parallel run.
+
+        Parameters
+        ----------
+        i : int
+            Current points control iteration.
+        N : int
+            Total number of points control iterations.
+        """
+        mem = psutil.virtual_memory()
+        m = ('Parallel run at iteration {0} out of {1}. '
+             'Memory utilization is {2:.3f} GB out of {3:.3f} GB '
+             'total ({4:.1f}% used, intended limit of {5:.1f}%)'
+             .format(i, N, mem.used / 1e9, mem.total / 1e9,
+                     100 * mem.used / mem.total,
+                     100 * self.mem_util_lim))
+        logger.info(m)
+
+    def _persistent_parallel_run(self, max_workers=None,
+                                 pool_size=(os.cpu_count() * 2),
+                                 timeout=1800, **kwargs):
+        """Execute parallel compute on a single long-lived process pool.
+
+        Workers are only spawned once per node and keep their imported
+        modules for the full run. Points control splits are queued to the
+        pool with at most pool_size splits in flight, and new splits are
+        submitted as results are collected. Splits that hit the timeout are
+        passed zeros and the pool is force shutdown the same way as in
+        _parallel_run(). A new pool is started for the remaining splits so
+        that a hung worker cannot block the run.
+
+        Resource handlers are not kept open between splits: each split still
+        opens its own resource file handlers in self.run(). Only the worker
+        processes and their imported modules persist.
+
+        Parameters
+        ----------
+        max_workers : None | int
+            Number of workers. None will default to cpu count.
+        pool_size : int
+            Maximum number of futures in flight at any given time.
+        timeout : int | float
+            Number of seconds to wait for parallel run iteration to complete
+            before returning zeros.
+        kwargs : dict
+            Keyword arguments to self.run().
+        """
+        N = len(self.points_control)
+        logger.debug('Running parallel execution on a persistent process '
+                     'pool with max_workers={} for {} points control '
+                     'iterations.'.format(max_workers, N))
+
+        i = 0
+        # PointsControl.__iter__ re-splits on every call, so use a one-shot
+        # generator that resumes where the last top-up stopped
+        splits = (pc for pc in self.points_control)
+        futures = {}
+        started = {}
+        loggers = [__name__, 'reV.gen', 'reV.econ', 'reV']
+        exe = SpawnProcessPool(max_workers=max_workers, loggers=loggers)
+        try:
+            while True:
+                # top up the in-flight splits
+                for pc in splits:
+                    futures[exe.submit(self.run, pc, **kwargs)] = pc
+                    if len(futures) >= pool_size:
+                        break
+
+                if not futures:
+                    break
+
+                i, failed = self._collect_completed(futures, i, N, timeout,
+                                                    started=started)
+
+                if failed:
+                    # splits still queued on the old pool are moved to the
+                    # new pool, running splits are left to finish or time out
+                    queued = [f for f in futures if f.cancel()]
+                    logger.info('Forcing pool shutdown after failed futures.')
+                    exe.shutdown(wait=False)
+                    logger.info('Forced pool shutdown complete. Starting a '
+                                'new process pool for the remaining points '
+                                'control iterations.')
+                    exe = SpawnProcessPool(max_workers=max_workers,
+                                           loggers=loggers)
+                    for future in queued:
+                        pc = futures.pop(future)
+                        futures[exe.submit(self.run, pc, **kwargs)] = pc
+
+        except Exception:
+            exe.shutdown(wait=False)
+            raise
+
+        exe.shutdown(wait=True)
+        self.flush()
+
+    def _collect_completed(self, futures, i, N, timeout=1800, started=None):
+        """Collect results from futures in the order that they complete.
+
+        Each future is timed from when the pool first reports it as running,
+        so futures still queued behind a slow split are never failed. Only
+        the futures that individually exceed the timeout are passed zeros,
+        the remaining futures are left in the futures dict to keep waiting.
+
+        Parameters
+        ----------
+        futures : dict
+            In-flight futures mapped to their points control split. Collected
+            futures are removed from this dict in-place.
+        i : int
+            Number of points control iterations collected so far.
+        N : int
+            Total number of points control iterations.
+        timeout : int | float
+            Number of seconds a single future may run before it is
+            considered failed and zeros are passed for its sites.
+        started : dict | None
+            Futures mapped to the time they were first seen running. This is
+            updated in-place so that a future's run time is tracked across
+            calls. None will only track run time within this call.
+
+        Returns
+        -------
+        i : int
+            Updated number of points control iterations collected.
+        failed : bool
+            Flag for whether any future hit the timeout.
+        """
+        if started is None:
+            started = {}
+
+        while True:
+            now = time.time()
+            for future in futures:
+                if future not in started and future.running():
+                    started[future] = now
+
+            # poll at least every second to start the clock on queued futures
+            deadline = min((started[f] + timeout for f in futures
+                            if f in started), default=now + timeout)
+            wait_time = max(0, min(deadline - now, 1))
+            done, not_done = wait(futures, timeout=wait_time,
+                                  return_when=FIRST_COMPLETED)
+
+            now = time.time()
+            expired = [f for f in not_done
+                       if f in started and now - started[f] >= timeout]
+            if done or expired:
+                break
+
+        for future in list(done) + expired:
+            i += 1
+            pc = futures.pop(future)
+            started.pop(future, None)
+            if future in done:
+                result = future.result()
+            else:
+                sites = pc.project_points.sites
+                result = self._handle_failed_future(future, i, sites,
+                                                    timeout)
+
+            self.out = result
+            del result
+            self._log_mem(i, N)
+
+        return i, bool(expired)
+
     def _parallel_run(self, max_workers=None, pool_size=(os.cpu_count() * 2),
-                      timeout=1800, **kwargs):
+                      timeout=1800, persistent_pool=False, **kwargs):
         """Execute parallel compute.
 
         Parameters
@@ -1116,10 +1423,20 @@ class BaseGen(ABC):
         timeout : int | float
             Number of seconds to wait for parallel run iteration to complete
             before returning zeros.
+        persistent_pool : bool
+            Flag to run all points control splits on a single long-lived
+            process pool instead of starting a new process pool for every
+            pool_size splits.
         kwargs : dict
             Keyword arguments to self.run().
         """
 
+        if persistent_pool:
+            self._persistent_parallel_run(max_workers=max_workers,
+                                          pool_size=pool_size,
+                                          timeout=timeout, **kwargs)
+            return
+
         logger.debug('Running parallel execution with max_workers={}'
                      .format(max_workers))
         i = 0
@@ -1130,36 +1447,18 @@ class BaseGen(ABC):
                          .format(j + 1, len(pc_chunks)))
 
             failed_futures = False
-            chunks = {}
-            futures = []
             loggers = [__name__, 'reV.gen', 'reV.econ', 'reV']
             with SpawnProcessPool(max_workers=max_workers,
                                   loggers=loggers) as exe:
-                for pc in pc_chunk:
-                    future = exe.submit(self.run, pc, **kwargs)
-                    futures.append(future)
-                    chunks[future] = pc
-
-                for future in futures:
-                    i += 1
-                    try:
-                        result = future.result(timeout=timeout)
-                    except TimeoutError:
-                        failed_futures = True
-                        sites = chunks[future].project_points.sites
-                        result = self._handle_failed_future(future, i, sites,
-                                                            timeout)
-
-                    self.out = result
-
-                    mem = psutil.virtual_memory()
-                    m = ('Parallel run at iteration {0} out of {1}. '
-                         'Memory utilization is {2:.3f} GB out of {3:.3f} GB '
-                         'total ({4:.1f}% used, intended limit of {5:.1f}%)'
-                         .format(i, N, mem.used / 1e9, mem.total / 1e9,
-                                 100 * mem.used / mem.total,
-                                 100 * self.mem_util_lim))
-                    logger.info(m)
+                futures = {exe.submit(self.run, pc, **kwargs): pc
+                           for pc in pc_chunk}
+                started = {}
+
+                while futures:
+                    i, failed = self._collect_completed(futures, i, N,
+                                                        timeout=timeout,
+                                                        started=started)
+                    failed_futures |= failed
 
                 if failed_futures:
                     logger.info('Forcing pool shutdown after failed futures.')
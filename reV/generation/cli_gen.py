@@ -110,6 +110,7 @@ def from_config(ctx, config_file, verbose):
     ctx.obj['MAX_WORKERS'] = config.execution_control.max_workers
     ctx.obj['MEM_UTIL_LIM'] = \
         config.execution_control.memory_utilization_limit
+    ctx.obj['PREFETCH'] = config.prefetch
 
     ctx.obj['CURTAILMENT'] = None
     if config.curtailment is not None:
@@ -271,13 +272,17 @@ def make_fout(name, year):
               default=None,
               help=('JSON file with curtailment inputs parameters. '
                     'Default is None (no curtailment).'))
+@click.option('-pf', '--prefetch', is_flag=True,
+              help='Flag to load the resource for the next points control '
+              'split in the background while SAM runs the current split. '
+              'Only applies to serial runs (max_workers=1).')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, tech, sam_files, res_file, points, lat_lon_fpath,
            lat_lon_coords, regions, region, region_col, sites_per_worker,
            fout, dirout, logdir, output_request, site_data, mem_util_lim,
-           curtailment, verbose):
+           curtailment, prefetch, verbose):
     """Run reV gen directly w/o a config file."""
     ctx.obj['TECH'] = tech
     ctx.obj['POINTS'] = points
@@ -291,6 +296,7 @@ def direct(ctx, tech, sam_files, res_file, points, lat_lon_fpath,
     ctx.obj['SITE_DATA'] = site_data
     ctx.obj['MEM_UTIL_LIM'] = mem_util_lim
     ctx.obj['CURTAILMENT'] = curtailment
+    ctx.obj['PREFETCH'] = prefetch
 
     ctx.obj['LAT_LON_FPATH'] = lat_lon_fpath
     ctx.obj['LAT_LON_COORDS'] = lat_lon_coords
@@ -390,6 +396,7 @@ def local(ctx, max_workers, timeout, points_range, verbose):
     site_data = ctx.obj['SITE_DATA']
     mem_util_lim = ctx.obj['MEM_UTIL_LIM']
     curtailment = ctx.obj['CURTAILMENT']
+    prefetch = ctx.obj['PREFETCH']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize loggers for multiple modules
@@ -423,7 +430,8 @@ def local(ctx, max_workers, timeout, points_range, verbose):
                 fout=fout,
                 dirout=dirout,
                 mem_util_lim=mem_util_lim,
-                timeout=timeout)
+                timeout=timeout,
+                prefetch=prefetch)
 
     tmp_str = ' with points range {}'.format(points_range)
     runtime = (time.time() - t0) / 60
@@ -531,7 +539,7 @@ def get_node_cmd(name, tech, sam_files, res_file, points=slice(0, 100),
                  fout='reV.h5', dirout='./out/gen_out',
                  logdir='./out/log_gen', output_request=('cf_mean',),
                  site_data=None, mem_util_lim=0.4, timeout=1800,
-                 curtailment=None, verbose=False):
+                 curtailment=None, prefetch=False, verbose=False):
     """Make a reV geneneration direct-local CLI call string.
 
     Parameters
@@ -577,6 +585,9 @@ def get_node_cmd(name, tech, sam_files, res_file, points=slice(0, 100),
     curtailment : NoneType | str
         Pointer to a file containing curtailment input parameters or None if
         no curtailment.
+    prefetch : bool
+        Flag to prefetch the resource for the next points control split
+        during serial runs.
     verbose : bool
         Flag to turn on debug logging. Default is False.
 
@@ -610,6 +621,9 @@ def get_node_cmd(name, tech, sam_files, res_file, points=slice(0, 100),
     if curtailment:
         arg_direct.append('-curt {}'.format(SLURM.s(curtailment)))
 
+    if prefetch:
+        arg_direct.append('-pf')
+
     # make a cli arg string for local() in this module
     arg_loc = ['-mw {}'.format(SLURM.s(max_workers)),
                '-to {}'.format(SLURM.s(timeout)),
@@ -670,6 +684,7 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, conda_env, module,
     mem_util_lim = ctx.obj['MEM_UTIL_LIM']
     timeout = ctx.obj['TIMEOUT']
     curtailment = ctx.obj['CURTAILMENT']
+    prefetch = ctx.obj['PREFETCH']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize a logger on the year level
@@ -696,7 +711,7 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, conda_env, module,
                            output_request=output_request,
                            site_data=site_data,
                            mem_util_lim=mem_util_lim, timeout=timeout,
-                           curtailment=curtailment,
+                           curtailment=curtailment, prefetch=prefetch,
                            verbose=verbose)
 
         status = Status.retrieve_job_status(dirout, 'generation', node_name,
@@ -6,6 +6,8 @@ import logging
 import numpy as np
 import os
 import pprint
+import psutil
+import time
 
 from reV.generation.base import BaseGen
 from reV.utilities.exceptions import ProjectPointsValueError
@@ -15,6 +17,7 @@ from reV.SAM.generation import (Pvwattsv5, Pvwattsv7, TcsMoltenSalt, WindPower,
 
 from rex.resource import Resource
 from rex.multi_file_resource import MultiFileResource
+from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.utilities import check_res_file
 
 logger = logging.getLogger(__name__)
@@ -376,7 +379,7 @@ class Gen(BaseGen):
 
     @staticmethod
     def run(points_control, tech=None, res_file=None, output_request=None,
-            scale_outputs=True):
+            scale_outputs=True, reuse_pysam=False, resources=None):
         """Run a SAM generation analysis based on the points_control iterator.
 
         Parameters
@@ -394,6 +397,12 @@ class Gen(BaseGen):
             Output variables requested from SAM.
         scale_outputs : bool
             Flag to scale outputs in-place immediately upon Gen returning data.
+        reuse_pysam : bool
+            Flag to re-use a single PySAM object per SAM config for all sites
+            on this worker instead of initializing a new object per site.
+        resources : rex.sam_resource.SAMResource | None
+            Optional resource object for this split that was already loaded
+            with Gen.get_resources(). None will load the resource on the fly.
 
         Returns
         -------
@@ -409,7 +418,9 @@ class Gen(BaseGen):
         # run generation method for specified technology
         try:
             out = Gen.OPTIONS[tech].reV_run(points_control, res_file, site_df,
-                                            output_request=output_request)
+                                            output_request=output_request,
+                                            reuse_pysam=reuse_pysam,
+                                            resources=resources)
         except Exception as e:
             out = {}
             logger.exception('Worker failed for PC: {}'.format(points_control))
@@ -441,6 +452,114 @@ class Gen(BaseGen):
 
         return out
 
+    @staticmethod
+    def get_resources(points_control, tech=None, res_file=None,
+                      output_request=None):
+        """Load the SAM resource for a single points control split.
+
+        Parameters
+        ----------
+        points_control : reV.config.PointsControl
+            A PointsControl instance dictating what sites and configs are run.
+        tech : str
+            SAM technology to analyze (pvwattsv7, windpower, tcsmoltensalt,
+            solarwaterheat, troughphysicalheat, lineardirectsteam)
+            The string should be lower-cased with spaces and _ removed.
+        res_file : str
+            Filepath to single resource file, multi-h5 directory,
+            or /h5_dir/prefix*suffix
+        output_request : list | tuple
+            Output variables requested from SAM.
+
+        Returns
+        -------
+        resources : rex.sam_resource.SAMResource
+            Preloaded (and curtailed) resource iterator object to pass to
+            Gen.run().
+        """
+        return Gen.OPTIONS[tech].get_resources(points_control, res_file,
+                                               output_request=output_request)
+
+    def _serial_run(self, prefetch=False, **kwargs):
+        """Execute serial compute, loading the resource for the next points
+        control split in the background while the current split runs.
+
+        h5py and PySAM both hold the GIL, so the resource is prefetched on a
+        single spawned process rather than a thread. At most one split is
+        prefetched, and only while memory utilization is below
+        mem_util_lim; otherwise the next split is loaded after the current
+        one finishes.
+
+        Parameters
+        ----------
+        prefetch : bool
+            Flag to prefetch the resource for the next split in the
+            background. False loads each split's resource in series.
+        kwargs : dict
+            Keyword arguments to self.run().
+        """
+        res_kwargs = {k: kwargs[k]
+                      for k in ('tech', 'res_file', 'output_request')}
+        N = len(self.points_control)
+        prefetch = prefetch and N > 1
+        logger.debug('Running serial execution for {} points control '
+                     'iterations with resource prefetching={}'
+                     .format(N, prefetch))
+
+        exe = future = None
+        if prefetch:
+            loggers = [__name__, 'reV.gen', 'reV']
+            exe = SpawnProcessPool(max_workers=1, loggers=loggers)
+
+        try:
+            i = 0
+            splits = iter(self.points_control)
+            pc = next(splits, None)
+            t_io_tot = t_run_tot = 0
+            while pc is not None:
+                i += 1
+                t0 = time.time()
+                if future is not None:
+                    resources = future.result()
+                else:
+                    resources = self.get_resources(pc, **res_kwargs)
+
+                t_io = time.time() - t0
+
+                pc_next = next(splits, None)
+                future = None
+                if exe is not None and pc_next is not None:
+                    mem = psutil.virtual_memory()
+                    if mem.used / mem.total < self.mem_util_lim:
+                        future = exe.submit(self.get_resources, pc_next,
+                                            **res_kwargs)
+
+                t0 = time.time()
+                self.out = self.run(pc, resources=resources, **kwargs)
+                t_run = time.time() - t0
+                del resources
+
+                t_io_tot += t_io
+                t_run_tot += t_run
+                logger.debug('Points control iteration {} out of {}: waited '
+                             '{:.2f} seconds for resource I/O and ran SAM '
+                             'for {:.2f} seconds (next split prefetched: {})'
+                             .format(i, N, t_io, t_run,
+                                     future is not None))
+                pc = pc_next
+
+        finally:
+            if future is not None:
+                future.cancel()
+            if exe is not None:
+                exe.shutdown(wait=False)
+
+        logger.info('Serial generation waited {:.2f} seconds on resource I/O '
+                    'and ran SAM for {:.2f} seconds over {} points control '
+                    'iterations.'.format(t_io_tot, t_run_tot, N))
+
+        self.flush()
+
     def _parse_output_request(self, req):
         """Set the output variables requested from generation.
 
@@ -472,7 +591,8 @@ class Gen(BaseGen):
                 max_workers=1, sites_per_worker=None,
                 pool_size=(os.cpu_count() * 2), timeout=1800,
                 points_range=None, fout=None,
-                dirout='./gen_out', mem_util_lim=0.4, scale_outputs=True):
+                dirout='./gen_out', mem_util_lim=0.4, scale_outputs=True,
+                reuse_pysam=False, persistent_pool=False, prefetch=False):
         """Execute a parallel reV generation run with smart data flushing.
 
         Parameters
@@ -533,6 +653,19 @@ class Gen(BaseGen):
             site results are stored in memory at any given time.
         scale_outputs : bool
             Flag to scale outputs in-place immediately upon Gen returning data.
+        reuse_pysam : bool
+            Flag to initialize a single PySAM object per SAM config on each
+            worker and re-use it for all sites. Site-agnostic inputs are only
+            assigned once and only the resource data and site-specific inputs
+            are updated for each site.
+        persistent_pool : bool
+            Flag to run all points control splits on a single long-lived
+            process pool (workers are only spawned once per node) instead of
+            starting a new process pool for every pool_size splits.
+        prefetch : bool
+            Flag to load the resource for the next points control split in
+            the background while SAM runs the current split. Only applies to
+            serial runs (max_workers=1). Default is False.
 
         Returns
         -------
@@ -553,7 +686,8 @@ class Gen(BaseGen):
         kwargs = {'tech': gen.tech,
                   'res_file': gen.res_file,
                   'output_request': gen.output_request,
-                  'scale_outputs': scale_outputs}
+                  'scale_outputs': scale_outputs,
+                  'reuse_pysam': reuse_pysam}
 
         logger.info('Running reV generation for: {}'.format(pc))
         logger.debug('The following project points were specified: "{}"'
@@ -567,14 +701,12 @@ class Gen(BaseGen):
         try:
             if max_workers == 1:
                 logger.debug('Running serial generation for: {}'.format(pc))
-                for pc_sub in pc:
-                    gen.out = gen.run(pc_sub, **kwargs)
-
-                gen.flush()
+                gen._serial_run(prefetch=prefetch, **kwargs)
             else:
                 logger.debug('Running parallel generation for: {}'.format(pc))
                 gen._parallel_run(max_workers=max_workers, pool_size=pool_size,
-                                  timeout=timeout, **kwargs)
+                                  timeout=timeout,
+                                  persistent_pool=persistent_pool, **kwargs)
 
         except Exception as e:
             logger.exception('reV generation failed!')
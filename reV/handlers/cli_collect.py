@@ -90,6 +90,7 @@ def from_config(ctx, config_file, verbose):
     ctx.obj['DSETS'] = config.dsets
     ctx.obj['PROJECT_POINTS'] = config.project_points
     ctx.obj['PURGE_CHUNKS'] = config.purge_chunks
+    ctx.obj['MAX_WORKERS'] = config.max_workers
     ctx.obj['VERBOSE'] = verbose
 
     for file_prefix in config.file_prefixes:
@@ -134,13 +135,16 @@ def from_config(ctx, config_file, verbose):
               help='File prefix found in the h5 file names to be collected.')
 @click.option('--log_dir', '-ld', type=STR, default='./logs',
               help='Directory to put log files.')
+@click.option('--max_workers', '-mw', type=INT, default=1,
+              help='Number of parallel workers used to collect each dataset. '
+              'Default is 1 (serial), None uses all available workers.')
 @click.option('-p', '--purge_chunks', is_flag=True,
               help='Flag to delete chunked files after collection.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
 @click.pass_context
 def direct(ctx, h5_file, h5_dir, project_points, dsets, file_prefix,
-           log_dir, purge_chunks, verbose):
+           log_dir, max_workers, purge_chunks, verbose):
     """Main entry point for collection with context passing."""
     ctx.obj['H5_FILE'] = h5_file
     ctx.obj['H5_DIR'] = h5_dir
@@ -149,6 +153,7 @@ def direct(ctx, h5_file, h5_dir, project_points, dsets, file_prefix,
     ctx.obj['FILE_PREFIX'] = file_prefix
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['PURGE_CHUNKS'] = purge_chunks
+    ctx.obj['MAX_WORKERS'] = max_workers
     ctx.obj['VERBOSE'] = verbose
 
 
@@ -167,6 +172,7 @@ def collect(ctx, verbose):
     file_prefix = ctx.obj['FILE_PREFIX']
     log_dir = ctx.obj['LOG_DIR']
     purge_chunks = ctx.obj['PURGE_CHUNKS']
+    max_workers = ctx.obj['MAX_WORKERS']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize loggers for multiple modules
@@ -183,12 +189,13 @@ def collect(ctx, verbose):
     t0 = time.time()
 
     Collector.collect(h5_file, h5_dir, project_points, dsets[0],
-                      file_prefix=file_prefix)
+                      file_prefix=file_prefix, max_workers=max_workers)
 
     if len(dsets) > 1:
         for dset_name in dsets[1:]:
             Collector.add_dataset(h5_file, h5_dir, dset_name,
-                                  file_prefix=file_prefix)
+                                  file_prefix=file_prefix,
+                                  max_workers=max_workers)
 
     if purge_chunks:
         Collector.purge_chunks(h5_file, h5_dir, project_points,
@@ -209,7 +216,7 @@ def collect(ctx, verbose):
 
 
 def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
-                 file_prefix=None, log_dir='./logs/',
+                 file_prefix=None, log_dir='./logs/', max_workers=1,
                  purge_chunks=False, verbose=False):
     """Make a reV collection local CLI call string.
 
@@ -230,6 +237,9 @@ def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
         .h5 file prefix, if None collect all files on h5_dir
     log_dir : str
         Log directory.
+    max_workers : int | None
+        Number of parallel workers used to collect each dataset. 1 runs in
+        serial, None uses all available workers.
     purge_chunks : bool
         Flag to delete the chunked files after collection.
     verbose : bool
@@ -249,6 +259,7 @@ def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
             '-ds {}'.format(SLURM.s(dsets)),
             '-fp {}'.format(SLURM.s(file_prefix)),
             '-ld {}'.format(SLURM.s(log_dir)),
+            '-mw {}'.format(SLURM.s(max_workers)),
             ]
 
     if purge_chunks:
@@ -297,6 +308,7 @@ def collect_slurm(ctx, alloc, memory, walltime, feature, conda_env, module,
     dsets = ctx.obj['DSETS']
     file_prefix = ctx.obj['FILE_PREFIX']
     purge_chunks = ctx.obj['PURGE_CHUNKS']
+    max_workers = ctx.obj['MAX_WORKERS']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
@@ -306,7 +318,8 @@ def collect_slurm(ctx, alloc, memory, walltime, feature, conda_env, module,
 
     cmd = get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
                        file_prefix=file_prefix, log_dir=log_dir,
-                       purge_chunks=purge_chunks, verbose=verbose)
+                       max_workers=max_workers, purge_chunks=purge_chunks,
+                       verbose=verbose)
 
     status = Status.retrieve_job_status(os.path.dirname(h5_file), 'collect',
                                         name, hardware='eagle',
@@ -80,6 +80,7 @@ def from_config(ctx, config_file, verbose):
     logger.info('Target logging directory: "{}"'.format(config.logdir))
 
     ctx.obj['MY_FILE'] = config.my_file
+    ctx.obj['MAX_WORKERS'] = config.max_workers
     if config.execution_control.option == 'local':
 
         ctx.obj['NAME'] = name
@@ -110,12 +111,17 @@ def from_config(ctx, config_file, verbose):
 @main.group()
 @click.option('--my_file', '-f', required=True, type=click.Path(),
               help='h5 file to use for multi-year collection.')
+@click.option('--max_workers', '-mw', type=INT, default=1,
+              help='Number of parallel workers used to compute multi-year '
+              'statistics. Default is 1 (serial), None uses all available '
+              'workers.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
 @click.pass_context
-def direct(ctx, my_file, verbose):
+def direct(ctx, my_file, max_workers, verbose):
     """Main entry point for collection with context passing."""
     ctx.obj['MY_FILE'] = my_file
+    ctx.obj['MAX_WORKERS'] = max_workers
     ctx.obj['VERBOSE'] = verbose
 
 
@@ -128,14 +134,18 @@ def direct(ctx, my_file, verbose):
 @click.option('--dsets', '-ds', required=True, type=STRLIST,
               help=('Dataset names to be collected. If means, multi-year '
                     'means will be computed.'))
+@click.option('-cs', '--compute_stats', is_flag=True,
+              help=('Flag to also compute multi-year mean and standard '
+                    'deviation profiles for profile datasets.'))
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
 @click.pass_context
-def multi_year(ctx, group, source_files, dsets, verbose):
+def multi_year(ctx, group, source_files, dsets, compute_stats, verbose):
     """Run multi year collection and means on local worker."""
 
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
+    max_workers = ctx.obj['MAX_WORKERS']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize loggers for multiple modules
@@ -155,10 +165,12 @@ def multi_year(ctx, group, source_files, dsets, verbose):
     for dset in dsets:
         if MultiYear.is_profile(source_files, dset):
             MultiYear.collect_profiles(my_file, source_files, dset,
-                                       group=group)
+                                       group=group,
+                                       compute_stats=compute_stats,
+                                       max_workers=max_workers)
         else:
             MultiYear.collect_means(my_file, source_files, dset,
-                                    group=group)
+                                    group=group, max_workers=max_workers)
 
     runtime = (time.time() - t0) / 60
     logger.info('Multi-year collection completed in: {:.2f} min.'
@@ -185,6 +197,7 @@ def multi_year_groups(ctx, group_params, verbose):
     """Run multi year collection and means for multiple groups."""
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
+    max_workers = ctx.obj['MAX_WORKERS']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize loggers for multiple modules
@@ -207,11 +220,15 @@ def multi_year_groups(ctx, group_params, verbose):
         t0 = time.time()
         for dset in group['dsets']:
             if MultiYear.is_profile(group['source_files'], dset):
-                MultiYear.collect_profiles(my_file, group['source_files'],
-                                           dset, group=group['group'])
+                MultiYear.collect_profiles(
+                    my_file, group['source_files'], dset,
+                    group=group['group'],
+                    compute_stats=group.get('compute_stats', False),
+                    max_workers=max_workers)
             else:
                 MultiYear.collect_means(my_file, group['source_files'],
-                                        dset, group=group['group'])
+                                        dset, group=group['group'],
+                                        max_workers=max_workers)
 
         runtime = (time.time() - t0) / 60
         logger.info('- {} collection completed in: {:.2f} min.'
@@ -230,7 +247,8 @@ def multi_year_groups(ctx, group_params, verbose):
                          status)
 
 
-def get_slurm_cmd(name, my_file, group_params, verbose=False):
+def get_slurm_cmd(name, my_file, group_params, max_workers=1,
+                  verbose=False):
     """Make a reV multi-year collection local CLI call string.
 
     Parameters
@@ -241,6 +259,9 @@ def get_slurm_cmd(name, my_file, group_params, verbose=False):
         Path to .h5 file to use for multi-year collection.
     group_params : list
         List of groups and their parameters to collect
+    max_workers : int | None
+        Number of parallel workers used to compute multi-year statistics.
+        1 runs in serial, None uses all available workers.
     verbose : bool
         Flag to turn on DEBUG logging
 
@@ -256,7 +277,8 @@ def get_slurm_cmd(name, my_file, group_params, verbose=False):
     if verbose:
         main_args.append('-v')
 
-    direct_args = '-f {}'.format(SLURM.s(my_file))
+    direct_args = '-f {} -mw {}'.format(SLURM.s(my_file),
+                                        SLURM.s(max_workers))
 
     collect_args = '-gp {}'.format(SLURM.s(group_params))
 
@@ -301,6 +323,7 @@ def multi_year_slurm(ctx, alloc, walltime, feature, memory, conda_env,
 
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
+    max_workers = ctx.obj['MAX_WORKERS']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
@@ -324,7 +347,8 @@ def multi_year_slurm(ctx, alloc, walltime, feature, memory, conda_env,
                     ' name "{}", collecting into "{}".'
                     .format(name, my_file))
         # create and submit the SLURM job
-        slurm_cmd = get_slurm_cmd(name, my_file, group_params, verbose=verbose)
+        slurm_cmd = get_slurm_cmd(name, my_file, group_params,
+                                  max_workers=max_workers, verbose=verbose)
         out = slurm_manager.sbatch(slurm_cmd, alloc=alloc, memory=memory,
                                    walltime=walltime, feature=feature,
                                    name=name, stdout_path=stdout_path,
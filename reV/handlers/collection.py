@@ -2,6 +2,7 @@
 """
 Base class to handle collection of profiles and means across multiple .h5 files
 """
+from concurrent.futures import wait, FIRST_COMPLETED
 import logging
 import numpy as np
 import os
@@ -17,6 +18,7 @@ from reV.utilities.exceptions import (CollectionRuntimeError,
                                       CollectionValueError,
                                       CollectionWarning)
 
+from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.loggers import log_mem
 
 logger = logging.getLogger(__name__)
@@ -28,7 +30,7 @@ class DatasetCollector:
     output file.
     """
     def __init__(self, h5_file, source_files, gids, dset_in, dset_out=None,
-                 mem_util_lim=0.7):
+                 mem_util_lim=0.7, max_workers=1):
         """
         Parameters
         ----------
@@ -45,10 +47,17 @@ class DatasetCollector:
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many sites
             will be collected at a time.
+        max_workers : int | None
+            Number of parallel source file readers feeding the single output
+            writer. 1 will run serial, None will use all available. The
+            memory limit is split between the readers.
         """
         self._h5_file = h5_file
         self._source_files = source_files
         self._gids = gids
+        self._max_workers = max_workers
+        self._bytes_copied = 0
+        self._bytes_written = 0
 
         self._dset_in = dset_in
         if dset_out is None:
@@ -57,6 +66,8 @@ class DatasetCollector:
 
         tot_mem = psutil.virtual_memory().total
         self._mem_avail = mem_util_lim * tot_mem
+        if max_workers != 1:
+            self._mem_avail /= (max_workers or os.cpu_count())
         self._attrs, self._axis, self._site_mem_req = self._pre_collect()
 
         logger.debug('Available memory for collection is {} bytes'
@@ -233,9 +244,10 @@ class DatasetCollector:
 
         return all_source_gids, source_gid_chunks
 
-    def _collect_chunk(self, all_source_gids, source_gids, f_out,
-                       f_source, fp_source):
-        """Collect one set of source gids from f_source to f_out.
+    @classmethod
+    def _read_chunk(cls, all_source_gids, source_gids, gids_out, f_source,
+                    fp_source, dset_in, axis):
+        """Read one set of source gids from f_source.
 
         Parameters
         ----------
@@ -243,38 +255,130 @@ class DatasetCollector:
             List of all source gids to be collected
         source_gids : np.ndarray | list
             Source gids to be collected
-        f_out : reV.handlers.outputs.Output
-            Output file handler
+        gids_out : list
+            List of resource GIDS in the final output meta data f_out
         f_source : reV.handlers.outputs.Output
             Source file handler
         fp_source : str
             Source filepath
+        dset_in : str
+            Dataset to collect
+        axis : int
+            Axis size (1 is 1D array, 2 is 2D array)
+
+        Returns
+        -------
+        out_slice : slice | np.ndarray
+            Slice in the final output file to write data to.
+        data : np.ndarray
+            Source data for the output slice.
         """
-        out_slice = self._get_gid_slice(self._gids, source_gids,
-                                        os.path.basename(fp_source))
+        out_slice = cls._get_gid_slice(gids_out, source_gids,
+                                       os.path.basename(fp_source))
 
         source_i0 = np.where(all_source_gids == np.min(source_gids))[0][0]
         source_i1 = np.where(all_source_gids == np.max(source_gids))[0][0]
         source_slice = slice(source_i0, source_i1 + 1)
-        source_indexer = np.isin(source_gids, self._gids)
+        source_indexer = np.isin(source_gids, gids_out)
 
         logger.debug('\t- Running low mem collection of "{}" for '
                      'output site {} from source site {} and file : {}'
-                     .format(self._dset_in, out_slice, source_slice,
+                     .format(dset_in, out_slice, source_slice,
                              os.path.basename(fp_source)))
 
+        if axis == 1:
+            data = f_source[dset_in, source_slice]
+            if not all(source_indexer):
+                data = data[source_indexer]
+
+        elif axis == 2:
+            data = f_source[dset_in, :, source_slice]
+            if not all(source_indexer):
+                data = data[:, source_indexer]
+
+        return out_slice, data
+
+    @classmethod
+    def _read_source_file(cls, fp_source, source_gids, gids_out, dset_in,
+                          axis):
+        """Open a source file and read one set of source gids from it. Used
+        by the parallel readers.
+
+        Parameters
+        ----------
+        fp_source : str
+            Source filepath
+        source_gids : np.ndarray | list
+            Source gids to be collected
+        gids_out : list
+            List of resource GIDS in the final output meta data f_out
+        dset_in : str
+            Dataset to collect
+        axis : int
+            Axis size (1 is 1D array, 2 is 2D array)
+
+        Returns
+        -------
+        out_slice : slice | np.ndarray
+            Slice in the final output file to write data to.
+        data : np.ndarray
+            Source data for the output slice.
+        """
         try:
-            if self._axis == 1:
-                data = f_source[self._dset_in, source_slice]
-                if not all(source_indexer):
-                    data = data[source_indexer]
-                f_out[self._dset_out, out_slice] = data
-
-            elif self._axis == 2:
-                data = f_source[self._dset_in, :, source_slice]
-                if not all(source_indexer):
-                    data = data[:, source_indexer]
-                f_out[self._dset_out, :, out_slice] = data
+            with Outputs(fp_source, mode='r') as f_source:
+                all_source_gids = f_source.get_meta_arr('gid')
+                out = cls._read_chunk(all_source_gids, source_gids, gids_out,
+                                      f_source, fp_source, dset_in, axis)
+        except Exception as e:
+            logger.exception('Failed to collect source file {}. '
+                             'Raised the following exception:\n{}'
+                             .format(os.path.basename(fp_source), e))
+            raise e
+
+        return out
+
+    def _write_chunk(self, f_out, out_slice, data):
+        """Write one chunk of collected data to the output file.
+
+        Parameters
+        ----------
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        out_slice : slice | np.ndarray
+            Slice in the final output file to write data to.
+        data : np.ndarray
+            Collected data for the output slice.
+        """
+        if self._axis == 1:
+            f_out[self._dset_out, out_slice] = data
+        elif self._axis == 2:
+            f_out[self._dset_out, :, out_slice] = data
+
+        self._bytes_written += data.nbytes
+
+    def _collect_chunk(self, all_source_gids, source_gids, f_out,
+                       f_source, fp_source):
+        """Collect one set of source gids from f_source to f_out.
+
+        Parameters
+        ----------
+        all_source_gids : list
+            List of all source gids to be collected
+        source_gids : np.ndarray | list
+            Source gids to be collected
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        f_source : reV.handlers.outputs.Output
+            Source file handler
+        fp_source : str
+            Source filepath
+        """
+        try:
+            out_slice, data = self._read_chunk(all_source_gids, source_gids,
+                                               self._gids, f_source,
+                                               fp_source, self._dset_in,
+                                               self._axis)
+            self._write_chunk(f_out, out_slice, data)
 
         except Exception as e:
             logger.exception('Failed to collect source file {}. '
@@ -282,24 +386,179 @@ class DatasetCollector:
                              .format(os.path.basename(fp_source), e))
             raise e
 
+    def _get_direct_slice(self, f_out, f_source):
+        """Get the output site slice for a raw chunk copy from f_source to
+        f_out if the two datasets have identical chunking, dtype, fill value,
+        and filters and the source sites are a chunk-aligned block of the
+        output sites. Unallocated source chunks are not copied, so they read
+        back as the output fill value.
+
+        Parameters
+        ----------
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        f_source : reV.handlers.outputs.Output
+            Source file handler
+
+        Returns
+        -------
+        out_slice : slice | None
+            Output site slice the source chunks map to. None if the source
+            chunks cannot be copied directly.
+        """
+        ds_in = f_source.h5[self._dset_in]
+        ds_out = f_out.h5[self._dset_out]
+        if not hasattr(ds_in.id, 'read_direct_chunk'):
+            return None
+
+        same = (ds_in.chunks is not None
+                and ds_in.chunks == ds_out.chunks
+                and ds_in.dtype == ds_out.dtype
+                and ds_in.shape[:-1] == ds_out.shape[:-1]
+                and (np.asarray(ds_in.fillvalue).tobytes()
+                     == np.asarray(ds_out.fillvalue).tobytes())
+                and all(getattr(ds_in, a) == getattr(ds_out, a)
+                        for a in ('compression', 'compression_opts',
+                                  'shuffle', 'fletcher32', 'scaleoffset')))
+        if not same:
+            return None
+
+        source_gids = f_source.get_meta_arr('gid')
+        gids_out = np.array(self._gids)
+        i0 = np.searchsorted(gids_out, source_gids[0])
+        out_slice = slice(i0, i0 + len(source_gids))
+        if not np.array_equal(gids_out[out_slice], source_gids):
+            return None
+
+        n = ds_in.chunks[-1]
+        if (out_slice.start % n
+                or (len(source_gids) % n
+                    and out_slice.stop != ds_out.shape[-1])):
+            return None
+
+        return out_slice
+
+    def _copy_chunks(self, f_out, f_source, out_slice):
+        """Copy the raw (still compressed) chunks of the source dataset into
+        the output dataset without decoding them.
+
+        Parameters
+        ----------
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        f_source : reV.handlers.outputs.Output
+            Source file handler
+        out_slice : slice
+            Output site slice from _get_direct_slice
+        """
+        ds_in = f_source.h5[self._dset_in].id
+        ds_out = f_out.h5[self._dset_out].id
+        for i in range(ds_in.get_num_chunks()):
+            offset = ds_in.get_chunk_info(i).chunk_offset
+            filter_mask, chunk = ds_in.read_direct_chunk(offset)
+            offset = offset[:-1] + (offset[-1] + out_slice.start,)
+            ds_out.write_direct_chunk(offset, chunk, filter_mask=filter_mask)
+            self._bytes_copied += len(chunk)
+
+    def _collect_serial(self, f_out, source_files):
+        """Serial collection from source files that could not be chunk
+        copied, optimized for low memory usage.
+
+        Parameters
+        ----------
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        source_files : list
+            List of source filepaths.
+        """
+        for fp in source_files:
+            with Outputs(fp, mode='r') as f_source:
+
+                x = self._get_source_gid_chunks(f_source)
+                all_source_gids, source_gid_chunks = x
+
+                for source_gids in source_gid_chunks:
+                    self._collect_chunk(all_source_gids, source_gids,
+                                        f_out, f_source, fp)
+
+            log_mem(logger, log_level='DEBUG')
+
+    def _collect_parallel(self, f_out, source_files):
+        """Collect source files with a pool of parallel readers feeding this
+        process as the single writer. At most one pending read per worker is
+        kept in flight to bound memory usage.
+
+        Parameters
+        ----------
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        source_files : list
+            List of source filepaths.
+        """
+        tasks = []
+        for fp in source_files:
+            with Outputs(fp, mode='r') as f_source:
+                _, source_gid_chunks = self._get_source_gid_chunks(f_source)
+            tasks += [(fp, gids) for gids in source_gid_chunks]
+
+        max_workers = self._max_workers or os.cpu_count()
+        loggers = [__name__, 'reV']
+        with SpawnProcessPool(max_workers=max_workers,
+                              loggers=loggers) as exe:
+            futures = set()
+            for i, (fp, source_gids) in enumerate(tasks):
+                futures.add(exe.submit(self._read_source_file, fp,
+                                       source_gids, self._gids,
+                                       self._dset_in, self._axis))
+                if len(futures) >= max_workers or i == len(tasks) - 1:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    if i == len(tasks) - 1:
+                        done |= wait(futures)[0]
+
+                    for future in done:
+                        self._write_chunk(f_out, *future.result())
+
+                    log_mem(logger, log_level='DEBUG')
+
     def _collect(self):
-        """Simple & robust serial collection optimized for low memory usage."""
+        """Collect the dataset from all source files. Source files whose raw
+        chunks line up with the output dataset are copied chunk-for-chunk,
+        the rest are read and written either serially or by a pool of
+        parallel readers."""
+        ts = time.time()
+        remaining = []
         with Outputs(self._h5_file, mode='a') as f_out:
             for fp in self._source_files:
                 with Outputs(fp, mode='r') as f_source:
+                    out_slice = self._get_direct_slice(f_out, f_source)
+                    if out_slice is None:
+                        remaining.append(fp)
+                    else:
+                        logger.debug('\t- Copying raw chunks of "{}" to '
+                                     'output site {} from file: {}'
+                                     .format(self._dset_in, out_slice,
+                                             os.path.basename(fp)))
+                        self._copy_chunks(f_out, f_source, out_slice)
+
+            logger.debug('Copied raw chunks from {} out of {} source files.'
+                         .format(len(self._source_files) - len(remaining),
+                                 len(self._source_files)))
+
+            if self._max_workers == 1 or len(remaining) < 2:
+                self._collect_serial(f_out, remaining)
+            else:
+                self._collect_parallel(f_out, remaining)
 
-                    x = self._get_source_gid_chunks(f_source)
-                    all_source_gids, source_gid_chunks = x
-
-                    for source_gids in source_gid_chunks:
-                        self._collect_chunk(all_source_gids, source_gids,
-                                            f_out, f_source, fp)
-
-                log_mem(logger, log_level='DEBUG')
+        tt = time.time() - ts
+        logger.info('Collected "{}" in {:.2f} seconds: copied {:.2f} MB of '
+                    'raw (compressed) chunks and wrote {:.2f} MB of decoded '
+                    'data.'.format(self._dset_in, tt,
+                                   self._bytes_copied / 1e6,
+                                   self._bytes_written / 1e6))
 
     @classmethod
     def collect_dset(cls, h5_file, source_files, gids, dset_in, dset_out=None,
-                     mem_util_lim=0.7):
+                     mem_util_lim=0.7, max_workers=1):
         """Collect a single dataset from a list of source files into a final
         output file.
 
@@ -318,9 +577,12 @@ class DatasetCollector:
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many sites
             will be collected at a time.
+        max_workers : int | None
+            Number of parallel source file readers. 1 will run serial, None
+            will use all available.
         """
         dc = cls(h5_file, source_files, gids, dset_in, dset_out=dset_out,
-                 mem_util_lim=mem_util_lim)
+                 mem_util_lim=mem_util_lim, max_workers=max_workers)
         dc._collect()
 
 
@@ -627,7 +889,8 @@ class Collector:
 
     @classmethod
     def collect(cls, h5_file, h5_dir, project_points, dset_name, dset_out=None,
-                file_prefix=None, mem_util_lim=0.7):
+                file_prefix=None, mem_util_lim=0.7,
+                max_workers=1):
         """
         Collect dataset from h5_dir to h5_file
 
@@ -651,6 +914,9 @@ class Collector:
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many sites
             will be collected at a time.
+        max_workers : int | None
+            Number of parallel source file readers. 1 will run serial, None
+            will use all available.
         """
         if file_prefix is None:
             h5_files = "*.h5"
@@ -671,7 +937,8 @@ class Collector:
 
         DatasetCollector.collect_dset(clt._h5_out, clt.h5_files, clt.gids,
                                       dset_name, dset_out=dset_out,
-                                      mem_util_lim=mem_util_lim)
+                                      mem_util_lim=mem_util_lim,
+                                      max_workers=max_workers)
 
         logger.debug("\t- Collection of '{}' complete".format(dset_name))
 
@@ -682,7 +949,7 @@ class Collector:
 
     @classmethod
     def add_dataset(cls, h5_file, h5_dir, dset_name, dset_out=None,
-                    file_prefix=None, mem_util_lim=0.7):
+                    file_prefix=None, mem_util_lim=0.7, max_workers=1):
         """
         Collect and add dataset to h5_file from h5_dir
 
@@ -702,6 +969,9 @@ class Collector:
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many sites
             will be collected at a time.
+        max_workers : int | None
+            Number of parallel source file readers. 1 will run serial, None
+            will use all available.
         """
         if file_prefix is None:
             h5_files = "*.h5"
@@ -723,7 +993,8 @@ class Collector:
 
         DatasetCollector.collect_dset(clt._h5_out, clt.h5_files, clt.gids,
                                       dset_name, dset_out=dset_out,
-                                      mem_util_lim=mem_util_lim)
+                                      mem_util_lim=mem_util_lim,
+                                      max_workers=max_workers)
 
         logger.debug("\t- Collection of '{}' complete".format(dset_name))
 
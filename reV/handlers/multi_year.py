@@ -2,6 +2,7 @@
 """
 Classes to collect reV outputs from multiple annual files.
 """
+from concurrent.futures import FIRST_COMPLETED, wait
 import logging
 import numpy as np
 import os
@@ -10,6 +11,7 @@ import pandas as pd
 from reV.handlers.outputs import Outputs
 from reV.utilities.exceptions import HandlerRuntimeError
 
+from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.utilities import parse_year
 
 logger = logging.getLogger(__name__)
@@ -86,9 +88,70 @@ class MultiYear(Outputs):
             self._create_dset(dset_out, time_index.shape, time_index.dtype,
                               data=time_index)
 
+    @staticmethod
+    def _get_site_slices(shape, chunks):
+        """
+        Split the site (last) axis of a dataset into blocks of whole chunk
+        columns so that only one block has to be held in memory at a time.
+
+        Parameters
+        ----------
+        shape : tuple
+            Dataset shape
+        chunks : tuple | None
+            Dataset chunk size
+
+        Returns
+        -------
+        site_slices : list
+            List of slices along the site axis
+        """
+        n_sites = shape[-1]
+        if chunks is not None and chunks[-1] is not None:
+            step = chunks[-1]
+        elif len(shape) == 1:
+            step = n_sites
+        else:
+            step = 100
+
+        step = max(1, min(step, n_sites))
+
+        return [slice(i, min(i + step, n_sites))
+                for i in range(0, n_sites, step)]
+
+    def _init_dset(self, dset_out, shape, dtype, chunks=None, attrs=None):
+        """
+        Create an empty dataset to be filled one site block at a time. An
+        existing dataset with the same name is replaced.
+
+        Parameters
+        ----------
+        dset_out : str
+            Dataset name
+        shape : tuple
+            Dataset shape
+        dtype : str
+            Dataset numpy dtype
+        chunks : tuple
+            Dataset chunk size
+        attrs : dict
+            Dataset attributes
+        """
+        if dset_out in self.datasets:
+            logger.debug("- Replacing {}".format(dset_out))
+            del self.h5[dset_out]
+        else:
+            logger.debug("- Creating {}".format(dset_out))
+
+        ds = self.h5.create_dataset(dset_out, shape=shape, dtype=dtype,
+                                    chunks=chunks)
+        if attrs is not None:
+            for key, value in attrs.items():
+                ds.attrs[key] = value
+
     def _copy_dset(self, source_h5, dset, meta=None):
         """
-        Copy dset_in from source_h5 to multiyear .h5
+        Copy dset_in from source_h5 to multiyear .h5 one site block at a time
 
         Parameters
         ----------
@@ -110,12 +173,15 @@ class MultiYear(Outputs):
                     if not meta[cols].equals(source_meta[cols]):
                         raise HandlerRuntimeError('Coordinates do not match')
 
-                _, ds_dtype, ds_chunks = f_in.get_dset_properties(dset)
+                ds_shape, ds_dtype, ds_chunks = f_in.get_dset_properties(dset)
                 ds_attrs = f_in.get_attrs(dset=dset)
-                ds_data = f_in[dset]
+                self._init_dset(dset_out, ds_shape, ds_dtype,
+                                chunks=ds_chunks, attrs=ds_attrs)
 
-            self._create_dset(dset_out, ds_data.shape, ds_dtype,
-                              chunks=ds_chunks, attrs=ds_attrs, data=ds_data)
+                ds_in = f_in.h5[dset]
+                ds_out = self.h5[dset_out]
+                for site_slice in self._get_site_slices(ds_shape, ds_chunks):
+                    ds_out[..., site_slice] = ds_in[..., site_slice]
 
     def collect(self, source_files, dset, profiles=False):
         """
@@ -171,29 +237,263 @@ class MultiYear(Outputs):
 
         return source_dsets
 
-    def _update_dset(self, dset_out, dset_data):
+    @staticmethod
+    def _welford_stats(blocks, stdev=True):
         """
-        Update dataset, create if needed
+        Compute the means and standard deviations of a sequence of annual
+        data blocks in a single pass using Welford's online algorithm.
 
         Parameters
         ----------
-        dset_out : str
-            Dataset name
-        dset_data : ndarray
-            Dataset data to write to disc
+        blocks : iterable
+            Annual data blocks, all with the same shape
+        stdev : bool
+            Flag to also compute standard deviations
+
+        Returns
+        -------
+        means : ndarray
+            Multi-year means for the block
+        stdev : ndarray | None
+            Multi-year standard deviations for the block, None if stdev
+            is False
         """
-        if dset_out in self.datasets:
-            logger.debug("- Updating {}".format(dset_out))
-            self[dset_out] = dset_data
+        means = m2 = None
+        n = 0
+        for n, data in enumerate(blocks, start=1):
+            data = np.asarray(data, dtype=np.float64)
+            if means is None:
+                means = np.zeros(data.shape, dtype=np.float64)
+                m2 = np.zeros(data.shape, dtype=np.float64)
+
+            delta = data - means
+            means += delta / n
+            if stdev:
+                m2 += delta * (data - means)
+
+        if stdev:
+            stdev = np.sqrt(m2 / n).astype('float32')
         else:
-            logger.debug("- Creating {}".format(dset_out))
-            source_dset = self._get_source_dsets(dset_out)[0]
-            _, ds_dtype, ds_chunks = self.get_dset_properties(source_dset)
-            ds_attrs = self.get_attrs(dset=source_dset)
-            self._add_dset(dset_out, dset_data, ds_dtype,
-                           chunks=ds_chunks, attrs=ds_attrs)
+            stdev = None
+
+        return means.astype('float32'), stdev
+
+    def _block_stats(self, source_dsets, ds_slice, stdev=True):
+        """
+        Compute the multi-year means and standard deviations for one site
+        block from the annual datasets in this file.
+
+        Parameters
+        ----------
+        source_dsets : list
+            List of annual datasets
+        ds_slice : tuple
+            Dataset slice selecting the site block
+        stdev : bool
+            Flag to also compute standard deviations
+
+        Returns
+        -------
+        means : ndarray
+            Multi-year means for the site block
+        stdev : ndarray | None
+            Multi-year standard deviations for the site block, None if stdev
+            is False
+        """
+        blocks = (self[(ds, ) + ds_slice] for ds in source_dsets)
 
-    def _compute_means(self, dset_out):
+        return self._welford_stats(blocks, stdev=stdev)
+
+    @classmethod
+    def _source_block_stats(cls, source_files, dset, ds_slice, stdev=True):
+        """
+        Compute the multi-year means and standard deviations for one site
+        block directly from the annual source files. Used by the parallel
+        workers, each of which opens its own read-only file handles.
+
+        Parameters
+        ----------
+        source_files : list
+            List of annual .h5 files to read dset from
+        dset : str
+            Source dataset (without year)
+        ds_slice : tuple
+            Dataset slice selecting the site block
+        stdev : bool
+            Flag to also compute standard deviations
+
+        Returns
+        -------
+        means : ndarray
+            Multi-year means for the site block
+        stdev : ndarray | None
+            Multi-year standard deviations for the site block, None if stdev
+            is False
+        """
+        def read_blocks():
+            for source_h5 in source_files:
+                with Outputs(source_h5, mode='r') as f_in:
+                    yield f_in[(dset, ) + ds_slice]
+
+        return cls._welford_stats(read_blocks(), stdev=stdev)
+
+    def _map_source_files(self, dset, source_dsets, source_files):
+        """
+        Map the annual datasets in this file to the source files they were
+        collected from.
+
+        Parameters
+        ----------
+        dset : str
+            Source dataset (without year)
+        source_dsets : list
+            List of annual datasets
+        source_files : list | None
+            List of annual .h5 files the datasets were collected from
+
+        Returns
+        -------
+        files : list | None
+            Source file for each annual dataset, None if any annual dataset
+            does not have a source file (e.g. years collected in a previous
+            run).
+        """
+        dset_files = {self._create_dset_name(source_h5, dset): source_h5
+                      for source_h5 in source_files or []}
+        if not all(ds in dset_files for ds in source_dsets):
+            return None
+
+        return [dset_files[ds] for ds in source_dsets]
+
+    def _compute_stats(self, dset, stdev=True, max_workers=1,
+                       source_files=None):
+        """
+        Compute multi-year means (and standard deviations) for given dataset
+        one site block at a time. Works for both 1D means and 2D profiles.
+
+        Parameters
+        ----------
+        dset : str
+            Source dataset (without year) to compute statistics for
+        stdev : bool
+            Flag to also compute standard deviations
+        max_workers : int | None
+            Number of processes used to compute site blocks in parallel.
+            1 will run serial, None will use all available. Parallel workers
+            read the annual data from source_files, so this runs in serial
+            if source_files are not available for every annual dataset.
+        source_files : list | None
+            List of annual .h5 files the annual datasets were collected from
+        """
+        means_out = "{}-means".format(dset)
+        stdev_out = "{}-stdev".format(dset)
+        source_dsets = self._get_source_dsets(means_out)
+        logger.debug('\t- Computing {} from {}'
+                     .format(means_out, source_dsets))
+
+        shape, dtype, chunks = self.get_dset_properties(source_dsets[0])
+        for ds in source_dsets:
+            if self.h5[ds].shape != shape:
+                raise HandlerRuntimeError("{} shape {} should be {}"
+                                          .format(ds, self.h5[ds].shape,
+                                                  shape))
+
+        attrs = self.get_attrs(dset=source_dsets[0])
+        self._init_dset(means_out, shape, dtype, chunks=chunks, attrs=attrs)
+        if stdev:
+            self._init_dset(stdev_out, shape, dtype, chunks=chunks,
+                            attrs=attrs)
+        else:
+            stdev_out = None
+
+        ds_slices = [(slice(None), ) * (len(shape) - 1) + (site_slice, )
+                     for site_slice in self._get_site_slices(shape, chunks)]
+
+        if max_workers != 1:
+            source_files = self._map_source_files(dset, source_dsets,
+                                                  source_files)
+            if source_files is None:
+                logger.debug('\t- Source files are not available for all of '
+                             '{}, computing {} in serial.'
+                             .format(source_dsets, means_out))
+                max_workers = 1
+
+        if max_workers == 1:
+            for ds_slice in ds_slices:
+                stats = self._block_stats(source_dsets, ds_slice, stdev=stdev)
+                self._write_block_stats(means_out, ds_slice, *stats,
+                                        stdev_out=stdev_out)
+        else:
+            self._parallel_stats(source_files, dset, ds_slices, means_out,
+                                 stdev_out=stdev_out, max_workers=max_workers)
+
+    def _parallel_stats(self, source_files, dset, ds_slices, means_out,
+                        stdev_out=None, max_workers=None):
+        """
+        Compute site block statistics on parallel worker processes and write
+        them to disk as they complete.
+
+        Parameters
+        ----------
+        source_files : list
+            Annual .h5 files to read dset from, one per annual dataset
+        dset : str
+            Source dataset (without year)
+        ds_slices : list
+            Dataset slices, one per site block
+        means_out : str
+            Multi-year means dataset name
+        stdev_out : str | None
+            Multi-year stdev dataset name, None to not compute stdev
+        max_workers : int | None
+            Number of worker processes, None will use all available.
+        """
+        # only keep max_workers site blocks in flight to bound memory
+        n_window = max_workers or os.cpu_count()
+        loggers = [__name__, 'reV']
+        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
+            futures = {}
+            for ds_slice in ds_slices:
+                if len(futures) >= n_window:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._write_block_stats(means_out,
+                                                futures.pop(future),
+                                                *future.result(),
+                                                stdev_out=stdev_out)
+
+                future = exe.submit(self._source_block_stats, source_files,
+                                    dset, ds_slice,
+                                    stdev=stdev_out is not None)
+                futures[future] = ds_slice
+
+            for future, ds_slice in futures.items():
+                self._write_block_stats(means_out, ds_slice, *future.result(),
+                                        stdev_out=stdev_out)
+
+    def _write_block_stats(self, means_out, ds_slice, block_means,
+                           block_stdev, stdev_out=None):
+        """
+        Write the statistics of one site block to disk
+
+        Parameters
+        ----------
+        means_out : str
+            Multi-year means dataset name
+        ds_slice : tuple
+            Dataset slice selecting the site block
+        block_means : ndarray
+            Multi-year means for the site block
+        block_stdev : ndarray | None
+            Multi-year standard deviations for the site block
+        stdev_out : str | None
+            Multi-year stdev dataset name, None to not write stdev
+        """
+        self._set_ds_array(means_out, block_means, ds_slice)
+        if stdev_out is not None:
+            self._set_ds_array(stdev_out, block_stdev, ds_slice)
+
+    def _compute_means(self, dset_out, max_workers=1):
         """
         Compute multi-year means for given dataset
 
@@ -201,27 +501,18 @@ class MultiYear(Outputs):
         ----------
         dset_out : str
             Multi-year means dataset name
+        max_workers : int | None
+            Number of processes used to compute site blocks in parallel.
 
         Returns
         -------
         my_means : ndarray
             Array of multi-year means
         """
-        source_dsets = self._get_source_dsets(dset_out)
-        logger.debug('\t- Computing {} from {}'.format(dset_out, source_dsets))
-
-        my_means = np.zeros(len(self), dtype='float32')
-        for ds in source_dsets:
-            if self.h5[ds].shape == my_means.shape:
-                my_means += self[ds]
-            else:
-                raise HandlerRuntimeError("{} shape {} should be {}"
-                                          .format(ds, self.h5[ds].shape,
-                                                  my_means.shape))
-        my_means /= len(source_dsets)
-        self._update_dset(dset_out, my_means)
+        dset = os.path.basename(dset_out).split("-")[0]
+        self._compute_stats(dset, stdev=False, max_workers=max_workers)
 
-        return my_means
+        return self[dset_out]
 
     def means(self, dset):
         """
@@ -245,40 +536,27 @@ class MultiYear(Outputs):
 
         return my_means
 
-    def _compute_stdev(self, dset_out, means=None):
+    def _compute_stdev(self, dset_out, max_workers=1):
         """
-        Compute multi-year standard deviation for given dataset
+        Compute multi-year standard deviation for given dataset. The means
+        are computed (or refreshed) in the same pass over the annual data.
 
         Parameters
         ----------
         dset_out : str
             Multi-year stdev dataset name
-        means : ndarray
-            Array of pre-computed means
+        max_workers : int | None
+            Number of processes used to compute site blocks in parallel.
 
         Returns
         -------
         my_stdev : ndarray
             Array of multi-year standard deviations
         """
-        if means is None:
-            means = self._compute_means("{}-means".format(dset_out))
-
-        source_dsets = self._get_source_dsets(dset_out)
-
-        my_stdev = np.zeros(means.shape, dtype='float32')
-        for ds in source_dsets:
-            if self.h5[ds].shape == my_stdev.shape:
-                my_stdev += (self[ds] - means)**2
-            else:
-                raise HandlerRuntimeError("{} shape {} should be {}"
-                                          .format(ds, self.h5[ds].shape,
-                                                  my_stdev.shape))
-
-        my_stdev = np.sqrt(my_stdev / len(source_dsets))
-        self._update_dset(dset_out, my_stdev)
+        dset = os.path.basename(dset_out).split("-")[0]
+        self._compute_stats(dset, stdev=True, max_workers=max_workers)
 
-        return my_stdev
+        return self[dset_out]
 
     def stdev(self, dset):
         """
@@ -298,8 +576,7 @@ class MultiYear(Outputs):
         if my_dset in self.datasets:
             my_stdev = self[my_dset]
         else:
-            my_means = self.means(dset)
-            my_stdev = self._compute_stdev(my_dset, means=my_means)
+            my_stdev = self._compute_stdev(my_dset)
 
         return my_stdev
 
@@ -349,7 +626,8 @@ class MultiYear(Outputs):
         return len(shape) == 2
 
     @classmethod
-    def collect_means(cls, my_file, source_files, dset, group=None):
+    def collect_means(cls, my_file, source_files, dset, group=None,
+                      max_workers=1):
         """
         Collect and compute multi-year means for given dataset
 
@@ -363,17 +641,21 @@ class MultiYear(Outputs):
             Dataset to collect
         group : str
             Group to collect datasets into
+        max_workers : int | None
+            Number of processes used to compute site blocks in parallel. 1
+            will run serial, None will use all available.
         """
         logger.info('Collecting {} into {} '
                     'and computing multi-year means and standard deviations.'
                     .format(dset, my_file))
         with cls(my_file, mode='a', group=group) as my:
             my.collect(source_files, dset)
-            means = my._compute_means("{}-means".format(dset))
-            my._compute_stdev("{}-stdev".format(dset), means=means)
+            my._compute_stats(dset, stdev=True, max_workers=max_workers,
+                              source_files=source_files)
 
     @classmethod
-    def collect_profiles(cls, my_file, source_files, dset, group=None):
+    def collect_profiles(cls, my_file, source_files, dset, group=None,
+                         compute_stats=False, max_workers=1):
         """
         Collect multi-year profiles associated with given dataset
 
@@ -387,7 +669,16 @@ class MultiYear(Outputs):
             Profiles dataset to collect
         group : str
             Group to collect datasets into
+        compute_stats : bool
+            Flag to also compute the multi-year mean and standard deviation
+            profiles. All annual profiles must have the same shape.
+        max_workers : int | None
+            Number of processes used to compute site blocks in parallel. 1
+            will run serial, None will use all available.
         """
         logger.info('Collecting {} into {}'.format(dset, my_file))
         with cls(my_file, mode='a', group=group) as my:
             my.collect(source_files, dset, profiles=True)
+            if compute_stats:
+                my._compute_stats(dset, stdev=True, max_workers=max_workers,
+                                  source_files=source_files)
@@ -69,12 +69,12 @@ class TransmissionFeatures:
         self._sink_tie_in_cost = sink_tie_in_cost
         self._available_capacity_frac = available_capacity
 
-        self._features = self._get_features(trans_table)
-        self._check_feature_dependencies()
+        features = self._get_features(trans_table)
+        self._check_feature_dependencies(features)
 
-        self._feature_gid_list = list(self._features.keys())
-        self._available_mask = np.ones(
-            (int(1 + max(list(self._features.keys()))), ), dtype=bool)
+        self._feature_gid_list = list(features.keys())
+        self._features_to_arrays(features)
+        self._available_mask = np.ones((len(self._types), ), dtype=bool)
 
         self._line_limited = line_limited
 
@@ -83,15 +83,165 @@ class TransmissionFeatures:
         return msg
 
     def __len__(self):
-        return len(self._features)
+        return len(self._feature_gid_list)
 
     def __getitem__(self, gid):
-        if gid not in self._features:
+        """Get a (read-only) dictionary view of a transmission feature.
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of interest
+
+        Returns
+        -------
+        feature : dict
+            Feature dictionary with "type" and "avail_cap" and/or "lines"
+        """
+        gid = self._check_gid(gid)
+        feature = {'type': self._types[gid]}
+        if self._has_cap[gid]:
+            feature['avail_cap'] = self._get_cap(gid)
+
+        if self._is_sub[gid]:
+            feature['lines'] = self._lines(gid).tolist()
+
+        return feature
+
+    def _check_gid(self, gid):
+        """Check that the feature gid is valid and raise error if not.
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of interest
+
+        Returns
+        -------
+        gid : int
+            Feature gid as an integer index into the feature arrays
+        """
+        # fast path for the python ints used in the connection loop
+        if (type(gid) is int and 0 <= gid < len(self._types)
+                and self._types[gid] is not None):
+            return gid
+
+        if not isinstance(gid, (int, np.integer)):
+            try:
+                if gid == int(gid):
+                    gid = int(gid)
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+        if (not isinstance(gid, (int, np.integer))
+                or not 0 <= gid < len(self._types)
+                or self._types[gid] is None):
             msg = "Invalid feature gid {}".format(gid)
             logger.error(msg)
             raise HandlerKeyError(msg)
 
-        return self._features[gid]
+        return gid
+
+    def _features_to_arrays(self, features):
+        """Store the features as dense arrays indexed by feature gid.
+
+        Parameters
+        ----------
+        features : dict
+            Nested dictionary of features (lines, substations, loadcenters)
+            lines : {capacity}
+            substations : {lines}
+            loadcenters : {capacity}
+        """
+        n = int(1 + max(features.keys()))
+        self._types = np.full(n, None, dtype=object)
+        self._avail_cap = np.full(n, np.nan, dtype=np.float64)
+        self._has_cap = np.zeros(n, dtype=bool)
+        self._is_sub = np.zeros(n, dtype=bool)
+        n_lines = np.zeros(n, dtype=np.int64)
+        sub_lines = {}
+
+        for gid, feature in features.items():
+            gid = int(gid)
+            self._types[gid] = feature['type']
+            if 'avail_cap' in feature:
+                self._has_cap[gid] = True
+                if feature['avail_cap'] is not None:
+                    self._avail_cap[gid] = feature['avail_cap']
+
+            if 'lines' in feature:
+                self._is_sub[gid] = True
+                sub_lines[gid] = feature['lines']
+                n_lines[gid] = len(feature['lines'])
+
+        # CSR-style index of the lines connected to each substation
+        self._line_ptr = np.zeros(n + 1, dtype=np.int64)
+        self._line_ptr[1:] = np.cumsum(n_lines)
+        self._line_gids = np.zeros(self._line_ptr[-1], dtype=np.int64)
+        for gid, lines in sub_lines.items():
+            i0, i1 = self._line_ptr[gid], self._line_ptr[gid + 1]
+            self._line_gids[i0:i1] = lines
+
+    def _lines(self, gid):
+        """Get the transmission line gids connected to a substation.
+
+        Parameters
+        ----------
+        gid : int
+            Substation feature gid
+
+        Returns
+        -------
+        line_gids : ndarray
+            Vector of transmission line gids connected to the substation
+        """
+        return self._line_gids[self._line_ptr[gid]:self._line_ptr[gid + 1]]
+
+    def _get_cap(self, gid):
+        """Get the stored available capacity of a feature.
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of interest
+
+        Returns
+        -------
+        avail_cap : float | None
+            Available capacity, None if the feature capacity is unlimited.
+        """
+        avail_cap = self._avail_cap[gid]
+        if avail_cap != avail_cap:
+            avail_cap = None
+
+        return avail_cap
+
+    def _capacity(self, gid):
+        """Get the available capacity of a (pre-checked) feature gid.
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of interest
+
+        Returns
+        -------
+        avail_cap : float | None
+            Available capacity, None if the feature capacity is unlimited.
+        """
+        if self._has_cap[gid]:
+            avail_cap = self._get_cap(gid)
+
+        elif self._is_sub[gid]:
+            avail_cap = self._substation_capacity(self._lines(gid))
+
+        else:
+            msg = ('Could not parse available capacity from feature: {}'
+                   .format(self[gid]))
+            logger.error(msg)
+            raise HandlerRuntimeError(msg)
+
+        return avail_cap
 
     @staticmethod
     def _parse_dictionary(features):
@@ -224,12 +374,19 @@ class TransmissionFeatures:
 
         return features
 
-    def _check_feature_dependencies(self):
-        """Check features for dependencies that are missing and raise error."""
+    @staticmethod
+    def _check_feature_dependencies(features):
+        """Check features for dependencies that are missing and raise error.
+
+        Parameters
+        ----------
+        features : dict
+            Nested dictionary of features (lines, substations, loadcenters)
+        """
         missing = {}
-        for gid, feature_dict in self._features.items():
+        for gid, feature_dict in features.items():
             for line_gid in feature_dict.get('lines', []):
-                if line_gid not in self._features:
+                if line_gid not in features:
                     if gid not in missing:
                         missing[gid] = []
                     missing[gid].append(line_gid)
@@ -273,8 +430,8 @@ class TransmissionFeatures:
 
         Parameters
         ----------
-        line_gids : list
-            List of transmission line gids connected to the substation
+        line_gids : ndarray
+            Vector of transmission line gids connected to the substation
 
 
         Returns
@@ -283,11 +440,11 @@ class TransmissionFeatures:
             Substation available capacity
         """
 
-        line_caps = [self[gid]['avail_cap'] for gid in line_gids]
-        avail_cap = sum(line_caps) / 2
+        line_caps = self._avail_cap[line_gids]
+        avail_cap = line_caps.sum() / 2
 
         if self._line_limited:
-            max_cap = max(line_caps) / 2
+            max_cap = line_caps.max() / 2
             if max_cap < avail_cap:
                 avail_cap = max_cap
 
@@ -309,19 +466,36 @@ class TransmissionFeatures:
             default = 10%
         """
 
-        feature = self[gid]
+        gid = self._check_gid(gid)
+
+        return self._capacity(gid)
 
-        if 'avail_cap' in feature:
-            avail_cap = feature['avail_cap']
+    def available_capacities(self):
+        """
+        Get the available capacity of all features as a vector indexed by
+        feature gid. Available capacities only decrease as capacity is
+        connected, so these are upper bounds for any later connection.
 
-        elif 'lines' in feature:
-            avail_cap = self._substation_capacity(feature['lines'])
+        Returns
+        -------
+        avail_cap : ndarray
+            Available capacity of each feature gid, NaN for features with
+            unlimited capacity, invalid gids, and substations without lines.
+        """
+        avail_cap = self._avail_cap.copy()
+        avail_cap[~self._has_cap] = np.nan
 
-        else:
-            msg = ('Could not parse available capacity from feature: {}'
-                   .format(feature))
-            logger.error(msg)
-            raise HandlerRuntimeError(msg)
+        n_lines = np.diff(self._line_ptr)
+        subs = np.where(self._is_sub & (n_lines > 0))[0]
+        if len(subs):
+            line_caps = self._avail_cap[self._line_gids]
+            i0 = self._line_ptr[subs]
+            sub_cap = np.add.reduceat(line_caps, i0) / 2
+            if self._line_limited:
+                max_cap = np.maximum.reduceat(line_caps, i0) / 2
+                sub_cap = np.minimum(sub_cap, max_cap)
+
+            avail_cap[subs] = sub_cap
 
         return avail_cap
 
@@ -334,7 +508,7 @@ class TransmissionFeatures:
         gid : list
             Feature gid to check
         """
-        avail_cap = self.available_capacity(gid)
+        avail_cap = self._capacity(gid)
         if avail_cap == 0:
             self._available_mask[gid] = False
 
@@ -367,7 +541,7 @@ class TransmissionFeatures:
         capacity : float
             Capacity needed in MW
         """
-        avail_cap = self[gid]['avail_cap']
+        avail_cap = self._avail_cap[gid]
 
         if avail_cap < capacity:
             msg = ("Cannot connect to {}: "
@@ -377,7 +551,7 @@ class TransmissionFeatures:
             logger.error(msg)
             raise RuntimeError(msg)
 
-        self[gid]['avail_cap'] -= capacity
+        self._avail_cap[gid] -= capacity
 
     def _fill_lines(self, line_gids, line_caps, capacity):
         """
@@ -404,11 +578,11 @@ class TransmissionFeatures:
         """
         apply_cap = capacity / len(line_gids)
         mask = line_caps < apply_cap
-        for pos in np.where(line_caps < apply_cap)[0]:
-            gid = line_gids[pos]
-            apply_cap = line_caps[pos]
-            self._connect(gid, apply_cap)
-            capacity -= apply_cap
+        if mask.any():
+            # fill lines that cannot take an equal share of the capacity
+            self._avail_cap[line_gids[mask]] = 0
+            for filled_cap in line_caps[mask]:
+                capacity -= filled_cap
 
         return line_gids[~mask], line_caps[~mask], capacity
 
@@ -434,8 +608,15 @@ class TransmissionFeatures:
                 break
 
         apply_cap = capacity / len(lines)
-        for gid in lines:
-            self._connect(gid, apply_cap)
+        if (self._avail_cap[lines] < apply_cap).any():
+            msg = ("Cannot connect to lines {}: "
+                   "needed capacity({} MW) > "
+                   "available capacity({} MW)"
+                   .format(lines, apply_cap, self._avail_cap[lines]))
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        self._avail_cap[lines] -= apply_cap
 
     def _connect_to_substation(self, line_gids, capacity):
         """
@@ -443,22 +624,18 @@ class TransmissionFeatures:
 
         Parameters
         ----------
-        line_gids : list
-            List of transmission line gids connected to the substation
+        line_gids : ndarray
+            Vector of transmission line gids connected to the substation
         capacity : float
             Capacity needed in MW
-        line_lmited : bool
-            Substation connection is limited by maximum capacity of the
-            attached lines
         """
-        line_caps = np.array([self[gid]['avail_cap']
-                              for gid in line_gids])
+        line_caps = self._avail_cap[line_gids]
         if self._line_limited:
             gid = line_gids[np.argmax(line_caps)]
             self._connect(gid, capacity)
         else:
             non_zero = np.nonzero(line_caps)[0]
-            line_gids = np.array([line_gids[i] for i in non_zero])
+            line_gids = line_gids[non_zero]
             line_caps = line_caps[non_zero]
             self._spread_substation_load(line_gids, line_caps, capacity)
 
@@ -482,18 +659,19 @@ class TransmissionFeatures:
         connected : bool
             Flag as to whether connection is possible or not
         """
-        if self.check_availability(gid):
-            avail_cap = self.available_capacity(gid)
+        gid = self._check_gid(gid)
+        if self._available_mask[gid]:
+            avail_cap = self._capacity(gid)
             if avail_cap is not None and capacity > avail_cap:
                 connected = False
             else:
                 connected = True
                 if apply:
-                    feature_type = self[gid]['type']
+                    feature_type = self._types[gid]
                     if feature_type == 'transline':
                         self._connect(gid, capacity)
                     elif feature_type == 'substation':
-                        lines = self[gid]['lines']
+                        lines = self._lines(gid)
                         self._connect_to_substation(lines, capacity)
                     elif feature_type == 'loadcen':
                         self._connect(gid, capacity)
@@ -528,7 +706,8 @@ class TransmissionFeatures:
             Cost of transmission in $/MW, if None indicates connection is
             NOT possible
         """
-        feature_type = self[gid]['type']
+        gid = self._check_gid(gid)
+        feature_type = self._types[gid]
         line_cost = self._line_cost
         if feature_type == 'transline':
             tie_in_cost = self._line_tie_in_cost
@@ -583,23 +762,82 @@ class TransmissionFeatures:
             Available Capacity for each transmission feature
         """
         try:
-            feature = cls(trans_table, available_capacity=available_capacity)
-
-            feature_cap = {}
-            for gid, _ in feature._features.items():
-                feature_cap[gid] = feature.available_capacity(gid)
+            trans_table = cls._parse_table(trans_table)
+            features = trans_table.groupby('trans_line_gid').first()
+            categories = features['category'].str.lower()
+            cls._check_categories(categories)
+
+            feature_cap = features['ac_cap'].astype(float) * available_capacity
+            feature_cap[categories == 'pcaloadcen'] = np.nan
+
+            sub_mask = (categories == 'substation').values
+            if sub_mask.any():
+                feature_cap[sub_mask] = cls._vectorized_substation_capacity(
+                    features.loc[sub_mask, 'trans_gids'], feature_cap)
         except Exception:
             logger.exception("Error computing available capacity for all "
                              "features in {}".format(cls))
             raise
 
-        feature_cap = pd.Series(feature_cap)
         feature_cap.name = 'avail_cap'
         feature_cap.index.name = 'trans_line_gid'
         feature_cap = feature_cap.to_frame().reset_index()
 
         return feature_cap
 
+    @staticmethod
+    def _check_categories(categories):
+        """Check that all transmission feature categories are recognized.
+
+        Parameters
+        ----------
+        categories : pandas.Series
+            Lower-case feature categories indexed by trans_line_gid.
+        """
+        known = ('transline', 'substation', 'loadcen', 'pcaloadcen')
+        bad = ~categories.isin(known)
+        if bad.any():
+            gid = categories.index[bad][0]
+            msg = ('Cannot not recognize feature type "{}" '
+                   'for trans gid {}!'.format(categories[gid], gid))
+            logger.error(msg)
+            raise HandlerKeyError(msg)
+
+    @staticmethod
+    def _vectorized_substation_capacity(trans_gids, line_cap):
+        """Aggregate substation capacity from their transmission lines.
+
+        Parameters
+        ----------
+        trans_gids : pandas.Series
+            JSON string lists of the transmission line gids connected to each
+            substation, indexed by the substation trans_line_gid.
+        line_cap : pandas.Series
+            Available capacity of all features indexed by trans_line_gid.
+
+        Returns
+        -------
+        sub_cap : np.ndarray
+            Available capacity of each substation, half of the sum of the
+            available capacity of its transmission lines.
+        """
+        lines = trans_gids.apply(json.loads).explode()
+        lines = lines.dropna().astype(line_cap.index.dtype)
+
+        missing = ~lines.isin(line_cap.index)
+        if missing.any():
+            missing = lines[missing].groupby(level=0).apply(list).to_dict()
+            emsg = ('Transmission feature table has {} parent features that '
+                    'depend on missing lines. Missing dependencies: {}'
+                    .format(len(missing), missing))
+            logger.error(emsg)
+            raise RuntimeError(emsg)
+
+        caps = pd.Series(line_cap.loc[lines.values].values, index=lines.index)
+        sub_cap = caps.groupby(level=0).sum() / 2
+
+        return sub_cap.reindex(trans_gids.index, fill_value=0).values
+
 
 class TransmissionCosts(TransmissionFeatures):
     """
@@ -655,14 +893,16 @@ class TransmissionCosts(TransmissionFeatures):
             Available capacity = capacity * available fraction
             default = 10%
         """
+        gid = self._check_gid(gid)
 
-        return self[gid]['avail_cap']
+        return self._get_cap(gid)
 
     @classmethod
     def feature_costs(cls, trans_table, capacity=None, line_tie_in_cost=14000,
                       line_cost=3667, station_tie_in_cost=0,
                       center_tie_in_cost=0, sink_tie_in_cost=14000,
-                      available_capacity=0.1, line_limited=False):
+                      available_capacity=0.1,
+                      line_limited=False):  # pylint: disable=unused-argument
         """
         Compute costs for all connections in given transmission table
 
@@ -670,9 +910,10 @@ class TransmissionCosts(TransmissionFeatures):
         ----------
         trans_table : str | pandas.DataFrame
             Path to .csv or .json containing supply curve transmission mapping
-        capacity : float
-            Capacity needed in MW, if None DO NOT check if connection is
-            possible
+        capacity : float | ndarray
+            Capacity needed in MW, either a single value or an array with a
+            value for every row in trans_table. If None DO NOT check if
+            connection is possible
         line_tie_in_cost : float
             Cost of connecting to a transmission line in $/MW
         line_cost : float
@@ -688,33 +929,57 @@ class TransmissionCosts(TransmissionFeatures):
             Fraction of capacity that is available for connection
         line_limited : bool
             Substation connection is limited by maximum capacity of the
-            attached lines, legacy method
+            attached lines, legacy method. This has no effect on the costs,
+            which are checked against the pre-computed available capacity
+            of each feature.
 
         Returns
         -------
         cost : ndarray
-            Cost of transmission in $/MW, if None indicates connection is
+            Cost of transmission in $/MW, if NaN indicates connection is
             NOT possible
         """
         try:
-            feature = cls(trans_table,
-                          line_tie_in_cost=line_tie_in_cost,
-                          line_cost=line_cost,
-                          station_tie_in_cost=station_tie_in_cost,
-                          center_tie_in_cost=center_tie_in_cost,
-                          sink_tie_in_cost=sink_tie_in_cost,
-                          available_capacity=available_capacity,
-                          line_limited=line_limited)
-
-            costs = []
-            for _, row in trans_table.iterrows():
-                tm = row.get('transmission_multiplier', 1)
-                costs.append(feature.cost(row['trans_line_gid'],
-                                          row['dist_mi'], capacity=capacity,
-                                          transmission_multiplier=tm))
+            trans_table = cls._parse_table(trans_table)
+            if 'avail_cap' not in trans_table:
+                fc = TransmissionFeatures.feature_capacity(
+                    trans_table, available_capacity=available_capacity)
+                avail_cap = trans_table[['trans_line_gid']].merge(
+                    fc, on='trans_line_gid', how='left')['avail_cap']
+            else:
+                avail_cap = trans_table['avail_cap']
+
+            tie_in_costs = {'transline': line_tie_in_cost,
+                            'substation': station_tie_in_cost,
+                            'loadcen': center_tie_in_cost,
+                            'pcaloadcen': sink_tie_in_cost}
+            categories = trans_table['category'].str.lower()
+            tie_in_cost = categories.map(tie_in_costs)
+            if tie_in_cost.isna().any():
+                msg = ("Do not recognize feature types {}, tie_in_cost set "
+                       "to 0".format(categories[tie_in_cost.isna()].unique()))
+                logger.warning(msg)
+                warn(msg, HandlerWarning)
+                tie_in_cost = tie_in_cost.fillna(0)
+
+            tm = 1
+            if 'transmission_multiplier' in trans_table:
+                tm = trans_table['transmission_multiplier'].values
+
+            costs = cls._calc_cost(trans_table['dist_mi'].values,
+                                   line_cost=line_cost,
+                                   tie_in_cost=tie_in_cost.values,
+                                   transmission_multiplier=tm)
+            costs = costs.astype('float32')
+
+            if capacity is not None:
+                # NaN available capacity (e.g. pcaloadcen) is unlimited
+                avail_cap = avail_cap.values.astype(float)
+                with np.errstate(invalid='ignore'):
+                    costs[capacity > avail_cap] = np.nan
         except Exception:
             logger.exception("Error computing costs for all connections in {}"
                              .format(cls))
             raise
 
-        return np.array(costs, dtype='float32')
+        return costs
@@ -12,6 +12,7 @@ import numpy as np
 import os
 import shutil
 import pandas as pd
+from scipy import sparse
 from scipy.spatial import cKDTree
 import logging
 from warnings import warn
@@ -36,6 +37,10 @@ class Offshore:
     DEFAULT_META_COLS = ('min_sub_tech', 'sub_type', 'array_cable_CAPEX',
                          'export_cable_CAPEX')
 
+    # Maximum number of bytes per dataset block read from gen_fpath during
+    # offshore farm aggregation
+    MAX_BLOCK_BYTES = 2 ** 28
+
     def __init__(self, gen_fpath, offshore_fpath, project_points,
                  max_workers=None, offshore_gid_adder=1e7,
                  farm_gid_label='wfarm_id', small_farm_limit=7,
@@ -494,81 +499,90 @@ class Offshore:
             new_fpath = os.path.join(new_dir, fn)
             shutil.move(self._gen_fpath, new_fpath)
 
-    @staticmethod
-    def _get_farm_data(gen_fpath, meta, system_inputs, site_data, site_gid=0):
-        """Get the offshore farm aggregated cf data and calculate LCOE.
+    def _get_agg_matrix(self):
+        """Get a sparse farm averaging matrix that maps the generation data
+        for all sites in gen_fpath to the mean of each output offshore farm.
+
+        Returns
+        -------
+        agg_matrix : scipy.sparse.csc_matrix
+            Sparse matrix with shape (n_farms, n_gen_sites). Row i has
+            weights of 1/n at the gen_fpath site indices of the n offshore
+            resource pixels belonging to output farm i (in the order of
+            meta_out_offshore).
+        """
+        n_farms = len(self.meta_out_offshore)
+        farm_pos = pd.Series(np.arange(n_farms),
+                             index=self.meta_out_offshore.index)
+        labels = farm_pos.reindex(self._i).values
+        mask = ~np.isnan(labels)
+
+        rows = labels[mask].astype(np.int64)
+        cols = self.meta_source_offshore.index.values[mask]
+        counts = np.bincount(rows, minlength=n_farms)
+        weights = 1 / counts[rows]
+
+        shape = (n_farms, len(self.meta_source_full))
+        agg_matrix = sparse.csc_matrix((weights, (rows, cols)), shape=shape)
+
+        return agg_matrix
+
+    @classmethod
+    def _get_block_slices(cls, cols, shape, chunks, itemsize):
+        """Get chunk-aligned slices of gen_fpath site columns that span the
+        requested columns and fit within the block memory limit.
 
         Parameters
         ----------
-        gen_fpath : str
-            Full filepath to reV gen h5 output file.
-        meta : pd.DataFrame
-            Offshore resource meta data for resource pixels belonging to the
-            single wind farm. The meta index should correspond to the gids in
-            the gen_fpath.
-        system_inputs : dict
-            Wind farm system inputs.
-        site_data : dict
-            Wind-farm site-specific data inputs.
-        site_gid : int
-            Optional site gid (farm index) for logging and debugging.
+        cols : np.ndarray
+            Site columns (gen_fpath site indices) that have to be read.
+        shape : tuple
+            Dataset shape.
+        chunks : tuple | None
+            Dataset chunk shape.
+        itemsize : int
+            Number of bytes per dataset element.
 
         Returns
         -------
-        gen_data : dict
-            Dictionary of all available generation datasets. Keys are reV gen
-            output dataset names, values are spatial averages - scalar resource
-            data (cf_mean) gets averaged to one offshore farm value (float),
-            profiles (cf_profile) gets averaged to one offshore farm profile
-            (1D arrays). Added ORCA lcoe as "lcoe_fcr" with wind farm site
-            LCOE value with units: $/MWh.
+        block_slices : list
+            List of site slices to read in order.
         """
+        chunk_sites = 1
+        if chunks is not None and chunks[-1] is not None:
+            chunk_sites = chunks[-1]
 
-        gen_data = Offshore._get_farm_gen_data(gen_fpath, meta)
-        cf = gen_data['cf_mean'].mean()
+        site_bytes = itemsize * int(np.prod(shape[:-1]))
+        n_chunks = max(1, cls.MAX_BLOCK_BYTES // (site_bytes * chunk_sites))
+        step = chunk_sites * n_chunks
 
-        if cf > 1:
-            m = ('Offshore wind aggregated mean capacity factor ({}) for '
-                 'wind farm gid {} is greater than 1, maybe the data is '
-                 'still integer scaled.'.format(cf, site_gid))
-            logger.warning(m)
-            warn(m, OffshoreWindInputWarning)
+        i0 = (cols.min() // chunk_sites) * chunk_sites
+        i1 = cols.max() + 1
 
-        lcoe = Offshore._run_orca(cf, system_inputs, site_data,
-                                  site_gid=site_gid)
-        gen_data['lcoe_fcr'] = lcoe
+        block_slices = [slice(i, min(i + step, i1))
+                        for i in range(i0, i1, step)]
 
-        return gen_data
+        return block_slices
 
-    @staticmethod
-    def _get_farm_gen_data(gen_fpath, meta, ignore=('meta', 'time_index',
-                                                    'lcoe_fcr')):
-        """Get the aggregated generation data for a single wind farm.
+    def _aggregate_gen_data(self, ignore=('meta', 'time_index', 'lcoe_fcr')):
+        """Aggregate the offshore generation data to the output farms with
+        one sequential scan of gen_fpath.
+
+        Each dataset is read once in chunk-aligned site blocks and all farm
+        means are computed with a sparse farm averaging matrix. Profiles
+        (e.g. cf_profile) are averaged to one profile per farm and scalar
+        datasets (e.g. cf_mean) are averaged to one value per farm. Results
+        are written to the offshore output arrays.
 
         Parameters
         ----------
-        gen_fpath : str
-            Full filepath to reV gen h5 output file.
-        meta : pd.DataFrame
-            Offshore resource meta data for resource pixels belonging to the
-            single wind farm. The meta index should correspond to the gids in
-            the gen_fpath.
         ignore : list | tuple
-            List of datasets to ignore and not retrieve.
-
-        Returns
-        -------
-        gen_data : dict
-            Dictionary of all available generation datasets. Keys are reV gen
-            output dataset names, values are spatial averages - scalar resource
-            data (cf_mean) gets averaged to one offshore farm value (float),
-            profiles (cf_profile) gets averaged to one offshore farm profile
-            (1D arrays).
+            List of datasets to ignore and not aggregate.
         """
+        agg_matrix = self._get_agg_matrix()
+        cols = np.where(np.diff(agg_matrix.indptr) > 0)[0]
 
-        gen_data = {}
-        with Outputs(gen_fpath, mode='r', unscale=True) as out:
-
+        with Outputs(self._gen_fpath, mode='r', unscale=True) as out:
             dsets = [d for d in out.datasets if d not in ignore]
 
             if 'cf_mean' not in dsets:
@@ -578,39 +592,26 @@ class Offshore:
                 raise KeyError(m)
 
             for dset in dsets:
-                shape = out.get_dset_properties(dset)[0]
-                if len(shape) == 1:
-                    gen_data[dset] = out[dset, meta.index.values].mean()
-                else:
-                    arr = out[dset, :, meta.index.values]
-                    gen_data[dset] = arr.mean(axis=1)
+                shape, dtype, chunks = out.get_dset_properties(dset)
+                block_slices = self._get_block_slices(
+                    cols, shape, chunks, np.dtype(dtype).itemsize)
 
-        return gen_data
+                logger.debug('Aggregating offshore data for "{}" in {} site '
+                             'blocks.'.format(dset, len(block_slices)))
 
-    @staticmethod
-    def _run_orca(cf_mean, system_inputs, site_data, site_gid=0):
-        """Run an ORCA LCOE compute for a wind farm.
+                farm_data = np.zeros((len(self.meta_out_offshore),)
+                                     + tuple(shape[:-1]), dtype=np.float64)
+                for block in block_slices:
+                    weights = agg_matrix[:, block]
+                    if weights.nnz:
+                        if len(shape) == 1:
+                            data = out[dset, block]
+                        else:
+                            data = out[dset, :, block].T
 
-        Parameters
-        ----------
-        cf_mean : float
-            Annual mean capacity factor for wind farm site.
-        system_inputs : dict
-            Wind farm system inputs.
-        site_data : dict
-            Wind-farm site-specific data inputs.
-        site_gid : int
-            Optional site gid for logging and debugging.
-
-        Results
-        -------
-        orca.lcoe : float
-            Site LCOE value with units: $/MWh.
-        """
-        site_data['gcf'] = cf_mean
-        orca = ORCA_LCOE(system_inputs, site_data, site_gid=site_gid)
+                        farm_data += weights @ data
 
-        return orca.lcoe
+                self._out[dset][...] = farm_data.T
 
     def _get_farm_gid(self, ifarm):
         """Get a unique resource gid for a wind farm.
@@ -716,9 +717,18 @@ class Offshore:
             warn(w, OffshoreWindInputWarning)
             self._warned = True
 
-    def _run_serial(self):
-        """Run offshore gen aggregation and ORCA econ compute in serial."""
+    def _get_farm_inputs(self):
+        """Get the ORCA inputs for all output offshore farms.
+
+        Returns
+        -------
+        farm_inputs : list
+            List of (i, farm_gid, system_inputs, site_data) tuples where i is
+            the farm position in meta_out_offshore and site_data includes the
+            farm aggregated capacity factor.
+        """
 
+        farm_inputs = []
         for i, (ifarm, meta) in enumerate(self.meta_out_offshore.iterrows()):
 
             row = self._offshore_data.loc[ifarm, :]
@@ -727,70 +737,89 @@ class Offshore:
             self._check_dist(meta, row)
 
             if farm_gid is not None:
-                cf_ilocs = np.where(self._i == ifarm)[0]
-                meta = self.meta_source_offshore.iloc[cf_ilocs]
                 system_inputs = self._get_system_inputs(res_gid)
                 site_data = row.to_dict()
 
-                logger.debug('Running offshore gen aggregation and ORCA econ '
-                             'compute for ifarm {}, farm gid {}, res gid {}'
-                             .format(ifarm, farm_gid, res_gid))
-
                 self._check_sys_inputs(system_inputs, site_data)
 
-                gen_data = self._get_farm_data(self._gen_fpath, meta,
-                                               system_inputs, site_data,
-                                               site_gid=farm_gid)
+                cf = float(self._out['cf_mean'][i])
+                if cf > 1:
+                    m = ('Offshore wind aggregated mean capacity factor ({}) '
+                         'for wind farm gid {} is greater than 1, maybe the '
+                         'data is still integer scaled.'.format(cf, farm_gid))
+                    logger.warning(m)
+                    warn(m, OffshoreWindInputWarning)
 
-                for k, v in gen_data.items():
-                    if isinstance(v, (np.ndarray, list, tuple)):
-                        self._out[k][:, i] = v
-                    else:
-                        self._out[k][i] = v
+                site_data['gcf'] = cf
+                farm_inputs.append((i, farm_gid, system_inputs, site_data))
 
-    def _run_parallel(self):
-        """Run offshore gen aggregation and ORCA econ compute in parallel."""
+        return farm_inputs
 
-        futures = {}
-        loggers = [__name__, 'reV']
-        with SpawnProcessPool(max_workers=self._max_workers,
-                              loggers=loggers) as exe:
+    @staticmethod
+    def _run_orca(farm_inputs):
+        """Run a batched ORCA LCOE compute for many wind farms.
+
+        Parameters
+        ----------
+        farm_inputs : list
+            List of (i, farm_gid, system_inputs, site_data) tuples from
+            _get_farm_inputs().
+
+        Returns
+        -------
+        lcoe : list
+            List of (i, lcoe) tuples with wind farm LCOE values with units:
+            $/MWh.
+        """
+        ilocs, farm_gids, system_inputs, site_data = zip(*farm_inputs)
+        lcoe = ORCA_LCOE.run_batch(system_inputs, site_data,
+                                   site_gids=farm_gids)
 
-            iterator = self.meta_out_offshore.iterrows()
-            for i, (ifarm, meta) in enumerate(iterator):
+        return list(zip(ilocs, lcoe))
 
-                row = self._offshore_data.loc[ifarm, :]
-                farm_gid, res_gid = self._get_farm_gid(ifarm)
+    def _run_serial(self):
+        """Run offshore ORCA econ compute in serial."""
+
+        farm_inputs = self._get_farm_inputs()
+        if farm_inputs:
+            for i, lcoe in self._run_orca(farm_inputs):
+                self._out['lcoe_fcr'][i] = lcoe
+
+    def _run_parallel(self):
+        """Run offshore ORCA econ compute in parallel. Farms are sorted by
+        system inputs so that each worker batch builds as few ORCA systems
+        as possible."""
 
-                self._check_dist(meta, row)
+        farm_inputs = sorted(self._get_farm_inputs(),
+                             key=lambda x: ORCA_LCOE._hash_inputs(x[2]))
 
-                if farm_gid is not None:
-                    cf_ilocs = np.where(self._i == ifarm)[0]
-                    meta = self.meta_source_offshore.iloc[cf_ilocs]
-                    system_inputs = self._get_system_inputs(res_gid)
-                    site_data = row.to_dict()
+        max_workers = self._max_workers
+        if max_workers is None:
+            max_workers = os.cpu_count()
 
-                    self._check_sys_inputs(system_inputs, site_data)
+        n_batches = max(1, min(max_workers, len(farm_inputs)))
+        batches = [b.tolist() for b in
+                   np.array_split(np.arange(len(farm_inputs)), n_batches)
+                   if len(b)]
 
-                    future = exe.submit(self._get_farm_data, self._gen_fpath,
-                                        meta, system_inputs, site_data,
-                                        site_gid=farm_gid)
+        futures = []
+        loggers = [__name__, 'reV']
+        with SpawnProcessPool(max_workers=self._max_workers,
+                              loggers=loggers) as exe:
 
-                    futures[future] = i
+            for batch in batches:
+                batch = [farm_inputs[j] for j in batch]
+                futures.append(exe.submit(self._run_orca, batch))
 
             for fi, future in enumerate(as_completed(futures)):
                 logger.info('Completed {} out of {} offshore compute futures.'
                             .format(fi + 1, len(futures)))
-                i = futures[future]
-                gen_data = future.result()
-                for k, v in gen_data.items():
-                    if isinstance(v, (np.ndarray, list, tuple)):
-                        self._out[k][:, i] = v
-                    else:
-                        self._out[k][i] = v
+                for i, lcoe in future.result():
+                    self._out['lcoe_fcr'][i] = lcoe
 
     def _run(self):
         """Run offshore gen aggregation and ORCA econ compute"""
+        self._aggregate_gen_data()
         if self._max_workers == 1:
             self._run_serial()
         else:
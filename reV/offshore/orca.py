@@ -6,8 +6,11 @@ Created on Fri Dec 13 10:03:35 2019
 @author: gbuster
 """
 from copy import deepcopy
+import hashlib
+import json
 import numpy as np
 import pandas as pd
+import time
 from warnings import warn
 import logging
 
@@ -143,3 +146,109 @@ class ORCA_LCOE:
         lcoe_result = self.system.lcoe(self.orca_data_struct)
         lcoe_result = self._filter_lcoe(lcoe_result[0], self._gid)
         return lcoe_result
+
+    @staticmethod
+    def _hash_inputs(inputs):
+        """Get a hash key for a dictionary of ORCA inputs.
+
+        Parameters
+        ----------
+        inputs : dict
+            System inputs or single-site data inputs.
+
+        Returns
+        -------
+        key : str
+            Hex digest of the json-serialized inputs.
+        """
+        inputs = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha1(inputs.encode()).hexdigest()
+
+    @classmethod
+    def _evaluate_group(cls, system_inputs, site_data, site_gids):
+        """Evaluate the LCOE for many sites that share one ORCA system.
+
+        Parameters
+        ----------
+        system_inputs : dict
+            System inputs (non site specific) shared by all sites.
+        site_data : pd.DataFrame
+            Site-specific inputs, one row per site.
+        site_gids : list
+            Site gids for logging and debugging.
+
+        Returns
+        -------
+        lcoe : list
+            Site LCOE values with units: $/MWh.
+        """
+        from ORCA.system import System as ORCASystem
+        from ORCA.data import Data as ORCAData
+
+        system = ORCASystem(system_inputs)
+
+        lcoe = np.atleast_1d(system.lcoe(ORCAData(site_data)))
+        if len(lcoe) != len(site_data):
+            # ORCA did not return one LCOE per site, evaluate sites one by one
+            lcoe = [system.lcoe(ORCAData(site_data.iloc[[i]]))[0]
+                    for i in range(len(site_data))]
+
+        return [cls._filter_lcoe(v, gid) for v, gid in zip(lcoe, site_gids)]
+
+    @classmethod
+    def run_batch(cls, system_inputs, site_data, site_gids=None):
+        """Compute the LCOE for a batch of offshore wind sites.
+
+        Sites are grouped by their system inputs (after site-specific
+        overrides) so each ORCA system is only built once, all sites in a
+        group are evaluated in one ORCA call, and sites with identical
+        system inputs and site data are only evaluated once per batch.
+
+        Parameters
+        ----------
+        system_inputs : list
+            List of system/technology configuration input dicts, one per site.
+        site_data : list
+            List of site-specific input dicts, one per site.
+        site_gids : list | None
+            Optional site gids for logging and debugging.
+
+        Returns
+        -------
+        lcoe : list
+            Site LCOE values with units: $/MWh.
+        """
+        t0 = time.time()
+        if site_gids is None:
+            site_gids = list(range(len(site_data)))
+
+        keys = []
+        groups = {}
+        for sys_in, data, gid in zip(system_inputs, site_data, site_gids):
+            sys_in, data = cls._parse_site_data(sys_in, data, site_gid=gid)
+            sys_key = cls._hash_inputs(sys_in)
+            key = (sys_key, cls._hash_inputs(data.iloc[0].to_dict()))
+            keys.append(key)
+
+            group = groups.setdefault(sys_key, (sys_in, {}))
+            group[1].setdefault(key, (data, gid))
+
+        lcoe = {}
+        for sys_in, sites in groups.values():
+            data = pd.concat([d for d, _ in sites.values()],
+                             ignore_index=True)
+            gids = [gid for _, gid in sites.values()]
+            lcoe.update(zip(sites.keys(),
+                            cls._evaluate_group(sys_in, data, gids)))
+
+        lcoe = [lcoe[key] for key in keys]
+
+        n_eval = sum(len(sites) for _, sites in groups.values())
+        elapsed = max(time.time() - t0, 1e-9)
+        logger.info('ORCA LCOE computed for {} sites ({} evaluated, {} '
+                    'duplicates) with {} unique systems in {:.2f} seconds '
+                    '({:.1f} sites/sec).'
+                    .format(len(keys), n_eval, len(keys) - n_eval,
+                            len(groups), elapsed, len(keys) / elapsed))
+
+        return lcoe
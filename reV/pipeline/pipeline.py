@@ -2,7 +2,6 @@
 """
 reV data pipeline architecture.
 """
-import time
 import os
 import numpy as np
 import logging
@@ -10,7 +9,7 @@ from warnings import warn
 
 from reV.config.base_analysis_config import AnalysisConfig
 from reV.config.pipeline import PipelineConfig
-from reV.pipeline.status import Status
+from reV.pipeline.status import JobStatusStore, Status
 from reV.utilities.exceptions import ExecutionError
 
 from rex.utilities import safe_json_load
@@ -40,6 +39,10 @@ class Pipeline:
                     2: 'failed',
                     3: 'complete'}
 
+    # maximum seconds between step status checks when no job updates are
+    # posted to the job status store (hardware status fallback)
+    MONITOR_INTERVAL = 5
+
     def __init__(self, pipeline, monitor=True, verbose=False):
         """
         Parameters
@@ -100,9 +103,12 @@ class Pipeline:
                 if not self.monitor:
                     break
 
-                time.sleep(1)
+                # wake up as soon as a job posts a status update or fall
+                # back to checking the hardware status every interval
+                store = JobStatusStore(self._config.dirout)
+                seq = store.last_seq
                 while return_code == 1 and self.monitor:
-                    time.sleep(5)
+                    seq = store.wait(seq, self.MONITOR_INTERVAL)
                     return_code = self._check_step_completed(i)
 
                     if return_code == 2:
@@ -2,13 +2,15 @@
 """
 reV job status manager.
 """
+from contextlib import contextmanager
 import copy
 import os
 import json
 import logging
+import sqlite3
 import time
+from urllib.request import pathname2url
 from warnings import warn
-import shutil
 
 from rex.utilities import safe_json_load
 from rex.utilities.hpc import SLURM
@@ -17,6 +19,244 @@ from rex.utilities.execution import SubprocessManager
 logger = logging.getLogger(__name__)
 
 
+class JobStatusStore:
+    """Indexed SQLite store of single-job status updates.
+
+    Node jobs post their status to this store instead of writing individual
+    jobstatus_*.json files. Each post is a single transaction keyed by job
+    name, so reading or consuming the update for one job does not require
+    scanning the status directory. Every post also advances a global sequence
+    number that monitors can wait on to be notified of new job updates.
+
+    The store relies on SQLite file locking. Some network filesystems (e.g.
+    NFS without a lock daemon) do not implement locking reliably, which can
+    lose or corrupt updates without raising an error, so the status
+    directory should be on a local or parallel filesystem with working
+    POSIX locks (e.g. Lustre or GPFS). Only a failed post that raises
+    sqlite3.Error falls back to a single-job json status file.
+    """
+
+    FNAME = 'jobstatus.db'
+    FALLBACK_FNAME = 'jobstatus_fallback'
+
+    def __init__(self, status_dir, timeout=60):
+        """
+        Parameters
+        ----------
+        status_dir : str
+            Directory containing the job status database.
+        timeout : float
+            Seconds to wait on a locked database before raising an error.
+        """
+        self._fpath = os.path.join(status_dir, self.FNAME)
+        self._timeout = timeout
+
+    @property
+    def fpath(self):
+        """Get the filepath to the job status database.
+
+        Returns
+        -------
+        str
+        """
+        return self._fpath
+
+    @property
+    def exists(self):
+        """Check whether the job status database has been created.
+
+        Returns
+        -------
+        bool
+        """
+        return os.path.isfile(self._fpath)
+
+    @property
+    def fallback_fpath(self):
+        """Get the filepath to the marker that is created when a job could
+        not post to the store and wrote a single-job json status file.
+
+        Returns
+        -------
+        str
+        """
+        return os.path.join(os.path.dirname(self._fpath),
+                            self.FALLBACK_FNAME)
+
+    @contextmanager
+    def _connect(self, read_only=False):
+        """Open a connection to the job status database in autocommit mode
+        so that transactions can be controlled explicitly. Read-only
+        connections do not create the database or its table."""
+        if read_only:
+            uri = 'file:{}?mode=ro'.format(pathname2url(self._fpath))
+            con = sqlite3.connect(uri, timeout=self._timeout, uri=True,
+                                  isolation_level=None)
+        else:
+            con = sqlite3.connect(self._fpath, timeout=self._timeout,
+                                  isolation_level=None)
+        try:
+            if not read_only:
+                con.execute('CREATE TABLE IF NOT EXISTS updates ('
+                            'seq INTEGER PRIMARY KEY AUTOINCREMENT, '
+                            'job_name TEXT NOT NULL UNIQUE, '
+                            'module TEXT NOT NULL, '
+                            'attrs TEXT NOT NULL)')
+            yield con
+        finally:
+            con.close()
+
+    def post(self, module, job_name, attrs):
+        """Post a job status update, replacing any unconsumed update for the
+        same job.
+
+        Parameters
+        ----------
+        module : str
+            reV module that the job belongs to.
+        job_name : str
+            Unique job name identification.
+        attrs : dict
+            Dictionary of job attributes that represent the job status.
+        """
+        attrs = json.dumps(attrs, sort_keys=True)
+        with self._connect() as con:
+            con.execute('INSERT OR REPLACE INTO updates '
+                        '(job_name, module, attrs) VALUES (?, ?, ?)',
+                        (job_name, module, attrs))
+
+    def pop(self, job_name):
+        """Consume the pending status update for a single job.
+
+        Parameters
+        ----------
+        job_name : str
+            Unique job name identification.
+
+        Returns
+        -------
+        status : dict | None
+            Job status dictionary {module: {job_name: attrs}} if an update
+            was found, otherwise None.
+        """
+        status = None
+        if self.exists:
+            with self._connect() as con:
+                con.execute('BEGIN IMMEDIATE')
+                row = con.execute('SELECT module, attrs FROM updates '
+                                  'WHERE job_name = ?',
+                                  (job_name,)).fetchone()
+                if row is not None:
+                    con.execute('DELETE FROM updates WHERE job_name = ?',
+                                (job_name,))
+                    status = {row[0]: {job_name: json.loads(row[1])}}
+                con.execute('COMMIT')
+
+        return status
+
+    def pop_all(self):
+        """Consume all pending job status updates in the order posted.
+
+        Returns
+        -------
+        statuses : list
+            List of job status dictionaries {module: {job_name: attrs}}.
+        """
+        statuses = []
+        if self.exists:
+            with self._connect() as con:
+                con.execute('BEGIN IMMEDIATE')
+                rows = con.execute('SELECT job_name, module, attrs '
+                                   'FROM updates ORDER BY seq').fetchall()
+                con.execute('DELETE FROM updates')
+                con.execute('COMMIT')
+
+            statuses = [{module: {job_name: json.loads(attrs)}}
+                        for job_name, module, attrs in rows]
+
+        return statuses
+
+    @staticmethod
+    def _read_seq(con):
+        """Read the sequence number of the most recent post.
+
+        Parameters
+        ----------
+        con : sqlite3.Connection
+            Open connection to the job status database.
+
+        Returns
+        -------
+        int
+        """
+        try:
+            row = con.execute('SELECT seq FROM sqlite_sequence '
+                              "WHERE name = 'updates'").fetchone()
+        except sqlite3.OperationalError:
+            # database file exists but the table is not created yet
+            row = None
+
+        return 0 if row is None else row[0]
+
+    @property
+    def last_seq(self):
+        """Get the sequence number of the most recent job status post.
+
+        Returns
+        -------
+        int
+            Monotonically increasing post counter. Zero if nothing has been
+            posted yet.
+        """
+        seq = 0
+        if self.exists:
+            with self._connect(read_only=True) as con:
+                seq = self._read_seq(con)
+
+        return seq
+
+    def wait(self, seq, timeout, interval=1.0):
+        """Block until a new job status is posted or the timeout elapses.
+
+        A single read-only connection is held for the duration of the wait
+        and polls the database "PRAGMA data_version", which only changes
+        when another connection commits, so the sequence number is only
+        re-read after a post.
+
+        Parameters
+        ----------
+        seq : int
+            Last sequence number seen by the caller.
+        timeout : float
+            Maximum number of seconds to wait.
+        interval : float
+            Seconds between checks for a new post.
+
+        Returns
+        -------
+        seq : int
+            Current sequence number, greater than the input seq if a new job
+            status was posted.
+        """
+        t_end = time.time() + timeout
+        current = seq
+        while not self.exists and time.time() < t_end:
+            time.sleep(min(interval, max(t_end - time.time(), 0)))
+
+        if self.exists:
+            with self._connect(read_only=True) as con:
+                version = con.execute('PRAGMA data_version').fetchone()[0]
+                current = self._read_seq(con)
+                while current <= seq and time.time() < t_end:
+                    time.sleep(min(interval, max(t_end - time.time(), 0)))
+                    new = con.execute('PRAGMA data_version').fetchone()[0]
+                    if new != version:
+                        version = new
+                        current = self._read_seq(con)
+
+        return current
+
+
 class Status(dict):
     """Base class for reV data pipeline health and status information."""
 
@@ -46,6 +286,7 @@ class Status(dict):
         self._status_dir = status_dir
         self._fpath = self._parse_fpath(status_dir, name)
         self.data = self._load(self._fpath)
+        self._dumped = copy.deepcopy(self.data)
 
     @staticmethod
     def _parse_fpath(status_dir, name):
@@ -101,19 +342,22 @@ class Status(dict):
         return data
 
     def _dump(self):
-        """Dump status json w/ backup file in case process gets killed."""
+        """Dump status json if the status data has changed. The json is
+        written to a temporary file and then moved into place so the status
+        file is never left partially written if the process gets killed."""
+
+        if self.data == self._dumped and os.path.exists(self._fpath):
+            return
 
         if not os.path.exists(os.path.dirname(self._fpath)):
             os.makedirs(os.path.dirname(self._fpath))
 
-        backup = self._fpath.replace('.json', '_backup.json')
+        temp = '{}.{}.tmp'.format(self._fpath, os.getpid())
         self._sort_by_index()
-        if os.path.exists(self._fpath):
-            shutil.copy(self._fpath, backup)
-        with open(self._fpath, 'w') as f:
+        with open(temp, 'w') as f:
             json.dump(self.data, f, indent=4, separators=(',', ': '))
-        if os.path.exists(backup):
-            os.remove(backup)
+        os.replace(temp, self._fpath)
+        self._dumped = copy.deepcopy(self.data)
 
     def _sort_by_index(self):
         """Sort modules in data dictionary by pipeline index."""
@@ -162,14 +406,29 @@ class Status(dict):
         return status
 
     def _check_all_job_files(self, status_dir):
-        """Look for all single-job job status files in the target status_dir
-        and update status.
+        """Look for all single-job status updates in the job status store and
+        any legacy job status files in the target status_dir and update
+        status. The status_dir is only scanned for legacy files if the store
+        does not exist or a job has fallen back to writing a json file.
 
         Parameters
         ----------
         status_dir : str
             Directory to look for completion file.
         """
+        store = JobStatusStore(status_dir)
+        for status in store.pop_all():
+            self.data = self.update_dict(self.data, status)
+
+        if store.exists:
+            if not os.path.exists(store.fallback_fpath):
+                return
+            # remove the marker before scanning so that a fallback written
+            # during the scan is picked up on the next check
+            try:
+                os.remove(store.fallback_fpath)
+            except FileNotFoundError:
+                pass
 
         for fname in os.listdir(status_dir):
             if fname.startswith('jobstatus_') and fname.endswith('.json'):
@@ -181,7 +440,8 @@ class Status(dict):
 
     @staticmethod
     def _check_job_file(status_dir, job_name):
-        """Look for a single-job job status file in the target status_dir.
+        """Look for a single-job status update in the job status store or a
+        legacy job status file in the target status_dir.
 
         Parameters
         ----------
@@ -195,15 +455,14 @@ class Status(dict):
         status : dict | None
             Job status dictionary if completion file found.
         """
-        status = None
-        target_fname = 'jobstatus_{}.json'.format(job_name)
-        for fname in os.listdir(status_dir):
-            if fname == target_fname:
-                # wait one second to make sure file is finished being written
-                time.sleep(0.01)
-                status = safe_json_load(os.path.join(status_dir, fname))
-                os.remove(os.path.join(status_dir, fname))
-                break
+        status = JobStatusStore(status_dir).pop(job_name)
+
+        fpath = os.path.join(status_dir, 'jobstatus_{}.json'.format(job_name))
+        if status is None and os.path.isfile(fpath):
+            # wait one second to make sure file is finished being written
+            time.sleep(0.01)
+            status = safe_json_load(fpath)
+            os.remove(fpath)
 
         return status
 
@@ -234,6 +493,10 @@ class Status(dict):
                 previous = self.data[module][job_name].get('job_status', None)
                 job_id = self.data[module][job_name].get('job_id', None)
 
+                # frozen statuses cannot be changed by the hardware status
+                if previous in self.FROZEN_STATUS:
+                    return
+
                 # get job status from hardware
                 current = self._get_job_status(job_id)
 
@@ -360,7 +623,10 @@ class Status(dict):
 
     @staticmethod
     def make_job_file(status_dir, module, job_name, attrs):
-        """Make a json file recording the status of a single job.
+        """Record the status of a single job in the job status store. Falls
+        back to writing a single-job json file if posting to the store raises
+        an sqlite3.Error. Filesystems with broken locking may not raise, see
+        JobStatusStore.
 
         Parameters
         ----------
@@ -376,12 +642,26 @@ class Status(dict):
         """
         if job_name.endswith('.h5'):
             job_name = job_name.replace('.h5', '')
+        try:
+            JobStatusStore(status_dir).post(module, job_name, attrs)
+            return
+        except sqlite3.Error as e:
+            msg = ('Could not post status for job "{}" to the job status '
+                   'store, writing a job status file instead: {}'
+                   .format(job_name, e))
+            logger.warning(msg)
+            warn(msg)
+
         status = {module: {job_name: attrs}}
         fpath = os.path.join(status_dir, 'jobstatus_{}.json'.format(job_name))
         with open(fpath, 'w') as f:
             json.dump(status, f, sort_keys=True, indent=4,
                       separators=(',', ': '))
 
+        # flag that the status_dir has to be scanned for job status files
+        with open(JobStatusStore(status_dir).fallback_fpath, 'w'):
+            pass
+
     @classmethod
     def add_job(cls, status_dir, module, job_name, replace=False,
                 job_attrs=None):
@@ -291,6 +291,9 @@ def supply_curve(ctx, sc_table, out_dir, sub_dir, columns, plot_type, cmap,
 @click.option('--min_area', '-ma', type=FLOAT, default=None,
               help='Contiguous area filter minimum area, default is None '
               '(No minimum area filter).')
+@click.option('--excl_cache_dir', '-ecd', type=STR, default=None,
+              help='Optional directory to cache the combined exclusion layer '
+              'mask in. Default is None (no cache).')
 @click.option('--plot_type', '-plt', default='plotly',
               type=click.Choice(['plot', 'plotly'], case_sensitive=False),
               help=(" plot_type of plot to create 'plot' or 'plotly', by "
@@ -308,8 +311,8 @@ def supply_curve(ctx, sc_table, out_dir, sub_dir, columns, plot_type, cmap,
                     'Prints successful status file.'))
 @click.pass_context
 def exclusions(ctx, excl_fpath, out_dir, sub_dir, excl_dict,
-               area_filter_kernel, min_area, plot_type, cmap, plot_step,
-               log_file, verbose, terminal):
+               area_filter_kernel, min_area, excl_cache_dir, plot_type, cmap,
+               plot_step, log_file, verbose, terminal):
     """
     Extract and plot reV exclusions mask
     """
@@ -330,7 +333,8 @@ def exclusions(ctx, excl_fpath, out_dir, sub_dir, excl_dict,
 
     QaQc.exclusions_mask(excl_fpath, qa_dir, layers_dict=excl_dict,
                          min_area=min_area, kernel=area_filter_kernel,
-                         plot_type=plot_type, cmap=cmap, plot_step=plot_step)
+                         plot_type=plot_type, cmap=cmap, plot_step=plot_step,
+                         cache_dir=excl_cache_dir)
 
     if terminal:
         status = {'dirout': out_dir, 'job_status': 'successful',
@@ -402,6 +406,7 @@ def from_config(ctx, config_file, verbose):
                                excl_dict=module_config.excl_dict,
                                area_filter_kernel=afk,
                                min_area=module_config.min_area,
+                               excl_cache_dir=module_config.excl_cache_dir,
                                plot_type=module_config.plot_type,
                                cmap=module_config.cmap,
                                plot_step=module_config.plot_step,
@@ -531,8 +536,8 @@ def get_sc_cmd(name, sc_table, out_dir, sub_dir, columns, plot_type, cmap,
 
 
 def get_excl_cmd(name, excl_fpath, out_dir, sub_dir, excl_dict,
-                 area_filter_kernel, min_area, plot_type, cmap, plot_step,
-                 log_file, verbose, terminal):
+                 area_filter_kernel, min_area, excl_cache_dir, plot_type, cmap,
+                 plot_step, log_file, verbose, terminal):
     """Build CLI call for exclusions."""
 
     args = ['-excl {}'.format(SLURM.s(excl_fpath)),
@@ -541,6 +546,7 @@ def get_excl_cmd(name, excl_fpath, out_dir, sub_dir, excl_dict,
             '-exd {}'.format(SLURM.s(excl_dict)),
             '-afk {}'.format(SLURM.s(area_filter_kernel)),
             '-ma {}'.format(SLURM.s(min_area)),
+            '-ecd {}'.format(SLURM.s(excl_cache_dir)),
             '-plt {}'.format(SLURM.s(plot_type)),
             '-cmap {}'.format(SLURM.s(cmap)),
             '-step {}'.format(SLURM.s(plot_step)),
@@ -601,6 +607,7 @@ def get_multiple_cmds(config, out_dir, log_file, verbose):
                                              module_config.excl_dict,
                                              module_config.area_filter_kernel,
                                              module_config.min_area,
+                                             module_config.excl_cache_dir,
                                              module_config.plot_type,
                                              module_config.cmap,
                                              module_config.plot_step,
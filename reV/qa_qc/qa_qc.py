@@ -189,7 +189,8 @@ class QaQc:
     @classmethod
     def exclusions_mask(cls, excl_h5, out_dir, layers_dict=None, min_area=None,
                         kernel='queen', hsds=False, plot_type='plotly',
-                        cmap='viridis', plot_step=100, **kwargs):
+                        cmap='viridis', plot_step=100, cache_dir=None,
+                        **kwargs):
         """
         Create inclusion mask from given layers dictionary, dump to disk and
         plot
@@ -213,6 +214,9 @@ class QaQc:
             Colormap name, by default 'viridis'
         plot_step : int
             Step between points to plot
+        cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask in,
+            re-using a cached mask from a previous run if available.
         kwargs : dict
             Additional plotting kwargs
         """
@@ -222,7 +226,8 @@ class QaQc:
                                                   layers_dict=layers_dict,
                                                   min_area=min_area,
                                                   kernel=kernel,
-                                                  hsds=hsds)
+                                                  hsds=hsds,
+                                                  cache_dir=cache_dir)
             excl_mask = np.round(excl_mask * 100).astype('uint8')
 
             out_file = os.path.basename(excl_h5).replace('.h5', '_mask.npy')
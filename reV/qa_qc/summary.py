@@ -6,8 +6,6 @@ import logging
 import numpy as np
 import os
 import pandas as pd
-import plotting as mplt
-import plotly.express as px
 
 from rex import Resource
 from rex.utilities import SpawnProcessPool, parse_table
@@ -522,6 +520,7 @@ class SummaryPlots(PlotBase):
         kwargs : dict
             Additional kwargs for plotting.dataframes.df_scatter
         """
+        import plotting as mplt
         self._check_value(self.summary, value)
         mplt.df_scatter(self.summary, x='longitude', y='latitude', c=value,
                         colormap=cmap, filename=out_path, **kwargs)
@@ -543,6 +542,7 @@ class SummaryPlots(PlotBase):
         kwargs : dict
             Additional kwargs for plotly.express.scatter
         """
+        import plotly.express as px
         self._check_value(self.summary, value)
         fig = px.scatter(self.summary, x='longitude', y='latitude',
                          color=value, color_continuous_scale=cmap, **kwargs)
@@ -587,6 +587,7 @@ class SummaryPlots(PlotBase):
         kwargs : dict
             Additional kwargs for plotting.dataframes.dist_plot
         """
+        import plotting as mplt
         self._check_value(self.summary, value, scatter=False)
         series = self.summary[value]
         mplt.dist_plot(series, filename=out_path, **kwargs)
@@ -604,6 +605,7 @@ class SummaryPlots(PlotBase):
         kwargs : dict
             Additional kwargs for plotly.express.histogram
         """
+        import plotly.express as px
         self._check_value(self.summary, value, scatter=False)
 
         fig = px.histogram(self.summary, x=value)
@@ -769,6 +771,7 @@ class SupplyCurvePlot(PlotBase):
         kwargs : dict
             Additional kwargs for plotting.dataframes.df_scatter
         """
+        import plotting as mplt
         sc_df = self._extract_sc_data(lcoe=lcoe)
         mplt.df_scatter(sc_df, x='cumulative_capacity', y=lcoe,
                         filename=out_path, **kwargs)
@@ -787,6 +790,7 @@ class SupplyCurvePlot(PlotBase):
         kwargs : dict
             Additional kwargs for plotly.express.scatter
         """
+        import plotly.express as px
         sc_df = self._extract_sc_data(lcoe=lcoe)
         fig = px.scatter(sc_df, x='cumulative_capacity', y=lcoe, **kwargs)
         fig.update_layout(font=dict(family="Arial", size=18, color="black"))
@@ -896,6 +900,7 @@ class ExclusionsMask(PlotBase):
         kwargs : dict
             Additional kwargs for plotting.colormaps.heatmap_plot
         """
+        import plotting as mplt
         mplt.heatmap_plot(self.mask[::plot_step, ::plot_step], cmap=cmap,
                           filename=out_path, **kwargs)
 
@@ -916,6 +921,7 @@ class ExclusionsMask(PlotBase):
         kwargs : dict
             Additional kwargs for plotly.express.imshow
         """
+        import plotly.express as px
         fig = px.imshow(self.mask[::plot_step, ::plot_step],
                         color_continuous_scale=cmap, **kwargs)
         fig.update_layout(font=dict(family="Arial", size=18, color="black"))
@@ -13,7 +13,9 @@ import logging
 import numpy as np
 import os
 import pandas as pd
+import psutil
 from scipy import stats
+from scipy.sparse import csr_matrix
 from warnings import warn
 
 
@@ -134,21 +136,43 @@ class RepresentativeMethods:
         return arr
 
     @staticmethod
-    def medianoid(profiles):
+    def medianoid(profiles, weights=None):
         """Find the median profile across all sites.
 
         Parameters
         ----------
         profiles : np.ndarray
             (time, sites) timeseries array of cf profile data.
+        weights : np.ndarray | list
+            1D array of weighting factors (multiplicative) for profiles.
+            With equal weights, this is the same as the unweighted median.
 
         Returns
         -------
         arr : np.ndarray
-            (time, 1) timeseries of the median at every timestep of all
-            cf profiles across sites.
+            (time, 1) timeseries of the (weighted) median at every timestep
+            of all cf profiles across sites.
         """
-        arr = np.median(profiles, axis=1)
+        if weights is None:
+            arr = np.median(profiles, axis=1)
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+            order = np.argsort(profiles, axis=1)
+            sorted_profiles = np.take_along_axis(profiles, order, axis=1)
+            cum_weights = np.cumsum(weights[order], axis=1)
+            half = weights.sum() / 2
+
+            # the first sites reaching and exceeding half of the total
+            # weight are the same site unless the weight splits exactly in
+            # half between two sites, which are then averaged
+            rows = np.arange(len(profiles))
+            i_max = profiles.shape[1] - 1
+            i_lo = np.minimum((cum_weights < half).sum(axis=1), i_max)
+            i_hi = np.minimum((cum_weights <= half).sum(axis=1), i_max)
+            arr = (sorted_profiles[rows, i_lo]
+                   + sorted_profiles[rows, i_hi]) / 2
+            arr = arr.astype(profiles.dtype)
+
         arr = arr.reshape((len(profiles), 1))
 
         return arr
@@ -268,10 +292,7 @@ class RepresentativeMethods:
         inst = cls(profiles, weights=weights, rep_method=rep_method,
                    err_method=err_method)
 
-        if inst._weights is not None:
-            baseline = inst._rep_method(inst._profiles, weights=inst._weights)
-        else:
-            baseline = inst._rep_method(inst._profiles)
+        baseline = inst._rep_method(inst._profiles, weights=inst._weights)
 
         if err_method is None:
             profiles = baseline
@@ -290,13 +311,176 @@ class RepresentativeMethods:
 
         return profiles, i_reps
 
+    @staticmethod
+    def _region_meanoids(profiles, codes, n_regions, weights=None):
+        """Find the (weighted) mean profile of every region with a single
+        sparse segment-sum.
+
+        Parameters
+        ----------
+        profiles : np.ndarray
+            (time, sites) timeseries array of cf profile data for all regions.
+        codes : np.ndarray
+            1D array of integer region codes (0 to n_regions - 1) for every
+            site (column) in profiles.
+        n_regions : int
+            Number of regions in codes.
+        weights : np.ndarray | None
+            1D array of weighting factors (multiplicative) for profiles.
+
+        Returns
+        -------
+        baselines : np.ndarray
+            (time, n_regions) timeseries of the mean cf profile of each region.
+        """
+        w = np.ones(len(codes)) if weights is None else weights
+        w = w.astype(np.float64)
+        seg = csr_matrix((w, (np.arange(len(codes)), codes)),
+                         shape=(len(codes), n_regions))
+        baselines = np.asarray(seg.T.dot(profiles.T).T)
+        baselines /= np.bincount(codes, weights=w, minlength=n_regions)
+
+        return baselines
+
+    @staticmethod
+    def _region_errors(profiles, baselines, codes, err_method='rmse'):
+        """Calculate the error of every site profile vs. its region baseline.
+
+        Parameters
+        ----------
+        profiles : np.ndarray
+            (time, sites) timeseries array of cf profile data for all regions.
+        baselines : np.ndarray
+            (time, n_regions) timeseries of the meanoid or medianoid of each
+            region.
+        codes : np.ndarray
+            1D array of integer region codes for every site in profiles.
+        err_method : str
+            Method identifier for calculation of error from the representative
+            profile.
+
+        Returns
+        -------
+        errors : np.ndarray
+            1D array of errors for every site in profiles.
+        """
+        if err_method == 'mbe':
+            errors = profiles.mean(axis=0) - baselines.mean(axis=0)[codes]
+        elif err_method == 'mae':
+            errors = np.abs(profiles - baselines[:, codes]).mean(axis=0)
+        else:
+            # ||a - b||^2 = ||a||^2 - 2ab + ||b||^2
+            p2 = np.einsum('ij,ij->j', profiles, profiles, dtype=np.float64)
+            pb = np.einsum('ij,ij->j', profiles, baselines[:, codes],
+                           dtype=np.float64)
+            b2 = np.einsum('ij,ij->j', baselines, baselines)[codes]
+            errors = np.sqrt(np.maximum(p2 - 2 * pb + b2, 0) / len(profiles))
+
+        return errors
+
+    @staticmethod
+    def _region_nargmins(errors, segment, n_profiles):
+        """Get the indices of the n_profiles lowest errors in one region.
+
+        Parameters
+        ----------
+        errors : np.ndarray
+            1D array of errors for all sites.
+        segment : np.ndarray
+            Sorted site indices belonging to one region.
+        n_profiles : int
+            Number of representative profiles to retrieve. If this exceeds
+            the number of sites in the region, the highest-error site is
+            repeated.
+
+        Returns
+        -------
+        i_reps : np.ndarray
+            Site indices of the n_profiles most representative profiles,
+            sorted from lowest to highest error.
+        """
+        err = errors[segment]
+        k = min(n_profiles, len(segment))
+        if k < len(segment):
+            top = np.argpartition(err, k - 1)[:k]
+        else:
+            top = np.arange(len(segment))
+
+        top = top[np.lexsort((top, err[top]))]
+        top = np.pad(top, (0, n_profiles - k), mode='edge')
+
+        return segment[top]
+
+    @classmethod
+    def run_regions(cls, profiles, labels, weights=None, rep_method='meanoid',
+                    err_method='rmse', n_profiles=1):
+        """Run representative profile methods for many regions at once.
+
+        Parameters
+        ----------
+        profiles : np.ndarray
+            (time, sites) timeseries array of cf profile data for all regions.
+        labels : np.ndarray | list
+            1D array of region labels for every site (column) in profiles.
+        weights : np.ndarray | list
+            1D array of weighting factors (multiplicative) for profiles.
+        rep_method : str
+            Method identifier for calculation of the representative profile.
+        err_method : str
+            Method identifier for calculation of error from the representative
+            profile.
+        n_profiles : int
+            Number of representative profiles to retrieve per region.
+
+        Returns
+        -------
+        regions : np.ndarray
+            Sorted unique region labels.
+        rep_profiles : dict
+            dict of n_profile-keyed arrays with shape (time, n_regions) for
+            the representative profile(s) of each region. Only key 0 with the
+            region baselines is returned if err_method is None.
+        i_reps : np.ndarray | None
+            (n_regions, n_profiles) array of column indices in profiles of the
+            representative profile(s). None if err_method is None.
+        """
+        inst = cls(profiles, weights=weights, rep_method=rep_method,
+                   err_method=err_method)
+        regions, codes = np.unique(labels, return_inverse=True)
+        codes = codes.ravel()
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(regions) + 1))
+        segments = [order[bounds[r]:bounds[r + 1]]
+                    for r in range(len(regions))]
+
+        if rep_method in ('mean', 'meanoid'):
+            baselines = cls._region_meanoids(profiles, codes, len(regions),
+                                             weights=inst._weights)
+        else:
+            baselines = np.hstack([inst._rep_method(
+                profiles[:, seg],
+                weights=None if inst._weights is None else inst._weights[seg])
+                for seg in segments])
+
+        if err_method is None:
+            return regions, {0: baselines}, None
+
+        errors = cls._region_errors(profiles, baselines, codes,
+                                    err_method=err_method)
+        i_reps = np.array([cls._region_nargmins(errors, seg, n_profiles)
+                           for seg in segments])
+        rep_profiles = {n: profiles[:, i_reps[:, n]]
+                        for n in range(n_profiles)}
+
+        return regions, rep_profiles, i_reps
+
 
 class RegionRepProfile:
     """Framework to handle rep profile for one resource region"""
 
     def __init__(self, gen_fpath, rev_summary, gid_col='gen_gids',
                  cf_dset='cf_profile', rep_method='meanoid', err_method='rmse',
-                 weight='gid_counts', n_profiles=1):
+                 weight='gid_counts', n_profiles=1, source_profiles=None):
         """
         Parameters
         ----------
@@ -321,6 +505,10 @@ class RegionRepProfile:
             weight values corresponding to the gid_col in the same row.
         n_profiles : int
             Number of representative profiles to retrieve.
+        source_profiles : np.ndarray | None
+            Optional pre-loaded (time, n) array of cf profiles corresponding
+            to the flattened gid_col entries in rev_summary. If None, the
+            profiles are read from gen_fpath.
         """
 
         self._gen_fpath = gen_fpath
@@ -328,7 +516,7 @@ class RegionRepProfile:
         self._gid_col = gid_col
         self._cf_dset = cf_dset
         self._profiles = None
-        self._source_profiles = None
+        self._source_profiles = source_profiles
         self._weights = None
         self._i_reps = None
         self._rep_method = rep_method
@@ -406,17 +594,21 @@ class RegionRepProfile:
 
         return data
 
-    def _run_rep_methods(self):
-        """Run the representative profile methods to find the meanoid/medianoid
-        profile and find the profiles most similar."""
+    def _check_weights(self, n_sites):
+        """Check that the weights match the number of source profiles.
 
+        Parameters
+        ----------
+        n_sites : int
+            Number of source profiles (gid_col entries) in the region.
+        """
         if self.weights is not None:
-            if len(self.weights) != self.source_profiles.shape[1]:
+            if len(self.weights) != n_sites:
                 e = ('Weights column "{}" resulted in {} weight scalars '
                      'which doesnt match gid column "{}" which yields '
-                     'profiles with shape {}.'
+                     '{} profiles.'
                      .format(self._weight, len(self.weights),
-                             self._gid_col, self.source_profiles.shape))
+                             self._gid_col, n_sites))
                 gen_gids = self._get_region_attr(self._rev_summary,
                                                  self._gid_col)
                 logger.debug('Gids from column "{}" with len {}: {}'
@@ -427,6 +619,11 @@ class RegionRepProfile:
                 logger.error(e)
                 raise DataShapeError(e)
 
+    def _run_rep_methods(self):
+        """Run the representative profile methods to find the meanoid/medianoid
+        profile and find the profiles most similar."""
+
+        self._check_weights(self.source_profiles.shape[1])
         self._profiles, self._i_reps = RepresentativeMethods.run(
             self.source_profiles, weights=self.weights,
             rep_method=self._rep_method, err_method=self._err_method,
@@ -478,7 +675,7 @@ class RegionRepProfile:
     def get_region_rep_profile(cls, gen_fpath, rev_summary, gid_col='gen_gids',
                                cf_dset='cf_profile', rep_method='meanoid',
                                err_method='rmse', weight='gid_counts',
-                               n_profiles=1):
+                               n_profiles=1, source_profiles=None):
         """Class method for parallelization of rep profile calc.
 
         Parameters
@@ -504,6 +701,10 @@ class RegionRepProfile:
             weight values corresponding to the gid_col in the same row.
         n_profiles : int
             Number of representative profiles to retrieve.
+        source_profiles : np.ndarray | None
+            Optional pre-loaded (time, n) array of cf profiles corresponding
+            to the flattened gid_col entries in rev_summary. If None, the
+            profiles are read from gen_fpath.
 
         Returns
         -------
@@ -518,7 +719,7 @@ class RegionRepProfile:
         """
         r = cls(gen_fpath, rev_summary, gid_col=gid_col, cf_dset=cf_dset,
                 rep_method=rep_method, err_method=err_method, weight=weight,
-                n_profiles=n_profiles)
+                n_profiles=n_profiles, source_profiles=source_profiles)
 
         return r.rep_profiles, r.i_reps, r.rep_gen_gids, r.rep_res_gids
 
@@ -851,7 +1052,7 @@ class RepProfiles(RepProfilesBase):
     def __init__(self, gen_fpath, rev_summary, reg_cols, gid_col='gen_gids',
                  cf_dset='cf_profile', rep_method='meanoid',
                  err_method='rmse', weight='gid_counts',
-                 n_profiles=1):
+                 n_profiles=1, mem_util_lim=0.4):
         """
         Parameters
         ----------
@@ -879,6 +1080,10 @@ class RepProfiles(RepProfilesBase):
             weight values corresponding to the gid_col in the same row.
         n_profiles : int
             Number of representative profiles to save to fout.
+        mem_util_lim : float
+            Memory utilization limit (fractional). Regions are processed in
+            batches so that the source profiles held in memory stay below
+            this fraction of the total node memory.
         """
 
         logger.info('Finding representative profiles that are most similar '
@@ -900,7 +1105,10 @@ class RepProfiles(RepProfilesBase):
                          rep_method=rep_method, err_method=err_method,
                          weight=weight, n_profiles=n_profiles)
 
+        self._region_indices = None
+        self._mem_util_lim = mem_util_lim
         self._set_meta()
+        self._set_region_indices()
         self._init_profiles()
 
     def _set_meta(self):
@@ -914,67 +1122,212 @@ class RepProfiles(RepProfilesBase):
         self._meta['rep_gen_gid'] = None
         self._meta['rep_res_gid'] = None
 
-    def _get_mask(self, region_dict):
-        """Get the mask for a given region and res class.
+    def _set_region_indices(self):
+        """Map each meta row to the positional indices of its region in the
+        rev summary using a single groupby on the region columns."""
+        groups = self._rev_summary.groupby(self._reg_cols).indices
+        groups = {(k if isinstance(k, tuple) else (k,)): v
+                  for k, v in groups.items()}
+
+        self._region_indices = {}
+        for i, row in self.meta.iterrows():
+            key = tuple(row[k] for k in self._reg_cols)
+            self._region_indices[i] = groups.get(key, np.array([], dtype=int))
+
+    def _read_source_profiles(self, gen_gids, block_size=5000):
+        """Read the cf profiles for a list of gen gids exactly once in
+        contiguous chunk-aligned column blocks, writing every block straight
+        into the output columns of its gids.
 
         Parameters
         ----------
-        region_dict : dict
-            Column-value pairs to filter the rev summary on.
+        gen_gids : list | np.ndarray
+            Gen gids to read profiles for. Can be unsorted and contain
+            repeated gids.
+        block_size : int
+            Maximum number of columns to read from the cf dataset at once.
+            Rounded down to a multiple of the dataset column chunk size.
 
         Returns
         -------
-        mask : np.ndarray
-            Boolean mask to filter rev_summary to the appropriate
-            region_dict values.
+        profiles : np.ndarray
+            (time, n) array of cf profiles corresponding to gen_gids.
         """
-        mask = None
-        for k, v in region_dict.items():
-            temp = (self._rev_summary[k] == v)
-            if mask is None:
-                mask = temp
-            else:
-                mask = (mask & temp)
+        gen_gids = np.array(gen_gids, dtype=np.int64)
+        gids, inv = np.unique(gen_gids, return_inverse=True)
+        order = np.argsort(inv.ravel(), kind='stable')
+        bounds = np.searchsorted(inv.ravel()[order], np.arange(len(gids) + 1))
+        profiles = None
+
+        with Resource(self._gen_fpath) as res:
+            ds = res.h5[self._cf_dset]
+            chunk_cols = block_size
+            if ds.chunks is not None:
+                chunk_cols = min(ds.chunks[1], block_size)
+
+            block_cols = chunk_cols * max(1, block_size // chunk_cols)
+            new_block = ((np.diff(gids // chunk_cols) > 1)
+                         | (np.diff(gids // block_cols) > 0))
+            blocks = np.split(np.arange(len(gids)),
+                              np.flatnonzero(new_block) + 1)
+
+            logger.debug('Reading {} "{}" profiles in {} column blocks.'
+                         .format(len(gids), self._cf_dset, len(blocks)))
+            for idx in blocks:
+                block_gids = gids[idx]
+                start = (block_gids[0] // chunk_cols) * chunk_cols
+                stop = (block_gids[-1] // chunk_cols + 1) * chunk_cols
+                stop = min(stop, ds.shape[1])
+                data = res[self._cf_dset, :, start:stop]
+                if profiles is None:
+                    profiles = np.zeros((data.shape[0], len(gen_gids)),
+                                        dtype=data.dtype)
+
+                cols = order[bounds[idx[0]]:bounds[idx[-1] + 1]]
+                profiles[:, cols] = data[:, gen_gids[cols] - start]
+
+        return profiles
+
+    def _site_batches(self, labels):
+        """Split the stacked sites into batches of whole regions so that the
+        source profiles of a batch stay below the memory utilization limit.
+
+        Parameters
+        ----------
+        labels : np.ndarray
+            Meta index of the region for every site, ordered by region (see
+            _get_stacked_inputs()).
+
+        Returns
+        -------
+        batches : list
+            List of slices of the stacked sites. Every batch has at least one
+            region.
+        """
+        with Resource(self._gen_fpath) as res:
+            ds = res.h5[self._cf_dset]
+            n_time = ds.shape[0]
+            # scaled integer profiles are unscaled to float32 on read
+            itemsize = max(ds.dtype.itemsize, np.dtype(np.float32).itemsize)
+
+        max_bytes = self._mem_util_lim * psutil.virtual_memory().total
+        max_sites = max(1, int(max_bytes // (n_time * itemsize)))
+
+        starts = np.append(0, np.flatnonzero(np.diff(labels)) + 1)
+        stops = np.append(starts[1:], len(labels))
+        batches = []
+        i0 = 0
+        for i, j in zip(starts.tolist(), stops.tolist()):
+            if j - i0 > max_sites and i > i0:
+                batches.append(slice(i0, i))
+                i0 = i
+
+        batches.append(slice(i0, len(labels)))
+
+        logger.debug('Running rep profiles for {} sites in {} batches of at '
+                     'most {} sites.'.format(len(labels), len(batches),
+                                             max_sites))
+
+        return batches
+
+    def _get_stacked_inputs(self):
+        """Get flat arrays of gids, weights, and region labels for all sites
+        in all regions, ordered by region.
+
+        Returns
+        -------
+        labels : np.ndarray
+            Meta index of the region for every site.
+        gen_gids : list
+            Generation gids (gid_col entries) for every site.
+        res_gids : list | None
+            Resource gids for every site if gid_col is "gen_gids".
+        weights : np.ndarray | None
+            Weight values for every site if a weight column is set.
+        """
+        labels, gen_gids, res_gids, weights = [], [], [], []
+        for i in self.meta.index:
+            idx = self._region_indices[i]
+            if not len(idx):
+                logger.warning('Skipping profile {} out of {} for region: {} '
+                               'with no valid mask.'
+                               .format(i + 1, len(self.meta),
+                                       self.meta.loc[i, self._reg_cols]
+                                       .to_dict()))
+                continue
+
+            r = RegionRepProfile(self._gen_fpath, self._rev_summary.iloc[idx],
+                                 gid_col=self._gid_col, weight=self._weight)
+            ggids = r._get_region_attr(r._rev_summary, self._gid_col)
+            r._check_weights(len(ggids))
+
+            labels += [i] * len(ggids)
+            gen_gids += ggids
+            if self._gid_col == 'gen_gids':
+                res_gids += r._get_region_attr(r._rev_summary, 'res_gids')
+            if r.weights is not None:
+                weights.append(r.weights)
+
+        res_gids = res_gids if self._gid_col == 'gen_gids' else None
+        weights = np.concatenate(weights) if weights else None
+
+        return np.array(labels), gen_gids, res_gids, weights
+
+    def _set_rep_gids(self, i, ggids, rgids):
+        """Record the representative gen and res gids for one region in the
+        meta data.
 
-        return mask
+        Parameters
+        ----------
+        i : int
+            Meta index of the region.
+        ggids : list
+            Generation gid(s) of the representative profile(s).
+        rgids : list
+            Resource gid(s) of the representative profile(s).
+        """
+        if len(ggids) == 1:
+            self._meta.at[i, 'rep_gen_gid'] = ggids[0]
+            self._meta.at[i, 'rep_res_gid'] = rgids[0]
+        else:
+            self._meta.at[i, 'rep_gen_gid'] = str(ggids)
+            self._meta.at[i, 'rep_res_gid'] = str(rgids)
 
     def _run_serial(self):
-        """Compute all representative profiles in serial."""
+        """Compute all representative profiles in serial with batched
+        multi-region representative method calculations."""
 
         logger.info('Running {} rep profile calculations in serial.'
                     .format(len(self.meta)))
-        meta_static = deepcopy(self.meta)
-        for i, row in meta_static.iterrows():
-            region_dict = {k: v for (k, v) in row.to_dict().items()
-                           if k in self._reg_cols}
-            mask = self._get_mask(region_dict)
-
-            if not any(mask):
-                logger.warning('Skipping profile {} out of {} '
-                               'for region: {} with no valid mask.'
-                               .format(i + 1, len(meta_static), region_dict))
-            else:
-                logger.debug('Working on profile {} out of {} for region: {}'
-                             .format(i + 1, len(meta_static), region_dict))
-                out = RegionRepProfile.get_region_rep_profile(
-                    self._gen_fpath, self._rev_summary[mask],
-                    gid_col=self._gid_col, cf_dset=self._cf_dset,
-                    rep_method=self._rep_method, err_method=self._err_method,
-                    weight=self._weight, n_profiles=self._n_profiles)
-                profiles, _, ggids, rgids = out
-                logger.info('Profile {} out of {} complete '
-                            'for region: {}'
-                            .format(i + 1, len(meta_static), region_dict))
-
-                for n in range(profiles.shape[1]):
-                    self._profiles[n][:, i] = profiles[:, n]
-
-                    if len(ggids) == 1:
-                        self._meta.at[i, 'rep_gen_gid'] = ggids[0]
-                        self._meta.at[i, 'rep_res_gid'] = rgids[0]
-                    else:
-                        self._meta.at[i, 'rep_gen_gid'] = str(ggids)
-                        self._meta.at[i, 'rep_res_gid'] = str(rgids)
+        labels, gen_gids, res_gids, weights = self._get_stacked_inputs()
+        if not len(labels):
+            return
+
+        n_regions = 0
+        for batch in self._site_batches(labels):
+            source_profiles = self._read_source_profiles(gen_gids[batch])
+            regions, profiles, i_reps = RepresentativeMethods.run_regions(
+                source_profiles, labels[batch],
+                weights=None if weights is None else weights[batch],
+                rep_method=self._rep_method, err_method=self._err_method,
+                n_profiles=self._n_profiles)
+            del source_profiles
+
+            for j, i in enumerate(regions):
+                for n, arr in profiles.items():
+                    self._profiles[n][:, i] = arr[:, j]
+
+                if i_reps is not None:
+                    ggids = [gen_gids[batch.start + k] for k in i_reps[j]]
+                    rgids = ([None] if res_gids is None
+                             else [res_gids[batch.start + k]
+                                   for k in i_reps[j]])
+                    self._set_rep_gids(i, ggids, rgids)
+
+            n_regions += len(regions)
+
+        logger.info('Finished {} rep profile calculations in serial.'
+                    .format(n_regions))
 
     def _run_parallel(self, max_workers=None, pool_size=72):
         """Compute all representative profiles in parallel.
@@ -992,59 +1345,60 @@ class RepProfiles(RepProfilesBase):
         logger.info('Kicking off {} rep profile futures.'
                     .format(len(self.meta)))
 
-        iter_chunks = np.array_split(self.meta.index.values,
-                                     np.ceil(len(self.meta) / pool_size))
-        n_complete = 0
-        for iter_chunk in iter_chunks:
-            logger.debug('Starting process pool...')
-            futures = {}
-            loggers = [__name__, 'reV']
-            with SpawnProcessPool(max_workers=max_workers,
-                                  loggers=loggers) as exe:
-                for i in iter_chunk:
-                    row = self.meta.loc[i, :]
-                    region_dict = {k: v for (k, v) in row.to_dict().items()
-                                   if k in self._reg_cols}
-
-                    mask = self._get_mask(region_dict)
+        labels, gen_gids, _, _ = self._get_stacked_inputs()
+        if not len(labels):
+            return
 
-                    if not any(mask):
-                        logger.info('Skipping profile {} out of {} '
-                                    'for region: {} with no valid mask.'
-                                    .format(i + 1, len(self.meta),
-                                            region_dict))
-                    else:
+        n_complete = 0
+        for batch in self._site_batches(labels):
+            source_profiles = self._read_source_profiles(gen_gids[batch])
+            regions, starts = np.unique(labels[batch], return_index=True)
+            stops = np.append(starts[1:], batch.stop - batch.start)
+            iter_chunks = np.array_split(np.arange(len(regions)),
+                                         np.ceil(len(regions) / pool_size))
+            for iter_chunk in iter_chunks:
+                logger.debug('Starting process pool...')
+                futures = {}
+                loggers = [__name__, 'reV']
+                with SpawnProcessPool(max_workers=max_workers,
+                                      loggers=loggers) as exe:
+                    for j in iter_chunk:
+                        i = regions[j]
+                        row = self.meta.loc[i, :]
+                        region_dict = {k: v for (k, v)
+                                       in row.to_dict().items()
+                                       if k in self._reg_cols}
+                        idx = self._region_indices[i]
                         future = exe.submit(
                             RegionRepProfile.get_region_rep_profile,
-                            self._gen_fpath, self._rev_summary[mask],
+                            self._gen_fpath, self._rev_summary.iloc[idx],
                             gid_col=self._gid_col,
                             cf_dset=self._cf_dset,
                             rep_method=self._rep_method,
                             err_method=self._err_method,
                             weight=self._weight,
-                            n_profiles=self._n_profiles)
+                            n_profiles=self._n_profiles,
+                            source_profiles=source_profiles[
+                                :, starts[j]:stops[j]])
 
                         futures[future] = [i, region_dict]
 
-                for future in as_completed(futures):
-                    i, region_dict = futures[future]
-                    profiles, _, ggids, rgids = future.result()
-                    n_complete += 1
-                    logger.info('Future {} out of {} complete '
-                                'for region: {}'
-                                .format(n_complete, len(self.meta),
-                                        region_dict))
-                    log_mem(logger, log_level='DEBUG')
+                    for future in as_completed(futures):
+                        i, region_dict = futures[future]
+                        profiles, _, ggids, rgids = future.result()
+                        n_complete += 1
+                        logger.info('Future {} out of {} complete '
+                                    'for region: {}'
+                                    .format(n_complete, len(self.meta),
+                                            region_dict))
+                        log_mem(logger, log_level='DEBUG')
+
+                        for n in range(profiles.shape[1]):
+                            self._profiles[n][:, i] = profiles[:, n]
 
-                    for n in range(profiles.shape[1]):
-                        self._profiles[n][:, i] = profiles[:, n]
+                        self._set_rep_gids(i, ggids, rgids)
 
-                    if len(ggids) == 1:
-                        self._meta.at[i, 'rep_gen_gid'] = ggids[0]
-                        self._meta.at[i, 'rep_res_gid'] = rgids[0]
-                    else:
-                        self._meta.at[i, 'rep_gen_gid'] = str(ggids)
-                        self._meta.at[i, 'rep_res_gid'] = str(rgids)
+            del source_profiles
 
     def _run(self, fout=None, save_rev_summary=True, scaled_precision=False,
              max_workers=None):
@@ -1080,7 +1434,8 @@ class RepProfiles(RepProfilesBase):
     def run(cls, gen_fpath, rev_summary, reg_cols, gid_col='gen_gids',
             cf_dset='cf_profile', rep_method='meanoid', err_method='rmse',
             weight='gid_counts', n_profiles=1, fout=None,
-            save_rev_summary=True, scaled_precision=False, max_workers=None):
+            save_rev_summary=True, scaled_precision=False, max_workers=None,
+            mem_util_lim=0.4):
         """Run representative profiles by finding the closest single profile
         to the weighted meanoid for each SC region.
 
@@ -1121,6 +1476,9 @@ class RepProfiles(RepProfilesBase):
         max_workers : int, optional
             Number of parallel workers. 1 will run serial, None will use all
             available., by default None
+        mem_util_lim : float, optional
+            Memory utilization limit (fractional) for the source profiles
+            held in memory, by default 0.4
 
         Returns
         -------
@@ -1136,7 +1494,8 @@ class RepProfiles(RepProfilesBase):
 
         rp = cls(gen_fpath, rev_summary, reg_cols, gid_col=gid_col,
                  cf_dset=cf_dset, rep_method=rep_method, err_method=err_method,
-                 n_profiles=n_profiles, weight=weight)
+                 n_profiles=n_profiles, weight=weight,
+                 mem_util_lim=mem_util_lim)
 
         rp._run(fout=fout, save_rev_summary=save_rev_summary,
                 scaled_precision=scaled_precision, max_workers=max_workers)
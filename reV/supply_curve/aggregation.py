@@ -4,11 +4,15 @@ reV aggregation framework.
 """
 from abc import ABC, abstractmethod, abstractstaticmethod
 from concurrent.futures import as_completed
+from contextlib import contextmanager
 import h5py
 import logging
 import numpy as np
 import os
 import pandas as pd
+import shutil
+import tempfile
+import weakref
 
 from reV.handlers.outputs import Outputs
 from reV.handlers.exclusions import ExclusionLayers
@@ -29,7 +33,8 @@ class AbstractAggFileHandler(ABC):
     """Simple framework to handle aggregation file context managers."""
 
     def __init__(self, excl_fpath, excl_dict=None, area_filter_kernel='queen',
-                 min_area=None, check_excl_layers=False):
+                 min_area=None, check_excl_layers=False, excl_cache_dir=None,
+                 area_filter_mode='window'):
         """
         Parameters
         ----------
@@ -44,13 +49,23 @@ class AbstractAggFileHandler(ABC):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
         """
 
         self._excl_fpath = excl_fpath
         self._excl = ExclusionMaskFromDict(excl_fpath, layers_dict=excl_dict,
                                            min_area=min_area,
                                            kernel=area_filter_kernel,
-                                           check_layers=check_excl_layers)
+                                           check_layers=check_excl_layers,
+                                           cache_dir=excl_cache_dir,
+                                           filter_mode=area_filter_mode)
 
     def __enter__(self):
         return self
@@ -92,7 +107,8 @@ class AggFileHandler(AbstractAggFileHandler):
 
     def __init__(self, excl_fpath, h5_fpath, excl_dict=None,
                  area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False):
+                 check_excl_layers=False, excl_cache_dir=None,
+                 area_filter_mode='window'):
         """
         Parameters
         ----------
@@ -109,11 +125,21 @@ class AggFileHandler(AbstractAggFileHandler):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
         """
         super().__init__(excl_fpath, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
-                         check_excl_layers=check_excl_layers)
+                         check_excl_layers=check_excl_layers,
+                         excl_cache_dir=excl_cache_dir,
+                         area_filter_mode=area_filter_mode)
 
         self._h5 = Resource(h5_fpath)
 
@@ -141,7 +167,9 @@ class AbstractAggregation(ABC):
 
     def __init__(self, excl_fpath, tm_dset, excl_dict=None,
                  area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False, resolution=64, gids=None):
+                 check_excl_layers=False, resolution=64, gids=None,
+                 excl_cache_dir=None, area_filter_mode='window',
+                 shared_dir=None):
         """
         Parameters
         ----------
@@ -165,6 +193,23 @@ class AbstractAggregation(ABC):
         gids : list | None
             List of gids to get summary for (can use to subset if running in
             parallel), or None for all gids in the SC extent.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache, except that
+            area_filter_mode="global" with min_area set uses a
+            temporary cache for the lifetime of the aggregation so
+            that the global area filter only runs once.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
+        shared_dir : str | None
+            Optional scratch directory (e.g. /dev/shm) for parallel runs. The
+            techmap and the source data arrays are read once by the parent
+            process and saved here as .npy files that every worker memory
+            maps read-only instead of reading its own copy. The files are
+            removed when the run finishes. None disables sharing.
         """
 
         self._excl_fpath = excl_fpath
@@ -178,6 +223,25 @@ class AbstractAggregation(ABC):
             logger.debug('Exclusions layers will be checked for un-excluded '
                          'values!')
 
+        self._area_filter_mode = area_filter_mode
+        self._shared_dir = shared_dir
+        if (excl_cache_dir is None and area_filter_mode == 'global'
+                and min_area is not None and excl_dict):
+            # every serial run and parallel chunk opens its own exclusion
+            # mask, so share one globally filtered mask through a cache
+            excl_cache_dir = self._make_tmp_cache_dir(shared_dir)
+
+        self._excl_cache_dir = excl_cache_dir
+        if excl_cache_dir is not None:
+            # build the mask caches once before any parallel workers start
+            with ExclusionMaskFromDict(excl_fpath, layers_dict=excl_dict,
+                                       min_area=min_area,
+                                       kernel=area_filter_kernel,
+                                       cache_dir=excl_cache_dir,
+                                       filter_mode=area_filter_mode) as excl:
+                logger.info('Using exclusions mask cache: {}'
+                            .format(excl.cache_fpath))
+
         if gids is None:
             with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
                 gids = sc.valid_sc_points(tm_dset)
@@ -186,6 +250,32 @@ class AbstractAggregation(ABC):
 
         self._gids = gids
 
+    def _make_tmp_cache_dir(self, shared_dir=None):
+        """Make a temporary exclusions mask cache directory that is removed
+        when this aggregation instance is garbage collected.
+
+        Parameters
+        ----------
+        shared_dir : str | None
+            Optional parent directory for the cache, None uses the system
+            temporary directory.
+
+        Returns
+        -------
+        cache_dir : str
+            Path to the temporary cache directory.
+        """
+        if shared_dir is not None:
+            os.makedirs(shared_dir, exist_ok=True)
+
+        cache_dir = tempfile.mkdtemp(prefix='reV_excl_', dir=shared_dir)
+        weakref.finalize(self, shutil.rmtree, cache_dir, ignore_errors=True)
+        logger.info('Running the global contiguous area filter once for all '
+                    'workers with a temporary exclusions mask cache: {}'
+                    .format(cache_dir))
+
+        return cache_dir
+
     @abstractmethod
     def _check_files(self):
         """Do a preflight check on input files"""
@@ -201,12 +291,99 @@ class AbstractAggregation(ABC):
                                      .format(self._tm_dset,
                                              self._excl_fpath))
 
+    @staticmethod
+    def _save_techmap(excl_fpath, tm_dset, fpath, chunk_rows=1000):
+        """Copy the techmap dataset to a memory-mappable .npy file.
+
+        Parameters
+        ----------
+        excl_fpath : str
+            Filepath to exclusions h5 with techmap dataset.
+        tm_dset : str
+            Dataset name in the exclusions file containing the
+            exclusions-to-resource mapping data.
+        fpath : str
+            Filepath to .npy file to save the techmap to.
+        chunk_rows : int
+            Number of techmap rows to copy at once.
+        """
+        with h5py.File(excl_fpath, 'r') as f:
+            ds = f[tm_dset]
+            shape = ds.shape[-2:]
+            out = np.lib.format.open_memmap(fpath, mode='w+', dtype=ds.dtype,
+                                            shape=shape)
+            for r in range(0, shape[0], chunk_rows):
+                rows = slice(r, min(r + chunk_rows, shape[0]))
+                out[rows] = ds[rows] if ds.ndim == 2 else ds[0, rows]
+
+            out.flush()
+            del out
+
+    @contextmanager
+    def _share_arrays(self, **arrays):
+        """Save the techmap and input arrays to a scratch directory that
+        parallel workers can memory map from.
+
+        Parameters
+        ----------
+        arrays : dict
+            Named arrays to share. None values are skipped.
+
+        Yields
+        ------
+        shared_arrays : dict | None
+            Filepaths to the shared .npy files keyed by array name with the
+            techmap keyed by "techmap". None if shared_dir was not set.
+        """
+        if self._shared_dir is None:
+            yield None
+            return
+
+        os.makedirs(self._shared_dir, exist_ok=True)
+        out_dir = tempfile.mkdtemp(prefix='reV_agg_', dir=self._shared_dir)
+        try:
+            shared_arrays = {'techmap': os.path.join(out_dir, 'techmap.npy')}
+            self._save_techmap(self._excl_fpath, self._tm_dset,
+                               shared_arrays['techmap'])
+            for i, (name, arr) in enumerate(arrays.items()):
+                if arr is not None:
+                    fpath = os.path.join(out_dir, 'array_{}.npy'.format(i))
+                    np.save(fpath, np.asarray(arr))
+                    shared_arrays[name] = fpath
+
+            logger.info('Shared {} aggregation arrays with parallel workers '
+                        'through: {}'.format(len(shared_arrays), out_dir))
+            yield shared_arrays
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    @staticmethod
+    def _load_shared_arrays(shared_arrays):
+        """Memory map the arrays saved by _share_arrays().
+
+        Parameters
+        ----------
+        shared_arrays : dict | None
+            Filepaths to shared .npy files keyed by array name.
+
+        Returns
+        -------
+        arrays : dict
+            Read-only memory mapped arrays keyed by array name. Empty if
+            shared_arrays is None.
+        """
+        if shared_arrays is None:
+            return {}
+
+        return {name: np.load(fpath, mmap_mode='r')
+                for name, fpath in shared_arrays.items()}
+
     @abstractstaticmethod
-    def run_serial(sc_point_method, excl_fpath, tm_dset,
-                   excl_dict=None, area_filter_kernel='queen',
-                   min_area=None, check_excl_layers=False,
-                   resolution=64, gids=None, args=None,
-                   kwargs=None):
+    def run_serial(sc_point_method, excl_fpath, tm_dset, excl_dict=None,
+                   area_filter_kernel='queen', min_area=None,
+                   check_excl_layers=False, resolution=64, gids=None,
+                   args=None, kwargs=None, *, shared_arrays=None,
+                   excl_cache_dir=None, area_filter_mode='window'):
         """Standalone method to create agg summary - can be parallelized.
 
         Parameters
@@ -237,6 +414,19 @@ class AbstractAggregation(ABC):
             List of positional args for sc_point_method
         kwargs : dict | None
             Dict of kwargs for sc_point_method
+        shared_arrays : dict | None
+            Filepaths to .npy files saved by the parent process in the
+            shared_dir, keyed by array name. A shared "techmap" array is
+            passed to sc_point_method as the techmap kwarg, so
+            sc_point_method must accept it when shared_dir is used.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
 
         Returns
         -------
@@ -249,6 +439,10 @@ class AbstractAggregation(ABC):
         if kwargs is None:
             kwargs = {}
 
+        shared = AbstractAggregation._load_shared_arrays(shared_arrays)
+        if 'techmap' in shared:
+            kwargs = dict(kwargs, techmap=shared['techmap'])
+
         output = []
 
         with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
@@ -260,7 +454,9 @@ class AbstractAggregation(ABC):
         file_kwargs = {'excl_dict': excl_dict,
                        'area_filter_kernel': area_filter_kernel,
                        'min_area': min_area,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'excl_cache_dir': excl_cache_dir,
+                       'area_filter_mode': area_filter_mode}
         # pylint: disable=abstract-class-instantiated
         with AbstractAggFileHandler(excl_fpath, **file_kwargs) as fh:
 
@@ -326,7 +522,9 @@ class AbstractAggregation(ABC):
         futures = []
         output = []
         loggers = [__name__, 'reV.supply_curve.points', 'reV']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
+        with self._share_arrays() as shared_arrays, \
+                SpawnProcessPool(max_workers=max_workers,
+                                 loggers=loggers) as exe:
 
             # iterate through split executions, submitting each to worker
             for gid_set in chunks:
@@ -338,10 +536,13 @@ class AbstractAggregation(ABC):
                     area_filter_kernel=self._area_filter_kernel,
                     min_area=self._min_area,
                     check_excl_layers=self._check_excl_layers,
+                    excl_cache_dir=self._excl_cache_dir,
+                    area_filter_mode=self._area_filter_mode,
                     resolution=self._resolution,
                     gids=gid_set,
                     args=args,
-                    kwargs=kwargs))
+                    kwargs=kwargs,
+                    shared_arrays=shared_arrays))
 
             # gather results
             for future in as_completed(futures):
@@ -385,6 +586,8 @@ class AbstractAggregation(ABC):
                                   area_filter_kernel=self._area_filter_kernel,
                                   min_area=self._min_area,
                                   check_excl_layers=self._check_excl_layers,
+                                  excl_cache_dir=self._excl_cache_dir,
+                                  area_filter_mode=self._area_filter_mode,
                                   resolution=self._resolution,
                                   gids=self._gids,
                                   args=args,
@@ -404,9 +607,10 @@ class AbstractAggregation(ABC):
 
     @classmethod
     def run(cls, excl_fpath, tm_dset, sc_point_method, excl_dict=None,
-            area_filter_kernel='queen', min_area=None,
-            check_excl_layers=False, resolution=64, gids=None,
-            args=None, kwargs=None, max_workers=None, chunk_point_len=1000):
+            area_filter_kernel='queen', min_area=None, check_excl_layers=False,
+            resolution=64, gids=None, args=None, kwargs=None, max_workers=None,
+            chunk_point_len=1000, excl_cache_dir=None,
+            area_filter_mode='window', shared_dir=None):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -444,6 +648,23 @@ class AbstractAggregation(ABC):
             available cpus.
         chunk_point_len : int
             Number of SC points to process on a single parallel worker.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache, except that
+            area_filter_mode="global" with min_area set uses a
+            temporary cache for the lifetime of the aggregation so
+            that the global area filter only runs once.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
+        shared_dir : str | None
+            Optional scratch directory (e.g. /dev/shm) for parallel runs. The
+            techmap and the source data arrays are read once by the parent
+            process and saved here as .npy files that every worker memory
+            maps read-only instead of reading its own copy. The files are
+            removed when the run finishes. None disables sharing.
 
         Returns
         -------
@@ -454,7 +675,8 @@ class AbstractAggregation(ABC):
         agg = cls(excl_fpath, tm_dset, excl_dict=excl_dict,
                   area_filter_kernel=area_filter_kernel, min_area=min_area,
                   check_excl_layers=check_excl_layers, resolution=resolution,
-                  gids=gids)
+                  gids=gids, excl_cache_dir=excl_cache_dir,
+                  area_filter_mode=area_filter_mode, shared_dir=shared_dir)
 
         aggregation = agg.aggregate(sc_point_method, args=args, kwargs=kwargs,
                                     max_workers=max_workers,
@@ -470,7 +692,8 @@ class Aggregation(AbstractAggregation):
     def __init__(self, excl_fpath, h5_fpath, tm_dset, *agg_dset,
                  excl_dict=None, area_filter_kernel='queen', min_area=None,
                  check_excl_layers=False, resolution=64, excl_area=None,
-                 gids=None):
+                 gids=None, excl_cache_dir=None, area_filter_mode='window',
+                 shared_dir=None):
         """
         Parameters
         ----------
@@ -501,11 +724,29 @@ class Aggregation(AbstractAggregation):
         gids : list | None
             List of gids to get aggregation for (can use to subset if running
             in parallel), or None for all gids in the SC extent.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache, except that
+            area_filter_mode="global" with min_area set uses a
+            temporary cache for the lifetime of the aggregation so
+            that the global area filter only runs once.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
+        shared_dir : str | None
+            Optional scratch directory (e.g. /dev/shm) to share the techmap
+            and gen index with parallel workers through memory mapped .npy
+            files. None disables sharing.
         """
         super().__init__(excl_fpath, tm_dset, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
                          check_excl_layers=check_excl_layers,
+                         excl_cache_dir=excl_cache_dir,
+                         area_filter_mode=area_filter_mode,
+                         shared_dir=shared_dir,
                          resolution=resolution, gids=gids)
 
         self._h5_fpath = h5_fpath
@@ -589,11 +830,11 @@ class Aggregation(AbstractAggregation):
         return gen_index
 
     @staticmethod
-    def run_serial(excl_fpath, h5_fpath, tm_dset, *agg_dset,
-                   agg_method='mean', excl_dict=None,
-                   area_filter_kernel='queen', min_area=None,
+    def run_serial(excl_fpath, h5_fpath, tm_dset, *agg_dset, agg_method='mean',
+                   excl_dict=None, area_filter_kernel='queen', min_area=None,
                    check_excl_layers=False, resolution=64, excl_area=0.0081,
-                   gids=None, gen_index=None):
+                   gids=None, gen_index=None, shared_arrays=None,
+                   excl_cache_dir=None, area_filter_mode='window'):
         """
         Standalone method to aggregate - can be parallelized.
 
@@ -631,12 +872,29 @@ class Aggregation(AbstractAggregation):
             Array of generation gids with array index equal to resource gid.
             Array value is -1 if the resource index was not used in the
             generation run.
+        shared_arrays : dict | None
+            Filepaths to .npy files saved by the parent process in the
+            shared_dir, keyed by array name. A shared "techmap" array is
+            used instead of reading tm_dset from the exclusions file and a
+            shared "gen_index" is used instead of gen_index.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
 
         Returns
         -------
         agg_out : dict
             Aggregated values for each aggregation dataset
         """
+        shared = AbstractAggregation._load_shared_arrays(shared_arrays)
+        techmap = shared.get('techmap')
+        gen_index = shared.get('gen_index', gen_index)
+
         with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
             exclusion_shape = sc.exclusions.shape
             if gids is None:
@@ -646,7 +904,9 @@ class Aggregation(AbstractAggregation):
         file_kwargs = {'excl_dict': excl_dict,
                        'area_filter_kernel': area_filter_kernel,
                        'min_area': min_area,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'excl_cache_dir': excl_cache_dir,
+                       'area_filter_mode': area_filter_mode}
         dsets = agg_dset + ('meta', )
         agg_out = {ds: [] for ds in dsets}
         with AggFileHandler(excl_fpath, h5_fpath, **file_kwargs) as fh:
@@ -665,7 +925,8 @@ class Aggregation(AbstractAggregation):
                         excl_area=excl_area,
                         exclusion_shape=exclusion_shape,
                         close=False,
-                        gen_index=gen_index)
+                        gen_index=gen_index,
+                        techmap=techmap)
 
                 except EmptySupplyCurvePointError:
                     logger.debug('SC gid {} is fully excluded or does not '
@@ -720,7 +981,9 @@ class Aggregation(AbstractAggregation):
         dsets = self._agg_dsets + ('meta', )
         agg_out = {ds: [] for ds in dsets}
         loggers = [__name__, 'reV.supply_curve.points', 'reV']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
+        with self._share_arrays(gen_index=self._gen_index) as shared_arrays, \
+                SpawnProcessPool(max_workers=max_workers,
+                                 loggers=loggers) as exe:
             # iterate through split executions, submitting each to worker
             for gid_set in chunks:
                 # submit executions and append to futures list
@@ -735,10 +998,13 @@ class Aggregation(AbstractAggregation):
                     area_filter_kernel=self._area_filter_kernel,
                     min_area=self._min_area,
                     check_excl_layers=self._check_excl_layers,
+                    excl_cache_dir=self._excl_cache_dir,
+                    area_filter_mode=self._area_filter_mode,
                     resolution=self._resolution,
                     excl_area=excl_area,
                     gids=gid_set,
-                    gen_index=self._gen_index))
+                    gen_index=None if shared_arrays else self._gen_index,
+                    shared_arrays=shared_arrays))
 
             # gather results
             for future in futures:
@@ -785,6 +1051,8 @@ class Aggregation(AbstractAggregation):
                                   area_filter_kernel=self._area_filter_kernel,
                                   min_area=self._min_area,
                                   check_excl_layers=self._check_excl_layers,
+                                  excl_cache_dir=self._excl_cache_dir,
+                                  area_filter_mode=self._area_filter_mode,
                                   resolution=self._resolution,
                                   excl_area=self._excl_area,
                                   gen_index=self._gen_index)
@@ -864,11 +1132,11 @@ class Aggregation(AbstractAggregation):
                 out[dset] = data
 
     @classmethod
-    def run(cls, excl_fpath, h5_fpath, tm_dset, *agg_dset,
-            excl_dict=None, area_filter_kernel='queen', min_area=None,
-            check_excl_layers=False, resolution=64, gids=None,
-            agg_method='mean', excl_area=None, max_workers=None,
-            chunk_point_len=1000, out_fpath=None):
+    def run(cls, excl_fpath, h5_fpath, tm_dset, *agg_dset, excl_dict=None,
+            area_filter_kernel='queen', min_area=None, check_excl_layers=False,
+            resolution=64, gids=None, agg_method='mean', excl_area=None,
+            max_workers=None, chunk_point_len=1000, out_fpath=None,
+            excl_cache_dir=None, area_filter_mode='window', shared_dir=None):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -909,6 +1177,21 @@ class Aggregation(AbstractAggregation):
             Number of SC points to process on a single parallel worker.
         out_fpath : str
             Output .h5 file path
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache, except that
+            area_filter_mode="global" with min_area set uses a
+            temporary cache for the lifetime of the aggregation so
+            that the global area filter only runs once.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
+        shared_dir : str | None
+            Optional scratch directory (e.g. /dev/shm) to share the techmap
+            and gen index with parallel workers through memory mapped .npy
+            files. None disables sharing.
 
         Returns
         -------
@@ -919,6 +1202,9 @@ class Aggregation(AbstractAggregation):
         agg = cls(excl_fpath, h5_fpath, tm_dset, *agg_dset,
                   excl_dict=excl_dict, area_filter_kernel=area_filter_kernel,
                   min_area=min_area, check_excl_layers=check_excl_layers,
+                  excl_cache_dir=excl_cache_dir,
+                  area_filter_mode=area_filter_mode,
+                  shared_dir=shared_dir,
                   resolution=resolution, gids=gids, excl_area=excl_area)
 
         aggregation = agg.aggregate(agg_method=agg_method,
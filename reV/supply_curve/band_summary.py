@@ -0,0 +1,865 @@
+# -*- coding: utf-8 -*-
+"""reV supply curve row-band data summary framework.
+
+Vectorized alternative to the single point SupplyCurvePointSummary. All
+supply curve points in one row of the supply curve grid (a "band" of
+exclusion rows with height equal to the SC resolution) are summarized at once
+using segment reductions keyed by the supply curve column index.
+"""
+import logging
+import numpy as np
+import pandas as pd
+from warnings import warn
+
+from reV.supply_curve.point_summary import SupplyCurvePointSummary
+from reV.utilities.exceptions import (FileInputError, InputWarning,
+                                      OutputWarning)
+
+logger = logging.getLogger(__name__)
+
+
+class SupplyCurveBandSummary:
+    """Vectorized supply curve summary of all SC points in a row-band of the
+    exclusions extent. Outputs match SupplyCurvePointSummary.summarize()."""
+
+    # technology-dependent power density estimates in MW/km2
+    POWER_DENSITY = SupplyCurvePointSummary.POWER_DENSITY
+
+    def __init__(self, sc_row_ind, excl, gen, tm_dset, gen_index,
+                 resolution=64, excl_area=0.0081, exclusion_shape=None,
+                 power_density=None, offshore_flags=None,
+                 friction_layer=None, techmap=None):
+        """
+        Parameters
+        ----------
+        sc_row_ind : int
+            Supply curve row index of the band to summarize.
+        excl : ExclusionMask
+            Open ExclusionMask file handler.
+        gen : Resource | MultiFileResource
+            Open rex resource handler for the reV generation (and econ)
+            outputs.
+        tm_dset : str
+            Dataset name in the techmap file containing the
+            exclusions-to-resource mapping data.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        resolution : int
+            Number of exclusion points per SC point along an axis.
+        excl_area : float
+            Area of an exclusion cell (square km).
+        exclusion_shape : tuple
+            Shape of the full exclusions extent (rows, cols).
+        power_density : float | None | pd.DataFrame
+            Constant power density float, None, or opened dataframe with
+            (resource) "gid" and "power_density columns".
+        offshore_flags : np.ndarray | None
+            Array of offshore boolean flags if available from wind generation
+            data. None if offshore flag is not available.
+        friction_layer : None | FrictionMask
+            Friction layer with scalar friction values if valid friction inputs
+            were entered. Otherwise, None to not apply friction layer.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
+        """
+
+        self._sc_row_ind = sc_row_ind
+        self._excl = excl
+        self._gen = gen
+        self._resolution = resolution
+        self._excl_area = excl_area
+        self._power_density = power_density
+        self._friction_layer = friction_layer
+
+        if exclusion_shape is None:
+            exclusion_shape = excl.shape
+
+        self._n_sc_cols = int(np.ceil(exclusion_shape[1] / resolution))
+        start = sc_row_ind * resolution
+        stop = int(np.min((start + resolution, exclusion_shape[0])))
+        self._rows = slice(start, stop)
+        self._cols = slice(0, exclusion_shape[1])
+        band_shape = (stop - start, exclusion_shape[1])
+
+        self._order, self._sizes = self._block_order(band_shape, resolution)
+        self._seg = np.repeat(np.arange(self._n_sc_cols), self._sizes)
+        self._starts = np.concatenate(([0], np.cumsum(self._sizes)[:-1]))
+
+        if techmap is not None:
+            tm = techmap[self._rows, self._cols]
+        else:
+            tm = excl.excl_h5[tm_dset, self._rows, self._cols]
+
+        tm = self._flat(tm).astype(np.int32)
+        self._excl_data = self._get_excl_data(tm)
+
+        self._valid = self._seg_any(tm != -1)
+        self._valid &= self._seg_any((tm != -1) & (self._excl_data != 0))
+
+        self._gen_gids, self._res_gids = self._map_gen_gids(tm, gen_index)
+        self._valid &= self._seg_any(self._gen_gids != -1)
+        self._remove_offshore(offshore_flags)
+        self._valid &= self._seg_any((self._gen_gids != -1)
+                                     & (self._excl_data != 0))
+
+    @staticmethod
+    def _block_order(shape, resolution):
+        """Get the index order that sorts a flattened band by SC point.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the exclusions band (rows, cols).
+        resolution : int
+            Number of exclusion points per SC point along an axis.
+
+        Returns
+        -------
+        order : np.ndarray
+            Index array that re-orders the C-flattened band so that the
+            pixels of each SC point are contiguous and in the same order as a
+            flattened single SC point slice.
+        sizes : np.ndarray
+            Number of exclusion pixels in each SC point of the band.
+        """
+        iarr = np.arange(shape[0] * shape[1]).reshape(shape)
+        n_blocks = int(np.ceil(shape[1] / resolution))
+        order = [iarr[:, i * resolution:(i + 1) * resolution].ravel()
+                 for i in range(n_blocks)]
+        sizes = np.array([len(o) for o in order])
+
+        return np.concatenate(order), sizes
+
+    def _flat(self, arr):
+        """Flatten a 2D band array into SC point (block) order.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            2D array with the band shape.
+
+        Returns
+        -------
+        arr : np.ndarray
+            1D array re-ordered so that SC point pixels are contiguous.
+        """
+        return arr.ravel()[self._order]
+
+    def _seg_any(self, bool_arr):
+        """Segment "any" reduction for a flat boolean pixel array.
+
+        Parameters
+        ----------
+        bool_arr : np.ndarray
+            1D boolean array in SC point (block) order.
+
+        Returns
+        -------
+        out : np.ndarray
+            Boolean array with one entry per SC point in the band.
+        """
+        counts = np.bincount(self._seg[bool_arr], minlength=self._n_sc_cols)
+
+        return counts > 0
+
+    def _seg_sum(self, arr, mask=None, dtype=None):
+        """Segment sum reduction for a flat pixel array.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            1D array in SC point (block) order.
+        mask : np.ndarray | None
+            Optional boolean mask of pixels to include in the sum.
+        dtype : np.dtype | None
+            Output dtype to emulate the precision of a numpy sum over the
+            single SC point array. Defaults to the dtype of arr.
+
+        Returns
+        -------
+        out : np.ndarray
+            Sum of arr for each SC point in the band.
+        """
+        seg = self._seg
+        if mask is not None:
+            seg = seg[mask]
+            arr = arr[mask]
+
+        if dtype is None:
+            dtype = arr.dtype
+
+        out = np.bincount(seg, weights=arr.astype(np.float64),
+                          minlength=self._n_sc_cols)
+
+        return out.astype(dtype)
+
+    def _get_excl_data(self, tm):
+        """Get the flat exclusions mask data for the band with pixels outside
+        of the resource extent set to zero.
+
+        Parameters
+        ----------
+        tm : np.ndarray
+            Flat techmap data (resource gids) for the band in block order.
+
+        Returns
+        -------
+        excl_data : np.ndarray
+            Flat exclusions mask data for the band in block order.
+        """
+        excl_data = self._flat(self._excl[self._rows, self._cols]).copy()
+        excl_data[(tm == -1)] = 0.0
+
+        if excl_data.max() > 1:
+            w = ('Exclusions data max value is > 1: {}'
+                 .format(excl_data.max()))
+            logger.warning(w)
+            warn(w, InputWarning)
+
+        return excl_data
+
+    @staticmethod
+    def _map_gen_gids(res_gids, gen_index):
+        """Map resource gids from techmap to gen gids in .h5 source file
+
+        Parameters
+        ----------
+        res_gids : np.ndarray
+            Resource gids from techmap
+        gen_index : np.ndarray
+            Equivalent gen gids to resource gids
+
+        Returns
+        -------
+        gen_gids : np.ndarray
+            Gen gid to excl mapping
+        res_gids : np.ndarray
+            Updated resource gid to excl mapping
+        """
+        res_gids = res_gids.copy()
+        mask = (res_gids >= len(gen_index)) | (res_gids == -1)
+        res_gids[mask] = -1
+        gen_gids = gen_index[res_gids]
+        gen_gids[mask] = -1
+        res_gids[(gen_gids == -1)] = -1
+
+        return gen_gids, res_gids
+
+    def _remove_offshore(self, offshore_flags=None):
+        """Remove offshore gids from the analysis if offshore flags are
+        available.
+
+        Parameters
+        ----------
+        offshore_flags : np.ndarray | None
+            Array of offshore boolean flags if available from wind generation
+            data. None if offshore flag is not available.
+        """
+        if offshore_flags is not None:
+            gen_offshore_flags = offshore_flags[self._gen_gids]
+            gen_offshore_flags[(self._gen_gids == -1)] = 0
+            offshore_mask = (gen_offshore_flags == 1)
+            self._gen_gids[offshore_mask] = -1
+            self._res_gids[offshore_mask] = -1
+            self._valid &= self._seg_any(self._gen_gids != -1)
+
+    def _apply_exclusions(self, res_data=None, res_class_bin=None):
+        """Apply exclusions and the resource class bin to the band.
+
+        Parameters
+        ----------
+        res_data : np.ndarray | None
+            Multi-year-mean resource data array for all sites in the
+            generation data output file. None if no resource classes.
+        res_class_bin : list | None
+            Two-entry lists dictating the single resource class bin.
+            None if no resource classes.
+
+        Returns
+        -------
+        gen_gids : np.ndarray
+            Flat generation gids with excluded pixels set to -1.
+        res_gids : np.ndarray
+            Flat resource gids with excluded pixels set to -1.
+        excl_data : np.ndarray
+            Flat exclusions data with excluded pixels set to 0.
+        valid : np.ndarray
+            Boolean array flagging the non-empty SC points in the band.
+        """
+        exclude = (self._excl_data == 0)
+        if res_data is not None and res_class_bin is not None:
+            res = res_data[self._gen_gids]
+            exclude |= ((res < np.min(res_class_bin))
+                        | (res >= np.max(res_class_bin)))
+
+        gen_gids = self._gen_gids.copy()
+        res_gids = self._res_gids.copy()
+        excl_data = self._excl_data.copy()
+        gen_gids[exclude] = -1
+        res_gids[exclude] = -1
+        excl_data[exclude] = 0.0
+
+        valid = self._valid & self._seg_any(gen_gids != -1)
+
+        return gen_gids, res_gids, excl_data, valid
+
+    def _ordered_unique(self, gids, mask):
+        """Get the unique gids for every SC point in the band in order of
+        first appearance.
+
+        Parameters
+        ----------
+        gids : np.ndarray
+            Flat gid array in block order.
+        mask : np.ndarray
+            Boolean mask of the pixels to consider.
+
+        Returns
+        -------
+        seg : np.ndarray
+            SC point (band column) index of each unique gid.
+        ugids : np.ndarray
+            Unique gids sorted by SC point and order of first appearance.
+        inverse : np.ndarray
+            Index of the (seg, ugid) pair for every masked pixel.
+        """
+        seg = self._seg[mask]
+        gids = gids[mask]
+        key = seg.astype(np.int64) * (int(gids.max(initial=0)) + 1) + gids
+        _, first, inverse = np.unique(key, return_index=True,
+                                      return_inverse=True)
+        order = np.argsort(first, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        return seg[first[order]], gids[first[order]], rank[inverse.ravel()]
+
+    def _split(self, seg, arr):
+        """Split a flat array of per-gid values into lists for each SC point.
+
+        Parameters
+        ----------
+        seg : np.ndarray
+            Sorted SC point (band column) index for each entry in arr.
+        arr : np.ndarray
+            Values to split.
+
+        Returns
+        -------
+        out : list
+            List of arrays, one for each SC point in the band.
+        """
+        bounds = np.searchsorted(seg, np.arange(1, self._n_sc_cols))
+
+        return np.split(arr, bounds)
+
+    def _weighted_mean(self, data, gen_gids, excl_data, mask):
+        """Exclusions-weighted mean of a flat data array of gen data for
+        every SC point in the band.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Array of resource/generation/econ data with an entry for every
+            site in the generation extent.
+        gen_gids : np.ndarray
+            Flat generation gids with excluded pixels set to -1.
+        excl_data : np.ndarray
+            Flat exclusions data with excluded pixels set to 0.
+        mask : np.ndarray
+            Boolean mask of the included pixels.
+
+        Returns
+        -------
+        mean : np.ndarray
+            Mean of data for each SC point in the band.
+        """
+        x = data[gen_gids[mask]] * excl_data[mask]
+        num = np.bincount(self._seg[mask], weights=x.astype(np.float64),
+                          minlength=self._n_sc_cols).astype(x.dtype)
+        den = self._seg_sum(excl_data, mask=mask)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = num / den
+
+        return mean
+
+    def _meta_summary(self, seg, gen_gids):
+        """Summarize gen meta data (mode/mean over unique sites) for every
+        SC point in the band.
+
+        Parameters
+        ----------
+        seg : np.ndarray
+            SC point (band column) index for each unique gen gid.
+        gen_gids : np.ndarray
+            Unique gen gids for each SC point in order of appearance.
+
+        Returns
+        -------
+        out : dict
+            Dictionary keyed by meta column names (country, state, county,
+            elevation, timezone) with series of summary values indexed by SC
+            column index or None if the column is not available.
+        """
+        meta = self._gen.meta
+        out = {}
+        for col in ('country', 'state', 'county', 'elevation', 'timezone'):
+            out[col] = None
+            if col in meta:
+                df = pd.DataFrame({'seg': seg,
+                                   col: meta.loc[gen_gids, col].values})
+                if col == 'elevation':
+                    values = df.groupby('seg')[col].mean()
+                else:
+                    values = df.groupby(['seg', col]).size()
+                    values = values.reset_index(name='count')
+                    values = values.sort_values(['seg', 'count', col],
+                                                ascending=[True, False, True])
+                    values = values.drop_duplicates('seg')
+                    values = values.set_index('seg')[col]
+
+                out[col] = values
+
+        return out
+
+    def _get_power_density(self, res_gids, excl_data, mask):
+        """Get the power density for every SC point in the band.
+
+        Parameters
+        ----------
+        res_gids : np.ndarray
+            Flat resource gids with excluded pixels set to -1.
+        excl_data : np.ndarray
+            Flat exclusions data with excluded pixels set to 0.
+        mask : np.ndarray
+            Boolean mask of the included pixels.
+
+        Returns
+        -------
+        power_density : float | np.ndarray | None
+            Constant power density or array of exclusions-weighted power
+            densities (MW/km2) for each SC point in the band.
+        """
+        power_density = self._power_density
+        if power_density is None:
+            tech = self._gen.meta['reV_tech'][0]
+            if tech in self.POWER_DENSITY:
+                power_density = self.POWER_DENSITY[tech]
+            else:
+                warn('Could not recognize reV technology in generation meta '
+                     'data: "{}". Cannot lookup an appropriate power density '
+                     'to calculate SC point capacity.'.format(tech))
+
+        elif isinstance(power_density, pd.DataFrame):
+            missing = (set(np.unique(res_gids[mask]))
+                       - set(power_density.index.values))
+            if any(missing):
+                msg = ('Variable power density input is missing the '
+                       'following resource GIDs: {}'.format(missing))
+                logger.error(msg)
+                raise FileInputError(msg)
+
+            pds = power_density.loc[res_gids[mask], 'power_density'].values
+            pds = pds.astype(np.float32)
+            pds *= excl_data[mask]
+            num = np.bincount(self._seg[mask], weights=pds,
+                              minlength=self._n_sc_cols).astype(pds.dtype)
+            den = self._seg_sum(excl_data, mask=mask)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                power_density = num / den
+
+        return power_density
+
+    def _get_centroids(self):
+        """Get the SC point centroid coordinates for the band.
+
+        Returns
+        -------
+        lats : np.ndarray
+            SC point centroid latitudes for the band.
+        lons : np.ndarray
+            SC point centroid longitudes for the band.
+        """
+        decimals = 3
+        lats = self._excl.excl_h5['latitude', self._rows, self._cols]
+        lons = self._excl.excl_h5['longitude', self._rows, self._cols]
+        lats = self._flat(lats)
+        lons = self._flat(lons)
+        lat_c = np.array([lats[s:s + n].mean() for s, n
+                          in zip(self._starts, self._sizes)])
+        lon_c = np.array([lons[s:s + n].mean() for s, n
+                          in zip(self._starts, self._sizes)])
+
+        return (np.round(lat_c, decimals=decimals),
+                np.round(lon_c, decimals=decimals))
+
+    def _friction(self, mask):
+        """Get the mean friction value for every SC point in the band.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            Boolean mask of the included pixels.
+
+        Returns
+        -------
+        friction : np.ndarray | None
+            Mean friction scalar for the non-excluded data or None if a
+            friction layer is not available.
+        """
+        friction = None
+        if self._friction_layer is not None:
+            data = self._flat(self._friction_layer[self._rows, self._cols])
+            total = self._seg_sum(data, mask=mask, dtype=np.float64)
+            count = np.bincount(self._seg[mask], minlength=self._n_sc_cols)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                friction = (total / count).astype(data.dtype)
+
+        return friction
+
+    def _data_layers(self, data_layers):
+        """Read the raw band data for the aggregation data layers.
+
+        Parameters
+        ----------
+        data_layers : None | dict
+            Aggregation data layers. Must be a dictionary keyed by data label
+            name. Each value must be another dictionary with "dset", "method",
+            and "fpath". Must have fobj exclusion handlers.
+
+        Returns
+        -------
+        out : dict
+            Dictionary keyed by data label name with values of
+            (flat band data, nodata value, method).
+        """
+        out = {}
+        if data_layers is not None:
+            for name, attrs in data_layers.items():
+                fobj = attrs['fobj']
+                raw = fobj[attrs['dset'], self._rows, self._cols]
+                nodata = fobj.get_nodata_value(attrs['dset'])
+                out[name] = (self._flat(raw), nodata, attrs['method'])
+
+        return out
+
+    def summary(self, sc_col_inds=None, res_class_dset=None,
+                res_class_bins=None, cf_dset=None, lcoe_dset=None,
+                h5_dsets=None, data_layers=None, args=None):
+        """Get the summary dictionaries for all SC points in the band.
+
+        Parameters
+        ----------
+        sc_col_inds : list | np.ndarray | None
+            Supply curve column indices to summarize. None will summarize
+            all SC points in the band.
+        res_class_dset : np.ndarray | None
+            Pre-extracted resource class data. None if no resource classes.
+        res_class_bins : list | None
+            List of two-entry lists dictating the resource class bins.
+            None if no resource classes.
+        cf_dset : np.ndarray | None
+            Pre-extracted capacity factor data.
+        lcoe_dset : np.ndarray | None
+            Pre-extracted LCOE data.
+        h5_dsets : dict | None
+            Pre-extracted data dictionary where keys are the dataset names
+            and values are the arrays of data from the h5 files.
+        data_layers : None | dict
+            Aggregation data layers. Must be a dictionary keyed by data label
+            name. Each value must be another dictionary with "dset", "method",
+            and "fobj".
+        args : tuple | list | None
+            List of summary arguments to include. None defaults to all
+            available args.
+
+        Returns
+        -------
+        summary : list
+            List of (sc_col_ind, res_class, summary dict) tuples ordered by
+            SC column index then resource class index.
+        """
+        if res_class_bins is None:
+            res_class_bins = [None]
+
+        if sc_col_inds is None:
+            sc_col_inds = np.arange(self._n_sc_cols)
+
+        lats, lons = self._get_centroids()
+        layers = self._data_layers(data_layers)
+
+        out = {}
+        for ri, res_bin in enumerate(res_class_bins):
+            out[ri] = self._summarize_bin(res_class_dset, res_bin, cf_dset,
+                                          lcoe_dset, h5_dsets, layers,
+                                          sc_col_inds, lats, lons, args)
+
+        summary = []
+        for c in sc_col_inds:
+            for ri in range(len(res_class_bins)):
+                if c in out[ri]:
+                    summary.append((c, ri, out[ri][c]))
+
+        return summary
+
+    def _band_arrays(self, res_data, res_bin, cf_data, lcoe_data,
+                     h5_dsets_data, lats, lons):
+        """Compute the band-wide summary arrays for a single resource class.
+
+        Parameters
+        ----------
+        res_data : np.ndarray | None
+            Pre-extracted resource class data.
+        res_bin : list | None
+            Two-entry list dictating the single resource class bin.
+        cf_data : np.ndarray | None
+            Pre-extracted capacity factor data.
+        lcoe_data : np.ndarray | None
+            Pre-extracted LCOE data.
+        h5_dsets_data : dict | None
+            Pre-extracted additional h5 datasets.
+        lats : np.ndarray
+            SC point centroid latitudes for the band.
+        lons : np.ndarray
+            SC point centroid longitudes for the band.
+
+        Returns
+        -------
+        band : dict
+            Summary outputs keyed by output name. Values are indexable by SC
+            column index (or None if not available).
+        mask : np.ndarray
+            Boolean mask of the included pixels in block order.
+        excl_data : np.ndarray
+            Exclusion values in block order.
+        valid : np.ndarray
+            Boolean flag for every SC column with any included pixels.
+        """
+        gen_gids, res_gids, excl_data, valid = self._apply_exclusions(
+            res_data=res_data, res_class_bin=res_bin)
+        mask = (gen_gids != -1)
+
+        res_seg, ures, res_inv = self._ordered_unique(res_gids, mask)
+        counts = np.bincount(res_inv, weights=excl_data[mask],
+                             minlength=len(ures)).astype(excl_data.dtype)
+        gen_seg, ugen, _ = self._ordered_unique(gen_gids, mask)
+
+        area = self._seg_sum(excl_data) * self._excl_area
+        power_density = self._get_power_density(res_gids, excl_data, mask)
+        capacity = None
+        if power_density is not None:
+            capacity = area * power_density
+
+        band = {'res_gids': self._split(res_seg, ures),
+                'gen_gids': self._split(gen_seg, ugen),
+                'gid_counts': self._split(res_seg, counts),
+                'n_gids': np.bincount(self._seg[excl_data > 0],
+                                      minlength=self._n_sc_cols
+                                      ).astype(np.int64)}
+        for k, data in (('mean_cf', cf_data), ('mean_lcoe', lcoe_data),
+                        ('mean_res', res_data)):
+            band[k] = None
+            if data is not None:
+                band[k] = self._weighted_mean(data, gen_gids, excl_data,
+                                              mask)
+
+        band['capacity'] = capacity
+        band['area_sq_km'] = area
+        band['latitude'] = lats
+        band['longitude'] = lons
+        band.update(self._meta_summary(gen_seg, ugen))
+
+        friction = self._friction(mask)
+        if friction is not None:
+            band['mean_friction'] = friction
+            band['mean_lcoe_friction'] = None
+            if band['mean_lcoe'] is not None:
+                band['mean_lcoe_friction'] = band['mean_lcoe'] * friction
+
+        if h5_dsets_data is not None:
+            for dset, data in h5_dsets_data.items():
+                band['mean_{}'.format(dset)] = self._weighted_mean(
+                    data, gen_gids, excl_data, mask)
+
+        return band, mask, excl_data, valid
+
+    def _summarize_bin(self, res_data, res_bin, cf_data, lcoe_data,
+                       h5_dsets_data, layers, sc_col_inds, lats, lons,
+                       args):
+        """Summarize all SC points in the band for a single resource class.
+
+        Parameters
+        ----------
+        res_data : np.ndarray | None
+            Pre-extracted resource class data.
+        res_bin : list | None
+            Two-entry list dictating the single resource class bin.
+        cf_data : np.ndarray | None
+            Pre-extracted capacity factor data.
+        lcoe_data : np.ndarray | None
+            Pre-extracted LCOE data.
+        h5_dsets_data : dict | None
+            Pre-extracted additional h5 datasets.
+        layers : dict
+            Output of _data_layers().
+        sc_col_inds : list | np.ndarray
+            Supply curve column indices to summarize.
+        lats : np.ndarray
+            SC point centroid latitudes for the band.
+        lons : np.ndarray
+            SC point centroid longitudes for the band.
+        args : tuple | list | None
+            List of summary arguments to include.
+
+        Returns
+        -------
+        out : dict
+            Summary dictionaries keyed by SC column index for all non-empty
+            SC points.
+        """
+        band, mask, excl_data, valid = self._band_arrays(
+            res_data, res_bin, cf_data, lcoe_data, h5_dsets_data, lats, lons)
+
+        if args is None:
+            args = list(band.keys())
+
+        missing = [arg for arg in args if arg not in band]
+        for arg in missing:
+            warn('Cannot find "{}" as an available SC self summary '
+                 'output'.format(arg), OutputWarning)
+
+        args = [arg for arg in args if arg in band]
+        out = {}
+        for c in sc_col_inds:
+            if valid[c]:
+                summary = {arg: self._get(band[arg], c) for arg in args}
+                for k in ('res_gids', 'gen_gids', 'gid_counts'):
+                    if k in summary:
+                        summary[k] = list(summary[k])
+
+                s = slice(self._starts[c], self._starts[c] + self._sizes[c])
+                for name, (raw, nodata, method) in layers.items():
+                    summary[name] = SupplyCurvePointSummary._agg_data_layer(
+                        name, raw[s], nodata, method, mask[s], excl_data[s],
+                        self._sc_row_ind * self._n_sc_cols + c)
+
+                out[c] = summary
+
+        return out
+
+    @staticmethod
+    def _get(arr, i):
+        """Get the i-th entry of an array that might be None.
+
+        Parameters
+        ----------
+        arr : np.ndarray | pd.Series | None
+            Array of values, series of values indexed by SC column index,
+            or None.
+        i : int
+            Index of interest.
+
+        Returns
+        -------
+        out : object | None
+            arr[i] or None if arr is None.
+        """
+        if arr is None:
+            return None
+
+        return arr[i]
+
+    @classmethod
+    def summarize(cls, sc_row_ind, excl, gen, tm_dset, gen_index,
+                  sc_col_inds=None, res_class_dset=None, res_class_bins=None,
+                  excl_area=0.0081, power_density=None, cf_dset=None,
+                  lcoe_dset=None, h5_dsets=None, resolution=64,
+                  exclusion_shape=None, offshore_flags=None,
+                  friction_layer=None, args=None, data_layers=None,
+                  techmap=None):
+        """Get the summary of all SC points in a single supply curve row.
+
+        Parameters
+        ----------
+        sc_row_ind : int
+            Supply curve row index of the band to summarize.
+        excl : ExclusionMask
+            Open ExclusionMask file handler.
+        gen : Resource | MultiFileResource
+            Open rex resource handler for the reV generation (and econ)
+            outputs.
+        tm_dset : str
+            Dataset name in the techmap file containing the
+            exclusions-to-resource mapping data.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        sc_col_inds : list | np.ndarray | None
+            Supply curve column indices to summarize. None will summarize
+            all SC points in the band.
+        res_class_dset : np.ndarray | None
+            Pre-extracted resource class data. None if no resource classes.
+        res_class_bins : list | None
+            List of two-entry lists dictating the resource class bins.
+            None if no resource classes.
+        excl_area : float
+            Area of an exclusion cell (square km).
+        power_density : float | None | pd.DataFrame
+            Constant power density float, None, or opened dataframe with
+            (resource) "gid" and "power_density columns".
+        cf_dset : np.ndarray | None
+            Pre-extracted capacity factor data.
+        lcoe_dset : np.ndarray | None
+            Pre-extracted LCOE data.
+        h5_dsets : dict | None
+            Pre-extracted data dictionary where keys are the dataset names
+            and values are the arrays of data from the h5 files.
+        resolution : int
+            Number of exclusion points per SC point along an axis.
+        exclusion_shape : tuple
+            Shape of the full exclusions extent (rows, cols).
+        offshore_flags : np.ndarray | None
+            Array of offshore boolean flags if available from wind generation
+            data. None if offshore flag is not available.
+        friction_layer : None | FrictionMask
+            Friction layer with scalar friction values if valid friction inputs
+            were entered. Otherwise, None to not apply friction layer.
+        args : tuple | list, optional
+            List of summary arguments to include. None defaults to all
+            available args, by default None
+        data_layers : dict, optional
+            Aggregation data layers. Must be a dictionary keyed by data label
+            name. Each value must be another dictionary with "dset", "method",
+            and "fobj", by default None
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
+
+        Returns
+        -------
+        summary : list
+            List of (sc_col_ind, res_class, summary dict) tuples ordered by
+            SC column index then resource class index.
+        """
+        band = cls(sc_row_ind, excl, gen, tm_dset, gen_index,
+                   resolution=resolution, excl_area=excl_area,
+                   exclusion_shape=exclusion_shape,
+                   power_density=power_density,
+                   offshore_flags=offshore_flags,
+                   friction_layer=friction_layer,
+                   techmap=techmap)
+
+        summary = band.summary(sc_col_inds=sc_col_inds,
+                               res_class_dset=res_class_dset,
+                               res_class_bins=res_class_bins,
+                               cf_dset=cf_dset, lcoe_dset=lcoe_dset,
+                               h5_dsets=h5_dsets, data_layers=data_layers,
+                               args=args)
+
+        return summary
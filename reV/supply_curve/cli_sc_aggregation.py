@@ -98,6 +98,8 @@ def from_config(ctx, config_file, verbose):
                        tm_dset=config.tm_dset,
                        excl_dict=config.excl_dict,
                        check_excl_layers=config.check_excl_layers,
+                       excl_cache_dir=config.excl_cache_dir,
+                       shared_dir=config.shared_dir,
                        res_class_dset=config.res_class_dset,
                        res_class_bins=config.res_class_bins,
                        cf_dset=config.cf_dset,
@@ -109,8 +111,12 @@ def from_config(ctx, config_file, verbose):
                        power_density=config.power_density,
                        area_filter_kernel=config.area_filter_kernel,
                        min_area=config.min_area,
+                       area_filter_mode=config.area_filter_mode,
                        friction_fpath=config.friction_fpath,
                        friction_dset=config.friction_dset,
+                       engine=config.engine,
+                       tm_engine=config.tm_engine,
+                       tm_sc_resolution=config.tm_sc_resolution,
                        out_dir=config.dirout,
                        log_dir=config.logdir,
                        verbose=verbose)
@@ -125,6 +131,8 @@ def from_config(ctx, config_file, verbose):
         ctx.obj['TM_DSET'] = config.tm_dset
         ctx.obj['EXCL_DICT'] = config.excl_dict
         ctx.obj['CHECK_LAYERS'] = config.check_excl_layers
+        ctx.obj['EXCL_CACHE_DIR'] = config.excl_cache_dir
+        ctx.obj['SHARED_DIR'] = config.shared_dir
         ctx.obj['RES_CLASS_DSET'] = config.res_class_dset
         ctx.obj['RES_CLASS_BINS'] = config.res_class_bins
         ctx.obj['CF_DSET'] = config.cf_dset
@@ -136,8 +144,12 @@ def from_config(ctx, config_file, verbose):
         ctx.obj['POWER_DENSITY'] = config.power_density
         ctx.obj['AREA_FILTER_KERNEL'] = config.area_filter_kernel
         ctx.obj['MIN_AREA'] = config.min_area
+        ctx.obj['AREA_FILTER_MODE'] = config.area_filter_mode
         ctx.obj['FRICTION_FPATH'] = config.friction_fpath
         ctx.obj['FRICTION_DSET'] = config.friction_dset
+        ctx.obj['ENGINE'] = config.engine
+        ctx.obj['TM_ENGINE'] = config.tm_engine
+        ctx.obj['TM_SC_RESOLUTION'] = config.tm_sc_resolution
         ctx.obj['OUT_DIR'] = config.dirout
         ctx.obj['LOG_DIR'] = config.logdir
         ctx.obj['VERBOSE'] = verbose
@@ -175,6 +187,16 @@ def from_config(ctx, config_file, verbose):
 @click.option('--check_excl_layers', '-cl', is_flag=True,
               help=('run a pre-flight check on each exclusion layer to '
                     'ensure they contain un-excluded values'))
+@click.option('--excl_cache_dir', '-ecd', type=STR, default=None,
+              help='Optional directory to cache the combined exclusion layer '
+              'mask in. The cache is keyed by the exclusion dictionary and '
+              'source layers and is re-used by later runs. Default is None '
+              '(no cache).')
+@click.option('--shared_dir', '-sd', type=STR, default=None,
+              help='Optional scratch directory (e.g. /dev/shm) to share the '
+              'techmap and gen/econ input arrays with parallel workers '
+              'through memory mapped files instead of every worker reading '
+              'its own copy. Default is None (no sharing).')
 @click.option('--res_class_dset', '-cd', type=STR, default=None,
               help='Dataset to determine the resource class '
               '(must be in gen_fpath).')
@@ -211,6 +233,11 @@ def from_config(ctx, config_file, verbose):
 @click.option('--min_area', '-ma', type=FLOAT, default=None,
               help='Contiguous area filter minimum area, default is None '
               '(No minimum area filter).')
+@click.option('--area_filter_mode', '-afm',
+              type=click.Choice(['window', 'global']), default='window',
+              help='Contiguous area filter mode. "window" filters a 3x '
+              'larger window around each SC point, "global" filters the '
+              'full exclusion extent once. Default is "window".')
 @click.option('--friction_fpath', '-ff', type=STR, default=None,
               help='Optional h5 filepath to friction surface data. '
               'Must match the exclusion shape/resolution and be '
@@ -219,6 +246,21 @@ def from_config(ctx, config_file, verbose):
               'LCOE multiplied by the friction data.')
 @click.option('--friction_dset', '-fd', type=STR, default=None,
               help='Optional friction surface dataset in friction_fpath.')
+@click.option('--engine', '-en', type=click.Choice(['point', 'band']),
+              default='point',
+              help='Aggregation engine. "point" summarizes one SC point at a '
+              'time, "band" summarizes full SC rows with vectorized '
+              'reductions. Default is "point".')
+@click.option('--tm_engine', '-tme', type=click.Choice(['chunk', 'band']),
+              default='chunk',
+              help='Tech mapping engine used if the techmap dset has to be '
+              'created. "chunk" maps chunks of SC points in memory, "band" '
+              'streams row bands of the exclusions with one resource '
+              'KD-tree per worker. Default is "chunk".')
+@click.option('--tm_sc_resolution', '-tmr', type=INT, default=None,
+              help='SC resolution to save the valid SC point index for next '
+              'to a newly created techmap. Default is None (the aggregation '
+              'resolution).')
 @click.option('--out_dir', '-o', type=STR, default='./',
               help='Directory to save aggregation summary output.')
 @click.option('--log_dir', '-ld', type=STR, default='./logs/',
@@ -227,10 +269,12 @@ def from_config(ctx, config_file, verbose):
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
-           excl_dict, check_excl_layers, res_class_dset, res_class_bins,
-           cf_dset, lcoe_dset, h5_dsets, data_layers, resolution, excl_area,
-           power_density, area_filter_kernel, min_area, friction_fpath,
-           friction_dset, out_dir, log_dir, verbose):
+           excl_dict, check_excl_layers, excl_cache_dir, shared_dir,
+           res_class_dset, res_class_bins, cf_dset, lcoe_dset, h5_dsets,
+           data_layers, resolution, excl_area, power_density,
+           area_filter_kernel, min_area, area_filter_mode, friction_fpath,
+           friction_dset, engine, tm_engine, tm_sc_resolution, out_dir,
+           log_dir, verbose):
     """reV Supply Curve Aggregation Summary CLI."""
     name = ctx.obj['NAME']
     ctx.obj['EXCL_FPATH'] = excl_fpath
@@ -240,6 +284,8 @@ def direct(ctx, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
     ctx.obj['TM_DSET'] = tm_dset
     ctx.obj['EXCL_DICT'] = excl_dict
     ctx.obj['CHECK_LAYERS'] = check_excl_layers
+    ctx.obj['EXCL_CACHE_DIR'] = excl_cache_dir
+    ctx.obj['SHARED_DIR'] = shared_dir
     ctx.obj['RES_CLASS_DSET'] = res_class_dset
     ctx.obj['RES_CLASS_BINS'] = res_class_bins
     ctx.obj['CF_DSET'] = cf_dset
@@ -251,8 +297,12 @@ def direct(ctx, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
     ctx.obj['POWER_DENSITY'] = power_density
     ctx.obj['AREA_FILTER_KERNEL'] = area_filter_kernel
     ctx.obj['MIN_AREA'] = min_area
+    ctx.obj['AREA_FILTER_MODE'] = area_filter_mode
     ctx.obj['FRICTION_FPATH'] = friction_fpath
     ctx.obj['FRICTION_DSET'] = friction_dset
+    ctx.obj['ENGINE'] = engine
+    ctx.obj['TM_ENGINE'] = tm_engine
+    ctx.obj['TM_SC_RESOLUTION'] = tm_sc_resolution
     ctx.obj['OUT_DIR'] = out_dir
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['VERBOSE'] = verbose
@@ -266,7 +316,9 @@ def direct(ctx, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
             dsets = list(f)
         if tm_dset not in dsets:
             try:
-                TechMapping.run(excl_fpath, res_fpath, tm_dset)
+                TechMapping.run(excl_fpath, res_fpath, tm_dset,
+                                engine=tm_engine,
+                                sc_resolution=tm_sc_resolution or resolution)
             except Exception as e:
                 logger.exception('TechMapping process failed. Received the '
                                  'following error:\n{}'.format(e))
@@ -294,9 +346,13 @@ def direct(ctx, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
                 power_density=power_density,
                 area_filter_kernel=area_filter_kernel,
                 min_area=min_area,
+                area_filter_mode=area_filter_mode,
                 friction_fpath=friction_fpath,
                 friction_dset=friction_dset,
-                check_excl_layers=check_excl_layers)
+                check_excl_layers=check_excl_layers,
+                excl_cache_dir=excl_cache_dir,
+                shared_dir=shared_dir,
+                engine=engine)
 
         except Exception as e:
             logger.exception('Supply curve Aggregation failed. Received the '
@@ -325,15 +381,19 @@ def direct(ctx, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
                   'excl_fpath': excl_fpath,
                   'excl_dict': excl_dict,
                   'area_filter_kernel': area_filter_kernel,
-                  'min_area': min_area}
+                  'min_area': min_area,
+                  'area_filter_mode': area_filter_mode,
+                  'excl_cache_dir': excl_cache_dir}
         Status.make_job_file(out_dir, 'supply-curve-aggregation', name, status)
 
 
 def get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
-                 excl_dict, check_excl_layers, res_class_dset, res_class_bins,
-                 cf_dset, lcoe_dset, h5_dsets, data_layers, resolution,
-                 excl_area, power_density, area_filter_kernel, min_area,
-                 friction_fpath, friction_dset, out_dir, log_dir, verbose):
+                 excl_dict, check_excl_layers, excl_cache_dir, shared_dir,
+                 res_class_dset, res_class_bins, cf_dset, lcoe_dset, h5_dsets,
+                 data_layers, resolution, excl_area, power_density,
+                 area_filter_kernel, min_area, area_filter_mode,
+                 friction_fpath, friction_dset, engine, tm_engine,
+                 tm_sc_resolution, out_dir, log_dir, verbose):
     """Get a CLI call command for the SC aggregation cli."""
 
     args = ['-exf {}'.format(SLURM.s(excl_fpath)),
@@ -342,6 +402,8 @@ def get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
             '-rf {}'.format(SLURM.s(res_fpath)),
             '-tm {}'.format(SLURM.s(tm_dset)),
             '-exd {}'.format(SLURM.s(excl_dict)),
+            '-ecd {}'.format(SLURM.s(excl_cache_dir)),
+            '-sd {}'.format(SLURM.s(shared_dir)),
             '-cd {}'.format(SLURM.s(res_class_dset)),
             '-cb {}'.format(SLURM.s(res_class_bins)),
             '-cf {}'.format(SLURM.s(cf_dset)),
@@ -353,8 +415,12 @@ def get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
             '-pd {}'.format(SLURM.s(power_density)),
             '-afk {}'.format(SLURM.s(area_filter_kernel)),
             '-ma {}'.format(SLURM.s(min_area)),
+            '-afm {}'.format(SLURM.s(area_filter_mode)),
             '-ff {}'.format(SLURM.s(friction_fpath)),
             '-fd {}'.format(SLURM.s(friction_dset)),
+            '-en {}'.format(SLURM.s(engine)),
+            '-tme {}'.format(SLURM.s(tm_engine)),
+            '-tmr {}'.format(SLURM.s(tm_sc_resolution)),
             '-o {}'.format(SLURM.s(out_dir)),
             '-ld {}'.format(SLURM.s(log_dir)),
             ]
@@ -400,6 +466,8 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
     tm_dset = ctx.obj['TM_DSET']
     excl_dict = ctx.obj['EXCL_DICT']
     check_excl_layers = ctx.obj['CHECK_LAYERS']
+    excl_cache_dir = ctx.obj['EXCL_CACHE_DIR']
+    shared_dir = ctx.obj['SHARED_DIR']
     res_class_dset = ctx.obj['RES_CLASS_DSET']
     res_class_bins = ctx.obj['RES_CLASS_BINS']
     cf_dset = ctx.obj['CF_DSET']
@@ -411,8 +479,12 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
     power_density = ctx.obj['POWER_DENSITY']
     area_filter_kernel = ctx.obj['AREA_FILTER_KERNEL']
     min_area = ctx.obj['MIN_AREA']
+    area_filter_mode = ctx.obj['AREA_FILTER_MODE']
     friction_fpath = ctx.obj['FRICTION_FPATH']
     friction_dset = ctx.obj['FRICTION_DSET']
+    engine = ctx.obj['ENGINE']
+    tm_engine = ctx.obj['TM_ENGINE']
+    tm_sc_resolution = ctx.obj['TM_SC_RESOLUTION']
     out_dir = ctx.obj['OUT_DIR']
     log_dir = ctx.obj['LOG_DIR']
     verbose = ctx.obj['VERBOSE']
@@ -421,13 +493,13 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
         stdout_path = os.path.join(log_dir, 'stdout/')
 
     cmd = get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath,
-                       tm_dset, excl_dict, check_excl_layers,
-                       res_class_dset, res_class_bins,
+                       tm_dset, excl_dict, check_excl_layers, excl_cache_dir,
+                       shared_dir, res_class_dset, res_class_bins,
                        cf_dset, lcoe_dset, h5_dsets, data_layers,
                        resolution, excl_area,
                        power_density, area_filter_kernel, min_area,
-                       friction_fpath, friction_dset,
-                       out_dir, log_dir, verbose)
+                       area_filter_mode, friction_fpath, friction_dset, engine,
+                       tm_engine, tm_sc_resolution, out_dir, log_dir, verbose)
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
     if slurm_manager is None:
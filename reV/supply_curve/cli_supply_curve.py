@@ -164,8 +164,8 @@ def from_config(ctx, config_file, verbose):
               help=('Flag as to whether offshore farms should be included '
                     'during CompetitiveWindFarms, by default False'))
 @click.option('--max_workers', '-mw', type=INT, default=None,
-              help=('Number of workers to use to compute lcot, if > 1 run in '
-                    'parallel. None uses all available cpus.'))
+              help=('Deprecated and ignored, lcot is computed with '
+                    'vectorized array operations.'))
 @click.option('--out_dir', '-o', type=STR, default='./',
               help='Directory to save aggregation summary output.')
 @click.option('--log_dir', '-ld', type=STR, default='./logs/',
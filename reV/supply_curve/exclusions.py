@@ -2,12 +2,19 @@
 """
 Generate reV inclusion mask from exclusion layers
 """
+import h5py
+import hashlib
+import json
 import logging
 import numpy as np
+import os
 from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from warnings import warn
 
 from reV.handlers.exclusions import ExclusionLayers
+from rex.resource import ResourceDataset
 from reV.utilities.exceptions import ExclusionLayerError
 
 logger = logging.getLogger(__name__)
@@ -388,8 +395,18 @@ class ExclusionMask:
                           [1, 1, 1],
                           [0, 1, 0]])}
 
+    # contiguous area filter modes
+    FILTER_MODES = ('window', 'global')
+
+    # number of exclusion rows combined at a time when building the cache
+    CACHE_CHUNK_ROWS = 1024
+
+    # (rows, cols) tile shape for the global contiguous area filter
+    FILTER_TILE_SHAPE = (2048, 2048)
+
     def __init__(self, excl_h5, layers=None, min_area=None,
-                 kernel='queen', hsds=False, check_layers=False):
+                 kernel='queen', hsds=False, check_layers=False,
+                 cache_dir=None, filter_mode='window'):
         """
         Parameters
         ----------
@@ -407,11 +424,32 @@ class ExclusionMask:
         check_layers : bool
             Run a pre-flight check on each layer to ensure they contain
             un-excluded values
+        cache_dir : str | None
+            Optional directory to cache the combined layer mask in. The
+            cache file is keyed by a hash of the layer configurations and
+            the source layer metadata and is re-used by any later
+            ExclusionMask with the same layers. The contiguous area filter
+            is always applied on the fly so results are identical to the
+            un-cached mask. None (default) disables the cache. The cache is
+            not available with hsds.
+        filter_mode : str
+            Contiguous area filter mode. "window" (default) filters each
+            requested slice within a 3x larger window around it. "global"
+            filters the full exclusion extent once in tiles (merging
+            contiguous areas across tile borders) and serves all requested
+            slices from the filtered mask. The filtered mask is held in
+            memory or written to cache_dir if set (in place of the combined
+            layer mask cache). Only used if min_area is set.
         """
         self._layers = {}
         self._excl_h5 = ExclusionLayers(excl_h5, hsds=hsds)
         self._excl_layers = None
         self._check_layers = check_layers
+        self._cache_dir = None if hsds else cache_dir
+        self._cache_fpath = None
+        self._cache = None
+        self._filtered = None
+        self._filtered_h5 = None
 
         if layers is not None:
             if not isinstance(layers, list):
@@ -429,6 +467,24 @@ class ExclusionMask:
         else:
             raise KeyError('kernel must be "queen" or "rook"')
 
+        if filter_mode not in self.FILTER_MODES:
+            msg = ('Area filter mode must be one of {} but received: "{}"'
+                   .format(self.FILTER_MODES, filter_mode))
+            logger.error(msg)
+            raise KeyError(msg)
+
+        self._filter_mode = filter_mode
+        global_filter = (self._min_area is not None
+                         and filter_mode == 'global' and bool(self.layers))
+
+        # the globally filtered mask is cached on its own, the combined
+        # layer mask would never be read after it is built
+        if self._cache_dir is not None and self.layers and not global_filter:
+            self._init_cache()
+
+        if global_filter:
+            self._init_global_filter()
+
     def __enter__(self):
         return self
 
@@ -472,6 +528,14 @@ class ExclusionMask:
         Close h5 instance
         """
         self.excl_h5.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+        if self._filtered_h5 is not None:
+            self._filtered_h5.close()
+            self._filtered_h5 = None
+            self._filtered = None
 
     @property
     def shape(self):
@@ -618,6 +682,312 @@ class ExclusionMask:
 
         return nodata
 
+    @property
+    def cache_key(self):
+        """Get the hash key of the combined layer mask. The key changes if
+        any of the layer configurations, the exclusions file, or the source
+        layer datasets (shape, dtype, attributes) change.
+
+        Returns
+        -------
+        key : str
+            Hex digest of the layer configurations and source layer metadata.
+        """
+        stat = os.stat(self.excl_h5.h5_file)
+        config = {'excl_h5': os.path.abspath(self.excl_h5.h5_file),
+                  'size': stat.st_size,
+                  'mtime': stat.st_mtime_ns,
+                  'layers': {}}
+
+        for name, layer in sorted(self._layers.items()):
+            dset = self.excl_h5.h5[name]
+            attrs = {k: str(v) for k, v in dset.attrs.items()}
+            config['layers'][name] = {'config': vars(layer),
+                                      'shape': dset.shape,
+                                      'dtype': str(dset.dtype),
+                                      'attrs': attrs}
+
+        config = json.dumps(config, sort_keys=True, default=str)
+
+        return hashlib.sha256(config.encode()).hexdigest()
+
+    @property
+    def cache_fpath(self):
+        """Get the filepath of the combined layer mask cache, or of the
+        globally filtered mask cache with filter_mode="global".
+
+        Returns
+        -------
+        str | None
+            Filepath to the mask cache .h5 file, None if not caching.
+        """
+        return self._cache_fpath
+
+    def _combine_layers(self, ds_slice):
+        """
+        Combine all exclusion layers into a single inclusion mask without
+        the contiguous area filter.
+
+        Parameters
+        ----------
+        ds_slice : int | slice | list | ndarray
+            What to extract from ds, each arg is for a sequential axis.
+            For example, (slice(0, 64), slice(0, 64)) will extract a 64x64
+            exclusions mask.
+
+        Returns
+        -------
+        mask : ndarray
+            Multiplicative inclusion mask with all layers multiplied together
+            ("and" operation) and the force inclusion layers applied.
+        """
+        mask = None
+        force_include = []
+        for layer in self.layers:
+            if layer.force_include:
+                force_include.append(layer)
+            else:
+                layer_slice = (layer.layer, ) + ds_slice
+                layer_mask = layer[self.excl_h5[layer_slice]]
+                if mask is None:
+                    mask = layer_mask
+                else:
+                    mask = np.minimum(mask, layer_mask)
+
+        mask = self._force_include(mask, force_include, ds_slice)
+
+        return mask
+
+    def _build_cache(self, fpath):
+        """Combine the exclusion layers for the full extent in row chunks and
+        write them to the mask cache file.
+
+        Parameters
+        ----------
+        fpath : str
+            Target filepath for the mask cache .h5 file. The file is written
+            to a temporary file and moved into place once complete so that
+            partially written caches are never read.
+        """
+        logger.info('Building exclusions mask cache: {}'.format(fpath))
+        tmp_fpath = '{}.{}.tmp'.format(fpath, os.getpid())
+        shape = self.shape
+        with h5py.File(tmp_fpath, mode='w') as f:
+            for start in range(0, shape[0], self.CACHE_CHUNK_ROWS):
+                stop = min(start + self.CACHE_CHUNK_ROWS, shape[0])
+                ds_slice = (slice(start, stop), slice(None))
+                mask = self._combine_layers(ds_slice)
+                if 'mask' not in f:
+                    chunks = (min(shape[0], 128), min(shape[1], 128))
+                    f.create_dataset('mask', shape=shape, dtype=mask.dtype,
+                                     chunks=chunks)
+                    f['mask'].attrs['layers'] = json.dumps(
+                        {k: vars(v) for k, v in self._layers.items()},
+                        default=str)
+
+                f['mask'][start:stop] = mask
+
+        os.replace(tmp_fpath, fpath)
+
+    def _init_cache(self):
+        """Open the combined layer mask cache, building it if it does not
+        exist yet."""
+        os.makedirs(self._cache_dir, exist_ok=True)
+        fn = 'excl_mask_{}.h5'.format(self.cache_key)
+        self._cache_fpath = os.path.join(self._cache_dir, fn)
+        if not os.path.exists(self._cache_fpath):
+            self._build_cache(self._cache_fpath)
+        else:
+            logger.debug('Using exclusions mask cache: {}'
+                         .format(self._cache_fpath))
+
+        self._cache = h5py.File(self._cache_fpath, mode='r')
+
+    def _tiles(self):
+        """Get the tile slices used for the global contiguous area filter.
+
+        Returns
+        -------
+        row_slices : list
+            List of row slices, one per tile row.
+        col_slices : list
+            List of column slices, one per tile column.
+        """
+        shape = self.shape
+        tile_rows, tile_cols = self.FILTER_TILE_SHAPE
+        row_slices = [slice(i, min(i + tile_rows, shape[0]))
+                      for i in range(0, shape[0], tile_rows)]
+        col_slices = [slice(i, min(i + tile_cols, shape[1]))
+                      for i in range(0, shape[1], tile_cols)]
+
+        return row_slices, col_slices
+
+    def _label_tile(self, mask, offset):
+        """Label the contiguous included areas in a single mask tile.
+
+        Parameters
+        ----------
+        mask : ndarray
+            Un-filtered inclusion mask tile.
+        offset : int
+            Number of labels in all previous tiles. Tile labels are offset by
+            this value so they are unique across the full extent.
+
+        Returns
+        -------
+        labels : ndarray
+            int64 array of global labels, 0 is excluded.
+        n : int
+            Number of labels in this tile.
+        """
+        s = self.FILTER_KERNELS[self._kernel]
+        labels, n = ndimage.label(mask > 0, structure=s)
+        labels = labels.astype(np.int64)
+        labels[labels > 0] += offset
+
+        return labels, n
+
+    @staticmethod
+    def _seam_edges(a, b, kernel='queen'):
+        """Get the label pairs that are connected across a tile seam.
+
+        Parameters
+        ----------
+        a : ndarray
+            1D array of labels on one side of the seam.
+        b : ndarray
+            1D array of labels on the other side of the seam (same length).
+        kernel : str
+            Kernel type, either 'queen' or 'rook'. The queen kernel also
+            connects diagonal neighbors.
+
+        Returns
+        -------
+        edges : ndarray
+            (2, n) array of connected label pairs.
+        """
+        pairs = [(a, b)]
+        if kernel == 'queen':
+            pairs += [(a[:-1], b[1:]), (a[1:], b[:-1])]
+
+        edges = []
+        for x, y in pairs:
+            mask = (x > 0) & (y > 0)
+            edges.append(np.stack((x[mask], y[mask])))
+
+        return np.concatenate(edges, axis=1)
+
+    def _global_area_filter(self, out):
+        """Run the contiguous area filter on the full exclusion extent.
+
+        Each tile is labeled independently, labels that touch across tile
+        borders are merged with a connected components (union-find) pass
+        on the seam label pairs, and pixels of merged areas smaller than
+        min_area are excluded.
+
+        Parameters
+        ----------
+        out : ndarray | h5py.Dataset
+            Full extent array to write the filtered mask to. This is also
+            used to hold the un-filtered mask between the two passes so
+            every exclusion layer is only read once.
+        """
+        row_slices, col_slices = self._tiles()
+        shape = self.shape
+        top = np.zeros((len(row_slices), shape[1]), dtype=np.int64)
+        bottom = np.zeros((len(row_slices), shape[1]), dtype=np.int64)
+        left = np.zeros((len(col_slices), shape[0]), dtype=np.int64)
+        right = np.zeros((len(col_slices), shape[0]), dtype=np.int64)
+        sizes = [np.zeros(1, dtype=np.int64)]
+        offsets = {}
+        offset = 0
+
+        for i, rs in enumerate(row_slices):
+            for j, cs in enumerate(col_slices):
+                if self._cache is not None:
+                    mask = self._cache['mask'][rs, cs]
+                else:
+                    mask = self._combine_layers((rs, cs))
+
+                out[rs, cs] = mask
+                labels, n = self._label_tile(mask, offset)
+                sizes.append(np.bincount(labels[labels > 0] - offset - 1,
+                                         minlength=n))
+                top[i, cs] = labels[0]
+                bottom[i, cs] = labels[-1]
+                left[j, rs] = labels[:, 0]
+                right[j, rs] = labels[:, -1]
+                offsets[(i, j)] = offset
+                offset += n
+
+            logger.debug('Global area filter labeled {} of {} tile rows.'
+                         .format(i + 1, len(row_slices)))
+
+        edges = [np.zeros((2, 0), dtype=np.int64)]
+        for i in range(len(row_slices) - 1):
+            edges.append(self._seam_edges(bottom[i], top[i + 1],
+                                          kernel=self._kernel))
+        for j in range(len(col_slices) - 1):
+            edges.append(self._seam_edges(right[j], left[j + 1],
+                                          kernel=self._kernel))
+
+        edges = np.concatenate(edges, axis=1)
+        graph = coo_matrix((np.ones(edges.shape[1]), (edges[0], edges[1])),
+                           shape=(offset + 1, offset + 1))
+        _, areas = connected_components(graph, directed=False)
+
+        sizes = np.concatenate(sizes)
+        area_sizes = np.bincount(areas, weights=sizes)
+        min_counts = np.ceil(self._min_area / 0.0081)
+        bad = area_sizes[areas] < min_counts
+        bad[0] = False
+        logger.debug('Global area filter found {} contiguous areas, {} are '
+                     'smaller than {} km2.'
+                     .format(len(np.unique(areas)) - 1,
+                             len(np.unique(areas[bad])), self._min_area))
+
+        for i, rs in enumerate(row_slices):
+            for j, cs in enumerate(col_slices):
+                mask = out[rs, cs]
+                labels, _ = self._label_tile(mask, offsets[(i, j)])
+                mask[bad[labels]] = 0
+                out[rs, cs] = mask
+
+    def _init_global_filter(self):
+        """Initialize the globally filtered mask, either in memory or in a
+        cache file in cache_dir if available."""
+        logger.info('Running global contiguous area filter with min area of '
+                    '{} km2 and filter kernel "{}".'
+                    .format(self._min_area, self._kernel))
+        dtype = self._combine_layers((slice(0, 1), slice(0, 1))).dtype
+        if self._cache_dir is None:
+            self._filtered = np.zeros(self.shape, dtype=dtype)
+            self._global_area_filter(self._filtered)
+            return
+
+        key = '{}_{}_{}'.format(self.cache_key, self._kernel, self._min_area)
+        key = hashlib.sha256(key.encode()).hexdigest()
+        fpath = os.path.join(self._cache_dir, 'excl_mask_{}.h5'.format(key))
+        if not os.path.exists(fpath):
+            logger.info('Building globally filtered exclusions mask cache: '
+                        '{}'.format(fpath))
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp_fpath = '{}.{}.tmp'.format(fpath, os.getpid())
+            shape = self.shape
+            with h5py.File(tmp_fpath, mode='w') as f:
+                chunks = (min(shape[0], 128), min(shape[1], 128))
+                f.create_dataset('mask', shape=shape, chunks=chunks,
+                                 dtype=dtype)
+                f['mask'].attrs['min_area'] = self._min_area
+                f['mask'].attrs['kernel'] = self._kernel
+                self._global_area_filter(f['mask'])
+
+            os.replace(tmp_fpath, fpath)
+
+        self._cache_fpath = fpath
+        self._filtered_h5 = h5py.File(fpath, mode='r')
+        self._filtered = self._filtered_h5['mask']
+
     @staticmethod
     def _area_filter(mask, min_area=1, kernel='queen', excl_area=0.0081):
         """
@@ -777,23 +1147,20 @@ class ExclusionMask:
         if len(ds_slice) == 1 & isinstance(ds_slice[0], tuple):
             ds_slice = ds_slice[0]
 
+        if self._filtered is not None:
+            if isinstance(self._filtered, np.ndarray):
+                return self._filtered[ds_slice].copy()
+
+            return ResourceDataset.extract(self._filtered, ds_slice)
+
         if self._min_area is not None:
             ds_slice, sub_slice = self._increase_mask_slice(ds_slice, n=1)
 
         if self.layers:
-            force_include = []
-            for layer in self.layers:
-                if layer.force_include:
-                    force_include.append(layer)
-                else:
-                    layer_slice = (layer.layer, ) + ds_slice
-                    layer_mask = layer[self.excl_h5[layer_slice]]
-                    if mask is None:
-                        mask = layer_mask
-                    else:
-                        mask = np.minimum(mask, layer_mask)
-
-            mask = self._force_include(mask, force_include, ds_slice)
+            if self._cache is not None:
+                mask = ResourceDataset.extract(self._cache['mask'], ds_slice)
+            else:
+                mask = self._combine_layers(ds_slice)
 
             if self._min_area is not None:
                 mask = self._area_filter(mask, min_area=self._min_area,
@@ -809,7 +1176,7 @@ class ExclusionMask:
 
     @classmethod
     def run(cls, excl_h5, layers=None, min_area=None,
-            kernel='queen', hsds=False):
+            kernel='queen', hsds=False, cache_dir=None, filter_mode='window'):
         """
         Create inclusion mask from given layers
 
@@ -826,6 +1193,10 @@ class ExclusionMask:
         hsds : bool
             Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
             behind HSDS
+        cache_dir : str | None
+            Optional directory to cache the combined layer mask in.
+        filter_mode : str
+            Contiguous area filter mode, either "window" or "global".
 
         Returns
         -------
@@ -833,7 +1204,8 @@ class ExclusionMask:
             Full inclusion mask
         """
         with cls(excl_h5, layers=layers, min_area=min_area,
-                 kernel=kernel, hsds=hsds) as f:
+                 kernel=kernel, hsds=hsds, cache_dir=cache_dir,
+                 filter_mode=filter_mode) as f:
             mask = f.mask
 
         return mask
@@ -844,7 +1216,8 @@ class ExclusionMaskFromDict(ExclusionMask):
     Class to initialize ExclusionMask from a dictionary defining layers
     """
     def __init__(self, excl_h5, layers_dict=None, min_area=None,
-                 kernel='queen', hsds=False, check_layers=False):
+                 kernel='queen', hsds=False, check_layers=False,
+                 cache_dir=None, filter_mode='window'):
         """
         Parameters
         ----------
@@ -862,6 +1235,14 @@ class ExclusionMaskFromDict(ExclusionMask):
         check_layers : bool
             Run a pre-flight check on each layer to ensure they contain
             un-excluded values
+        cache_dir : str | None
+            Optional directory to cache the combined layer mask in. The
+            cache is keyed by the layers_dict and source layer metadata and
+            is re-used on later runs. None disables the cache.
+        filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each requested slice, "global" filters the
+            full exclusion extent once.
         """
         if layers_dict is not None:
             layers = []
@@ -871,11 +1252,12 @@ class ExclusionMaskFromDict(ExclusionMask):
             layers = None
 
         super().__init__(excl_h5, layers=layers, min_area=min_area,
-                         kernel=kernel, hsds=hsds, check_layers=check_layers)
+                         kernel=kernel, hsds=hsds, check_layers=check_layers,
+                         cache_dir=cache_dir, filter_mode=filter_mode)
 
     @classmethod
     def run(cls, excl_h5, layers_dict=None, min_area=None,
-            kernel='queen', hsds=False):
+            kernel='queen', hsds=False, cache_dir=None, filter_mode='window'):
         """
         Create inclusion mask from given layers dictionary
 
@@ -892,6 +1274,10 @@ class ExclusionMaskFromDict(ExclusionMask):
         hsds : bool
             Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
             behind HSDS
+        cache_dir : str | None
+            Optional directory to cache the combined layer mask in.
+        filter_mode : str
+            Contiguous area filter mode, either "window" or "global".
 
         Returns
         -------
@@ -899,7 +1285,8 @@ class ExclusionMaskFromDict(ExclusionMask):
             Full inclusion mask
         """
         with cls(excl_h5, layers_dict=layers_dict, min_area=min_area,
-                 kernel=kernel, hsds=hsds) as f:
+                 kernel=kernel, hsds=hsds, cache_dir=cache_dir,
+                 filter_mode=filter_mode) as f:
             mask = f.mask
 
         return mask
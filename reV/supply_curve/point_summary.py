@@ -33,7 +33,7 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
                  power_density=None, cf_dset='cf_mean-means',
                  lcoe_dset='lcoe_fcr-means', h5_dsets=None, resolution=64,
                  exclusion_shape=None, close=False, offshore_flags=None,
-                 friction_layer=None):
+                 friction_layer=None, techmap=None):
         """
         Parameters
         ----------
@@ -90,6 +90,10 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
         friction_layer : None | FrictionMask
             Friction layer with scalar friction values if valid friction inputs
             were entered. Otherwise, None to not apply friction layer.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
         """
 
         self._res_class_dset = res_class_dset
@@ -108,7 +112,8 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
         super().__init__(gid, excl, gen, tm_dset, gen_index,
                          excl_dict=excl_dict, resolution=resolution,
                          excl_area=excl_area, exclusion_shape=exclusion_shape,
-                         offshore_flags=offshore_flags, close=close)
+                         offshore_flags=offshore_flags, close=close,
+                         techmap=techmap)
 
         self._apply_exclusions()
 
@@ -460,35 +465,69 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
                     raw = attrs['fobj'][attrs['dset'], self.rows, self.cols]
                     nodata = attrs['fobj'].get_nodata_value(attrs['dset'])
 
-                data = raw.flatten()[self.bool_mask]
-                excl_mult = self.excl_data_flat[self.bool_mask]
+                summary[name] = self._agg_data_layer(name, raw.flatten(),
+                                                     nodata, attrs['method'],
+                                                     self.bool_mask,
+                                                     self.excl_data_flat,
+                                                     self._gid)
 
-                if nodata is not None:
-                    nodata_mask = (data == nodata)
+        return summary
+
+    @classmethod
+    def _agg_data_layer(cls, name, raw, nodata, method, bool_mask,
+                        excl_data_flat, gid):
+        """Aggregate a single flattened data layer for one SC point. If there
+        is no valid data in the included area, the data layer will be taken
+        from the full SC point extent (ignoring exclusions).
+
+        Parameters
+        ----------
+        name : str
+            Data layer label name.
+        raw : np.ndarray
+            Flattened raw data layer values for the full SC point extent.
+        nodata : int | float | None
+            Nodata value for the data layer.
+        method : str
+            Aggregation method (mode, mean, max, min, sum, category)
+        bool_mask : np.ndarray
+            Boolean inclusion mask (True if excl point is not excluded).
+        excl_data_flat : np.ndarray
+            1D flattened exclusions data mask.
+        gid : int
+            Supply curve point gid (used for logging).
+
+        Returns
+        -------
+        data : float | int | str | None
+            Result of applying method to the included data.
+        """
 
-                    # All included extent is nodata.
-                    # Reset data from raw without exclusions.
-                    if all(nodata_mask):
-                        data = raw.flatten()
-                        excl_mult = self.excl_data_flat
-                        nodata_mask = (data == nodata)
+        data = raw[bool_mask]
+        excl_mult = excl_data_flat[bool_mask]
 
-                    data = data[~nodata_mask]
-                    excl_mult = excl_mult[~nodata_mask]
+        if nodata is not None:
+            nodata_mask = (data == nodata)
 
-                    if not data.size:
-                        data = None
-                        excl_mult = None
-                        m = ('Data layer "{}" has no valid data for '
-                             'SC point gid {}!'
-                             .format(name, self._gid))
-                        logger.debug(m)
+            # All included extent is nodata.
+            # Reset data from raw without exclusions.
+            if all(nodata_mask):
+                data = raw
+                excl_mult = excl_data_flat
+                nodata_mask = (data == nodata)
 
-                data = self._agg_data_layer_method(data, excl_mult,
-                                                   attrs['method'])
-                summary[name] = data
+            data = data[~nodata_mask]
+            excl_mult = excl_mult[~nodata_mask]
 
-        return summary
+            if not data.size:
+                data = None
+                excl_mult = None
+                m = ('Data layer "{}" has no valid data for '
+                     'SC point gid {}!'
+                     .format(name, gid))
+                logger.debug(m)
+
+        return cls._agg_data_layer_method(data, excl_mult, method)
 
     @staticmethod
     def _agg_data_layer_method(data, excl_mult, method):
@@ -607,7 +646,7 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
                   cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                   h5_dsets=None, resolution=64, exclusion_shape=None,
                   close=False, offshore_flags=None, friction_layer=None,
-                  args=None, data_layers=None):
+                  args=None, data_layers=None, techmap=None):
         """Get a summary dictionary of a single supply curve point.
 
         Parameters
@@ -671,6 +710,10 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             Aggregation data layers. Must be a dictionary keyed by data label
             name. Each value must be another dictionary with "dset", "method",
             and "fpath", by default None
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
 
         Returns
         -------
@@ -684,7 +727,7 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
                   "resolution": resolution,
                   "exclusion_shape": exclusion_shape, "close": close,
                   "offshore_flags": offshore_flags,
-                  'friction_layer': friction_layer}
+                  'friction_layer': friction_layer, 'techmap': techmap}
         with cls(gid, excl_fpath, gen_fpath, tm_dset, gen_index,
                  **kwargs) as point:
             summary = point.point_summary(args=args, data_layers=data_layers)
@@ -3,6 +3,7 @@
 reV supply curve extent and points base frameworks.
 """
 from abc import ABC
+import h5py
 import logging
 import numpy as np
 import pandas as pd
@@ -12,7 +13,8 @@ from warnings import warn
 from reV.handlers.exclusions import ExclusionLayers
 from reV.supply_curve.exclusions import ExclusionMask, ExclusionMaskFromDict
 from reV.utilities.exceptions import (SupplyCurveError, SupplyCurveInputError,
-                                      EmptySupplyCurvePointError, InputWarning)
+                                      EmptySupplyCurvePointError, InputWarning,
+                                      FileInputWarning)
 
 from rex.resource import Resource
 
@@ -156,7 +158,7 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
 
     def __init__(self, gid, excl, tm_dset, excl_dict=None,
                  resolution=64, excl_area=0.0081, exclusion_shape=None,
-                 close=True):
+                 close=True, techmap=None):
         """
         Parameters
         ----------
@@ -184,6 +186,10 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
             data. None if offshore flag is not available.
         close : bool
             Flag to close object file handlers on exit.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
         """
 
         self._excl_dict = excl_dict
@@ -200,7 +206,7 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
         self._excl_data_flat = None
         self._excl_area = excl_area
 
-        self._gids = self._parse_techmap(tm_dset)
+        self._gids = self._parse_techmap(tm_dset, techmap=techmap)
         self._check_excl()
 
     @staticmethod
@@ -236,7 +242,7 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
 
         return excl_fpath, exclusions
 
-    def _parse_techmap(self, tm_dset):
+    def _parse_techmap(self, tm_dset, techmap=None):
         """Parse data from the tech map file (exclusions to resource mapping).
         Raise EmptySupplyCurvePointError if there are no valid resource points
         in this SC point.
@@ -246,6 +252,10 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
         tm_dset : str
             Dataset name in the exclusions file containing the
             exclusions-to-resource mapping data.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
 
         Returns
         -------
@@ -254,7 +264,11 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
             gids (native resource index) from the original resource data
             corresponding to the tech exclusions.
         """
-        res_gids = self.exclusions.excl_h5[tm_dset, self.rows, self.cols]
+        if techmap is not None:
+            res_gids = techmap[self.rows, self.cols]
+        else:
+            res_gids = self.exclusions.excl_h5[tm_dset, self.rows, self.cols]
+
         res_gids = res_gids.astype(np.int32).flatten()
 
         if (res_gids != -1).sum() == 0:
@@ -494,7 +508,7 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
 
     @classmethod
     def sc_mean(cls, gid, excl, tm_dset, data, excl_dict=None, resolution=64,
-                exclusion_shape=None, close=True):
+                exclusion_shape=None, close=True, techmap=None):
         """
         Compute exclusions weight mean for the sc point from data
 
@@ -524,6 +538,10 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
             data. None if offshore flag is not available.
         close : bool
             Flag to close object file handlers on exit
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
 
         Returns
         -------
@@ -531,7 +549,8 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
             Exclusions weighted means of data for supply curve point
         """
         kwargs = {"excl_dict": excl_dict, "resolution": resolution,
-                  "exclusion_shape": exclusion_shape, "close": close}
+                  "exclusion_shape": exclusion_shape, "close": close,
+                  "techmap": techmap}
         with cls(gid, excl, tm_dset, **kwargs) as point:
             means = point.exclusion_weighted_mean(data)
 
@@ -539,7 +558,7 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
 
     @classmethod
     def sc_sum(cls, gid, excl, tm_dset, data, excl_dict=None, resolution=64,
-               exclusion_shape=None, close=True):
+               exclusion_shape=None, close=True, techmap=None):
         """
         Compute the aggregate (sum) of data for the sc point
 
@@ -569,6 +588,10 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
             data. None if offshore flag is not available.
         close : bool
             Flag to close object file handlers on exit.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
 
         Returns
         -------
@@ -576,7 +599,8 @@ class SupplyCurvePoint(AbstractSupplyCurvePoint):
             Sum / aggregation of data for supply curve point
         """
         kwargs = {"excl_dict": excl_dict, "resolution": resolution,
-                  "exclusion_shape": exclusion_shape, "close": close}
+                  "exclusion_shape": exclusion_shape, "close": close,
+                  "techmap": techmap}
         with cls(gid, excl, tm_dset, **kwargs) as point:
             agg = point.aggregate(data)
 
@@ -588,7 +612,7 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
 
     def __init__(self, gid, excl, agg_h5, tm_dset, excl_dict=None,
                  resolution=64, excl_area=0.0081, exclusion_shape=None,
-                 close=True, gen_index=None):
+                 close=True, gen_index=None, techmap=None):
         """
         Parameters
         ----------
@@ -619,11 +643,15 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
             Array of generation gids with array index equal to resource gid.
             Array value is -1 if the resource index was not used in the
             generation run.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
         """
         super().__init__(gid, excl, tm_dset, excl_dict=excl_dict,
                          resolution=resolution, excl_area=excl_area,
                          exclusion_shape=exclusion_shape,
-                         close=close)
+                         close=close, techmap=techmap)
 
         self._h5_gid_set = None
         self._h5_fpath, self._h5 = self._parse_h5_file(agg_h5)
@@ -853,7 +881,7 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
     @classmethod
     def run(cls, gid, excl, agg_h5, tm_dset, *agg_dset, agg_method='mean',
             excl_dict=None, resolution=64, excl_area=0.0081,
-            exclusion_shape=None, close=True, gen_index=None):
+            exclusion_shape=None, close=True, gen_index=None, techmap=None):
         """
         Compute exclusions weight mean for the sc point from data
 
@@ -893,6 +921,10 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
             Array of generation gids with array index equal to resource gid.
             Array value is -1 if the resource index was not used in the
             generation run.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
 
         Returns
         -------
@@ -904,7 +936,7 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
 
         kwargs = {"excl_dict": excl_dict, "resolution": resolution,
                   "excl_area": excl_area, "exclusion_shape": exclusion_shape,
-                  "close": close, "gen_index": gen_index}
+                  "close": close, "gen_index": gen_index, "techmap": techmap}
         with cls(gid, excl, agg_h5, tm_dset, **kwargs) as point:
             if agg_method.lower().startswith('mean'):
                 agg_method = point.exclusion_weighted_mean
@@ -929,7 +961,7 @@ class GenerationSupplyCurvePoint(AggregationSupplyCurvePoint):
 
     def __init__(self, gid, excl, gen, tm_dset, gen_index, excl_dict=None,
                  resolution=64, excl_area=0.0081, exclusion_shape=None,
-                 offshore_flags=None, close=True):
+                 offshore_flags=None, close=True, techmap=None):
         """
         Parameters
         ----------
@@ -964,6 +996,10 @@ class GenerationSupplyCurvePoint(AggregationSupplyCurvePoint):
             data. None if offshore flag is not available.
         close : bool
             Flag to close object file handlers on exit.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
         """
 
         super().__init__(gid, excl, gen, tm_dset,
@@ -971,7 +1007,8 @@ class GenerationSupplyCurvePoint(AggregationSupplyCurvePoint):
                          resolution=resolution,
                          excl_area=excl_area,
                          exclusion_shape=exclusion_shape,
-                         close=close)
+                         close=close,
+                         techmap=techmap)
 
         self._res_gid_set = None
         self._gen_gid_set = None
@@ -1579,10 +1616,93 @@ class SupplyCurveExtent:
 
         return slices
 
+    def _sc_row_bands(self, band_size=1e7):
+        """Split the SC rows into bands that are streamed from the
+        exclusions file one at a time.
+
+        Parameters
+        ----------
+        band_size : int | float
+            Approximate number of exclusion pixels to read per band.
+
+        Returns
+        -------
+        bands : list
+            List of slices of SC row indices.
+        """
+        n = int(max(1, band_size // (self.resolution
+                                     * self.exclusions.shape[1])))
+
+        return [slice(r, min(r + n, self.n_rows))
+                for r in range(0, self.n_rows, n)]
+
+    def _read_blocks(self, dset, sc_rows, fill):
+        """Read the exclusion pixels for a band of SC rows and reshape them
+        into SC point blocks.
+
+        Parameters
+        ----------
+        dset : str
+            Exclusions dataset to read (e.g. techmap, latitude).
+        sc_rows : slice
+            Slice of SC row indices to read.
+        fill : int | float
+            Value to pad partial SC points at the extent edges with.
+
+        Returns
+        -------
+        blocks : np.ndarray
+            4D array (n_sc_rows, resolution, n_sc_cols, resolution) of the
+            exclusion pixels in the band. Reduce over axes (1, 3) to get
+            per-SC point values.
+        """
+        res = self.resolution
+        n_rows = sc_rows.stop - sc_rows.start
+        rows = slice(sc_rows.start * res,
+                     min(sc_rows.stop * res, self.exclusions.shape[0]))
+        blocks = self.exclusions[dset, rows, :]
+
+        pad_rows = n_rows * res - blocks.shape[0]
+        pad_cols = self.n_cols * res - blocks.shape[1]
+        if pad_rows or pad_cols:
+            data = blocks
+            dtype = np.result_type(data.dtype, np.min_scalar_type(fill))
+            blocks = np.full((n_rows * res, self.n_cols * res), fill,
+                             dtype=dtype)
+            blocks[:data.shape[0], :data.shape[1]] = data
+
+        return blocks.reshape(n_rows, res, self.n_cols, res)
+
+    @staticmethod
+    def _count_unique(tm):
+        """Count the unique resource gids in each SC point block.
+
+        Parameters
+        ----------
+        tm : np.ndarray
+            4D techmap blocks from _read_blocks(), -1 where no resource gid
+            is mapped.
+
+        Returns
+        -------
+        counts : np.ndarray
+            2D array (n_sc_rows, n_sc_cols) of unique resource gid counts.
+        """
+        shape = (tm.shape[0], tm.shape[2])
+        tm = tm.transpose(0, 2, 1, 3).reshape(shape[0] * shape[1], -1)
+        seg, ind = np.nonzero(tm != -1)
+        gids = tm[seg, ind].astype(np.int64)
+        n_gids = gids.max(initial=0) + 1
+        keys = np.unique(seg * n_gids + gids)
+        counts = np.bincount(keys // n_gids, minlength=len(tm))
+
+        return counts.reshape(shape)
+
     def valid_sc_points(self, tm_dset):
         """
         Determine which sc_point_gids contain resource gids and are thus
-        valid supply curve points
+        valid supply curve points. Uses the persisted SC point index if one
+        was saved next to the techmap (see save_sc_point_index()).
 
         Parameters
         ----------
@@ -1594,16 +1714,171 @@ class SupplyCurveExtent:
         valid_gids : ndarray
             Vector of valid sc_point_gids that contain resource gis
         """
-        valid_gids = []
-        tm = self._excls[tm_dset]
-        gid = 0
-        for r in range(self.n_rows):
-            r = slice(r * self._res, (r + 1) * self._res)
-            for c in range(self.n_cols):
-                c = slice(c * self._res, (c + 1) * self._res)
-                if np.any(tm[r, c] != -1):
-                    valid_gids.append(gid)
+        index = self.load_sc_point_index(tm_dset)
+        if index is not None:
+            return index['gid'].values.astype(np.uint32)
+
+        valid = [np.any(self._read_blocks(tm_dset, rows, -1) != -1,
+                        axis=(1, 3))
+                 for rows in self._sc_row_bands()]
+        valid_gids = np.where(np.concatenate(valid).ravel())[0]
+
+        return valid_gids.astype(np.uint32)
+
+    def sc_point_index_dset(self, tm_dset):
+        """Get the name of the persisted SC point index dataset for a
+        techmap.
+
+        Parameters
+        ----------
+        tm_dset : str
+            Techmap dataset name
+
+        Returns
+        -------
+        dset : str
+            SC point index dataset name in the exclusions file.
+        """
+        return '{}-sc_points-{}'.format(tm_dset, self.resolution)
 
-                gid += 1
+    def sc_point_index(self, tm_dset):
+        """Build a compact index of the valid SC points by streaming the
+        techmap and coordinates in bands of SC rows.
 
-        return np.array(valid_gids, dtype=np.uint32)
+        Parameters
+        ----------
+        tm_dset : str
+            Techmap dataset name
+
+        Returns
+        -------
+        index : pd.DataFrame
+            Valid SC points with columns: gid, row_ind, col_ind, n_res_gids
+            (number of unique resource gids mapped to the SC point), and
+            latitude, longitude (SC point centroid).
+        """
+        index = []
+        for rows in self._sc_row_bands():
+            tm = self._read_blocks(tm_dset, rows, -1)
+            valid = np.any(tm != -1, axis=(1, 3)).ravel()
+            band = pd.DataFrame({'gid': np.arange(rows.start * self.n_cols,
+                                                  rows.stop * self.n_cols),
+                                 'n_res_gids': self._count_unique(tm).ravel()})
+            for dset in ('latitude', 'longitude'):
+                coords = self._read_blocks(dset, rows, np.nan)
+                band[dset] = np.nanmean(coords, axis=(1, 3)).ravel()
+
+            index.append(band[valid])
+
+        index = pd.concat(index, ignore_index=True)
+        index.insert(1, 'row_ind', index['gid'] // self.n_cols)
+        index.insert(2, 'col_ind', index['gid'] % self.n_cols)
+
+        return index
+
+    def load_sc_point_index(self, tm_dset):
+        """Load the persisted SC point index for a techmap if available.
+
+        Parameters
+        ----------
+        tm_dset : str
+            Techmap dataset name
+
+        Returns
+        -------
+        index : pd.DataFrame | None
+            Valid SC point index (see sc_point_index()) or None if it has
+            not been saved to the exclusions file or was built from a
+            different techmap.
+        """
+        dset = self.sc_point_index_dset(tm_dset)
+        if dset not in self.exclusions.h5:
+            return None
+
+        logger.debug('Loading SC point index "{}" from {}'
+                     .format(dset, self._excl_fpath))
+
+        ds = self.exclusions.h5[dset]
+        fingerprint = self._techmap_fingerprint(self.exclusions.h5, tm_dset)
+        saved = {k: v for k, v in ds.attrs.items() if k.startswith('techmap_')}
+        for k in set(fingerprint) | set(saved):
+            v = fingerprint.get(k)
+            if k not in saved or not np.array_equal(saved[k], v):
+                w = ('SC point index "{}" in {} does not match techmap "{}" '
+                     '({}: {} != {}), ignoring the saved index.'
+                     .format(dset, self._excl_fpath, tm_dset, k,
+                             saved.get(k), v))
+                logger.warning(w)
+                warn(w, FileInputWarning)
+                return None
+
+        return pd.DataFrame(ds[...])
+
+    @staticmethod
+    def _techmap_fingerprint(f, tm_dset):
+        """Get the techmap properties that a persisted SC point index is
+        only valid for.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Open exclusions h5 file with techmap dataset.
+        tm_dset : str
+            Techmap dataset name
+
+        Returns
+        -------
+        fingerprint : dict
+            Techmap shape and the techmap fpath and distance_upper_bound
+            attrs (if present), keyed by SC point index attr name.
+        """
+        fingerprint = {'techmap_shape': np.array(f[tm_dset].shape)}
+        for attr in ('fpath', 'distance_upper_bound'):
+            if attr in f[tm_dset].attrs:
+                fingerprint['techmap_' + attr] = f[tm_dset].attrs[attr]
+
+        return fingerprint
+
+    @classmethod
+    def save_sc_point_index(cls, excl_fpath, tm_dset, resolution=64):
+        """Build the SC point index for a techmap and save it as a compound
+        dataset next to the techmap in the exclusions file so that later
+        runs do not have to re-scan the full techmap.
+
+        Parameters
+        ----------
+        excl_fpath : str
+            Filepath to exclusions h5 with techmap dataset.
+        tm_dset : str
+            Techmap dataset name
+        resolution : int
+            Number of exclusion points per SC point along an axis.
+
+        Returns
+        -------
+        index : pd.DataFrame
+            Valid SC point index (see sc_point_index()).
+        """
+        with cls(excl_fpath, resolution=resolution) as sc:
+            index = sc.sc_point_index(tm_dset)
+            dset = sc.sc_point_index_dset(tm_dset)
+
+        dtypes = {'gid': np.uint32, 'row_ind': np.uint32,
+                  'col_ind': np.uint32, 'n_res_gids': np.uint32,
+                  'latitude': np.float32, 'longitude': np.float32}
+        records = np.rec.fromarrays([index[c].values.astype(dtypes[c])
+                                     for c in index.columns],
+                                    names=list(index.columns))
+
+        logger.info('Saving SC point index with {} valid SC points to '
+                    '"{}" in {}'.format(len(index), dset, excl_fpath))
+        with h5py.File(excl_fpath, 'a') as f:
+            if dset in f:
+                del f[dset]
+
+            f.create_dataset(dset, data=records)
+            f[dset].attrs['resolution'] = resolution
+            for k, v in cls._techmap_fingerprint(f, tm_dset).items():
+                f[dset].attrs[k] = v
+
+        return index
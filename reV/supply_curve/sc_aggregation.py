@@ -19,6 +19,7 @@ from reV.offshore.offshore import Offshore as OffshoreClass
 from reV.supply_curve.aggregation import (AbstractAggFileHandler,
                                           AbstractAggregation,
                                           Aggregation)
+from reV.supply_curve.band_summary import SupplyCurveBandSummary
 from reV.supply_curve.exclusions import FrictionMask
 from reV.supply_curve.points import SupplyCurveExtent
 from reV.supply_curve.point_summary import SupplyCurvePointSummary
@@ -47,7 +48,8 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
                  data_layers=None, power_density=None, excl_dict=None,
                  friction_fpath=None, friction_dset=None,
                  area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False):
+                 check_excl_layers=False, excl_cache_dir=None,
+                 area_filter_mode='window'):
         """
         Parameters
         ----------
@@ -88,11 +90,21 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
         """
         super().__init__(excl_fpath, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
-                         check_excl_layers=check_excl_layers)
+                         check_excl_layers=check_excl_layers,
+                         excl_cache_dir=excl_cache_dir,
+                         area_filter_mode=area_filter_mode)
 
         self._gen = self._open_gen_econ_resource(gen_fpath, econ_fpath)
         # pre-initialize any import attributes
@@ -565,13 +577,18 @@ class OffshoreAggregation:
 class SupplyCurveAggregation(AbstractAggregation):
     """Supply points aggregation framework."""
 
+    # available SC point summary engines
+    ENGINES = ('point', 'band')
+
     def __init__(self, excl_fpath, gen_fpath, tm_dset, econ_fpath=None,
                  excl_dict=None, area_filter_kernel='queen', min_area=None,
                  check_excl_layers=False, resolution=64, excl_area=None,
                  gids=None, res_class_dset=None, res_class_bins=None,
                  cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                  h5_dsets=None, data_layers=None, power_density=None,
-                 friction_fpath=None, friction_dset=None):
+                 friction_fpath=None, friction_dset=None, engine='point',
+                 excl_cache_dir=None, area_filter_mode='window',
+                 shared_dir=None):
         """
         Parameters
         ----------
@@ -637,12 +654,38 @@ class SupplyCurveAggregation(AbstractAggregation):
             Dataset name in friction_fpath for the friction surface data.
             Must be paired with friction_fpath. Must be same shape as
             exclusions.
+        engine : str
+            SC point summary engine. "point" summarizes one SC point at a time
+            with SupplyCurvePointSummary. "band" reads full rows of SC points
+            (bands of exclusion rows) at once and summarizes all SC points in
+            each band with vectorized segment reductions. The "band" engine
+            requires area_filter_mode="global" when min_area is set.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache, except that
+            area_filter_mode="global" with min_area set uses a
+            temporary cache for the lifetime of the aggregation so
+            that the global area filter only runs once.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
+        shared_dir : str | None
+            Optional scratch directory (e.g. /dev/shm) for parallel runs. The
+            techmap, gen index, and gen/econ input arrays (cf, lcoe, resource
+            class, and h5_dsets data) are read once by the parent process and
+            saved here as .npy files that every worker memory maps read-only
+            instead of reading its own copy. None disables sharing.
         """
 
         super().__init__(excl_fpath, tm_dset, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
                          check_excl_layers=check_excl_layers,
+                         excl_cache_dir=excl_cache_dir,
+                         area_filter_mode=area_filter_mode,
+                         shared_dir=shared_dir,
                          resolution=resolution, gids=gids)
 
         self._gen_fpath = gen_fpath
@@ -656,9 +699,12 @@ class SupplyCurveAggregation(AbstractAggregation):
         self._friction_fpath = friction_fpath
         self._friction_dset = friction_dset
         self._data_layers = data_layers
+        self._engine = str(engine).lower()
 
         logger.debug('Resource class bins: {}'.format(self._res_class_bins))
 
+        self._check_engine(self._engine, min_area, area_filter_mode)
+
         if self._power_density is None:
             msg = ('Supply curve aggregation power density not specified. '
                    'Will try to infer based on lookup table: {}'
@@ -679,6 +725,35 @@ class SupplyCurveAggregation(AbstractAggregation):
             logger.error(e)
             raise SupplyCurveInputError(e)
 
+    @classmethod
+    def _check_engine(cls, engine, min_area, area_filter_mode):
+        """Check that the SC point summary engine is valid and produces the
+        same results as the "point" engine with the area filter inputs.
+
+        Parameters
+        ----------
+        engine : str
+            SC point summary engine, either "point" or "band".
+        min_area : float | None
+            Minimum required contiguous area filter in sq-km
+        area_filter_mode : str
+            Contiguous area filter mode, either "window" or "global".
+        """
+        if engine not in cls.ENGINES:
+            e = ('SC aggregation engine must be one of {} but received: "{}"'
+                 .format(cls.ENGINES, engine))
+            logger.error(e)
+            raise SupplyCurveInputError(e)
+
+        if (engine == 'band' and min_area is not None
+                and area_filter_mode != 'global'):
+            e = ('The "band" SC aggregation engine cannot reproduce the '
+                 '"{}" contiguous area filter of the "point" engine. Use '
+                 'area_filter_mode="global" or engine="point" with '
+                 'min_area={}.'.format(area_filter_mode, min_area))
+            logger.error(e)
+            raise SupplyCurveInputError(e)
+
     def _check_files(self):
         """Do a preflight check on input files"""
 
@@ -839,6 +914,74 @@ class SupplyCurveAggregation(AbstractAggregation):
         return (res_data, res_class_bins, cf_data, lcoe_data, offshore_flag,
                 h5_dsets_data)
 
+    def _get_shared_arrays(self):
+        """Read the gen index and SC point agg input data once so that they
+        can be shared with parallel workers.
+
+        Returns
+        -------
+        arrays : dict
+            Input arrays to share keyed by name. Empty if shared_dir is None.
+        """
+        if self._shared_dir is None:
+            return {}
+
+        gen = SupplyCurveAggFileHandler._open_gen_econ_resource(
+            self._gen_fpath, self._econ_fpath)
+        with gen:
+            inputs = self._get_input_data(gen, self._gen_fpath,
+                                          self._econ_fpath,
+                                          self._res_class_dset,
+                                          self._res_class_bins,
+                                          self._cf_dset, self._lcoe_dset,
+                                          self._h5_dsets)
+
+        arrays = {'gen_index': self._gen_index,
+                  'res_data': inputs[0],
+                  'cf_data': inputs[2],
+                  'lcoe_data': inputs[3],
+                  'offshore_flag': inputs[4]}
+        if inputs[5] is not None:
+            arrays.update({'h5_dset-{}'.format(dset): data
+                           for dset, data in inputs[5].items()})
+
+        return arrays
+
+    @staticmethod
+    def _get_shared_input_data(shared, res_class_bins, h5_dsets):
+        """Get SC point agg input data args from the arrays shared by the
+        parent process. Mirrors the output of _get_input_data().
+
+        Parameters
+        ----------
+        shared : dict
+            Memory mapped arrays from _load_shared_arrays() keyed by name.
+        res_class_bins : list | None
+            List of two-entry lists dictating the resource class bins.
+            None if no resource classes.
+        h5_dsets : list | None
+            Optional list of additional datasets from the source h5 gen/econ
+            files to aggregate.
+
+        Returns
+        -------
+        inputs : tuple
+            res_data, res_class_bins, cf_data, lcoe_data, offshore_flags,
+            h5_dsets_data (see _get_input_data()).
+        """
+        if res_class_bins is None or 'res_data' not in shared:
+            res_class_bins = [None]
+
+        h5_dsets_data = None
+        if h5_dsets is not None:
+            h5_dsets_data = {dset: shared['h5_dset-{}'.format(dset)]
+                             for dset in h5_dsets
+                             if 'h5_dset-{}'.format(dset) in shared}
+
+        return (shared.get('res_data', None), res_class_bins,
+                shared.get('cf_data', None), shared.get('lcoe_data', None),
+                shared.get('offshore_flag', None), h5_dsets_data)
+
     @staticmethod
     def run_serial(excl_fpath, gen_fpath, tm_dset, gen_index, econ_fpath=None,
                    excl_dict=None, area_filter_kernel='queen', min_area=None,
@@ -846,7 +989,9 @@ class SupplyCurveAggregation(AbstractAggregation):
                    args=None, res_class_dset=None, res_class_bins=None,
                    cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                    h5_dsets=None, data_layers=None, power_density=None,
-                   friction_fpath=None, friction_dset=None, excl_area=0.0081):
+                   friction_fpath=None, friction_dset=None, excl_area=0.0081,
+                   engine='point', *, shared_arrays=None,
+                   excl_cache_dir=None, area_filter_mode='window'):
         """Standalone method to create agg summary - can be parallelized.
 
         Parameters
@@ -918,6 +1063,22 @@ class SupplyCurveAggregation(AbstractAggregation):
             exclusions.
         excl_area : float
             Area of an exclusion cell (square km).
+        engine : str
+            SC point summary engine, either "point" (one SC point at a time)
+            or "band" (vectorized summary of full SC rows).
+        shared_arrays : dict | None
+            Filepaths to .npy files saved by the parent process in the
+            shared_dir, keyed by array name. The shared techmap, gen index,
+            and input data arrays are memory mapped and used instead of
+            reading them from the exclusions and gen/econ files.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
 
         Returns
         -------
@@ -925,7 +1086,13 @@ class SupplyCurveAggregation(AbstractAggregation):
             List of dictionaries, each being an SC point summary.
         """
 
+        SupplyCurveAggregation._check_engine(engine, min_area,
+                                             area_filter_mode)
+
         summary = []
+        shared = SupplyCurveAggregation._load_shared_arrays(shared_arrays)
+        techmap = shared.pop('techmap', None)
+        gen_index = shared.pop('gen_index', gen_index)
 
         with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
             points = sc.points
@@ -942,17 +1109,24 @@ class SupplyCurveAggregation(AbstractAggregation):
                        'min_area': min_area,
                        'friction_fpath': friction_fpath,
                        'friction_dset': friction_dset,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'excl_cache_dir': excl_cache_dir,
+                       'area_filter_mode': area_filter_mode}
         with SupplyCurveAggFileHandler(excl_fpath, gen_fpath,
                                        **file_kwargs) as fh:
-            inputs = SupplyCurveAggregation._get_input_data(fh.gen,
-                                                            gen_fpath,
-                                                            econ_fpath,
-                                                            res_class_dset,
-                                                            res_class_bins,
-                                                            cf_dset,
-                                                            lcoe_dset,
-                                                            h5_dsets)
+            if shared_arrays is None:
+                inputs = SupplyCurveAggregation._get_input_data(
+                    fh.gen, gen_fpath, econ_fpath, res_class_dset,
+                    res_class_bins, cf_dset, lcoe_dset, h5_dsets)
+            else:
+                inputs = SupplyCurveAggregation._get_shared_input_data(
+                    shared, res_class_bins, h5_dsets)
+
+            if engine == 'band':
+                return SupplyCurveAggregation._summarize_bands(
+                    fh, tm_dset, gen_index, gids, points, inputs,
+                    resolution=resolution, exclusion_shape=exclusion_shape,
+                    excl_area=excl_area, args=args, techmap=techmap)
 
             n_finished = 0
             for gid in gids:
@@ -978,7 +1152,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                             excl_area=excl_area,
                             close=False,
                             offshore_flags=inputs[4],
-                            friction_layer=fh.friction_layer)
+                            friction_layer=fh.friction_layer,
+                            techmap=techmap)
 
                     except EmptySupplyCurvePointError:
                         pass
@@ -1001,6 +1176,133 @@ class SupplyCurveAggregation(AbstractAggregation):
 
         return summary
 
+    @staticmethod
+    def _summarize_bands(fh, tm_dset, gen_index, gids, points, inputs,
+                         resolution=64, exclusion_shape=None,
+                         excl_area=0.0081, args=None, techmap=None):
+        """Summarize SC points one full SC row (exclusions band) at a time.
+
+        Parameters
+        ----------
+        fh : SupplyCurveAggFileHandler
+            Open aggregation file handler.
+        tm_dset : str
+            Dataset name in the exclusions file containing the
+            exclusions-to-resource mapping data.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        gids : list | np.ndarray
+            List of SC point gids to get summary for.
+        points : pd.DataFrame
+            SC extent points table with row_ind and col_ind columns.
+        inputs : tuple
+            Pre-extracted input data output from _get_input_data().
+        resolution : int
+            SC resolution.
+        exclusion_shape : tuple
+            Shape of the full exclusions extent (rows, cols).
+        excl_area : float
+            Area of an exclusion cell (square km).
+        args : list | None
+            List of summary arguments to include.
+        techmap : np.ndarray | None
+            Optional full 2D techmap array (e.g. memory mapped from a shared
+            scratch file) to use instead of reading tm_dset from the
+            exclusions file.
+
+        Returns
+        -------
+        summary : list
+            List of dictionaries, each being an SC point summary.
+        """
+
+        summary = []
+        gids = np.sort(np.asarray(gids))
+        rows = points.loc[gids, 'row_ind'].values
+        cols = points.loc[gids, 'col_ind'].values
+        n_sc_cols = points['col_ind'].max() + 1
+
+        for row in np.unique(rows):
+            try:
+                band = SupplyCurveBandSummary.summarize(
+                    row,
+                    fh.exclusions,
+                    fh.gen,
+                    tm_dset,
+                    gen_index,
+                    sc_col_inds=cols[(rows == row)],
+                    res_class_dset=inputs[0],
+                    res_class_bins=inputs[1],
+                    cf_dset=inputs[2],
+                    lcoe_dset=inputs[3],
+                    h5_dsets=inputs[5],
+                    data_layers=fh.data_layers,
+                    resolution=resolution,
+                    exclusion_shape=exclusion_shape,
+                    power_density=fh.power_density,
+                    args=args,
+                    excl_area=excl_area,
+                    offshore_flags=inputs[4],
+                    friction_layer=fh.friction_layer,
+                    techmap=techmap)
+
+            except Exception:
+                logger.exception('SC row {} failed!'.format(row))
+                raise
+
+            for col, ri, pointsum in band:
+                pointsum['sc_point_gid'] = row * n_sc_cols + col
+                pointsum['sc_row_ind'] = row
+                pointsum['sc_col_ind'] = col
+                pointsum['res_class'] = ri
+                summary.append(pointsum)
+
+            logger.debug('Band aggregation: SC row {} complete with {} '
+                         'SC point summaries.'.format(row, len(band)))
+
+        return summary
+
+    def _get_chunks(self, chunk_point_len=1000):
+        """Split the SC point gids into chunks for parallel workers. Chunks
+        for the "band" engine only contain full SC rows so that each
+        exclusions band is only read by one worker.
+
+        Parameters
+        ----------
+        chunk_point_len : int
+            Approximate number of SC points in each chunk.
+
+        Returns
+        -------
+        chunks : list
+            List of arrays of SC point gids.
+        """
+
+        if self._engine != 'band':
+            return np.array_split(
+                self._gids, int(np.ceil(len(self._gids) / chunk_point_len)))
+
+        with SupplyCurveExtent(self._excl_fpath,
+                               resolution=self._resolution) as sc:
+            gids = np.sort(self._gids)
+            rows = sc.points.loc[gids, 'row_ind'].values
+
+        bounds = np.where(np.diff(rows) != 0)[0] + 1
+        chunks = []
+        chunk = []
+        for row_gids in np.split(gids, bounds):
+            chunk.append(row_gids)
+            if sum(len(c) for c in chunk) >= chunk_point_len:
+                chunks.append(np.concatenate(chunk))
+                chunk = []
+
+        if chunk:
+            chunks.append(np.concatenate(chunk))
+
+        return chunks
+
     def run_parallel(self, args=None, excl_area=0.0081, max_workers=None):
         """Get the supply curve points aggregation summary using futures.
 
@@ -1021,8 +1323,7 @@ class SupplyCurveAggregation(AbstractAggregation):
             List of dictionaries, each being an SC point summary.
         """
 
-        chunks = np.array_split(self._gids,
-                                int(np.ceil(len(self._gids) / 1000)))
+        chunks = self._get_chunks(chunk_point_len=1000)
 
         logger.info('Running supply curve point aggregation for '
                     'points {} through {} at a resolution of {} '
@@ -1033,8 +1334,11 @@ class SupplyCurveAggregation(AbstractAggregation):
         n_finished = 0
         futures = []
         summary = []
-        loggers = [__name__, 'reV.supply_curve.point_summary', 'reV']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
+        loggers = [__name__, 'reV.supply_curve.point_summary',
+                   'reV.supply_curve.band_summary', 'reV']
+        with self._share_arrays(**self._get_shared_arrays()) as shared, \
+                SpawnProcessPool(max_workers=max_workers,
+                                 loggers=loggers) as exe:
 
             # iterate through split executions, submitting each to worker
             for gid_set in chunks:
@@ -1042,7 +1346,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                 futures.append(exe.submit(
                     self.run_serial,
                     self._excl_fpath, self._gen_fpath,
-                    self._tm_dset, self._gen_index,
+                    self._tm_dset,
+                    None if shared else self._gen_index,
                     econ_fpath=self._econ_fpath,
                     excl_dict=self._excl_dict,
                     res_class_dset=self._res_class_dset,
@@ -1058,7 +1363,11 @@ class SupplyCurveAggregation(AbstractAggregation):
                     area_filter_kernel=self._area_filter_kernel,
                     min_area=self._min_area,
                     gids=gid_set, args=args, excl_area=excl_area,
-                    check_excl_layers=self._check_excl_layers))
+                    check_excl_layers=self._check_excl_layers,
+                    excl_cache_dir=self._excl_cache_dir,
+                    area_filter_mode=self._area_filter_mode,
+                    engine=self._engine,
+                    shared_arrays=shared))
 
             # gather results
             for future in as_completed(futures):
@@ -1241,7 +1550,10 @@ class SupplyCurveAggregation(AbstractAggregation):
                                       min_area=self._min_area,
                                       gids=self._gids, args=args,
                                       excl_area=self._excl_area,
-                                      check_excl_layers=chk)
+                                      check_excl_layers=chk,
+                                      excl_cache_dir=self._excl_cache_dir,
+                                      area_filter_mode=self._area_filter_mode,
+                                      engine=self._engine)
         else:
             summary = self.run_parallel(args=args, excl_area=self._excl_area,
                                         max_workers=max_workers)
@@ -1271,10 +1583,11 @@ class SupplyCurveAggregation(AbstractAggregation):
                 res_class_dset=None, res_class_bins=None,
                 cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                 h5_dsets=None, data_layers=None, power_density=None,
-                friction_fpath=None, friction_dset=None,
-                args=None, excl_area=None, max_workers=None,
-                offshore_capacity=600, offshore_gid_counts=494,
-                offshore_pixel_area=4, offshore_meta_cols=None):
+                friction_fpath=None, friction_dset=None, args=None,
+                excl_area=None, max_workers=None, offshore_capacity=600,
+                offshore_gid_counts=494, offshore_pixel_area=4,
+                offshore_meta_cols=None, engine='point', excl_cache_dir=None,
+                area_filter_mode='window', shared_dir=None):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -1359,6 +1672,29 @@ class SupplyCurveAggregation(AbstractAggregation):
             through to the offshore module output meta data. None will use
             Offshore class variable DEFAULT_META_COLS, and any
             additional requested cols will be added to DEFAULT_META_COLS.
+        engine : str
+            SC point summary engine. "point" summarizes one SC point at a time
+            with SupplyCurvePointSummary. "band" reads full rows of SC points
+            (bands of exclusion rows) at once and summarizes all SC points in
+            each band with vectorized segment reductions. The "band" engine
+            requires area_filter_mode="global" when min_area is set.
+        excl_cache_dir : str | None
+            Optional directory to cache the combined exclusion layer mask
+            in. The cache is re-used by later runs with the same excl_dict
+            and exclusion layers. None disables the cache, except that
+            area_filter_mode="global" with min_area set uses a
+            temporary cache for the lifetime of the aggregation so
+            that the global area filter only runs once.
+        area_filter_mode : str
+            Contiguous area filter mode. "window" (default) filters a 3x
+            larger window around each SC point, "global" filters the full
+            exclusion extent once and serves all SC points from it.
+        shared_dir : str | None
+            Optional scratch directory (e.g. /dev/shm) for parallel runs. The
+            techmap, gen index, and gen/econ input arrays (cf, lcoe, resource
+            class, and h5_dsets data) are read once by the parent process and
+            saved here as .npy files that every worker memory maps read-only
+            instead of reading its own copy. None disables sharing.
 
         Returns
         -------
@@ -1383,7 +1719,11 @@ class SupplyCurveAggregation(AbstractAggregation):
                   area_filter_kernel=area_filter_kernel,
                   min_area=min_area,
                   check_excl_layers=check_excl_layers,
-                  excl_area=excl_area)
+                  excl_cache_dir=excl_cache_dir,
+                  area_filter_mode=area_filter_mode,
+                  shared_dir=shared_dir,
+                  excl_area=excl_area,
+                  engine=engine)
 
         summary = agg.summarize(args=args,
                                 max_workers=max_workers,
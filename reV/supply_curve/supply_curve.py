@@ -5,7 +5,6 @@ reV supply curve module
 - Supply Curve creation
 """
 from copy import deepcopy
-import os
 import logging
 import numpy as np
 import pandas as pd
@@ -14,9 +13,10 @@ from warnings import warn
 from reV.handlers.transmission import TransmissionCosts as TC
 from reV.handlers.transmission import TransmissionFeatures as TF
 from reV.supply_curve.competitive_wind_farms import CompetitiveWindFarms
-from reV.utilities.exceptions import SupplyCurveInputError, SupplyCurveError
+from reV.utilities.exceptions import (SupplyCurveInputError, SupplyCurveError,
+                                      reVDeprecationWarning)
 
-from rex.utilities import parse_table, SpawnProcessPool
+from rex.utilities import parse_table
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +53,8 @@ class SupplyCurve:
         connectable : bool
             Determine if connection is possible
         max_workers : int | NoneType
-            Number of workers to use to compute lcot, if > 1 run in parallel.
-            None uses all available cpu's.
+            Deprecated and ignored, LCOT is computed with vectorized array
+            operations for the full transmission table.
         consider_friction : bool
             Flag to consider friction layer on LCOE.
         offshore_trans_table : str, optional
@@ -65,6 +65,12 @@ class SupplyCurve:
         logger.info('Supply curve points input: {}'.format(sc_points))
         logger.info('Transmission table input: {}'.format(trans_table))
 
+        if max_workers is not None:
+            w = ('SupplyCurve max_workers is deprecated and will be ignored, '
+                 'LCOT is computed with vectorized array operations.')
+            logger.warning(w)
+            warn(w, reVDeprecationWarning)
+
         trans_costs = transmission_costs
         self._sc_points = self._parse_sc_points(sc_points,
                                                 sc_features=sc_features)
@@ -75,8 +81,7 @@ class SupplyCurve:
         self._trans_table = self._add_trans_lcot(self._trans_table, fcr,
                                                  trans_costs=trans_costs,
                                                  line_limited=line_limited,
-                                                 connectable=connectable,
-                                                 max_workers=max_workers)
+                                                 connectable=connectable)
         self._trans_features = self._create_handler(self._trans_table,
                                                     trans_costs=trans_costs)
 
@@ -346,8 +351,7 @@ class SupplyCurve:
 
     @staticmethod
     def _add_trans_lcot(trans_table, fcr, trans_costs=None,
-                        line_limited=False, connectable=True,
-                        max_workers=None):
+                        line_limited=False, connectable=True):
         """Compute LCOT for possible connections and add to the trans_table
 
         Parameters
@@ -365,9 +369,6 @@ class SupplyCurve:
             attached lines, legacy method
         connectable : bool
             Determine if connection is possible
-        max_workers : int | NoneType
-            Number of workers to use to compute lcot, if > 1 run in parallel.
-            None uses all available cpu's.
 
         Returns
         -------
@@ -382,8 +383,7 @@ class SupplyCurve:
         lcot, cost = SupplyCurve._compute_lcot(trans_table, fcr,
                                                trans_costs=trans_costs,
                                                line_limited=line_limited,
-                                               connectable=connectable,
-                                               max_workers=max_workers)
+                                               connectable=connectable)
 
         trans_table['trans_cap_cost'] = cost
         trans_table['lcot'] = lcot
@@ -456,7 +456,7 @@ class SupplyCurve:
         return trans_table, sc_gids, mask
 
     @staticmethod
-    def _compute_lcot(trans_table, fcr, trans_costs=None, max_workers=None,
+    def _compute_lcot(trans_table, fcr, trans_costs=None,
                       connectable=True, line_limited=False):
         """
         Compute levelized cost of transmission for all combinations of
@@ -473,9 +473,6 @@ class SupplyCurve:
             Transmission feature costs to use with TransmissionFeatures
             handler: line_tie_in_cost, line_cost, station_tie_in_cost,
             center_tie_in_cost, sink_tie_in_cost
-        max_workers : int | NoneType
-            Number of workers to use to compute lcot, if > 1 run in parallel.
-            None uses all available cpu's.
         connectable : bool
             Determine if connection is possible
         line_limited : bool
@@ -501,53 +498,24 @@ class SupplyCurve:
         else:
             trans_costs = {}
 
-        if max_workers is None:
-            max_workers = os.cpu_count()
+        capacity = None
+        if connectable:
+            n_caps = trans_table.groupby('sc_gid')['capacity'].nunique()
+            if (n_caps > 1).any():
+                sc_gid = n_caps.index[n_caps > 1][0]
+                capacity = trans_table.loc[trans_table['sc_gid'] == sc_gid,
+                                           'capacity'].unique()
+                msg = ('Each supply curve point should only have '
+                       'a single capacity, but {} has {}'
+                       .format(sc_gid, capacity))
+                logger.error(msg)
+                raise RuntimeError(msg)
+
+            capacity = trans_table['capacity'].values
 
         logger.info('Computing LCOT costs for all possible connections...')
-        if max_workers > 1:
-            groups = trans_table.groupby('sc_gid')
-            loggers = [__name__, 'reV.handlers.transmission', 'reV']
-            with SpawnProcessPool(max_workers=max_workers,
-                                  loggers=loggers) as exe:
-                futures = []
-                for sc_gid, sc_table in groups:
-                    if connectable:
-                        capacity = sc_table['capacity'].unique()
-                        if len(capacity) == 1:
-                            capacity = capacity[0]
-                        else:
-                            msg = ('Each supply curve point should only have '
-                                   'a single capacity, but {} has {}'
-                                   .format(sc_gid, capacity))
-                            logger.error(msg)
-                            raise RuntimeError(msg)
-                    else:
-                        capacity = None
-
-                    futures.append(exe.submit(TC.feature_costs, sc_table,
-                                              capacity=capacity,
-                                              line_limited=line_limited,
-                                              **trans_costs))
-
-                cost = [future.result() for future in futures]
-                cost = np.hstack(cost)
-        else:
-            feature = TC(trans_table, line_limited=line_limited,
-                         **trans_costs)
-            cost = []
-            for _, row in trans_table.iterrows():
-                if connectable:
-                    capacity = row['capacity']
-                else:
-                    capacity = None
-
-                tm = row.get('transmission_multiplier', 1)
-                cost.append(feature.cost(row['trans_line_gid'], row['dist_mi'],
-                                         capacity=capacity,
-                                         transmission_multiplier=tm))
-
-            cost = np.array(cost, dtype='float32')
+        cost = TC.feature_costs(trans_table, capacity=capacity,
+                                line_limited=line_limited, **trans_costs)
 
         cf_mean_arr = trans_table['mean_cf'].values
         lcot = (cost * fcr) / (cf_mean_arr * 8760)
@@ -644,6 +612,43 @@ class SupplyCurve:
 
         return table
 
+    def _connectable_rows(self, trans_sc_gids, trans_gids, capacities):
+        """Find the transmission table rows that can still be connected.
+        Feature capacity only decreases as supply curve points are
+        connected, so rows for excluded supply curve points or with a
+        capacity larger than the current feature capacity can never be
+        connected and are skipped before the sequential connection loop.
+
+        Parameters
+        ----------
+        trans_sc_gids : ndarray
+            Supply curve point gid of each transmission table row.
+        trans_gids : ndarray
+            Transmission feature gid of each transmission table row.
+        capacities : ndarray
+            Supply curve point capacity of each transmission table row.
+
+        Returns
+        -------
+        rows : list
+            Positional indices of the rows that might be connected, in
+            table order.
+        """
+        feature_cap = self._trans_features.available_capacities()
+        valid = (trans_gids >= 0) & (trans_gids < len(feature_cap))
+        avail_cap = np.full(len(trans_gids), np.nan)
+        avail_cap[valid] = feature_cap[trans_gids[valid]]
+
+        # keep borderline rows for the exact check in the connection loop
+        too_big = ((capacities > avail_cap)
+                   & ~np.isclose(capacities, avail_cap))
+        mask = self._mask[trans_sc_gids] & ~too_big
+
+        logger.debug('Skipping {} of {} transmission table rows that cannot '
+                     'be connected'.format(np.sum(~mask), len(mask)))
+
+        return np.where(mask)[0].tolist()
+
     def _full_sort(self, trans_table, comp_wind_dirs=None,
                    total_lcoe_fric=None, sort_on='total_lcoe',
                    columns=('trans_gid', 'trans_capacity', 'trans_type',
@@ -682,9 +687,16 @@ class SupplyCurve:
         conn_lists = {k: deepcopy(init_list) for k in columns}
 
         trans_sc_gids = trans_table['sc_gid'].values.astype(int)
-        trans_gids = trans_table['trans_line_gid'].values
-        trans_cap = trans_table['avail_cap'].values
+        trans_gids = trans_table['trans_line_gid'].values.astype(int)
         capacities = trans_table['capacity'].values
+        rows = self._connectable_rows(trans_sc_gids, trans_gids, capacities)
+
+        # python lists have faster scalar access than numpy arrays in the
+        # sequential connection loop below
+        trans_sc_gids = trans_sc_gids.tolist()
+        trans_gids = trans_gids.tolist()
+        capacities = capacities.tolist()
+        trans_cap = trans_table['avail_cap'].values
         categories = trans_table['category'].values
         dists = trans_table['dist_mi'].values
         trans_cap_costs = trans_table['trans_cap_cost'].values
@@ -693,7 +705,7 @@ class SupplyCurve:
 
         connected = 0
         progress = 0
-        for i in range(len(trans_table)):
+        for i in rows:
             sc_gid = trans_sc_gids[i]
             if self._mask[sc_gid]:
                 trans_gid = trans_gids[i]
@@ -948,8 +960,8 @@ class SupplyCurve:
         columns : list | tuple
             Columns to preserve in output supply curve dataframe.
         max_workers : int | NoneType
-            Number of workers to use to compute lcot, if > 1 run in parallel.
-            None uses all available cpu's.
+            Deprecated and ignored, LCOT is computed with vectorized array
+            operations for the full transmission table.
         wind_dirs : pandas.DataFrame | str
             path to .csv or reVX.wind_dirs.wind_dirs.WindDirs output with
             the neighboring supply curve point gids and power-rose value at
@@ -1018,8 +1030,8 @@ class SupplyCurve:
         columns : list | tuple
             Columns to preserve in output supply curve dataframe.
         max_workers : int | NoneType
-            Number of workers to use to compute lcot, if > 1 run in parallel.
-            None uses all available cpu's.
+            Deprecated and ignored, LCOT is computed with vectorized array
+            operations for the full transmission table.
         wind_dirs : pandas.DataFrame | str
             path to .csv or reVX.wind_dirs.wind_dirs.WindDirs output with
             the neighboring supply curve point gids and power-rose value at
@@ -9,11 +9,14 @@ Created on Fri Jun 21 16:05:47 2019
 @author: gbuster
 """
 import h5py
-from concurrent.futures import as_completed
+from concurrent.futures import as_completed, FIRST_COMPLETED, wait
+from functools import lru_cache
 import numpy as np
 import os
+import psutil
 from scipy.spatial import cKDTree
 import logging
+import time
 from warnings import warn
 
 from reV.supply_curve.points import SupplyCurveExtent
@@ -28,8 +31,12 @@ logger = logging.getLogger(__name__)
 class TechMapping:
     """Framework to create map between tech layer (exclusions), res, and gen"""
 
+    # available tech mapping engines
+    ENGINES = ('chunk', 'band')
+
     def __init__(self, excl_fpath, res_fpath, dset, distance_upper_bound=0.03,
-                 map_chunk=2560, max_workers=None):
+                 map_chunk=2560, max_workers=None, engine='chunk',
+                 mem_util_lim=0.4):
         """
         Parameters
         ----------
@@ -49,6 +56,17 @@ class TechMapping:
             Calculation chunk used for the tech mapping calc.
         max_workers : int | None
             Number of cores to run mapping on. None uses all available cpus.
+        engine : str
+            Tech mapping engine. "chunk" builds a resource KD-tree for every
+            chunk of SC points and assembles the full extent in memory.
+            "band" builds the resource KD-tree once per worker, streams the
+            exclusion coordinates in h5-chunk-aligned row bands of roughly
+            map_chunk**2 points, and writes the techmap band by band.
+        mem_util_lim : float
+            Memory utilization limit (fractional) for the "band" engine. Row
+            bands are only submitted while the coordinates and results of the
+            bands in flight stay below this fraction of the total node
+            memory (at least one band is always in flight).
         """
 
         self._distance_upper_bound = distance_upper_bound
@@ -61,6 +79,14 @@ class TechMapping:
         if max_workers is None:
             max_workers = os.cpu_count()
         self._max_workers = max_workers
+        self._mem_util_lim = mem_util_lim
+
+        self._engine = str(engine).lower()
+        if self._engine not in self.ENGINES:
+            e = ('TechMapping engine must be one of {} but received: "{}"'
+                 .format(self.ENGINES, engine))
+            logger.error(e)
+            raise ValueError(e)
 
         with SupplyCurveExtent(self._excl_fpath,
                                resolution=self._map_chunk) as sc:
@@ -341,6 +367,254 @@ class TechMapping:
 
         return ind_out, coords_out
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_res_tree(res_fpath):
+        """Build the resource meta KD-tree. Cached so that every worker only
+        builds the tree once.
+
+        Parameters
+        ----------
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+
+        Returns
+        -------
+        res_tree : cKDTree
+            KD-tree of the resource (latitude, longitude) coordinates.
+        """
+        with Resource(res_fpath, str_decode=False) as res:
+            res_meta = np.vstack((res.get_meta_arr('latitude'),
+                                  res.get_meta_arr('longitude'))).T
+
+        # pylint: disable=not-callable
+        return cKDTree(res_meta)
+
+    @staticmethod
+    def map_resource_band(coords, res_fpath, distance_upper_bound):
+        """Map a band of exclusion coordinates to the resource meta using the
+        global resource KD-tree.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            3D array (rows, cols, 2) of the un-projected latitude, longitude
+            of the tech exclusion points in the band.
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+        distance_upper_bound : float
+            Upper boundary distance for KNN lookup between exclusion points and
+            resource points.
+
+        Returns
+        -------
+        ind : np.ndarray
+            2D (rows, cols) index values of the NN resource point. -1 if no
+            resource point is found within the distance_upper_bound.
+        """
+        res_tree = TechMapping._get_res_tree(res_fpath)
+        dist, ind = res_tree.query(coords.reshape(-1, 2),
+                                   distance_upper_bound=(
+                                       distance_upper_bound * (1 + 1e-6)))
+        ind[(dist > distance_upper_bound)] = -1
+
+        return ind.astype(np.int32).reshape(coords.shape[:2])
+
+    def _get_row_bands(self):
+        """Get exclusion row slices of roughly map_chunk**2 points that are
+        aligned with the h5 chunks of the coordinate datasets.
+
+        Returns
+        -------
+        bands : list
+            List of exclusion row slices.
+        """
+        with h5py.File(self._excl_fpath, 'r') as f:
+            chunks = f['latitude'].chunks
+
+        n_rows = max(1, self._map_chunk ** 2 // self._excl_shape[1])
+        if chunks is not None:
+            n_rows = int(np.ceil(n_rows / chunks[0]) * chunks[0])
+
+        return [slice(r, min(r + n_rows, self._excl_shape[0]))
+                for r in range(0, self._excl_shape[0], n_rows)]
+
+    def _band_resource_map(self, save_flag=False):
+        """Map all exclusion points to the resource meta in row bands with a
+        single resource KD-tree per worker.
+
+        Parameters
+        ----------
+        save_flag : bool
+            Flag to stream the techmap dataset to excl_fpath band by band
+            instead of assembling the full techmap in memory.
+
+        Returns
+        -------
+        ind_all : np.ndarray | None
+            Index values of the NN resource point. -1 if no res point found.
+            2D integer array with shape equal to the exclusions extent shape.
+            None if the techmap was streamed to excl_fpath.
+        """
+        bands = self._get_row_bands()
+        dub = self.distance_upper_bound
+        logger.info('Running band TechMapping for {} exclusion points in {} '
+                    'row bands.'.format(self._n_excl, len(bands)))
+
+        t0 = time.time()
+        n_done = 0
+        futures = {}
+        loggers = [__name__, 'reV']
+        mode = 'a' if save_flag else 'r'
+        with h5py.File(self._excl_fpath, mode) as f, \
+                SpawnProcessPool(max_workers=self._max_workers,
+                                 loggers=loggers) as exe:
+            if save_flag:
+                ind_all = self._init_out_dset(f, self._dset, self._excl_shape,
+                                              np.int32, self._res_fpath, dub,
+                                              fpath_out=self._excl_fpath)
+            else:
+                ind_all = np.full(self._excl_shape, -1, dtype=np.int32)
+
+            # coordinates sent to and techmap indices returned by each band
+            point_bytes = (f['latitude'].dtype.itemsize
+                           + f['longitude'].dtype.itemsize
+                           + np.dtype(np.int32).itemsize)
+            max_bytes = (self._mem_util_lim
+                         * psutil.virtual_memory().total)
+
+            for rows in bands:
+                band_bytes = self._band_bytes(rows, point_bytes)
+                while futures and (
+                        len(futures) >= 2 * self._max_workers
+                        or self._band_bytes(futures.values(), point_bytes)
+                        + band_bytes > max_bytes):
+                    n_done = self._collect_bands(futures, ind_all, n_done, t0)
+
+                coords = np.dstack((f['latitude'][rows],
+                                    f['longitude'][rows]))
+                futures[exe.submit(self.map_resource_band, coords,
+                                   self._res_fpath, dub)] = rows
+
+            while futures:
+                n_done = self._collect_bands(futures, ind_all, n_done, t0)
+
+        if save_flag:
+            logger.info('Successfully saved tech map "{}" to {}'
+                        .format(self._dset, self._excl_fpath))
+            ind_all = None
+
+        return ind_all
+
+    def _band_bytes(self, rows, point_bytes):
+        """Get the memory held by row bands in flight.
+
+        Parameters
+        ----------
+        rows : slice | iterable
+            Exclusion row slice of one band or an iterable of row slices.
+        point_bytes : int
+            Bytes per exclusion point for the band coordinates and results.
+
+        Returns
+        -------
+        n_bytes : int
+            Bytes held by the band coordinates and results.
+        """
+        if isinstance(rows, slice):
+            rows = [rows]
+
+        n_rows = sum(r.stop - r.start for r in rows)
+
+        return n_rows * self._excl_shape[1] * point_bytes
+
+    def _collect_bands(self, futures, ind_all, n_done, t0):
+        """Write the completed band futures to the techmap output.
+
+        Parameters
+        ----------
+        futures : dict
+            Band futures keyed by future with exclusion row slice values.
+            Completed futures are popped.
+        ind_all : np.ndarray | h5py.Dataset
+            Full extent techmap output to write band results to.
+        n_done : int
+            Number of exclusion points mapped so far.
+        t0 : float
+            Start time of the tech mapping.
+
+        Returns
+        -------
+        n_done : int
+            Updated number of exclusion points mapped so far.
+        """
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            rows = futures.pop(future)
+            ind_all[rows] = future.result()
+            n_done += (rows.stop - rows.start) * self._excl_shape[1]
+
+        elapsed = time.time() - t0
+        logger.info('TechMapping mapped {} out of {} exclusion points '
+                    '({:.0f} points/sec).'
+                    .format(n_done, self._n_excl, n_done / max(elapsed, 1e-6)))
+
+        return n_done
+
+    @staticmethod
+    def _init_out_dset(f, dset, shape, dtype, res_fpath,
+                       distance_upper_bound, chunks=(128, 128),
+                       fpath_out=None):
+        """Get or create the techmap output dataset and remove SC point
+        indices built from a previous techmap.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Open h5 file in append mode.
+        dset : str
+            Dataset name to save mapping results to.
+        shape : tuple
+            Techmap shape (equal to the exclusions shape).
+        dtype : np.dtype
+            Techmap dtype.
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+        distance_upper_bound : float
+            Distance upper bound to save as attr.
+        chunks : tuple
+            Chunk shape of the 2D output dataset.
+        fpath_out : str | None
+            .h5 filepath of f for logging.
+
+        Returns
+        -------
+        ds : h5py.Dataset
+            Techmap output dataset.
+        """
+        chunks = (np.min((shape[0], chunks[0])), np.min((shape[1], chunks[1])))
+        if dset in list(f):
+            wmsg = ('TechMap results dataset "{}" is being replaced '
+                    'in pre-existing Exclusions TechMapping file "{}"'
+                    .format(dset, fpath_out))
+            logger.warning(wmsg)
+            warn(wmsg, FileInputWarning)
+        else:
+            f.create_dataset(dset, shape=shape, dtype=dtype, chunks=chunks,
+                             fillvalue=-1)
+
+        f[dset].attrs['fpath'] = res_fpath
+        f[dset].attrs['distance_upper_bound'] = distance_upper_bound
+
+        # SC point indices built from a previous techmap are now stale
+        stale = [ds for ds in f if ds.startswith(dset + '-sc_points-')]
+        for ds in stale:
+            logger.info('Removing stale SC point index "{}" from {}'
+                        .format(ds, fpath_out))
+            del f[ds]
+
+        return f[dset]
+
     @staticmethod
     def save_tech_map(lats, lons, ind, fpath_out, res_fpath, dset,
                       distance_upper_bound, chunks=(128, 128)):
@@ -390,26 +664,19 @@ class TechMapping:
                                      chunks=chunks)
 
         with h5py.File(fpath_out, 'a') as f:
-            if dset in list(f):
-                wmsg = ('TechMap results dataset "{}" is being replaced '
-                        'in pre-existing Exclusions TechMapping file "{}"'
-                        .format(dset, fpath_out))
-                logger.warning(wmsg)
-                warn(wmsg, FileInputWarning)
-                f[dset][...] = ind
-            else:
-                f.create_dataset(dset, shape=shape, dtype=ind.dtype,
-                                 data=ind, chunks=chunks)
-
-            f[dset].attrs['fpath'] = res_fpath
-            f[dset].attrs['distance_upper_bound'] = distance_upper_bound
+            ds = TechMapping._init_out_dset(f, dset, shape, ind.dtype,
+                                            res_fpath, distance_upper_bound,
+                                            chunks=chunks,
+                                            fpath_out=fpath_out)
+            ds[...] = ind
 
         logger.info('Successfully saved tech map "{}" to {}'
                     .format(dset, fpath_out))
 
     @classmethod
     def run(cls, excl_fpath, res_fpath, dset, save_flag=True,
-            distance_upper_bound=0.03, map_chunk=2560, max_workers=None):
+            distance_upper_bound=0.03, map_chunk=2560, max_workers=None,
+            engine='chunk', sc_resolution=None, mem_util_lim=0.4):
         """Run parallel mapping and save to h5 file.
 
         Parameters
@@ -425,27 +692,52 @@ class TechMapping:
             Flag to write techmap to excl_fpath.
         kwargs : dict
             Keyword args to initialize the TechMapping object.
+        sc_resolution : int | None
+            Optional SC resolution to build and save the valid SC point index
+            for next to the techmap (see
+            SupplyCurveExtent.save_sc_point_index). Only used if save_flag is
+            True. None will not save an SC point index.
+        mem_util_lim : float
+            Memory utilization limit (fractional) for the bands in flight
+            with the "band" engine.
 
         Returns
         -------
-        lats : np.ndarray
+        lats : np.ndarray | None
             2D un-projected latitude array of tech exclusion points.
             0's if no res point found. Shape is equal to exclusions shape.
-        lons : np.ndarray
+            None if the "band" engine streamed the techmap to excl_fpath.
+        lons : np.ndarray | None
             2D un-projected longitude array of tech exclusion points.
             0's if no res point found. Shape is equal to exclusions shape.
-        ind_all : np.ndarray
+            None if the "band" engine streamed the techmap to excl_fpath.
+        ind_all : np.ndarray | None
             Index values of the NN resource point. -1 if no res point found.
             2D integer array with shape equal to the exclusions extent shape.
+            None if the "band" engine streamed the techmap to excl_fpath.
         """
         kwargs = {"distance_upper_bound": distance_upper_bound,
-                  "map_chunk": map_chunk, "max_workers": max_workers}
+                  "map_chunk": map_chunk, "max_workers": max_workers,
+                  "engine": engine, "mem_util_lim": mem_util_lim}
         with cls(excl_fpath, res_fpath, dset, **kwargs) as mapper:
-            lats, lons, ind = mapper._parallel_resource_map()
+            if mapper._engine == 'band':
+                ind = mapper._band_resource_map(save_flag=save_flag)
+                lats = lons = None
+                if not save_flag:
+                    with h5py.File(excl_fpath, 'r') as f:
+                        lats = f['latitude'][...]
+                        lons = f['longitude'][...]
+            else:
+                lats, lons, ind = mapper._parallel_resource_map()
+
             distance_upper_bound = mapper._distance_upper_bound
 
         if save_flag:
-            mapper.save_tech_map(lats, lons, ind, excl_fpath, res_fpath,
-                                 dset, distance_upper_bound)
+            if mapper._engine != 'band':
+                mapper.save_tech_map(lats, lons, ind, excl_fpath, res_fpath,
+                                     dset, distance_upper_bound)
+            if sc_resolution is not None:
+                SupplyCurveExtent.save_sc_point_index(
+                    excl_fpath, dset, resolution=sc_resolution)
 
         return lats, lons, ind
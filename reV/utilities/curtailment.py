@@ -6,6 +6,7 @@ Created on Fri Mar  1 13:47:30 2019
 @author: gbuster
 """
 import datetime
+from functools import lru_cache
 import logging
 import numpy as np
 import pandas as pd
@@ -13,41 +14,49 @@ from warnings import warn
 
 from reV.utilities.exceptions import HandlerWarning
 
+from rex.utilities.exceptions import ResourceRuntimeError
 from rex.utilities.solar_position import SolarPosition
 from rex.utilities.utilities import check_tz
 
 logger = logging.getLogger(__name__)
 
 
-def curtail(resource, curtailment, random_seed=0):
-    """Curtail the SAM wind resource object based on project points.
+@lru_cache(maxsize=None)
+def _compile_equation(equation):
+    """Compile a curtailment equation string once per unique equation.
 
     Parameters
     ----------
-    resource : rex.sam_resource.SAMResource
-        SAM resource object for WIND resource.
-    curtailment : reV.config.curtailment.Curtailment
-        Curtailment config object.
-    random_seed : int | NoneType
-        Number to seed the numpy random number generator. Used to generate
-        reproducable psuedo-random results if the probability of curtailment
-        is not set to 1. Numpy random will be seeded with the system time if
-        this is None.
+    equation : str
+        Python equation based on curtailment variables (wind_speed,
+        temperature, precipitation_rate, solar_zenith_angle).
 
     Returns
     -------
-    resource : reV.handlers.sam_resource.SAMResource
-        Same as the input argument but with the wind speed dataset set to zero
-        where curtailment is in effect.
+    code : code
+        Compiled equation expression.
     """
+    return compile(equation, '<curtailment equation>', 'eval')
 
-    shape = resource.shape
 
-    # start with curtailment everywhere
-    curtail_mult = np.zeros(shape)
+def _get_time_mask(time_index, curtailment):
+    """Get a 1D boolean mask of the timesteps where curtailment is possible
+    based on the curtailment months or date range.
 
+    Parameters
+    ----------
+    time_index : pandas.DatetimeIndex
+        Resource time index.
+    curtailment : reV.config.curtailment.Curtailment
+        Curtailment config object.
+
+    Returns
+    -------
+    mask : ndarray
+        1D boolean array, True where curtailment is possible.
+    """
     if curtailment.date_range is not None:
-        year = resource.time_index.year[0]
+        year = time_index.year[0]
         d0 = pd.to_datetime(datetime.datetime(
             month=int(curtailment.date_range[0][:2]),
             day=int(curtailment.date_range[0][2:]),
@@ -56,16 +65,11 @@ def curtail(resource, curtailment, random_seed=0):
             month=int(curtailment.date_range[1][:2]),
             day=int(curtailment.date_range[1][2:]),
             year=year), utc=True)
-        time_index = check_tz(resource.time_index)
+        time_index = check_tz(time_index)
         mask = (time_index >= d0) & (time_index < d1)
-        mask = np.tile(np.expand_dims(mask, axis=1), shape[1])
-        curtail_mult = np.where(mask, curtail_mult, 1)
 
     elif curtailment.months is not None:
-        # Curtail resource when in curtailment months
-        mask = np.isin(resource.time_index.month, curtailment.months)
-        mask = np.tile(np.expand_dims(mask, axis=1), shape[1])
-        curtail_mult = np.where(mask, curtail_mult, 1)
+        mask = np.isin(time_index.month, curtailment.months)
 
     else:
         msg = ('You must specify either months or date_range over '
@@ -73,56 +77,106 @@ def curtail(resource, curtailment, random_seed=0):
         logger.error(msg)
         raise KeyError(msg)
 
+    return np.asarray(mask, dtype=bool)
+
+
+def curtail(resource, curtailment, random_seed=0):
+    """Curtail the SAM wind resource object based on project points.
+
+    All curtailment rules are fused into a single boolean mask that is
+    updated in-place. The solar position is only computed for timesteps in
+    the curtailment months/date range.
+
+    Parameters
+    ----------
+    resource : rex.sam_resource.SAMResource
+        SAM resource object for WIND resource.
+    curtailment : reV.config.curtailment.Curtailment
+        Curtailment config object.
+    random_seed : int | NoneType
+        Number to seed the numpy random number generator. Used to generate
+        reproducable psuedo-random results if the probability of curtailment
+        is not set to 1. Numpy random will be seeded with the system time if
+        this is None.
+
+    Returns
+    -------
+    resource : reV.handlers.sam_resource.SAMResource
+        Same as the input argument but with the wind speed dataset set to zero
+        where curtailment is in effect.
+    """
+
+    shape = resource.shape
+    res_arrays = resource._res_arrays
+
+    # Curtail resource when in curtailment months or date range
+    time_mask = _get_time_mask(resource.time_index, curtailment)
+
     # Curtail resource when curtailment is possible and is nighttime
-    solar_zenith_angle = SolarPosition(
-        resource.time_index,
-        resource.meta[['latitude', 'longitude']].values).zenith
-    mask = (solar_zenith_angle > curtailment.dawn_dusk)
-    curtail_mult = np.where(mask, curtail_mult, 1)
+    lat_lon = resource.meta[['latitude', 'longitude']].values
+    solar_zenith_angle = np.full(shape, np.nan)
+    if time_mask.any():
+        solar_zenith_angle[time_mask] = SolarPosition(
+            resource.time_index[time_mask], lat_lon).zenith
+
+    mask = np.zeros(shape, dtype=bool)
+    mask[time_mask] = solar_zenith_angle[time_mask] > curtailment.dawn_dusk
+
+    # scratch buffer for the in-place threshold comparisons
+    rule = np.empty(shape, dtype=bool)
 
     # Curtail resource when curtailment is possible and not raining
     if curtailment.precipitation is not None:
-        if 'precipitationrate' not in resource._res_arrays:
+        if 'precipitationrate' not in res_arrays:
             warn('Curtailment has a precipitation threshold of "{}", but '
                  '"precipitationrate" was not found in the SAM resource '
                  'variables. The following resource variables were '
                  'available: {}.'
                  .format(curtailment.precipitation,
-                         list(resource._res_arrays.keys())),
+                         list(res_arrays.keys())),
                  HandlerWarning)
         else:
-            mask = (resource._res_arrays['precipitationrate']
-                    < curtailment.precipitation)
-            curtail_mult = np.where(mask, curtail_mult, 1)
+            np.less(res_arrays['precipitationrate'],
+                    curtailment.precipitation, out=rule)
+            mask &= rule
 
     # Curtail resource when curtailment is possible and temperature is high
     if curtailment.temperature is not None:
-        mask = (resource._res_arrays['temperature']
-                > curtailment.temperature)
-        curtail_mult = np.where(mask, curtail_mult, 1)
+        np.greater(res_arrays['temperature'], curtailment.temperature,
+                   out=rule)
+        mask &= rule
 
     # Curtail resource when curtailment is possible and not that windy
     if curtailment.wind_speed is not None:
-        mask = (resource._res_arrays['windspeed']
-                < curtailment.wind_speed)
-        curtail_mult = np.where(mask, curtail_mult, 1)
+        np.less(res_arrays['windspeed'], curtailment.wind_speed, out=rule)
+        mask &= rule
 
     if curtailment.equation is not None:
-        # pylint: disable=W0123,W0612
-        wind_speed = resource._res_arrays['windspeed']
-        temperature = resource._res_arrays['temperature']
-        if 'precipitationrate' in resource._res_arrays:
-            precipitation_rate = resource._res_arrays['precipitationrate']
-        mask = eval(curtailment.equation)
-        curtail_mult = np.where(mask, curtail_mult, 1)
+        # a single namespace so that the curtailment variables are also
+        # visible inside lambdas and comprehensions in the equation
+        namespace = dict(globals())
+        namespace.update(wind_speed=res_arrays['windspeed'],
+                         temperature=res_arrays['temperature'],
+                         solar_zenith_angle=solar_zenith_angle)
+        if 'precipitationrate' in res_arrays:
+            namespace['precipitation_rate'] = res_arrays['precipitationrate']
+
+        code = _compile_equation(curtailment.equation)
+        # pylint: disable=W0123
+        mask &= np.asarray(eval(code, namespace), dtype=bool)
 
     # Apply probability mask when curtailment is possible.
     if curtailment.probability != 1:
         np.random.seed(seed=random_seed)
-        mask = np.random.rand(shape[0], shape[1]) < curtailment.probability
-        curtail_mult = np.where(mask, curtail_mult, 1)
+        mask &= np.random.rand(shape[0], shape[1]) < curtailment.probability
+
+    # Apply curtailment directly to the resource windspeed array in-place
+    if 'windspeed' not in res_arrays:
+        msg = 'windspeed has not be loaded!'
+        logger.error(msg)
+        raise ResourceRuntimeError(msg)
 
-    # Apply curtailment multiplier directly to resource
-    resource.curtail_windspeed(resource.sites, curtail_mult)
+    windspeed = res_arrays['windspeed']
+    np.multiply(windspeed, 0, out=windspeed, where=mask)
 
     return resource
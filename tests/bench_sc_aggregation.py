@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+"""
+Benchmark of the "band" supply curve aggregation engine against the per-point
+"point" engine. Will not run with pytest.
+
+RUN THIS FILE AS A SCRIPT
+"""
+import os
+import time
+
+from pandas.testing import assert_frame_equal
+
+from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
+from reV import TESTDATADIR
+
+EXCL = os.path.join(TESTDATADIR, 'ri_exclusions/ri_exclusions.h5')
+GEN = os.path.join(TESTDATADIR, 'gen_out/ri_my_pv_gen.h5')
+TM_DSET = 'techmap_nsrdb'
+RES_CLASS_DSET = 'ghi_mean-means'
+RES_CLASS_BINS = [0, 4, 100]
+DATA_LAYERS = {'pct_slope': {'dset': 'ri_srtm_slope',
+                             'method': 'mean'},
+               'reeds_region': {'dset': 'ri_reeds_regions',
+                                'method': 'mode'},
+               'padus': {'dset': 'ri_padus',
+                         'method': 'mode'}}
+EXCL_DICT = {'ri_srtm_slope': {'inclusion_range': (None, 5),
+                               'exclude_nodata': True},
+             'ri_padus': {'exclude_values': [1],
+                          'exclude_nodata': True}}
+
+
+def run_benchmark(excl_fpath=EXCL, gen_fpath=GEN, tm_dset=TM_DSET,
+                  n_repeats=3, **kwargs):
+    """Time both SC point summary engines and check that they produce the
+    same summary.
+
+    Parameters
+    ----------
+    excl_fpath : str
+        Filepath to exclusions h5 with techmap dataset.
+    gen_fpath : str
+        Filepath to .h5 reV generation output results.
+    tm_dset : str
+        Dataset name in the techmap file.
+    n_repeats : int
+        Number of timed runs per engine. The fastest run is reported.
+    kwargs : dict
+        Additional SupplyCurveAggregation.summary() kwargs. Defaults to the
+        RI test exclusions, resource classes, and data layers.
+
+    Returns
+    -------
+    times : dict
+        Fastest runtime in seconds keyed by engine name.
+    """
+    if not kwargs:
+        kwargs = {'excl_dict': EXCL_DICT,
+                  'res_class_dset': RES_CLASS_DSET,
+                  'res_class_bins': RES_CLASS_BINS,
+                  'data_layers': DATA_LAYERS}
+
+    kwargs['max_workers'] = 1
+
+    times = {}
+    summaries = {}
+    for engine in SupplyCurveAggregation.ENGINES:
+        for _ in range(n_repeats):
+            t0 = time.time()
+            summary = SupplyCurveAggregation.summary(
+                excl_fpath, gen_fpath, tm_dset, engine=engine, **kwargs)
+            elapsed = time.time() - t0
+            times[engine] = min(times.get(engine, elapsed), elapsed)
+
+        for c in ['res_gids', 'gen_gids', 'gid_counts']:
+            summary[c] = summary[c].astype(str)
+
+        summaries[engine] = summary
+
+    assert_frame_equal(summaries['point'], summaries['band'],
+                       check_dtype=False, rtol=0.001)
+
+    print('{} SC point summaries, identical between engines.'
+          .format(len(summaries['band'])))
+    print('Point engine: {:.2f}s, band engine: {:.2f}s, speedup: {:.1f}x'
+          .format(times['point'], times['band'],
+                  times['point'] / times['band']))
+
+    return times
+
+
+if __name__ == '__main__':
+    run_benchmark()
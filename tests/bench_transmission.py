@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+"""
+Benchmark of the array based transmission feature state against the
+dictionary based reference on a synthetic 10M row transmission table. Will
+not run with pytest.
+
+RUN THIS FILE AS A SCRIPT
+"""
+import time
+
+from reV.handlers.transmission import TransmissionFeatures as TF
+
+from test_handlers_transmission import (DictFeatures, greedy_connect,
+                                        make_synthetic_table)
+
+
+def run_benchmark(n_rows=10000000, **kwargs):
+    """Time the greedy connection of a synthetic transmission table with the
+    array and dictionary based feature states and check that they connect
+    the same supply curve points.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of supply curve point to transmission feature connections.
+    kwargs : dict
+        Additional make_synthetic_table() kwargs.
+
+    Returns
+    -------
+    times : dict
+        Runtime in seconds keyed by feature state.
+    """
+    trans_table = make_synthetic_table(n_rows, **kwargs)
+    tf = TF(trans_table, available_capacity=0.1)
+    ref = DictFeatures(tf)
+
+    times = {}
+    t0 = time.time()
+    truth = greedy_connect(ref, trans_table)
+    times['dict'] = time.time() - t0
+
+    t0 = time.time()
+    test = greedy_connect(tf, trans_table)
+    times['array'] = time.time() - t0
+
+    assert test == truth
+
+    print('{} of {} supply curve points connected, identical between feature '
+          'states.'.format(len(test), trans_table['sc_gid'].nunique()))
+    print('Dictionary state: {:.2f}s, array state: {:.2f}s'
+          .format(times['dict'], times['array']))
+
+    return times
+
+
+if __name__ == '__main__':
+    run_benchmark()
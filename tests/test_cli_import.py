@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+"""
+PyTest file to guard the cold start import cost of the reV CLI.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+HEAVY_MODULES = ('PySAM', 'plotting', 'plotly', 'matplotlib', 'seaborn',
+                 'reV.generation', 'reV.econ', 'reV.qa_qc',
+                 'reV.supply_curve', 'reV.offshore')
+
+
+def get_imported_modules(args):
+    """Run the reV CLI in a fresh interpreter with -X importtime and return
+    the names of all imported modules."""
+    code = ('import sys; from reV.cli import main; '
+            'main({}, standalone_mode=False)'.format(args))
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                         universal_newlines=True, check=True)
+    modules = [line.split('|')[-1].strip()
+               for line in out.stderr.split('\n')
+               if line.startswith('import time:')]
+
+    return modules
+
+
+def check_heavy_modules(modules):
+    """Assert that no heavy modules were imported."""
+    heavy = [m for m in modules
+             if any(m == h or m.startswith(h + '.') for h in HEAVY_MODULES)]
+    msg = 'Heavy modules imported on CLI cold start: {}'.format(heavy)
+    assert not heavy, msg
+
+
+def test_cli_help():
+    """Test that reV --help does not import any reV module CLIs."""
+    modules = get_imported_modules(['--help'])
+    check_heavy_modules(modules)
+    assert not any(m.startswith('reV.pipeline') for m in modules)
+
+
+@pytest.mark.parametrize('command', ['pipeline', 'batch'])
+def test_cli_pipeline(command):
+    """Test that pipeline/batch commands only import their own module."""
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'config.json')
+        with open(fp, 'w') as f:
+            json.dump({}, f)
+
+        modules = get_imported_modules(
+            ['-c', fp, command, 'valid-{}-keys'.format(command)])
+
+    check_heavy_modules(modules)
+    assert 'reV.pipeline.pipeline' in modules
+
+
+def test_cli_generation():
+    """Test that the generation module is only imported when invoked."""
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'config.json')
+        with open(fp, 'w') as f:
+            json.dump({}, f)
+
+        modules = get_imported_modules(
+            ['-c', fp, 'generation', 'valid-generation-keys'])
+
+    assert 'reV.generation.generation' in modules
+    assert 'reV.qa_qc' not in modules
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/prints)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -140,6 +140,34 @@ def test_config_mapping():
             assert cid == df.loc[site].values[0]
 
 
+def test_gid_lookup():
+    """Test the hashed gid lookup and per-site config copies."""
+    fpp = os.path.join(TESTDATADIR, 'project_points/pp_offshore.csv')
+    sam_files = {'onshore': os.path.join(
+                 TESTDATADIR, 'SAM/wind_gen_standard_losses_0.json'),
+                 'offshore': os.path.join(
+                 TESTDATADIR, 'SAM/wind_gen_standard_losses_1.json')}
+    df = pd.read_csv(fpp, index_col=0)
+    pp = ProjectPoints(fpp, sam_files, 'windpower')
+
+    for i, site in enumerate(pp.sites):
+        assert pp.index(site) == i
+        assert pp.gid_index[site] == i
+
+    site = pp.sites[0]
+    cid, config = pp[site]
+    assert cid == df.loc[site].values[0]
+    config['__test_key__'] = 1
+    assert '__test_key__' not in pp[site][1]
+    assert '__test_key__' not in pp.sam_configs[cid]
+
+    with pytest.raises(KeyError):
+        pp[-1]
+
+    with pytest.raises(ConfigError):
+        pp.index(-1)
+
+
 def test_sam_config_kw_replace():
     """Test that the SAM config with old keys from pysam v1 gets updated on
     the fly and gets propogated to downstream splits."""
@@ -11,11 +11,13 @@ import numpy as np
 import pandas as pd
 import pytest
 from reV.SAM.SAM import RevPySam
+from reV.config.curtailment import Curtailment
 from reV.config.project_points import ProjectPoints
 from reV import TESTDATADIR
 from reV.utilities.curtailment import curtail
 from reV.generation.generation import Gen
 
+from rex.sam_resource import SAMResource
 from rex.utilities.solar_position import SolarPosition
 from rex.utilities import safe_json_load
 
@@ -271,6 +273,32 @@ def test_eqn_curtailment(plot=False):
         plt.savefig('equation_based_curtailment.png')
 
 
+@pytest.mark.parametrize('eqn', ['(lambda: {})()',
+                                 'np.all([m for m in ({},)], axis=0)'])
+def test_eqn_namespace(eqn):
+    """Test that the curtailment variables are available to lambdas and
+    comprehensions in equation-based curtailment."""
+    time_index = pd.date_range('2012-01-01', periods=8784, freq='1h')
+    res = SAMResource([0, 1, 2], 'windpower', time_index)
+    res.meta = pd.DataFrame({'latitude': [40, 41, 42],
+                             'longitude': [-105, -100, -95]})
+    np.random.seed(0)
+    res['windspeed'] = np.random.uniform(0, 10, res.shape)
+    res['temperature'] = np.random.uniform(-10, 30, res.shape)
+
+    base_eqn = '(wind_speed < 6) & (temperature > 10)'
+    config = {'dawn_dusk': 'nautical', 'months': [4, 5, 6, 7],
+              'equation': base_eqn}
+    truth = curtail(deepcopy(res), Curtailment(config))
+
+    config['equation'] = eqn.format(base_eqn)
+    test = curtail(deepcopy(res), Curtailment(config))
+
+    assert (truth._res_arrays['windspeed'] == 0).any()
+    assert np.array_equal(truth._res_arrays['windspeed'],
+                          test._res_arrays['windspeed'])
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -59,6 +59,34 @@ def test_lcoe(year, max_workers, spw):
     assert result
 
 
+@pytest.mark.parametrize(('year', 'max_workers'),
+                         [('2012', 1),
+                          ('2013', 2)])
+def test_vectorized_lcoe(year, max_workers):
+    """Test the vectorized lcoe against the per-site PySAM Lcoefcr runs."""
+    cf_file = os.path.join(TESTDATADIR,
+                           'gen_out/gen_ri_pv_{}_x000.h5'.format(year))
+    sam_files = os.path.join(TESTDATADIR,
+                             'SAM/i_lcoe_naris_pv_1axis_inv13.json')
+    points = slice(0, 100)
+    site_data = pd.DataFrame({'gid': np.arange(100),
+                              'capital_cost': np.linspace(1e7, 5e7, 100)})
+    site_data.loc[::3, 'capital_cost'] = np.nan
+
+    out = []
+    for vectorized_lcoe in (False, True):
+        obj = Econ.reV_run(points=points, sam_files=sam_files,
+                           cf_file=cf_file, year=year, site_data=site_data,
+                           output_request=('lcoe_fcr', 'capital_cost'),
+                           max_workers=max_workers, sites_per_worker=25,
+                           points_range=None, fout=None,
+                           vectorized_lcoe=vectorized_lcoe)
+        out.append(obj.out)
+
+    for dset in ('lcoe_fcr', 'capital_cost'):
+        assert np.array_equal(out[0][dset], out[1][dset])
+
+
 @pytest.mark.parametrize('year', ('2012', '2013'))
 def test_fout(year):
     """Gen PV CF profiles with write to disk and compare against rev1."""
@@ -9,6 +9,7 @@ Created on Thu Nov 29 09:54:51 2018
 """
 
 import os
+import shutil
 import h5py
 import pytest
 import pandas as pd
@@ -233,6 +234,132 @@ def test_smart(year):
     assert result is True
 
 
+def test_flush_finished():
+    """Test streaming early flushes of finished sites to disk."""
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_2012.h5'
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    rev2_out_dir = os.path.join(TESTDATADIR, 'ri_pv_reV2_flush')
+    rev2_out = 'gen_ri_pv_flush_2012.h5'
+    output_request = ('cf_mean', 'ghi_mean')
+
+    points = slice(0, 20)
+    baseline = Gen.reV_run(tech='pvwattsv5', points=points,
+                           sam_files=sam_files, res_file=res_file,
+                           max_workers=1, sites_per_worker=3, fout=None,
+                           output_request=output_request)
+
+    # zero memory utilization limit forces a flush after every result
+    gen = Gen(baseline.points_control, res_file, fout=rev2_out,
+              dirout=rev2_out_dir, output_request=output_request,
+              mem_util_lim=0.0)
+    gen._site_limit = 100
+    gen._init_out_arrays()
+    for pc_sub in baseline.points_control:
+        gen.out = Gen.run(pc_sub, tech='pvwattsv5', res_file=res_file,
+                          output_request=gen.output_request)
+        assert not gen._finished_sites
+
+    gen.flush()
+
+    with Outputs(os.path.join(rev2_out_dir, rev2_out), 'r') as out:
+        for dset in output_request:
+            assert np.allclose(out[dset], baseline.out[dset])
+
+    # outputs well below the limit are held in memory regardless of the
+    # memory used by other processes on the node
+    gen = Gen(baseline.points_control, res_file, fout=rev2_out,
+              dirout=rev2_out_dir, output_request=output_request,
+              mem_util_lim=0.4)
+    gen._site_limit = 100
+    gen._init_out_arrays()
+    n_finished = 0
+    for pc_sub in baseline.points_control:
+        gen.out = Gen.run(pc_sub, tech='pvwattsv5', res_file=res_file,
+                          output_request=gen.output_request)
+        assert len(gen._finished_sites) > n_finished
+        n_finished = len(gen._finished_sites)
+
+    assert not gen._pending
+    assert gen._pending_bytes == 0
+
+    if PURGE_OUT:
+        shutil.rmtree(rev2_out_dir)
+
+
+def test_out_of_order_results():
+    """Test that gen results can be set in any order."""
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_2012.h5'
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    rev2_out_dir = os.path.join(TESTDATADIR, 'ri_pv_reV2_order')
+    rev2_out = 'gen_ri_pv_order_2012.h5'
+    output_request = ('cf_mean', 'cf_profile')
+
+    points = slice(0, 20)
+    baseline = Gen.reV_run(tech='pvwattsv5', points=points,
+                           sam_files=sam_files, res_file=res_file,
+                           max_workers=1, sites_per_worker=3, fout=None,
+                           output_request=output_request)
+
+    gen = Gen(baseline.points_control, res_file, fout=rev2_out,
+              dirout=rev2_out_dir, output_request=output_request)
+    # small in-memory output chunk so later results have to be held
+    gen._site_limit = 4
+    gen._init_out_arrays()
+    results = [Gen.run(pc_sub, tech='pvwattsv5', res_file=res_file,
+                       output_request=gen.output_request)
+               for pc_sub in baseline.points_control]
+    for result in results[::-1]:
+        gen.out = result
+
+    assert not gen._pending
+    gen.flush()
+
+    with Outputs(os.path.join(rev2_out_dir, rev2_out), 'r') as out:
+        for dset in output_request:
+            assert np.allclose(out[dset], baseline.out[dset])
+
+    if PURGE_OUT:
+        shutil.rmtree(rev2_out_dir)
+
+
+def test_persistent_pool():
+    """Test gen on a persistent process pool against a serial run."""
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_2012.h5'
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    output_request = ('cf_mean', 'cf_profile')
+    points = slice(0, 20)
+
+    baseline = Gen.reV_run(tech='pvwattsv5', points=points,
+                           sam_files=sam_files, res_file=res_file,
+                           max_workers=1, sites_per_worker=3, fout=None,
+                           output_request=output_request)
+    test = Gen.reV_run(tech='pvwattsv5', points=points,
+                       sam_files=sam_files, res_file=res_file,
+                       max_workers=2, sites_per_worker=3, pool_size=2,
+                       fout=None, output_request=output_request,
+                       persistent_pool=True)
+
+    for dset in output_request:
+        assert np.allclose(test.out[dset], baseline.out[dset])
+
+
+def test_prefetch():
+    """Test serial gen with resource prefetching against a serial run that
+    loads each split's resource in series."""
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_2012.h5'
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    output_request = ('cf_mean', 'cf_profile', 'ghi_mean')
+    kwargs = dict(tech='pvwattsv5', points=slice(0, 20), sam_files=sam_files,
+                  res_file=res_file, max_workers=1, sites_per_worker=3,
+                  fout=None, output_request=output_request)
+
+    baseline = Gen.reV_run(prefetch=False, **kwargs)
+    test = Gen.reV_run(prefetch=True, **kwargs)
+
+    for dset in output_request:
+        assert np.allclose(test.out[dset], baseline.out[dset])
+
+
 def test_multi_file_nsrdb_2018():
     """Test running reV gen from a multi-h5 directory with prefix and suffix"""
     points = slice(0, 10)
@@ -426,6 +553,34 @@ def test_gen_pv_site_data():
     assert np.allclose(test.out['losses'][2:], 14.07566 * np.ones(3))
 
 
+@pytest.mark.parametrize('site_data', [None, 'losses'])
+def test_gen_reuse_pysam(site_data):
+    """Test that re-using PySAM objects across sites matches the baseline"""
+    output_request = ('cf_mean', 'cf_profile', 'azimuth', 'losses')
+    year = 2012
+    rev2_points = slice(0, 5)
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_{}.h5'.format(year)
+    sam_files = TESTDATADIR + '/SAM/i_pvwatts_fixed_lat_tilt.json'
+
+    if site_data is not None:
+        site_data = pd.DataFrame({'gid': np.arange(1, 3),
+                                  'losses': np.ones(2)})
+
+    kwargs = dict(tech='pvwattsv7', points=rev2_points, sam_files=sam_files,
+                  res_file=res_file, max_workers=1, sites_per_worker=5,
+                  fout=None, output_request=output_request,
+                  site_data=site_data)
+    baseline = Gen.reV_run(**kwargs)
+    test = Gen.reV_run(reuse_pysam=True, **kwargs)
+
+    for k in output_request:
+        assert np.allclose(baseline.out[k], test.out[k])
+
+    if site_data is not None:
+        assert np.allclose(test.out['losses'][1:3], np.ones(2))
+        assert not np.allclose(test.out['losses'][3:], np.ones(2))
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -5,9 +5,10 @@ pytests for output collection
 import h5py
 import numpy as np
 import os
+import pandas as pd
 import pytest
 
-from reV.handlers.collection import Collector
+from reV.handlers.collection import Collector, DatasetCollector
 from reV import TESTDATADIR
 
 from rex.utilities.loggers import init_logger
@@ -80,6 +81,77 @@ def test_collection():
         os.remove(h5_file)
 
 
+def test_parallel_collection():
+    """
+    Test parallel reader collection of 'cf_profile' against serial collection
+    """
+    init_logger('reV.handlers.collection')
+    profiles = manual_collect(H5_DIR, 'peregrine_2012', 'cf_profile')
+    h5_file = os.path.join(TEMP_DIR, 'collection_parallel.h5')
+    Collector.collect(h5_file, H5_DIR, POINTS_PATH, 'cf_profile',
+                      dset_out=None,
+                      file_prefix='peregrine_2012',
+                      mem_util_lim=0.00002,
+                      max_workers=2)
+    with h5py.File(h5_file, 'r') as f:
+        cf_profiles = f['cf_profile'][...]
+
+    assert np.allclose(profiles, cf_profiles)
+
+    if PURGE_OUT:
+        os.remove(h5_file)
+
+
+def make_chunked_source(fpath, gids, fillvalue=0, n_time=24, chunk=4):
+    """Make a source file with cf_profile chunked by site. The first site
+    chunk is left unallocated (fill value)."""
+    meta = pd.DataFrame({'gid': gids, 'latitude': 40.0, 'longitude': -100.0})
+    time_index = pd.date_range('2012-01-01', periods=n_time, freq='h')
+    with h5py.File(fpath, 'w') as f:
+        f.create_dataset('meta', data=meta.to_records(index=False))
+        f.create_dataset('time_index',
+                         data=time_index.astype(str).values.astype('S'))
+        ds = f.create_dataset('cf_profile', shape=(n_time, len(gids)),
+                              dtype=np.float32, chunks=(n_time, chunk),
+                              fillvalue=fillvalue)
+        ds[:, chunk:] = np.random.uniform(0, 1, (n_time, len(gids) - chunk))
+        data = ds[...]
+
+    return data
+
+
+@pytest.mark.parametrize(('fillvalue', 'n_copies'), ((0, 2), (-1, 0)))
+def test_chunk_copy_collection(fillvalue, n_copies, monkeypatch, tmp_path):
+    """
+    Test that source files with chunking aligned to the output are copied
+    chunk-for-chunk unless their fill value differs from the output
+    """
+    copies = []
+    copy_chunks = DatasetCollector._copy_chunks
+
+    def _copy_chunks(self, f_out, f_source, out_slice):
+        copies.append(out_slice)
+        copy_chunks(self, f_out, f_source, out_slice)
+
+    monkeypatch.setattr(DatasetCollector, '_copy_chunks', _copy_chunks)
+
+    h5_dir = tmp_path / 'source'
+    h5_dir.mkdir()
+    truth = [make_chunked_source(str(h5_dir / 'src_x{:03d}.h5'.format(i)),
+                                 np.arange(8 * i, 8 * (i + 1)),
+                                 fillvalue=fillvalue)
+             for i in range(2)]
+    truth = np.hstack(truth)
+
+    h5_file = str(tmp_path / 'collection.h5')
+    Collector.collect(h5_file, str(h5_dir), None, 'cf_profile',
+                      file_prefix='src')
+
+    assert len(copies) == n_copies
+    with h5py.File(h5_file, 'r') as f:
+        assert np.array_equal(f['cf_profile'][...], truth)
+
+
 def test_collect_means():
     """
     Test means collection:
@@ -238,6 +238,30 @@ def test_my_stdev(dset, group):
         os.remove(my_out)
 
 
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_my_profile_stats(max_workers):
+    """
+    Test the streamed multi-year mean and stdev profiles
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of processes used to compute site blocks
+    """
+    my_out = os.path.join(TEMP_DIR, "cf_profile-stats-MY.h5")
+    MultiYear.collect_profiles(my_out, H5_FILES, 'cf_profile',
+                               compute_stats=True, max_workers=max_workers)
+
+    my_means = manual_means(H5_FILES, 'cf_profile')
+    my_std = manual_stdev(H5_FILES, 'cf_profile')
+    with MultiYear(my_out, mode='r') as my:
+        compare_arrays(my_means, my['cf_profile-means'], "Profile means")
+        compare_arrays(my_std, my['cf_profile-stdev'], "Profile STDEV")
+
+    if PURGE_OUT:
+        os.remove(my_out)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
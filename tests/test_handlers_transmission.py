@@ -2,12 +2,16 @@
 """
 Transmission Feature Tests
 """
+import json
 import os
+import numpy as np
 import pandas as pd
 import pytest
 
 from reV import TESTDATADIR
 from reV.handlers.transmission import TransmissionFeatures as TF
+from reV.handlers.transmission import TransmissionCosts as TC
+from reV.utilities.exceptions import HandlerKeyError
 
 TRANS_COSTS_1 = {'line_tie_in_cost': 200, 'line_cost': 1000,
                  'station_tie_in_cost': 50, 'center_tie_in_cost': 10,
@@ -127,6 +131,207 @@ def test_substation_load_spreading(i, trans_costs, trans_table):
         assert LINE_CAPS[i][line_id] == tf[line_id]['avail_cap'], msg
 
 
+@pytest.mark.parametrize('trans_costs', (TRANS_COSTS_1, TRANS_COSTS_2))
+def test_vectorized_costs(trans_costs, trans_table):
+    """
+    Test vectorized feature capacity and costs against the feature handlers
+    """
+    tf = TF(trans_table, **trans_costs)
+    avc = trans_costs['available_capacity']
+    feature_cap = TF.feature_capacity(trans_table, available_capacity=avc)
+    feature_cap = feature_cap.set_index('trans_line_gid')['avail_cap']
+    for gid, cap in feature_cap.items():
+        truth = tf.available_capacity(gid)
+        if truth is None:
+            assert np.isnan(cap)
+        else:
+            assert np.isclose(cap, truth)
+
+    trans_table = trans_table.merge(feature_cap.reset_index(),
+                                    on='trans_line_gid')
+    capacity = 350
+    tc = TC(trans_table, **trans_costs)
+    truth = [tc.cost(gid, dist, capacity=capacity)
+             for gid, dist in trans_table[['trans_line_gid', 'dist_mi']]
+             .values]
+    truth = np.array(truth, dtype='float32')
+    test = TC.feature_costs(trans_table, capacity=capacity, **trans_costs)
+
+    assert np.allclose(truth, test, equal_nan=True)
+
+
+class DictFeatures:
+    """Dictionary based transmission feature state with the original
+    (pre-vectorization) connection logic, used as a reference."""
+
+    def __init__(self, tf):
+        self._features = {gid: tf[gid] for gid in tf._feature_gid_list}
+        self._unavailable = set()
+
+    def available_capacity(self, gid):
+        """Get the available capacity of a feature."""
+        feature = self._features[gid]
+        if 'avail_cap' in feature:
+            return feature['avail_cap']
+
+        return sum(self._features[line]['avail_cap']
+                   for line in feature['lines']) / 2
+
+    def connect(self, gid, capacity):
+        """Connect to a feature and update the available capacity."""
+        if gid in self._unavailable:
+            return False
+
+        avail_cap = self.available_capacity(gid)
+        if avail_cap is not None and capacity > avail_cap:
+            return False
+
+        feature = self._features[gid]
+        if feature['type'] == 'substation':
+            self._spread_substation_load(feature['lines'], capacity)
+        elif feature['type'] != 'pcaloadcen':
+            feature['avail_cap'] -= capacity
+
+        if self.available_capacity(gid) == 0:
+            self._unavailable.add(gid)
+
+        return True
+
+    def _spread_substation_load(self, lines, capacity):
+        """Spread capacity over the lines of a substation."""
+        lines = [line for line in lines
+                 if self._features[line]['avail_cap'] != 0]
+        while True:
+            apply_cap = capacity / len(lines)
+            full = [line for line in lines
+                    if self._features[line]['avail_cap'] < apply_cap]
+            for line in full:
+                capacity -= self._features[line]['avail_cap']
+                self._features[line]['avail_cap'] = 0
+
+            if not full:
+                break
+
+            lines = [line for line in lines if line not in full]
+
+        for line in lines:
+            self._features[line]['avail_cap'] -= apply_cap
+
+
+def make_synthetic_table(n_rows, n_features=305000, n_sc=1000000, seed=0):
+    """Make a synthetic supply curve transmission mapping table.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of supply curve point to transmission feature connections.
+    n_features : int
+        Number of transmission features, roughly 80% lines, 15%
+        substations, 4% load centers and 1% synthetic load centers.
+    n_sc : int
+        Number of supply curve points.
+    seed : int
+        Random seed.
+
+    Returns
+    -------
+    trans_table : pd.DataFrame
+        Synthetic transmission mapping table in random connection order.
+    """
+    rng = np.random.default_rng(seed)
+    categories = np.array(['TransLine', 'Substation', 'LoadCen',
+                           'PCALoadCen'], dtype=object)
+    cat = rng.choice(len(categories), n_features, p=[0.8, 0.15, 0.04, 0.01])
+    ac_cap = rng.uniform(100, 3000, n_features).round(1)
+
+    lines = np.where(cat == 0)[0]
+    trans_gids = np.full(n_features, np.nan, dtype=object)
+    for gid in np.where(cat == 1)[0]:
+        sub_lines = rng.choice(lines, rng.integers(1, 7), replace=False)
+        trans_gids[gid] = json.dumps(sorted(sub_lines.tolist()))
+
+    features = rng.integers(0, n_features, n_rows)
+    sc_gids = rng.integers(0, n_sc, n_rows)
+    sc_cap = rng.uniform(5, 100, n_sc).round(2)
+
+    trans_table = pd.DataFrame({'sc_gid': sc_gids,
+                                'trans_line_gid': features,
+                                'category': categories[cat[features]],
+                                'ac_cap': ac_cap[features],
+                                'trans_gids': trans_gids[features],
+                                'capacity': sc_cap[sc_gids],
+                                'dist_mi': rng.uniform(0, 100, n_rows)})
+
+    return trans_table
+
+
+def greedy_connect(features, trans_table):
+    """Connect supply curve points in table order as in SupplyCurve."""
+    connected = {}
+    for sc_gid, gid, capacity in zip(trans_table['sc_gid'].tolist(),
+                                     trans_table['trans_line_gid'].tolist(),
+                                     trans_table['capacity'].tolist()):
+        if sc_gid not in connected and features.connect(gid, capacity):
+            connected[sc_gid] = gid
+
+    return connected
+
+
+def test_synthetic_connections():
+    """
+    Test the greedy connection of a synthetic transmission table against the
+    dictionary based reference. See bench_transmission.py for the 10M row
+    benchmark.
+    """
+    trans_table = make_synthetic_table(100000, n_features=5000, n_sc=20000)
+    tf = TF(trans_table, available_capacity=0.1)
+    ref = DictFeatures(tf)
+
+    truth = greedy_connect(ref, trans_table)
+    test = greedy_connect(tf, trans_table)
+    assert test == truth
+
+    for gid in tf._feature_gid_list:
+        if 'avail_cap' in ref._features[gid]:
+            truth = ref._features[gid]['avail_cap']
+            test = tf[gid]['avail_cap']
+            assert (truth is None and test is None) or truth == test
+
+
+@pytest.mark.parametrize('line_limited', (False, True))
+def test_available_capacities(line_limited):
+    """
+    Test the vector of feature capacities against the per feature capacity
+    before and after connections
+    """
+    trans_table = make_synthetic_table(20000, n_features=1000, n_sc=5000)
+    tf = TF(trans_table, available_capacity=0.1, line_limited=line_limited)
+    for connect in (False, True):
+        if connect:
+            greedy_connect(tf, trans_table)
+
+        avail_cap = tf.available_capacities()
+        for gid in tf._feature_gid_list:
+            truth = tf.available_capacity(gid)
+            if truth is None:
+                assert np.isnan(avail_cap[gid])
+            else:
+                assert np.isclose(avail_cap[gid], truth)
+
+
+@pytest.mark.parametrize('gid', ('a', None, np.nan, 1.5, -1, 10**12))
+def test_invalid_gid(gid):
+    """
+    Test that invalid feature gids raise a HandlerKeyError
+    """
+    tf = TF(make_synthetic_table(1000, n_features=100, n_sc=50))
+    with pytest.raises(HandlerKeyError):
+        tf[gid]  # pylint: disable=pointless-statement
+
+    with pytest.raises(HandlerKeyError):
+        tf.available_capacity(gid)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -14,6 +14,7 @@ import pandas as pd
 import json
 
 from reV.offshore.offshore import Offshore
+from reV.offshore.orca import ORCA_LCOE
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
 from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
@@ -175,6 +176,57 @@ def test_offshore_module(offshore):
         os.remove(OUTPUT_FILE)
 
 
+def test_farm_aggregation():
+    """Test the single-pass sparse farm aggregation against the mean of the
+    gen data for each farm's resource pixels."""
+    obj = Offshore(GEN_FPATH, OFFSHORE_FPATH, None)
+    obj._aggregate_gen_data()
+
+    with Outputs(GEN_FPATH, mode='r', unscale=True) as source:
+        cf_mean = source['cf_mean']
+        cf_profile = source['cf_profile']
+
+    for i, ifarm in enumerate(obj.meta_out_offshore.index):
+        ilocs = np.where(obj._i == ifarm)[0]
+        gen_locs = obj.meta_source_offshore.iloc[ilocs].index.values
+
+        assert np.allclose(obj.out['cf_mean'][i],
+                           cf_mean[gen_locs].mean(), rtol=1e-6)
+        assert np.allclose(obj.out['cf_profile'][:, i],
+                           cf_profile[:, gen_locs].mean(axis=1), rtol=1e-6)
+
+
+def test_orca_batch():
+    """Test the batched ORCA LCOE against per-farm ORCA LCOE for a batch with
+    multiple ORCA systems and duplicate farms."""
+    pytest.importorskip("ORCA")
+    with open(SAM_FILE['default'], 'r') as f:
+        base_inputs = json.load(f)
+
+    farms = pd.read_csv(OFFSHORE_FPATH).iloc[:10]
+    system_inputs = []
+    site_data = []
+    for i, row in farms.iterrows():
+        sys_in = dict(base_inputs)
+        sys_in['turbine_capacity'] = 6 if i % 2 else 8
+        row = row.to_dict()
+        row['gcf'] = 0.3 + 0.01 * i
+        system_inputs.append(sys_in)
+        site_data.append(row)
+
+    system_inputs += system_inputs[:3]
+    site_data += site_data[:3]
+    gids = list(range(len(site_data)))
+
+    truth = [ORCA_LCOE(sys_in, data, site_gid=gid).lcoe
+             for sys_in, data, gid in zip(system_inputs, site_data, gids)]
+    test = ORCA_LCOE.run_batch(system_inputs, site_data, site_gids=gids)
+
+    assert len(test) == len(truth)
+    assert np.allclose(truth, test, rtol=RTOL)
+    assert test[-3:] == test[:3]
+
+
 def test_sc_agg_offshore():
     """Test the SC offshore aggregation and check offshore SC points against
     known offshore gen points."""
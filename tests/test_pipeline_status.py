@@ -11,8 +11,9 @@ Created on Thu Nov 29 09:54:51 2018
 import os
 import pytest
 import json
+import sqlite3
 
-from reV.pipeline.status import Status
+from reV.pipeline.status import JobStatusStore, Status
 from reV import TESTDATADIR
 
 RTOL = 0.0
@@ -111,6 +112,78 @@ def test_job_replacement():
     purge()
 
 
+def test_job_status_store():
+    """Test job status posting, change notification, and consumption"""
+    purge()
+    store = JobStatusStore(STATUS_DIR)
+    assert store.last_seq == 0
+    assert store.pop('test1') is None
+
+    Status.make_job_file(STATUS_DIR, 'generation', 'test1', TEST_1_ATTRS_1)
+    assert not any(fn.startswith('jobstatus_')
+                   and fn.endswith('.json')
+                   for fn in os.listdir(STATUS_DIR))
+    seq = store.last_seq
+    assert seq > 0
+    assert store.wait(seq, 0.1) == seq
+
+    Status.make_job_file(STATUS_DIR, 'generation', 'test1', TEST_1_ATTRS_2)
+    Status.make_job_file(STATUS_DIR, 'generation', 'test2', TEST_2_ATTRS_1)
+    assert store.wait(seq, 1) > seq
+
+    status = store.pop('test1')
+    assert status == {'generation': {'test1': TEST_1_ATTRS_2}}
+    assert store.pop('test1') is None
+    assert store.pop_all() == [{'generation': {'test2': TEST_2_ATTRS_1}}]
+    purge()
+
+
+def test_legacy_job_file():
+    """Test that single-job json status files are still picked up"""
+    purge()
+    fpath = os.path.join(STATUS_DIR, 'jobstatus_test1.json')
+    with open(fpath, 'w') as f:
+        json.dump({'generation': {'test1': TEST_1_ATTRS_1}}, f)
+
+    status = Status.retrieve_job_status(STATUS_DIR, 'generation', 'test1')
+    assert status == 'R'
+    assert not os.path.exists(fpath)
+    purge()
+
+
+def test_legacy_scan_after_fallback(monkeypatch):
+    """Test that the status dir is only scanned for job status files once a
+    job has fallen back to writing one"""
+    purge()
+    Status.make_job_file(STATUS_DIR, 'generation', 'test1', TEST_1_ATTRS_1)
+    fpath = os.path.join(STATUS_DIR, 'jobstatus_test2.json')
+    with open(fpath, 'w') as f:
+        json.dump({'generation': {'test2': TEST_2_ATTRS_1}}, f)
+
+    Status.update(STATUS_DIR)
+    assert 'test1' in Status(STATUS_DIR).data['generation']
+    assert 'test2' not in Status(STATUS_DIR).data['generation']
+    assert os.path.exists(fpath)
+
+    def locked_post(*args, **kwargs):
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(JobStatusStore, 'post', locked_post)
+    with pytest.warns(UserWarning):
+        Status.make_job_file(STATUS_DIR, 'generation', 'test3',
+                             TEST_1_ATTRS_2)
+
+    store = JobStatusStore(STATUS_DIR)
+    assert os.path.exists(store.fallback_fpath)
+    Status.update(STATUS_DIR)
+    status = Status(STATUS_DIR).data['generation']
+    assert status['test2'] == TEST_2_ATTRS_1
+    assert status['test3'] == TEST_1_ATTRS_2
+    assert not os.path.exists(fpath)
+    assert not os.path.exists(store.fallback_fpath)
+    purge()
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
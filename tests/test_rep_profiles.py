@@ -93,6 +93,42 @@ def test_weighted_meanoid():
     assert np.allclose(meanoid, w_meanoid)
 
 
+def test_weighted_medianoid():
+    """Test a medianoid weighted by gid_counts against the medianoid of
+    profiles repeated by their integer weights."""
+    sites = np.arange(20)
+    with Resource(GEN_FPATH) as res:
+        profiles = res['cf_profile', :, sites]
+
+    weights = np.random.randint(0, 4, len(sites))
+    weights[0] = 1
+    w_medianoid = RepresentativeMethods.medianoid(profiles, weights=weights)
+    truth = RepresentativeMethods.medianoid(np.repeat(profiles, weights,
+                                                      axis=1))
+    assert np.allclose(w_medianoid, truth)
+
+    medianoid = RepresentativeMethods.medianoid(profiles)
+    assert np.allclose(medianoid, RepresentativeMethods.medianoid(
+        profiles, weights=np.ones(len(sites))))
+
+    rev_summary = pd.DataFrame({'gen_gids': sites,
+                                'res_gids': sites,
+                                'gid_counts': weights,
+                                'region': ['a', 'b'] * 10,
+                                'timezone': -5})
+    for max_workers in (1, 2):
+        p1, m1, _ = RepProfiles.run(GEN_FPATH, rev_summary, 'region',
+                                    rep_method='medianoid',
+                                    max_workers=max_workers)
+        for i, region in enumerate(m1['region']):
+            mask = (rev_summary['region'] == region).values
+            truth, i_rep = RepresentativeMethods.run(
+                profiles[:, mask], weights=weights[mask],
+                rep_method='medianoid')
+            assert np.allclose(p1[0][:, i], truth[:, 0])
+            assert m1.loc[i, 'rep_gen_gid'] == sites[mask][i_rep[0]]
+
+
 def test_integrated():
     """Test a multi-region rep profile calc serial vs. parallel and against
     baseline results."""
@@ -198,6 +234,66 @@ def test_many_regions():
         assert r2 in m1['region2'].values
 
 
+@pytest.mark.parametrize('mem_util_lim', (0.4, 0.0))
+def test_batched_region_reads(mem_util_lim):
+    """Test that the batched source profile reads match per-region reads
+    for regions with interleaved and repeated gen gids. A zero memory limit
+    runs one region per batch."""
+    gen_gids = [json.dumps([int(g) for g in np.arange(i, 100, 10)])
+                for i in range(10)]
+    gen_gids += [json.dumps([3, 4, 5]), json.dumps([90, 1, 45])]
+    timezone = np.random.choice([-4, -5, -6, -7], len(gen_gids))
+    rev_summary = pd.DataFrame({'gen_gids': gen_gids,
+                                'res_gids': gen_gids,
+                                'region': ['a', 'b', 'c'] * 4,
+                                'timezone': timezone})
+
+    rp = RepProfiles(GEN_FPATH, rev_summary, 'region', weight=None,
+                     mem_util_lim=mem_util_lim)
+    _, gids, _, _ = rp._get_stacked_inputs()
+    profiles = rp._read_source_profiles(gids, block_size=7)
+    assert len(gids) > len(set(gids))
+
+    with Resource(GEN_FPATH) as res:
+        truth = res['cf_profile', :, np.arange(100)]
+
+    assert np.allclose(profiles, truth[:, gids])
+
+    for max_workers in (1, 2):
+        p1, m1, _ = RepProfiles.run(GEN_FPATH, rev_summary, 'region',
+                                    weight=None, max_workers=max_workers,
+                                    mem_util_lim=mem_util_lim)
+        for i, region in enumerate(m1['region']):
+            mask = rev_summary['region'] == region
+            r = RegionRepProfile(GEN_FPATH, rev_summary[mask], weight=None)
+            assert np.allclose(p1[0][:, i], r.rep_profiles[:, 0])
+            assert m1.loc[i, 'rep_gen_gid'] == r.rep_gen_gids[0]
+
+
+def test_run_regions():
+    """Test the batched multi-region rep methods against per-region runs."""
+    sites = np.arange(100)
+    with Resource(GEN_FPATH) as res:
+        profiles = res['cf_profile', :, sites]
+
+    labels = np.random.choice(['a', 'b', 'c', 'd'], 100)
+    weights = np.random.uniform(1, 10, 100)
+    for rep_method in ('meanoid', 'medianoid'):
+        for err_method in ('rmse', 'mae', 'mbe'):
+            regions, reps, i_reps = RepresentativeMethods.run_regions(
+                profiles, labels, weights=weights, rep_method=rep_method,
+                err_method=err_method, n_profiles=3)
+            for j, region in enumerate(regions):
+                mask = labels == region
+                truth, i_truth = RepresentativeMethods.run(
+                    profiles[:, mask], weights=weights[mask],
+                    rep_method=rep_method, err_method=err_method,
+                    n_profiles=3)
+                for n in range(3):
+                    assert np.allclose(reps[n][:, j], truth[:, n])
+                assert (sites[mask][i_truth] == i_reps[j]).all()
+
+
 def test_write_to_file():
     """Test rep profiles with file write."""
 
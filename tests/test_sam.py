@@ -13,6 +13,8 @@ import warnings
 from reV.SAM.defaults import (DefaultPvwattsv5, DefaultPvwattsv7,
                               DefaultWindPower)
 from reV.SAM.generation import Pvwattsv5
+from reV.SAM.SAM import Sam
+from reV.config.sam_config import SAMConfig
 from reV import TESTDATADIR
 from reV.config.project_points import ProjectPoints
 from reV.SAM.version_checker import PySamVersionChecker
@@ -148,6 +150,31 @@ def test_default_windpower():
     assert round(default.Outputs.annual_energy, -1) == 201595970
 
 
+def test_attr_table():
+    """Test that PySAM attribute tables are shared between SAM instances
+    and that SAM inputs are filtered for PySAM."""
+    class PV(Sam):
+        """Minimal SAM wrapper around the PySAM pvwattsv5 module."""
+        PYSAM = Pvwattsv5.PYSAM
+
+    pv_0 = PV()
+    pv_1 = PV()
+    assert pv_0._attr_table is pv_1._attr_table
+    assert type(pv_0.pysam) in Sam._ATTR_TABLES
+    assert 'tilt' in pv_0.input_list
+    assert pv_0._get_group('tilt') == 'SystemDesign'
+
+    assert SAMConfig.filter_inputs('adjust:constant', 0) == ('constant', 0)
+    assert SAMConfig.filter_inputs('a.b', 1) == ('a_b', 1)
+    assert SAMConfig.filter_inputs('x', '[1, 2]') == ('x', [1, 2])
+    assert SAMConfig.filter_inputs('x', 'abc') == ('x', 'abc')
+
+    pv_0['tilt'] = 12
+    pv_0.assign_inputs({'azimuth': 90, 'shading.azal': '[[0, 1], [2, 3]]'})
+    assert pv_0['tilt'] == 12
+    assert pv_0['azimuth'] == 90
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -2,12 +2,15 @@
 """
 Aggregation tests
 """
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import os
 from pandas.testing import assert_frame_equal
 import pytest
 
+from reV.supply_curve import aggregation
 from reV.supply_curve.aggregation import Aggregation
+from reV.supply_curve.exclusions import ExclusionMask
 from reV import TESTDATADIR
 
 from rex.resource import Resource
@@ -79,6 +82,36 @@ def test_aggregation_parallel(excl_dict, baseline_name):
     check_agg(agg_out, baseline_h5)
 
 
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_global_area_filter_once(max_workers, monkeypatch, tmp_path):
+    """
+    test that the global contiguous area filter runs once per aggregation
+    run instead of once per chunk of SC points
+    """
+    n_calls = []
+    global_area_filter = ExclusionMask._global_area_filter
+
+    def counted_filter(self, out):
+        n_calls.append(1)
+        return global_area_filter(self, out)
+
+    # run the parallel chunks in threads so that every call is counted
+    monkeypatch.setattr(ExclusionMask, '_global_area_filter', counted_filter)
+    monkeypatch.setattr(aggregation, 'SpawnProcessPool',
+                        lambda max_workers, loggers: ThreadPoolExecutor(
+                            max_workers=max_workers))
+
+    agg_out = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET,
+                              excl_dict=EXCL_DICT, min_area=0.1,
+                              area_filter_mode='global',
+                              max_workers=max_workers, chunk_point_len=10,
+                              shared_dir=str(tmp_path))
+
+    assert len(agg_out['meta']) > 10
+    assert len(n_calls) == 1
+    assert not os.listdir(tmp_path)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
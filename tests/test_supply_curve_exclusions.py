@@ -5,6 +5,7 @@ Exclusions unit test module
 import numpy as np
 import os
 import pytest
+import shutil
 
 from reV import TESTDATADIR
 from reV.handlers.exclusions import ExclusionLayers
@@ -335,6 +336,81 @@ def test_force_inclusion():
     assert np.allclose(test, truth)
 
 
+@pytest.mark.parametrize(('scenario'), ['urban_pv', 'weighted'])
+def test_mask_cache(scenario):
+    """
+    Test that the on-disk exclusions mask cache reproduces the un-cached
+    mask and is only re-built when the layer configuration changes.
+    """
+    excl_h5 = os.path.join(TESTDATADIR, 'ri_exclusions', 'ri_exclusions.h5')
+    truth_path = os.path.join(TESTDATADIR, 'ri_exclusions',
+                              '{}.npy'.format(scenario))
+    truth = np.load(truth_path)
+
+    layers_dict = CONFIGS[scenario]
+    min_area = AREA.get(scenario, None)
+    td = os.path.join(TESTDATADIR, 'ri_exclusions', 'mask_cache/')
+    if os.path.exists(td):
+        shutil.rmtree(td)
+
+    with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                               min_area=min_area, cache_dir=td) as f:
+        fpath = f.cache_fpath
+        test = f.mask
+
+    assert os.path.exists(fpath)
+    assert np.allclose(truth, test)
+    mtime = os.path.getmtime(fpath)
+
+    test = ExclusionMaskFromDict.run(excl_h5, layers_dict=layers_dict,
+                                     min_area=min_area, cache_dir=td)
+    assert np.allclose(truth, test)
+    assert os.path.getmtime(fpath) == mtime
+    assert len(os.listdir(td)) == 1
+
+    layers_dict = {'ri_srtm_slope': {'inclusion_range': (0, 10),
+                                     'exclude_nodata': True}}
+    with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                               cache_dir=td) as f:
+        assert f.cache_fpath != fpath
+
+    assert len(os.listdir(td)) == 2
+
+    shutil.rmtree(td)
+
+
+@pytest.mark.parametrize(('tile_shape', 'kernel'),
+                         [((2048, 2048), 'queen'),
+                          ((50, 70), 'queen'),
+                          ((50, 70), 'rook')])
+def test_global_area_filter(tile_shape, kernel):
+    """
+    Test that the tiled global contiguous area filter matches the area filter
+    run on the full exclusion extent at once.
+    """
+    excl_h5 = os.path.join(TESTDATADIR, 'ri_exclusions', 'ri_exclusions.h5')
+    layers_dict = CONFIGS['urban_pv']
+    min_area = AREA['urban_pv']
+
+    with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict) as f:
+        truth = ExclusionMask._area_filter(f.mask, min_area=min_area,
+                                           kernel=kernel)
+
+    default_shape = ExclusionMask.FILTER_TILE_SHAPE
+    ExclusionMask.FILTER_TILE_SHAPE = tile_shape
+    try:
+        with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                                   min_area=min_area, kernel=kernel,
+                                   filter_mode='global') as f:
+            test = f.mask
+            ds_slice = (slice(64, 128), slice(128, 192))
+            assert np.allclose(truth[ds_slice], f[ds_slice])
+    finally:
+        ExclusionMask.FILTER_TILE_SHAPE = default_shape
+
+    assert np.allclose(truth, test)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
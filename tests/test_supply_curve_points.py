@@ -6,6 +6,8 @@ Created on Wed Jun 19 15:37:05 2019
 """
 # pylint: disable=no-member
 import os
+import shutil
+import h5py
 import numpy as np
 import pytest
 
@@ -14,6 +16,7 @@ from reV.supply_curve.points import (SupplyCurvePoint,
                                      GenerationSupplyCurvePoint,
                                      SupplyCurveExtent)
 from reV.handlers.outputs import Outputs
+from reV.utilities.exceptions import FileInputWarning
 from reV import TESTDATADIR
 
 F_EXCL = os.path.join(TESTDATADIR, 'ri_exclusions/ri_exclusions.h5')
@@ -133,6 +136,54 @@ def test_aggregate(gid, resolution, excl_dict, time_series):
         assert np.allclose(test, total, rtol=RTOL)
 
 
+@pytest.mark.parametrize('resolution', [7, 64, 163])
+def test_sc_point_index(resolution):
+    """Test the vectorized valid SC points against a brute force scan of the
+    techmap and the persisted SC point index."""
+    excl_fpath = os.path.join(TESTDATADIR, 'sc_out/sc_point_index.h5')
+    shutil.copy(F_EXCL, excl_fpath)
+
+    with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
+        tm = sc.exclusions[TM_DSET]
+        truth = [gid for gid in range(len(sc))
+                 if np.any(tm[sc.get_excl_slices(gid)] != -1)]
+        assert np.array_equal(sc.valid_sc_points(TM_DSET), truth)
+        assert sc.load_sc_point_index(TM_DSET) is None
+
+    index = SupplyCurveExtent.save_sc_point_index(excl_fpath, TM_DSET,
+                                                  resolution=resolution)
+    with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
+        saved = sc.load_sc_point_index(TM_DSET)
+        assert np.array_equal(sc.valid_sc_points(TM_DSET), truth)
+        for _, row in saved.iterrows():
+            gid = int(row['gid'])
+            rows, cols = sc.get_excl_slices(gid)
+            gids = tm[rows, cols]
+            assert row['n_res_gids'] == len(np.unique(gids[gids != -1]))
+            assert row['row_ind'] == sc.points.loc[gid, 'row_ind']
+            assert row['col_ind'] == sc.points.loc[gid, 'col_ind']
+
+        assert np.allclose(saved['latitude'],
+                           sc.latitude[saved['gid'].values])
+        assert np.allclose(saved['longitude'],
+                           sc.longitude[saved['gid'].values])
+
+    assert np.array_equal(index['gid'], saved['gid'])
+
+    # an index built from a different techmap is ignored
+    with h5py.File(excl_fpath, 'a') as f:
+        f[TM_DSET].attrs['distance_upper_bound'] = 1e6
+
+    with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
+        with pytest.warns(FileInputWarning):
+            assert sc.load_sc_point_index(TM_DSET) is None
+
+        with pytest.warns(FileInputWarning):
+            assert np.array_equal(sc.valid_sc_points(TM_DSET), truth)
+
+    os.remove(excl_fpath)
+
+
 def plot_all_sc_points(resolution=64):
     """Test the calculation of the SC points setup from exclusions tiff."""
 
@@ -12,6 +12,7 @@ from pandas.testing import assert_frame_equal
 import pytest
 
 from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
+from reV.utilities.exceptions import SupplyCurveInputError
 from reV import TESTDATADIR
 
 EXCL = os.path.join(TESTDATADIR, 'ri_exclusions/ri_exclusions.h5')
@@ -237,6 +238,108 @@ def test_data_layer_methods():
             assert slope_min <= slope_mean <= slope_max
 
 
+@pytest.mark.parametrize('gids', (None, list(range(50, 70))))
+def test_band_engine(gids):
+    """Test that the row-band aggregation engine matches the per-point
+    engine."""
+    kwargs = {'excl_dict': EXCL_DICT,
+              'res_class_dset': RES_CLASS_DSET,
+              'res_class_bins': RES_CLASS_BINS,
+              'data_layers': DATA_LAYERS,
+              'gids': gids,
+              'max_workers': 1}
+
+    s_point = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                             engine='point', **kwargs)
+    s_band = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                            engine='band', **kwargs)
+
+    for c in ['res_gids', 'gen_gids', 'gid_counts']:
+        s_point[c] = s_point[c].astype(str)
+        s_band[c] = s_band[c].astype(str)
+
+    assert_frame_equal(s_point, s_band, check_dtype=False, rtol=RTOL)
+
+
+def test_band_engine_parallel():
+    """Test that the parallel row-band engine matches the serial engine."""
+    s1 = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                        excl_dict=EXCL_DICT,
+                                        res_class_dset=RES_CLASS_DSET,
+                                        res_class_bins=RES_CLASS_BINS,
+                                        engine='band', max_workers=1)
+    s2 = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                        excl_dict=EXCL_DICT,
+                                        res_class_dset=RES_CLASS_DSET,
+                                        res_class_bins=RES_CLASS_BINS,
+                                        engine='band', max_workers=2)
+    assert_frame_equal(s1, s2)
+
+
+def test_band_engine_global_filter():
+    """Test that the point and band engines produce identical results with
+    the global contiguous area filter."""
+    kwargs = {'excl_dict': EXCL_DICT,
+              'res_class_dset': RES_CLASS_DSET,
+              'res_class_bins': RES_CLASS_BINS,
+              'min_area': 0.1,
+              'area_filter_mode': 'global',
+              'max_workers': 1}
+    s_point = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                             engine='point', **kwargs)
+    s_band = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                            engine='band', **kwargs)
+    s_window = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                              excl_dict=EXCL_DICT,
+                                              res_class_dset=RES_CLASS_DSET,
+                                              res_class_bins=RES_CLASS_BINS,
+                                              max_workers=1)
+    assert s_point['area_sq_km'].sum() <= s_window['area_sq_km'].sum()
+
+    for c in ['res_gids', 'gen_gids', 'gid_counts']:
+        s_point[c] = s_point[c].astype(str)
+        s_band[c] = s_band[c].astype(str)
+
+    assert_frame_equal(s_point, s_band, check_dtype=False, rtol=RTOL)
+
+
+def test_band_engine_window_filter():
+    """Test that the band engine refuses the windowed contiguous area filter,
+    which it cannot reproduce exactly."""
+    with pytest.raises(SupplyCurveInputError):
+        SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                       excl_dict=EXCL_DICT, min_area=0.1,
+                                       engine='band', max_workers=1)
+
+    with pytest.raises(SupplyCurveInputError):
+        SupplyCurveAggregation.run_serial(EXCL, GEN, TM_DSET, None,
+                                          excl_dict=EXCL_DICT, min_area=0.1,
+                                          engine='band')
+
+
+@pytest.mark.parametrize('engine', ('point', 'band'))
+def test_shared_arrays(engine):
+    """Test that parallel aggregation with input arrays shared through
+    memory mapped scratch files matches the standard parallel aggregation."""
+    shared_dir = os.path.join(TESTDATADIR, 'sc_out/shared_arrays/')
+    kwargs = {'h5_dsets': ['lcoe_fcr-2012', 'lcoe_fcr-2013'],
+              'econ_fpath': ONLY_ECON,
+              'excl_dict': EXCL_DICT,
+              'res_class_dset': RES_CLASS_DSET,
+              'res_class_bins': RES_CLASS_BINS,
+              'data_layers': DATA_LAYERS,
+              'engine': engine,
+              'max_workers': 2}
+    s1 = SupplyCurveAggregation.summary(EXCL, ONLY_GEN, TM_DSET, **kwargs)
+    s2 = SupplyCurveAggregation.summary(EXCL, ONLY_GEN, TM_DSET,
+                                        shared_dir=shared_dir, **kwargs)
+
+    assert not os.listdir(shared_dir)
+    os.rmdir(shared_dir)
+
+    assert_frame_equal(s1, s2)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
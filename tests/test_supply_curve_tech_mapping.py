@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 import pytest
 import os
+import shutil
 
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
@@ -21,11 +22,12 @@ GEN = os.path.join(TESTDATADIR, 'gen_out/gen_ri_pv_2012_x000.h5')
 TM_DSET = 'techmap_nsrdb_ri_truth'
 
 
-def test_resource_tech_mapping():
+@pytest.mark.parametrize('engine', ('chunk', 'band'))
+def test_resource_tech_mapping(engine):
     """Run the supply curve technology mapping and compare to baseline file"""
 
     lats, lons, ind = TechMapping.run(EXCL, RES, TM_DSET, max_workers=2,
-                                      save_flag=False)
+                                      save_flag=False, engine=engine)
 
     with ExclusionLayers(EXCL) as ex:
         lat_truth = ex.latitude
@@ -41,6 +43,27 @@ def test_resource_tech_mapping():
     assert len(set(ind.flatten())) == 101, msg
 
 
+@pytest.mark.parametrize('mem_util_lim', (0.4, 0.0))
+def test_band_tech_mapping_save(mem_util_lim):
+    """Test the band tech mapping engine streaming the techmap to the
+    exclusions file. A zero memory limit maps one band at a time."""
+    excl_fpath = os.path.join(TESTDATADIR, 'sc_out/band_tech_mapping.h5')
+    shutil.copy(EXCL, excl_fpath)
+
+    out = TechMapping.run(excl_fpath, RES, 'techmap_band', max_workers=2,
+                          map_chunk=256, engine='band',
+                          mem_util_lim=mem_util_lim)
+    assert out == (None, None, None)
+
+    with ExclusionLayers(EXCL) as ex:
+        ind_truth = ex[TM_DSET]
+
+    with ExclusionLayers(excl_fpath) as ex:
+        assert np.array_equal(ex['techmap_band'], ind_truth)
+
+    os.remove(excl_fpath)
+
+
 def plot_tech_mapping():
     """Run the supply curve technology mapping and plot the resulting mapped
     points."""